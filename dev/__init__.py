@@ -42,9 +42,18 @@ __version__ = "2.0.0"
 __author__ = "Palimpsest Project"
 
 # Expose primary interfaces for convenience
-from dev.database.manager import PalimpsestDB
 from dev.core.paths import DATA_DIR, DB_PATH, LOG_DIR, MD_DIR, PDF_DIR
 
+
+def __getattr__(name: str):
+    """Import PalimpsestDB on first access so CLI startup skips SQLAlchemy."""
+    if name == "PalimpsestDB":
+        from dev.database.manager import PalimpsestDB
+
+        return PalimpsestDB
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "PalimpsestDB",
     "DATA_DIR",
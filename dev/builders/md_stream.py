@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+md_stream.py
+-------------------
+Streaming helpers for assembling the Markdown that PDF builders typeset.
+
+Both PDF builders concatenate a year of daily files into one temporary
+Markdown document grouped by month. These helpers write that document
+entry by entry: each file is read once, frontmatter is skipped and LaTeX
+markers are injected around the first date header in a single scan, and
+the body goes straight to the output without being split into lines and
+re-joined. Only one entry is held in memory at a time.
+
+Provides:
+- group_by_month: Group daily files (YYYY-MM-DD.*) by month
+- write_body: Stream an entry body without frontmatter, injecting lines
+  around its date header
+- raw_latex_block: Wrap LaTeX in a raw block pandoc passes through
+
+Usage:
+    with tmp_path.open("w", encoding="utf-8") as out:
+        for month, month_files in group_by_month(files).items():
+            out.write(raw_latex_block(NEWPAGE))
+            for md_file in month_files:
+                write_body(out, md_file, after_header=ANNOTATION_LINES)
+"""
+# --- Annotations ---
+from __future__ import annotations
+
+# --- Standard library imports ---
+import re
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, TextIO
+
+# --- Local imports ---
+from dev.core.logging_manager import PalimpsestLogger, safe_logger
+
+
+_DELIMITER_LINE = re.compile(r"^[^\S\n]*---[^\S\n]*$", re.MULTILINE)
+"""A frontmatter delimiter line (surrounding whitespace allowed)."""
+
+_BLANK_LINES = re.compile(r"(?:[^\S\n]*\n)*")
+"""Run of whitespace-only lines."""
+
+_TRAILING_BLANK = re.compile(r"[^\S\n]*\Z")
+"""Whitespace-only remainder of a file."""
+
+
+def group_by_month(
+    files: Sequence[Path], logger: Optional[PalimpsestLogger] = None
+) -> Dict[str, List[Path]]:
+    """
+    Group daily files named YYYY-MM-DD.* by month.
+
+    Args:
+        files: Daily files
+        logger: Optional logger (warned about malformed names)
+
+    Returns:
+        Month string ('01'..'12') → sorted files, in calendar order
+    """
+    months: Dict[str, List[Path]] = defaultdict(list)
+    for path in sorted(files):
+        parts = path.stem.split("-")
+        if len(parts) < 2:
+            safe_logger(logger).log_warning(f"Skipping malformed filename: {path.stem}")
+            continue
+        months[parts[1]].append(path)
+    return {m: months[m] for m in sorted(months, key=int)}
+
+
+def _body_start(text: str) -> int:
+    """
+    Find where an entry's body starts, past frontmatter and blank lines.
+
+    Mirrors split_frontmatter: without a closing delimiter the whole
+    text is body.
+
+    Args:
+        text: Entry file content
+
+    Returns:
+        Offset of the first body line (len(text) if the body is blank)
+    """
+    opening = _DELIMITER_LINE.match(text)
+    if not opening:
+        return 0
+    closing = _DELIMITER_LINE.search(text, opening.end() + 1)
+    if not closing:
+        return 0
+    pos = _BLANK_LINES.match(text, closing.end() + 1).end()
+    return len(text) if _TRAILING_BLANK.match(text, pos) else pos
+
+
+def write_body(
+    out: TextIO,
+    md_file: Path,
+    before_header: Sequence[str] = (),
+    after_header: Sequence[str] = (),
+    header_prefix: str = "##",
+    end: str = "\n\n",
+    drop_trailing_blank: bool = False,
+) -> bool:
+    """
+    Stream an entry body into a document, injecting marker lines.
+
+    Writes the same text as ``"\\n".join(split_frontmatter(text)[1]) + end``
+    with the marker lines placed around the first line starting with
+    header_prefix. The file is read once and scanned with string searches
+    (no splitting into lines or re-joining); the body is written as at
+    most three slices, and its final newline doubles as the first newline
+    of ``end``. Unicode line separators other than newlines are copied
+    as-is.
+
+    With drop_trailing_blank, a body ending in an empty line loses that
+    one line, matching a second ``splitlines()``/join pass over the
+    joined body (as the notes builder used to run).
+
+    Args:
+        out: Destination text stream
+        md_file: Entry Markdown file
+        before_header: Lines to insert before the first header
+        after_header: Lines to insert after the first header
+        header_prefix: Prefix identifying the header line
+        end: Text that follows the body (must start with a newline)
+        drop_trailing_blank: Drop one trailing empty line of the body
+
+    Returns:
+        True if a header was found (and markers inserted)
+    """
+    with md_file.open(encoding="utf-8") as handle:
+        text = handle.read()
+
+    pos = _body_start(text)
+    stop = len(text)
+    if drop_trailing_blank and pos < stop and text.endswith("\n\n"):
+        stop -= 1
+
+    header = -1
+    if before_header or after_header:
+        if text.startswith(header_prefix, pos):
+            header = pos
+        else:
+            found = text.find("\n" + header_prefix, pos)
+            header = found + 1 if found >= 0 else -1
+
+    if header >= 0:
+        out.write(text[pos:header])
+        for marker in before_header:
+            out.write(marker + "\n")
+        line_end = text.find("\n", header)
+        if line_end < 0:
+            line_end = len(text)
+        out.write(text[header:line_end] + "\n")
+        for marker in after_header:
+            out.write(marker + "\n")
+        pos = line_end + 1
+        ends_with_newline = True
+    else:
+        ends_with_newline = False
+
+    if pos < stop:
+        out.write(text[pos:stop])
+        ends_with_newline = text.endswith("\n")
+
+    out.write(end[1:] if ends_with_newline else end)
+    return header >= 0
+
+
+def raw_latex_block(latex: str) -> str:
+    """
+    Wrap LaTeX in a raw Markdown block pandoc passes through verbatim.
+
+    The fence is longer than any backtick run inside the LaTeX.
+
+    Args:
+        latex: LaTeX source
+
+    Returns:
+        Fenced ``{=latex}`` block followed by a blank line
+    """
+    longest = max((len(run) for run in re.findall(r"`+", latex)), default=0)
+    fence = "`" * max(3, longest + 1)
+    return f"{fence}{{=latex}}\n{latex.rstrip()}\n{fence}\n\n"
@@ -34,7 +34,6 @@ from __future__ import annotations
 
 # --- Standard library imports ---
 import calendar
-from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 
@@ -43,6 +42,7 @@ from pypandoc import convert_file
 
 # --- Local imports ---
 from dev.builders.base import BuilderStats as BaseStats
+from dev.builders.md_stream import group_by_month, raw_latex_block
 from dev.core.exceptions import PdfBuildError
 from dev.core.logging_manager import PalimpsestLogger, safe_logger
 from dev.core.temporal_files import TemporalFileManager
@@ -681,6 +681,7 @@ class MetadataPdfBuilder:
         preamble: LaTeX preamble for formatting
         force_overwrite: If True, overwrite existing PDF
         keep_temp_on_error: If True, preserve temp files on error
+        temp_dir: Scratch directory for temporary files (None = system temp)
         logger: Optional logger for operations
     """
 
@@ -692,6 +693,7 @@ class MetadataPdfBuilder:
         preamble: Path,
         force_overwrite: bool = False,
         keep_temp_on_error: bool = True,
+        temp_dir: Optional[Path] = None,
         logger: Optional[PalimpsestLogger] = None,
     ):
         """
@@ -704,6 +706,7 @@ class MetadataPdfBuilder:
             preamble: Path to LaTeX preamble
             force_overwrite: Overwrite existing PDF
             keep_temp_on_error: Preserve temp files on error for debugging
+            temp_dir: Scratch directory for temporary files (None = system temp)
             logger: Optional logger
         """
         self.year = year
@@ -712,6 +715,7 @@ class MetadataPdfBuilder:
         self.preamble = preamble
         self.force_overwrite = force_overwrite
         self.keep_temp_on_error = keep_temp_on_error
+        self.temp_dir = temp_dir
         self.logger = logger
 
     def gather_yaml(self) -> List[Path]:
@@ -775,45 +779,36 @@ class MetadataPdfBuilder:
             f"Creating formatted metadata markdown: {tmp_path.name}"
         )
 
-        # Group files by month
-        months: Dict[str, List[Path]] = defaultdict(list)
-        for yaml_file in sorted(files):
-            parts = yaml_file.stem.split("-")
-            if len(parts) < 2:
-                safe_logger(self.logger).log_warning(
-                    f"Skipping malformed filename: {yaml_file.stem}"
-                )
-                continue
-            _, month_str, *_ = parts
-            months[month_str].append(yaml_file)
+        months = group_by_month(files, self.logger)
 
         safe_logger(self.logger).log_debug(
             f"Grouped into {len(months)} months for year {self.year}"
         )
 
+        newpage = raw_latex_block("\\newpage")
         try:
             with tmp_path.open("w", encoding="utf-8") as tmp:
                 # Process each month
-                for month_str in sorted(months.keys(), key=lambda m: int(m)):
+                for month_str, month_files in months.items():
                     month_name = calendar.month_name[int(month_str)]
 
                     # Month subtitle page (centered, on its own page)
-                    tmp.write("```{=latex}\n\\newpage\n```\n\n")
-                    tmp.write("```{=latex}\n")
-                    tmp.write("\\vspace*{\\fill}\n")
-                    tmp.write("\\begin{center}\n")
-                    tmp.write(f"{{\\fontsize{{36pt}}{{40pt}}\\selectfont\\bfseries {month_name}, {self.year}\\par}}\n")
-                    tmp.write("\\end{center}\n")
-                    tmp.write("\\vspace*{\\fill}\n")
-                    tmp.write("```\n\n")
-
-                    # Process daily entries
-                    for yaml_file in months[month_str]:
+                    tmp.write(newpage)
+                    tmp.write(raw_latex_block(
+                        "\\vspace*{\\fill}\n"
+                        "\\begin{center}\n"
+                        f"{{\\fontsize{{36pt}}{{40pt}}\\selectfont\\bfseries {month_name}, {self.year}\\par}}\n"
+                        "\\end{center}\n"
+                        "\\vspace*{\\fill}"
+                    ))
+
+                    # Process daily entries (YAML has to be parsed per file)
+                    for yaml_file in month_files:
                         try:
                             entry = MetadataEntry.from_file(yaml_file)
 
                             # Start each entry on a new page
-                            tmp.write("```{=latex}\n\\newpage\n```\n\n")
+                            tmp.write(newpage)
 
                             # Write entry metadata
                             tmp.write(format_entry_metadata(entry))
@@ -826,7 +821,7 @@ class MetadataPdfBuilder:
                             continue
 
                 # Add table of contents at end
-                tmp.write("```{=latex}\n\\newpage\n```\n\n")
+                tmp.write(newpage)
                 tmp.write("```{=latex}\n\\tableofcontents\n```\n")
 
         except OSError as e:
@@ -958,7 +953,7 @@ class MetadataPdfBuilder:
         stats.files_processed = len(files)
 
         # Use TemporalFileManager for proper cleanup
-        temp_manager = TemporalFileManager()
+        temp_manager = TemporalFileManager(base_dir=self.temp_dir)
         error_occurred = False
 
         try:
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+pdf_cache.py
+-------------------
+Content-addressed cache for yearly PDF builds.
+
+Stores two kinds of records under one cache directory:
+
+1. Fragments - pandoc's JSON AST for one month of entries, stored as
+   ``fragments/<key>.json`` where the key hashes everything the parse
+   depends on (month source, notes formatting, pandoc version)
+2. Builds - the input key each output PDF was last typeset from, stored
+   as ``builds/<path digest>.json`` together with the fragment keys used
+
+A PDF whose recorded key matches the current inputs is up to date and
+is not rebuilt. Editing one entry changes only its month's fragment key,
+so only that month goes back through pandoc before the final
+typesetting pass.
+
+Safety:
+    - Writes are atomic (temp file + rename), so concurrent builds of
+      different years can share a cache directory
+    - A missing or corrupt record is treated as a miss
+    - Fragments no build references are removed by prune()
+
+Usage:
+    from dev.builders.pdf_cache import PdfBuildCache
+
+    cache = PdfBuildCache(PDF_CACHE_DIR)
+    key = PdfBuildCache.digest(source, "notes")
+    ast = cache.get_fragment(key)
+    if ast is None:
+        cache.put_fragment(key, parse(source))
+"""
+# --- Annotations ---
+from __future__ import annotations
+
+# --- Standard library imports ---
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterable, List, Optional, Set, Union
+
+
+# Bump when the fragment or record layout changes; older entries miss
+CACHE_VERSION = 2
+
+
+class PdfBuildCache:
+    """
+    Cache of month AST fragments and PDF build keys.
+
+    Attributes:
+        cache_dir: Root directory of the cache
+        fragments_dir: Directory holding ``<key>.json`` fragments
+        builds_dir: Directory holding one JSON record per output PDF
+    """
+
+    def __init__(self, cache_dir: Path):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Root directory (created on first write)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.fragments_dir = self.cache_dir / "fragments"
+        self.builds_dir = self.cache_dir / "builds"
+
+    @staticmethod
+    def digest(*parts: Union[str, bytes]) -> str:
+        """
+        Hash an ordered sequence of inputs into a cache key.
+
+        Each part is length-prefixed, so ("ab", "c") and ("a", "bc")
+        produce different keys.
+
+        Args:
+            *parts: Strings or bytes the key depends on
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        hasher = hashlib.sha256(f"v{CACHE_VERSION}".encode())
+        for part in parts:
+            data = part.encode("utf-8") if isinstance(part, str) else part
+            hasher.update(len(data).to_bytes(8, "big"))
+            hasher.update(data)
+        return hasher.hexdigest()
+
+    # --- Fragments ---
+
+    def fragment_path(self, key: str) -> Path:
+        """Path of the fragment stored under a key."""
+        return self.fragments_dir / f"{key}.json"
+
+    def get_fragment(self, key: str) -> Optional[str]:
+        """
+        Look up a cached fragment.
+
+        Args:
+            key: Fragment key
+
+        Returns:
+            The fragment text, or None on a miss
+        """
+        try:
+            return self.fragment_path(key).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def put_fragment(self, key: str, text: str) -> None:
+        """
+        Store a fragment.
+
+        Args:
+            key: Fragment key
+            text: Fragment text produced for the key's inputs
+        """
+        self._write_atomic(self.fragment_path(key), text)
+
+    # --- Build records ---
+
+    def _record_path(self, pdf_path: Path) -> Path:
+        """Record file for an output PDF (keyed by its resolved path)."""
+        name = hashlib.sha1(str(Path(pdf_path).resolve()).encode()).hexdigest()
+        return self.builds_dir / f"{name[:16]}.json"
+
+    def build_key(self, pdf_path: Path) -> Optional[str]:
+        """
+        Get the input key a PDF was last built from.
+
+        Args:
+            pdf_path: Output PDF path
+
+        Returns:
+            The recorded key, or None if the PDF has no valid record
+        """
+        try:
+            record = json.loads(self._record_path(pdf_path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(record, dict) or record.get("version") != CACHE_VERSION:
+            return None
+        return record.get("key")
+
+    def record_build(
+        self, pdf_path: Path, key: str, fragments: Iterable[str] = ()
+    ) -> None:
+        """
+        Record the input key a PDF was built from.
+
+        Args:
+            pdf_path: Output PDF path
+            key: Input key of the build
+            fragments: Fragment keys the build used (kept by prune())
+        """
+        record = {
+            "version": CACHE_VERSION,
+            "pdf": str(pdf_path),
+            "key": key,
+            "fragments": sorted(set(fragments)),
+        }
+        self._write_atomic(self._record_path(pdf_path), json.dumps(record, indent=2))
+
+    def forget(self, pdf_path: Path) -> None:
+        """
+        Drop the record of a PDF so its next build runs unconditionally.
+
+        Args:
+            pdf_path: Output PDF path
+        """
+        self._record_path(pdf_path).unlink(missing_ok=True)
+
+    # --- Maintenance ---
+
+    def prune(self) -> int:
+        """
+        Delete fragments no build record references.
+
+        Files left by older cache layouts are removed too; in-progress
+        atomic writes (dot-prefixed temp files) are left alone.
+
+        Returns:
+            Number of fragments removed
+        """
+        live: Set[str] = set()
+        for record_path in self._glob(self.builds_dir, "*.json"):
+            try:
+                record = json.loads(record_path.read_text(encoding="utf-8"))
+                live.update(record.get("fragments", []))
+            except (OSError, ValueError, AttributeError):
+                continue
+
+        removed = 0
+        for fragment in self._glob(self.fragments_dir, "*"):
+            if fragment.name.startswith(".") or not fragment.is_file():
+                continue
+            if fragment.stem not in live:
+                fragment.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    # --- Helpers ---
+
+    @staticmethod
+    def _glob(directory: Path, pattern: str) -> List[Path]:
+        """List matching files, treating a missing directory as empty."""
+        return sorted(directory.glob(pattern)) if directory.is_dir() else []
+
+    @staticmethod
+    def _write_atomic(path: Path, text: str) -> None:
+        """Write text through a temp file in the same directory."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+                tmp.write(text)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
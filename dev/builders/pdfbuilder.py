@@ -14,6 +14,11 @@ Features:
 - Automatic TOC generation
 - Temporary file management
 - Build statistics tracking
+- Optional content-addressed build cache (see dev/builders/pdf_cache.py):
+  PDFs whose inputs are unchanged are not rebuilt, and only months with
+  edited entries are re-parsed before the final typesetting pass. Months
+  are cached as pandoc's JSON AST, so the final pass still sees every
+  table, strikeout or code block and its template loads their packages
 
 Usage:
     builder = PdfBuilder(
@@ -22,6 +27,7 @@ Usage:
         pdf_dir=Path("journal/pdf"),
         preamble=Path("journal/latex/preamble.tex"),
         preamble_notes=Path("journal/latex/preamble_notes.tex"),
+        cache_dir=Path("tmp/pdf-cache"),
         logger=logger
     )
     stats = builder.build()
@@ -31,19 +37,21 @@ from __future__ import annotations
 
 # --- Standard library imports ---
 import calendar
-from collections import defaultdict
+import io
+import json
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, TextIO
 
 # --- Third party imports ---
-from pypandoc import convert_file
+from pypandoc import convert_file, convert_text, get_pandoc_version
 
 # --- Local imports ---
 from dev.builders.base import BuilderStats as BaseStats
+from dev.builders.md_stream import group_by_month, write_body
+from dev.builders.pdf_cache import PdfBuildCache
 from dev.core.exceptions import PdfBuildError
 from dev.core.logging_manager import PalimpsestLogger, safe_logger
 from dev.core.temporal_files import TemporalFileManager
-from dev.utils.md import split_frontmatter
 
 
 # --- LaTeX Command Constants ---
@@ -96,6 +104,19 @@ curation notes, locations, people, references, epigraphs, poems, connections,
 and tags.
 """
 
+NOTES_BEFORE_HEADER = (LATEX_NO_LINE_NUMBERS.strip(),)
+"""Lines injected before the first entry's date header in notes PDFs."""
+
+NOTES_BEFORE_LATER_HEADER = (LATEX_NEWPAGE.strip(), LATEX_NO_LINE_NUMBERS.strip())
+"""Lines injected before later entries' date headers (each starts a page)."""
+
+NOTES_AFTER_HEADER = (
+    *ANNOTATION_TEMPLATE,
+    LATEX_RESET_LINE_COUNTER.strip(),
+    LATEX_LINE_NUMBERS.strip(),
+)
+"""Lines injected after each date header in notes PDFs."""
+
 PANDOC_ENGINE = "tectonic"
 """Pandoc PDF engine to use for compilation (tectonic is a modern, self-contained LaTeX engine)."""
 
@@ -111,6 +132,47 @@ PDF_AUTHOR = "Sofía F."
 AUTHOR_BIRTH_YEAR = 1993
 """Birth year used to calculate age annotation in PDF metadata."""
 
+FRAGMENT_FORMAT_VERSION = "2"
+"""Bump when month fragment generation changes to invalidate cached fragments."""
+
+_ATTR_FIRST_ELEMENTS = frozenset({
+    "Div", "Span", "CodeBlock", "Code", "Link", "Image", "Table", "Figure",
+})
+"""Pandoc AST elements whose first field is an Attr (identifier first)."""
+
+
+def _prefix_identifiers(node: Any, prefix: str) -> None:
+    """
+    Prefix the identifiers and internal link targets of a pandoc JSON AST.
+
+    Months are parsed separately, so the same header text in two months
+    would otherwise give two elements the same label once joined.
+
+    Args:
+        node: Pandoc JSON node (edited in place)
+        prefix: Identifier prefix (e.g. '2025-01-')
+    """
+    if isinstance(node, list):
+        for child in node:
+            _prefix_identifiers(child, prefix)
+        return
+    if not isinstance(node, dict):
+        return
+
+    element, content = node.get("t"), node.get("c")
+    attr = None
+    if element == "Header":
+        attr = content[1]
+    elif element in _ATTR_FIRST_ELEMENTS:
+        attr = content[0]
+    if attr and attr[0]:
+        attr[0] = prefix + attr[0]
+    if element == "Link" and content[2][0].startswith("#"):
+        content[2][0] = "#" + prefix + content[2][0][1:]
+
+    if isinstance(content, list):
+        _prefix_identifiers(content, prefix)
+
 
 # --- Classes ---
 class PdfBuildStats(BaseStats):
@@ -125,6 +187,9 @@ class PdfBuildStats(BaseStats):
         super().__init__()
         self.files_processed: int = 0
         self.pdfs_created: int = 0
+        self.pdfs_up_to_date: int = 0
+        self.months_converted: int = 0
+        self.months_cached: int = 0
         self.errors: int = 0
 
     def summary(self) -> str:
@@ -134,11 +199,18 @@ class PdfBuildStats(BaseStats):
         Returns:
             Summary string with file count, PDFs created, errors, and duration
         """
-        return (
+        summary = (
             f"{self.files_processed} entries, "
             f"{self.pdfs_created} PDFs created, "
-            f"{self.errors} errors in {self.duration():.2f}s"
         )
+        if self.pdfs_up_to_date:
+            summary += f"{self.pdfs_up_to_date} up to date, "
+        if self.months_converted or self.months_cached:
+            summary += (
+                f"{self.months_converted} months converted "
+                f"({self.months_cached} cached), "
+            )
+        return summary + f"{self.errors} errors in {self.duration():.2f}s"
 
 
 class PdfBuilder:
@@ -157,6 +229,9 @@ class PdfBuilder:
         force_overwrite: If True, overwrite existing PDFs
         logger: Optional logger for operations
         keep_temp_on_error: If True, preserve temp files when errors occur
+        cache: Build cache, or None to build without caching
+        temp_dir: Scratch directory for temporary files (None = system temp)
+        prune: Whether build() prunes unreferenced cache fragments
     """
 
     # --- Initialization ---
@@ -169,6 +244,9 @@ class PdfBuilder:
         preamble_notes: Optional[Path] = None,
         force_overwrite: bool = False,
         keep_temp_on_error: bool = True,
+        cache_dir: Optional[Path] = None,
+        temp_dir: Optional[Path] = None,
+        prune: bool = True,
         logger: Optional[PalimpsestLogger] = None,
     ):
         """
@@ -182,6 +260,16 @@ class PdfBuilder:
             preamble_notes: Path to LaTeX preamble for notes PDF
             force_overwrite: Overwrite existing PDFs
             keep_temp_on_error: Preserve temp files on error for debugging
+            cache_dir: Build cache directory. When set, PDFs are rebuilt
+                whenever their inputs change (and skipped otherwise) and
+                parsed month fragments are reused; when None, existing PDFs
+                are skipped unless force_overwrite is set
+            temp_dir: Scratch directory for temporary files (None = system
+                temp); parallel builds give each job its own
+            prune: Remove unreferenced cache fragments after building.
+                Batches sharing a cache pass False and prune once at the
+                end, since a concurrent job's new fragments are not
+                referenced until its PDF is recorded
             logger: Optional logger
         """
         self.year = year
@@ -191,7 +279,12 @@ class PdfBuilder:
         self.preamble_notes = preamble_notes
         self.force_overwrite = force_overwrite
         self.keep_temp_on_error = keep_temp_on_error
+        self.cache = PdfBuildCache(cache_dir) if cache_dir else None
+        self.temp_dir = temp_dir
+        self.prune = prune
         self.logger = logger
+        self._stats: Optional[PdfBuildStats] = None
+        self._pandoc_version_str: Optional[str] = None
 
     def gather_md(self) -> List[Path]:
         """
@@ -219,6 +312,71 @@ class PdfBuilder:
 
         return files
 
+    def _group_by_month(self, files: List[Path]) -> Dict[str, List[Path]]:
+        """
+        Group daily Markdown files by month.
+
+        Args:
+            files: List of daily Markdown files
+
+        Returns:
+            Month string ('01'..'12') → sorted files, in calendar order
+        """
+        months = group_by_month(files, self.logger)
+        safe_logger(self.logger).log_debug(
+            f"Grouped into {len(months)} months for year {self.year}"
+        )
+        return months
+
+    def _month_header(self, month_str: str, notes: bool) -> str:
+        """
+        Build the chapter header that opens a month.
+
+        Args:
+            month_str: Two-digit month
+            notes: If True, include notes formatting
+
+        Returns:
+            Markdown/LaTeX header text
+        """
+        header = LATEX_NEWPAGE
+        if notes:
+            header += LATEX_NO_LINE_NUMBERS
+        return header + f"# {calendar.month_name[int(month_str)]}, {self.year}\n\n"
+
+    def _document_tail(self, notes: bool) -> str:
+        """Build the closing table of contents page."""
+        tail = LATEX_NEWPAGE
+        if notes:
+            tail += LATEX_NO_LINE_NUMBERS
+        return tail + LATEX_TOC
+
+    def _write_month_entries(
+        self, out: TextIO, month_files: List[Path], notes: bool = False
+    ) -> None:
+        """
+        Stream a month's daily entries into a document.
+
+        Frontmatter is skipped while reading; in notes mode the annotation
+        template and line-number commands are injected around each date
+        header in the same pass.
+
+        Args:
+            out: Destination text stream
+            month_files: The month's daily Markdown files, in order
+            notes: If True, include notes formatting
+        """
+        first_day = True
+        for md_file in month_files:
+            if notes:
+                before = NOTES_BEFORE_HEADER if first_day else NOTES_BEFORE_LATER_HEADER
+                if write_body(
+                    out, md_file, before, NOTES_AFTER_HEADER, drop_trailing_blank=True
+                ):
+                    first_day = False
+            else:
+                write_body(out, md_file)
+
     def _write_temp_md(
         self, files: List[Path], tmp_path: Path, notes: bool = False
     ) -> None:
@@ -241,83 +399,186 @@ class PdfBuilder:
             f"Creating concatenated {pdf_type} Markdown: {tmp_path.name}"
         )
 
-        # Group files by month
-        months: Dict[str, List[Path]] = defaultdict(list)
-        for md_file in sorted(files):
-            parts = md_file.stem.split("-")
-            if len(parts) < 2:
-                safe_logger(self.logger).log_warning(
-                    f"Skipping malformed filename: {md_file.stem}"
-                )
-                continue
-            _, month_str, *_ = parts
-            months[month_str].append(md_file)
-
-        safe_logger(self.logger).log_debug(
-            f"Grouped into {len(months)} months for year {self.year}"
-        )
+        months = self._group_by_month(files)
 
         try:
             with tmp_path.open("w", encoding="utf-8") as tmp:
-                # Process each month
-                for month_str in sorted(months.keys(), key=lambda m: int(m)):
-                    month_name = calendar.month_name[int(month_str)]
-
-                    # Month chapter header
-                    tmp.write(LATEX_NEWPAGE)
-                    if notes:
-                        tmp.write(LATEX_NO_LINE_NUMBERS)
-                    tmp.write(f"# {month_name}, {self.year}\n\n")
-
-                    # Process daily entries
-                    first_day = True
-                    for md_file in months[month_str]:
-                        content = md_file.read_text(encoding="utf-8")
-
-                        # Strip YAML frontmatter using utility function
-                        _, body_lines = split_frontmatter(content)
-                        content = '\n'.join(body_lines)
-
-                        if notes:
-                            # Add notes formatting
-                            lines = content.splitlines()
-                            updated_lines = []
-                            inserted = False
-
-                            for line in lines:
-                                # Insert notes template after date header
-                                if line.startswith("##") and not inserted:
-                                    if not first_day:
-                                        updated_lines.append(LATEX_NEWPAGE.strip())
-                                    updated_lines.append(LATEX_NO_LINE_NUMBERS.strip())
-                                    updated_lines.append(line)
-                                    updated_lines.extend(ANNOTATION_TEMPLATE)
-                                    updated_lines.append(
-                                        LATEX_RESET_LINE_COUNTER.strip()
-                                    )
-                                    updated_lines.append(LATEX_LINE_NUMBERS.strip())
-                                    inserted = True
-                                    first_day = False
-                                else:
-                                    updated_lines.append(line)
-
-                            tmp.write("\n".join(updated_lines))
-                        else:
-                            tmp.write(content)
-
-                        tmp.write("\n\n")
+                for month_str, month_files in months.items():
+                    tmp.write(self._month_header(month_str, notes))
+                    self._write_month_entries(tmp, month_files, notes)
 
                 # Add table of contents at end
-                tmp.write(LATEX_NEWPAGE)
-                if notes:
-                    tmp.write(LATEX_NO_LINE_NUMBERS)
-                tmp.write(LATEX_TOC)
+                tmp.write(self._document_tail(notes))
 
         except OSError as e:
             raise PdfBuildError(
                 f"Failed to write temporary file {tmp_path}: {e}"
             ) from e
 
+    # --- Cached builds ---
+
+    def _pandoc_version(self) -> str:
+        """Pandoc version for cache keys ('' if pandoc is unavailable)."""
+        if self._pandoc_version_str is None:
+            try:
+                self._pandoc_version_str = str(get_pandoc_version())
+            except (OSError, RuntimeError):
+                self._pandoc_version_str = ""
+        return self._pandoc_version_str
+
+    def _month_fragment(self, month_str: str, source: str, key: str) -> Dict[str, Any]:
+        """
+        Get the pandoc AST for one month, parsing it on a cache miss.
+
+        Identifiers are prefixed with the year and month so labels stay
+        unique once the months are joined.
+
+        Args:
+            month_str: Two-digit month
+            source: The month's Markdown (chapter header and entries)
+            key: Fragment cache key for the source
+
+        Returns:
+            Pandoc JSON document of the month
+
+        Raises:
+            PdfBuildError: If pandoc fails
+        """
+        cached = self.cache.get_fragment(key)
+        if cached is not None:
+            try:
+                ast = json.loads(cached)
+            except ValueError:
+                ast = None
+            if isinstance(ast, dict) and isinstance(ast.get("blocks"), list):
+                if self._stats is not None:
+                    self._stats.months_cached += 1
+                return ast
+
+        safe_logger(self.logger).log_debug(
+            f"Parsing {calendar.month_name[int(month_str)]} {self.year}"
+        )
+        try:
+            ast = json.loads(convert_text(source, to="json", format="markdown"))
+        except (OSError, RuntimeError, ValueError) as e:
+            raise PdfBuildError(
+                f"Pandoc conversion failed for {self.year}-{month_str}: {e}"
+            ) from e
+
+        _prefix_identifiers(ast["blocks"], f"{self.year}-{month_str}-")
+        self.cache.put_fragment(key, json.dumps(ast, ensure_ascii=False))
+        if self._stats is not None:
+            self._stats.months_converted += 1
+        return ast
+
+    def _build_cached_pdf(
+        self,
+        files: List[Path],
+        pdf_path: Path,
+        preamble: Path,
+        metadata: Dict[str, str],
+        vars: Dict[str, str],
+        temp_manager: TemporalFileManager,
+        pdf_type: str,
+        notes: bool = False,
+    ) -> bool:
+        """
+        Build a single PDF through the build cache.
+
+        The build key hashes every month fragment key together with the
+        preamble, metadata, variables and typesetting settings. A PDF
+        whose recorded key matches is left alone (unless force_overwrite
+        is set). Otherwise months with a cached AST are reused, the rest
+        are parsed, and the joined ASTs are typeset from pandoc JSON, so
+        the LaTeX template sees (and loads packages for) every feature
+        the entries use, exactly as in a direct build.
+
+        Args:
+            files: List of Markdown files
+            pdf_path: Output PDF path
+            preamble: LaTeX preamble file
+            metadata: Pandoc metadata
+            vars: LaTeX variables
+            temp_manager: Temp file manager
+            pdf_type: Type name for logging ("clean" or "notes")
+            notes: If True, include notes formatting
+
+        Returns:
+            True if PDF was created, False if up to date
+        """
+        pandoc_version = self._pandoc_version()
+
+        sources: Dict[str, str] = {}
+        fragment_keys: Dict[str, str] = {}
+        for month_str, month_files in self._group_by_month(files).items():
+            buffer = io.StringIO()
+            buffer.write(self._month_header(month_str, notes))
+            self._write_month_entries(buffer, month_files, notes)
+            sources[month_str] = buffer.getvalue()
+            fragment_keys[month_str] = PdfBuildCache.digest(
+                FRAGMENT_FORMAT_VERSION, pandoc_version, pdf_type,
+                self.year, month_str, sources[month_str],
+            )
+
+        build_key = PdfBuildCache.digest(
+            FRAGMENT_FORMAT_VERSION, pandoc_version,
+            PANDOC_ENGINE, PANDOC_DOCUMENT_CLASS,
+            preamble.read_bytes(),
+            json.dumps(metadata, sort_keys=True),
+            json.dumps(vars, sort_keys=True),
+            *(f"{m}:{k}" for m, k in fragment_keys.items()),
+        )
+
+        if (
+            not self.force_overwrite
+            and pdf_path.exists()
+            and self.cache.build_key(pdf_path) == build_key
+        ):
+            safe_logger(self.logger).log_info(
+                f"{pdf_type.capitalize()} PDF up to date, skipping: {pdf_path.name}"
+            )
+            if self._stats is not None:
+                self._stats.pdfs_up_to_date += 1
+            return False
+
+        fragments = {
+            m: self._month_fragment(m, sources[m], fragment_keys[m])
+            for m in sources
+        }
+
+        document: Dict[str, Any] = {"meta": {}, "blocks": []}
+        for ast in fragments.values():
+            document["pandoc-api-version"] = ast.get("pandoc-api-version")
+            document["blocks"].extend(ast["blocks"])
+        document["blocks"].append(
+            {"t": "RawBlock", "c": ["latex", self._document_tail(notes)]}
+        )
+
+        tmp_file = temp_manager.create_temp_file(
+            suffix=".json", prefix=f"palimpsest_{self.year}_{pdf_type}_"
+        )
+        try:
+            with tmp_file.open("w", encoding="utf-8") as tmp:
+                json.dump(document, tmp, ensure_ascii=False)
+        except OSError as e:
+            raise PdfBuildError(
+                f"Failed to write temporary file {tmp_file}: {e}"
+            ) from e
+
+        # A failed run must not leave the old key pointing at a partial PDF
+        self.cache.forget(pdf_path)
+        if pdf_path.exists():
+            pdf_path.unlink()
+        self._run_pandoc(
+            tmp_file, pdf_path, preamble, metadata, vars, input_format="json"
+        )
+        self.cache.record_build(pdf_path, build_key, fragment_keys.values())
+
+        safe_logger(self.logger).log_operation(
+            "pdf_created", {"type": pdf_type, "file": str(pdf_path)}
+        )
+        return True
+
     def _run_pandoc(
         self,
         in_md: Path,
@@ -325,6 +586,7 @@ class PdfBuilder:
         preamble: Path,
         metadata: Dict[str, str],
         extra_vars: Dict[str, str],
+        input_format: str = "markdown",
     ) -> None:
         """
         Convert Markdown to PDF using Pandoc.
@@ -335,6 +597,7 @@ class PdfBuilder:
             preamble: LaTeX preamble file
             metadata: Pandoc metadata key-value pairs
             extra_vars: Additional LaTeX variables
+            input_format: Pandoc input format ('json' for a joined AST)
 
         Raises:
             PdfBuildError: If conversion fails
@@ -345,7 +608,7 @@ class PdfBuilder:
         # Build Pandoc arguments
         args = [
             "--from",
-            "markdown",
+            input_format,
             "--pdf-engine",
             PANDOC_ENGINE,
             "--include-in-header",
@@ -399,6 +662,12 @@ class PdfBuilder:
         Returns:
             True if PDF was created, False if skipped
         """
+        if self.cache is not None:
+            return self._build_cached_pdf(
+                files, pdf_path, preamble, metadata, vars,
+                temp_manager, pdf_type, notes=notes,
+            )
+
         if pdf_path.exists() and not self.force_overwrite:
             safe_logger(self.logger).log_info(
                 f"{pdf_type.capitalize()} PDF exists, skipping: {pdf_path.name}"
@@ -435,6 +704,7 @@ class PdfBuilder:
             PdfBuildError: If build fails
         """
         stats = PdfBuildStats()
+        self._stats = stats
 
         safe_logger(self.logger).log_operation(
             "pdf_build_start",
@@ -475,7 +745,7 @@ class PdfBuilder:
         stats.files_processed = len(files)
 
         # Use TemporalFileManager for proper cleanup
-        temp_manager = TemporalFileManager()
+        temp_manager = TemporalFileManager(base_dir=self.temp_dir)
         error_occurred = False
 
         try:
@@ -518,6 +788,13 @@ class PdfBuilder:
                         f"Cleaned up {cleanup_stats['files_removed']} temporary files"
                     )
 
+        if self.cache is not None and self.prune:
+            pruned = self.cache.prune()
+            if pruned:
+                safe_logger(self.logger).log_debug(
+                    f"Pruned {pruned} unused month fragments"
+                )
+
         safe_logger(self.logger).log_operation("pdf_build_complete", {"stats": stats.summary()})
 
         return stats
@@ -11,6 +11,7 @@ Functions:
     setup_logger: Initialize PalimpsestLogger for CLI operations
 
 Classes:
+    LazyGroup: Click group that imports its subcommands on first use
     OperationStats: Base class for all statistics
     ConversionStats: For conversion operations (txt2md, yaml2sql)
     ExportStats: For export operations (sql2yaml)
@@ -28,10 +29,14 @@ Usage:
 from __future__ import annotations
 
 # --- Standard library imports ---
+import importlib
 from pathlib import Path
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+
+# --- Third party imports ---
+import click
 
 # --- Local imports ---
 from dev.core.logging_manager import PalimpsestLogger
@@ -66,6 +71,82 @@ def setup_logger(log_dir: Path, component_name: str) -> PalimpsestLogger:
     return PalimpsestLogger(operations_log_dir, component_name=component_name)
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# LAZY COMMAND GROUPS
+# ═══════════════════════════════════════════════════════════════════════════
+
+class LazyGroup(click.Group):
+    """
+    Click group whose subcommands are imported on first use.
+
+    Subcommands are declared as ``name -> "module:attribute"`` and the
+    module is imported only when the command is invoked, completed or
+    listed by ``--help``. Running one command therefore never imports
+    the modules (and their pandoc, Jinja2 or ORM dependencies) behind
+    the others.
+
+    Attributes:
+        lazy_subcommands: Command name → import path of the command
+
+    Examples:
+        >>> @click.group(cls=LazyGroup, lazy_subcommands={
+        ...     "wiki": "dev.pipeline.cli.wiki:wiki",
+        ... })
+        ... def cli():
+        ...     pass
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_subcommands: Optional[Dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Initialize the group.
+
+        Args:
+            *args: Positional arguments for click.Group
+            lazy_subcommands: Command name → ``"module:attribute"``
+            **kwargs: Keyword arguments for click.Group
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands: Dict[str, str] = dict(lazy_subcommands or {})
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """List eager and lazy command names without importing anything."""
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(
+        self, ctx: click.Context, cmd_name: str
+    ) -> Optional[click.Command]:
+        """Return a command, importing its module on first request."""
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            self.add_command(self._load(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        """
+        Import a lazy subcommand.
+
+        Args:
+            cmd_name: Declared command name
+
+        Returns:
+            The command object
+
+        Raises:
+            TypeError: If the import path does not name a click command
+        """
+        module_name, _, attr = self.lazy_subcommands[cmd_name].partition(":")
+        command = getattr(importlib.import_module(module_name), attr)
+        if not isinstance(command, click.Command):
+            raise TypeError(
+                f"{self.lazy_subcommands[cmd_name]} is not a click command"
+            )
+        return command
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # STATISTICS CLASSES
 # ═══════════════════════════════════════════════════════════════════════════
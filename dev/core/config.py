@@ -13,7 +13,7 @@ Key Features:
     - Shared defaults committed to the repository
     - Per-host local overrides (gitignored)
     - Shallow merge: local sections override shared sections key-by-key
-    - Typed accessor for sync-specific configuration
+    - Typed accessors for sync and database configuration
 
 Usage:
     from dev.core.config import get_sync_config
@@ -23,6 +23,9 @@ Usage:
     print(cfg["no_wiki"])     # e.g. False
     print(cfg["auto_commit"]) # e.g. False
 
+    db_cfg = get_database_config()
+    print(db_cfg["profile"])  # e.g. "interactive"
+
 Dependencies:
     - PyYAML for YAML parsing
     - dev.core.paths for project root
@@ -95,3 +98,23 @@ def get_sync_config() -> Dict[str, Any]:
         "no_wiki": sync.get("no_wiki", False),
         "auto_commit": sync.get("auto_commit", False),
     }
+
+
+def get_database_config() -> Dict[str, Any]:
+    """
+    Get database connection config with defaults.
+
+    Extracts the ``database`` section from the project config and
+    fills in defaults for any missing keys.
+
+    Returns:
+        Dictionary with keys:
+            - profile: Default connection profile name (str)
+            - pragmas: PRAGMA overrides applied on top of the profile (dict)
+    """
+    config = load_config()
+    database: Dict[str, Any] = config.get("database", {})
+    return {
+        "profile": str(database.get("profile", "interactive")),
+        "pragmas": dict(database.get("pragmas") or {}),
+    }
@@ -86,6 +86,11 @@ ALEMBIC_DIR = DEV_DIR / "migrations"
 DB_DIR = DATA_DIR / "metadata"
 DB_PATH = DB_DIR / "palimpsest.db"
 SYNC_STATE_PATH = DB_DIR / ".sync_state"
+FILE_STATE_PATH = DB_DIR / ".file_state.json"
+EXPORT_STATE_PATH = DB_DIR / ".export_state.json"
+EXPORT_INDEX_PATH = DB_DIR / ".export_index.json"
+WIKI_INDEX_PATH = DB_DIR / ".wiki_index.json"
+WIKI_LINT_CACHE_PATH = DB_DIR / ".wiki_lint.json"
 
 # ---- Journal ----
 JOURNAL_DIR = DATA_DIR / "journal"
@@ -124,6 +129,8 @@ NOTES_ARCHIVE = LEGACY_DIR / "notes_archive.yaml"  # Extracted notes from MD fro
 LOG_DIR = ROOT / "logs"
 TMP_DIR = ROOT / "tmp"
 BACKUP_DIR = ROOT / "backups"
+SERVER_SOCKET_PATH = TMP_DIR / "plm.sock"  # `plm serve` JSON-RPC socket
+PDF_CACHE_DIR = TMP_DIR / "pdf-cache"  # LaTeX month fragments + PDF build keys
 
 # ---- Wiki ----
 WIKI_DIR = DATA_DIR / "wiki"
@@ -131,6 +138,7 @@ WIKI_JOURNAL_DIR = WIKI_DIR / "journal"
 WIKI_MANUSCRIPT_DIR = WIKI_DIR / "manuscript"
 WIKI_INDEXES_DIR = WIKI_DIR / "indexes"
 WIKI_TEMPLATES_DIR = DEV_DIR / "wiki" / "templates"
+WIKI_TEMPLATE_CACHE_DIR = TMP_DIR / "wiki-templates"  # Compiled template bytecode
 
 # ---- Vignettes ----
 VIGNETTES_DIR = DATA_DIR / "vignettes"
@@ -21,10 +21,26 @@ from dev.core.exceptions import (
     BackupError,
     HealthCheckError,
 )
-from .manager import PalimpsestDB
-from .health_monitor import HealthMonitor
-from .query_analytics import QueryAnalytics
-from .decorators import DatabaseOperation
+from importlib import import_module
+
+# Heavy modules (SQLAlchemy, Alembic) load on first attribute access so
+# importing a dev.database subpackage stays cheap for CLI startup.
+_LAZY = {
+    "PalimpsestDB": ".manager",
+    "HealthMonitor": ".health_monitor",
+    "QueryAnalytics": ".query_analytics",
+    "DatabaseOperation": ".decorators",
+}
+
+
+def __getattr__(name: str):
+    """Resolve a lazily exported name and cache it on the package."""
+    if name in _LAZY:
+        value = getattr(import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __version__ = "2.0.0"
 __author__ = "Palimpsest Development Team"
@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+aggregates.py
+-------------
+Materialized statistics over the journal, refreshed from the change log.
+
+Wiki pages and analytics show the same counts over and over: entries per
+month of a tag, people co-mentioned with a person, tags and themes that
+co-occur with a theme. Rescanning every entry list for every page makes
+generation quadratic in practice. These tables hold the counts instead:
+
+    - agg_entity_months: (entity, "YYYY-MM") -> entries
+    - agg_co_occurrences: (entity, other entity) -> shared entries,
+      covering person-person co-mentions, tag/theme co-occurrence
+      matrices and person-location counts
+
+Key Features:
+    - refresh_aggregates: rebuilds only the rows of entities linked to
+      rows changed since its watermark (one INSERT ... SELECT ... GROUP BY
+      per count kind), or everything on first run
+    - Aggregates: read-side cache loading each table once per session,
+      refreshing first so counts match the session's data
+    - The YAML importer and JSON sync refresh the tables after writing,
+      so the read-side refresh is normally a no-op. When data changed
+      through another path, the first read of a wiki build or analytics
+      query writes the refreshed rows (and moves the watermark) in the
+      reader's transaction: reads are not side-effect free
+    - Deleted entries or scenes force a full rebuild, since the links
+      they had are gone and cannot be traced back to entities
+
+Usage:
+    from dev.database.aggregates import Aggregates, refresh_aggregates
+
+    refresh_aggregates(session)  # after an import
+    aggregates = Aggregates(session)
+    aggregates.monthly_counts("tags", 4)
+    # {"2024-11": 3, "2024-12": 1}
+    aggregates.co_occurrences("people", 2, "people")
+    # {2: 40, 7: 12, 9: 3}  (the diagonal is the person's entry count)
+"""
+# --- Annotations ---
+from __future__ import annotations
+
+# --- Standard library imports ---
+from typing import Dict, List, Optional, Set, Tuple
+
+# --- Third-party imports ---
+from sqlalchemy import Table, func, inspect, literal, select
+from sqlalchemy.orm import Session
+
+# --- Local imports ---
+from .change_tracking import (
+    changes_since,
+    get_watermark,
+    latest_change_id,
+    set_watermark,
+)
+from .models import (
+    EntityChange,
+    EntityCoOccurrence,
+    EntityMonthCount,
+    Entry,
+    MotifInstance,
+    Scene,
+    ThemeInstance,
+    arc_entries,
+    entry_cities,
+    entry_locations,
+    entry_people,
+    entry_tags,
+    scene_locations,
+    scene_people,
+)
+
+
+# Change-log consumer name of the aggregate tables
+AGGREGATES_CONSUMER = "aggregates"
+
+# Entity type -> (table linking it to entries, entity column)
+ENTRY_LINKS: Dict[str, Tuple[Table, str]] = {
+    "people": (entry_people, "person_id"),
+    "tags": (entry_tags, "tag_id"),
+    "themes": (ThemeInstance.__table__, "theme_id"),
+    "motifs": (MotifInstance.__table__, "motif_id"),
+    "cities": (entry_cities, "city_id"),
+    "locations": (entry_locations, "location_id"),
+    "arcs": (arc_entries, "arc_id"),
+}
+
+# (subject, other) pairs counted over shared entries
+ENTRY_PAIRS: Tuple[Tuple[str, str], ...] = (
+    ("people", "people"),
+    ("tags", "tags"),
+    ("tags", "themes"),
+    ("tags", "people"),
+    ("themes", "themes"),
+    ("themes", "tags"),
+    ("themes", "people"),
+)
+
+# (subject, other) pairs counted over shared scenes (distinct entries)
+SCENE_PAIRS: Tuple[Tuple[str, str], ...] = (("people", "locations"),)
+
+# Entity type -> (table linking it to scenes, entity column)
+SCENE_LINKS: Dict[str, Tuple[Table, str]] = {
+    "people": (scene_people, "person_id"),
+    "locations": (scene_locations, "location_id"),
+}
+
+# Entity ids per DELETE / INSERT ... SELECT statement
+ID_CHUNK = 500
+
+
+def _chunks(ids: Optional[Set[int]]) -> List[Optional[List[int]]]:
+    """Split ids into statement-sized lists; None means every row."""
+    if ids is None:
+        return [None]
+    ordered = sorted(ids)
+    return [ordered[i:i + ID_CHUNK] for i in range(0, len(ordered), ID_CHUNK)]
+
+
+def _month_select(entity_type: str, ids: Optional[List[int]]):
+    """SELECT of (type, id, month, count) rows for one entity type."""
+    link, column = ENTRY_LINKS[entity_type]
+    month = func.strftime("%Y-%m", Entry.date)
+    stmt = (
+        select(
+            literal(entity_type), link.c[column], month, func.count()
+        )
+        .select_from(link)
+        .join(Entry, Entry.id == link.c.entry_id)
+        .group_by(link.c[column], month)
+    )
+    if ids is not None:
+        stmt = stmt.where(link.c[column].in_(ids))
+    return stmt
+
+
+def _pair_select(subject: str, other: str, ids: Optional[List[int]]):
+    """SELECT of (type, id, other type, other id, count) rows for a pair."""
+    if (subject, other) in SCENE_PAIRS:
+        (a_table, a_col), (b_table, b_col) = SCENE_LINKS[subject], SCENE_LINKS[other]
+        a, b = a_table.alias("a"), b_table.alias("b")
+        stmt = (
+            select(
+                literal(subject), a.c[a_col], literal(other), b.c[b_col],
+                func.count(Scene.entry_id.distinct()),
+            )
+            .select_from(a)
+            .join(b, b.c.scene_id == a.c.scene_id)
+            .join(Scene, Scene.id == a.c.scene_id)
+        )
+    else:
+        (a_table, a_col), (b_table, b_col) = ENTRY_LINKS[subject], ENTRY_LINKS[other]
+        a, b = a_table.alias("a"), b_table.alias("b")
+        stmt = (
+            select(
+                literal(subject), a.c[a_col], literal(other), b.c[b_col],
+                func.count(),
+            )
+            .select_from(a)
+            .join(b, b.c.entry_id == a.c.entry_id)
+        )
+    stmt = stmt.group_by(a.c[a_col], b.c[b_col])
+    if ids is not None:
+        stmt = stmt.where(a.c[a_col].in_(ids))
+    return stmt
+
+
+def _rebuild(session: Session, subjects: Optional[Dict[str, Set[int]]]) -> int:
+    """
+    Replace the aggregate rows of some (or all) entities.
+
+    Args:
+        session: Active session
+        subjects: Entity type -> ids to rebuild (None = everything)
+
+    Returns:
+        Number of aggregate rows written
+    """
+    months = EntityMonthCount.__table__
+    pairs = EntityCoOccurrence.__table__
+    written = 0
+
+    def ids_of(entity_type: str) -> Optional[Set[int]]:
+        return None if subjects is None else subjects.get(entity_type, set())
+
+    for entity_type in ENTRY_LINKS:
+        for chunk in _chunks(ids_of(entity_type)):
+            delete = months.delete().where(months.c.entity_type == entity_type)
+            if chunk is not None:
+                delete = delete.where(months.c.entity_id.in_(chunk))
+            session.execute(delete)
+            written += session.execute(
+                months.insert().from_select(
+                    ["entity_type", "entity_id", "month", "entry_count"],
+                    _month_select(entity_type, chunk),
+                )
+            ).rowcount
+
+    for subject, other in ENTRY_PAIRS + SCENE_PAIRS:
+        for chunk in _chunks(ids_of(subject)):
+            delete = pairs.delete().where(
+                pairs.c.entity_type == subject, pairs.c.other_type == other
+            )
+            if chunk is not None:
+                delete = delete.where(pairs.c.entity_id.in_(chunk))
+            session.execute(delete)
+            written += session.execute(
+                pairs.insert().from_select(
+                    ["entity_type", "entity_id", "other_type", "other_id", "entry_count"],
+                    _pair_select(subject, other, chunk),
+                )
+            ).rowcount
+
+    return written
+
+
+def _affected_subjects(
+    session: Session, changed: Dict[str, Set[int]]
+) -> Optional[Dict[str, Set[int]]]:
+    """
+    Find the entities whose aggregate rows a set of changes can affect.
+
+    These are the changed entities themselves plus every entity linked
+    to a changed entry or scene (or theme/motif instance). Removed links
+    are covered by the change log, which touches both sides of a link.
+
+    Args:
+        session: Active session
+        changed: Table name -> changed ids, from the change log
+
+    Returns:
+        Entity type -> ids, or None when a full rebuild is needed
+    """
+    for model, name in ((Entry, "entries"), (Scene, "scenes")):
+        ids = changed.get(name, set())
+        if ids:
+            existing = set(session.execute(
+                select(model.id).where(model.id.in_(sorted(ids)))
+            ).scalars())
+            if ids - existing:
+                return None
+
+    subjects: Dict[str, Set[int]] = {
+        entity_type: set(changed.get(entity_type, ()))
+        for entity_type in ENTRY_LINKS
+    }
+    entries = sorted(changed.get("entries", ()))
+    scenes = sorted(changed.get("scenes", ()))
+    for entity_type, (link, column) in ENTRY_LINKS.items():
+        for start in range(0, len(entries), ID_CHUNK):
+            subjects[entity_type].update(session.execute(
+                select(link.c[column]).where(
+                    link.c.entry_id.in_(entries[start:start + ID_CHUNK])
+                )
+            ).scalars())
+    for entity_type, (link, column) in SCENE_LINKS.items():
+        for start in range(0, len(scenes), ID_CHUNK):
+            subjects[entity_type].update(session.execute(
+                select(link.c[column]).where(
+                    link.c.scene_id.in_(scenes[start:start + ID_CHUNK])
+                )
+            ).scalars())
+    for entity_type, model in (("themes", ThemeInstance), ("motifs", MotifInstance)):
+        instance_ids = sorted(changed.get(model.__tablename__, ()))
+        link_column = getattr(model, ENTRY_LINKS[entity_type][1])
+        for start in range(0, len(instance_ids), ID_CHUNK):
+            subjects[entity_type].update(session.execute(
+                select(link_column).where(
+                    model.id.in_(instance_ids[start:start + ID_CHUNK])
+                )
+            ).scalars())
+    return subjects
+
+
+def refresh_aggregates(session: Session, full: bool = False) -> int:
+    """
+    Bring the aggregate tables up to date with the session's data.
+
+    Without a change log (or on first run) every row is rebuilt;
+    otherwise only the rows of entities affected by changes since the
+    ``aggregates`` watermark. Pending ORM changes are flushed first.
+    A database without the aggregate tables is left alone.
+
+    Args:
+        session: Active session (caller commits)
+        full: Rebuild every row regardless of the watermark
+
+    Returns:
+        Number of aggregate rows written
+    """
+    session.flush()
+    inspector = inspect(session.get_bind())
+    if not inspector.has_table(EntityMonthCount.__tablename__):
+        return 0  # Database predates the aggregate tables
+    tracked = inspector.has_table(EntityChange.__tablename__)
+    watermark = get_watermark(session, AGGREGATES_CONSUMER) if tracked else None
+
+    if watermark is None or full:
+        head = latest_change_id(session) if tracked else None
+        written = _rebuild(session, None)
+    else:
+        head, changed = changes_since(session, watermark)
+        if head == watermark:
+            return 0
+        written = _rebuild(session, _affected_subjects(session, changed))
+
+    if head is not None:
+        set_watermark(session, AGGREGATES_CONSUMER, head)
+    return written
+
+
+class Aggregates:
+    """
+    Read-side cache of the aggregate tables.
+
+    Each table is loaded in one query the first time it is read, after
+    refreshing the tables, so a builder rendering thousands of pages
+    costs two queries rather than two per page. The refresh writes to
+    the session when the tables are behind the change log; pass
+    ``refresh=False`` for a strictly read-only view.
+
+    Attributes:
+        session: Session the counts are read with
+    """
+
+    def __init__(self, session: Session, refresh: bool = True) -> None:
+        """
+        Initialize aggregate reader.
+
+        Args:
+            session: Active session
+            refresh: Refresh the tables before the first read
+        """
+        self.session = session
+        self._refresh = refresh
+        self._months: Optional[Dict[Tuple[str, int], Dict[str, int]]] = None
+        self._pairs: Optional[Dict[Tuple[str, int, str], Dict[int, int]]] = None
+
+    def _ensure_fresh(self) -> None:
+        """Refresh the tables once, before the first read."""
+        if self._refresh:
+            refresh_aggregates(self.session)
+            self._refresh = False
+
+    def monthly_counts(self, entity_type: str, entity_id: int) -> Dict[str, int]:
+        """
+        Entries per month of one entity.
+
+        Args:
+            entity_type: Table name (a key of ENTRY_LINKS)
+            entity_id: Entity primary key
+
+        Returns:
+            "YYYY-MM" -> entry count, in month order
+        """
+        if self._months is None:
+            self._ensure_fresh()
+            months: Dict[Tuple[str, int], Dict[str, int]] = {}
+            table = EntityMonthCount.__table__
+            for row in self.session.execute(
+                select(table).order_by(table.c.month)
+            ):
+                months.setdefault(
+                    (row.entity_type, row.entity_id), {}
+                )[row.month] = row.entry_count
+            self._months = months
+        return dict(self._months.get((entity_type, entity_id), {}))
+
+    def co_occurrences(
+        self, entity_type: str, entity_id: int, other_type: str
+    ) -> Dict[int, int]:
+        """
+        Entries one entity shares with each entity of another type.
+
+        Args:
+            entity_type: Table name of the subject
+            entity_id: Subject primary key
+            other_type: Table name of the co-occurring entities
+
+        Returns:
+            Other id -> shared entries (the subject itself included when
+            both types match)
+        """
+        if self._pairs is None:
+            self._ensure_fresh()
+            pairs: Dict[Tuple[str, int, str], Dict[int, int]] = {}
+            for row in self.session.execute(select(EntityCoOccurrence.__table__)):
+                pairs.setdefault(
+                    (row.entity_type, row.entity_id, row.other_type), {}
+                )[row.other_id] = row.entry_count
+            self._pairs = pairs
+        return dict(self._pairs.get((entity_type, entity_id, other_type), {}))
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+bulk.py
+-------
+Set-based writes for bulk imports, through SQLAlchemy Core.
+
+Importing thousands of rows one ORM object at a time costs a SELECT, an
+INSERT or UPDATE and a flush per row. These helpers write a whole table's
+worth of rows in a few statements instead:
+
+    - bulk_upsert: ``INSERT ... ON CONFLICT DO UPDATE ... RETURNING``
+      keyed by a unique constraint, batched with executemany
+    - replace_links: make association-table rows match a desired
+      parent -> children mapping, inserting and deleting only the
+      difference
+
+Key Features:
+    - Rows whose values already match are not rewritten (the conflict
+      update has a ``WHERE ... IS NOT excluded...`` guard), so unchanged
+      data never bumps ``updated_at`` or lands in the change log
+    - Duplicate keys within one call collapse to the last row, as with
+      sequential ORM updates
+    - Written rows are recorded in the entity_changes log when tracking
+      is on, since Core statements bypass the after_flush hook
+
+Limitations:
+    - SQLite only (uses the sqlite dialect's upsert)
+    - The conflict target must be a unique constraint; rows whose key
+      has no constraint (e.g. NULL members) need the ORM path
+    - Statements bypass the session's identity map; do not mix with ORM
+      objects of the same table loaded earlier in the session
+
+Usage:
+    from dev.database.bulk import bulk_upsert, replace_links
+
+    ids = bulk_upsert(session, City, rows, ("name",), track=True)
+    # ids == {("Montreal",): 3} for rows inserted or changed
+    replace_links(session, entry_people, "entry_id", "person_id", {1: {4, 5}})
+"""
+# --- Annotations ---
+from __future__ import annotations
+
+# --- Standard library imports ---
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Sequence, Set, Tuple
+
+# --- Third-party imports ---
+from sqlalchemy import Table, and_, bindparam, or_, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+# --- Local imports ---
+from .change_tracking import record_changes
+
+
+# Parent ids per SELECT ... IN (...) when reading existing links
+LINK_QUERY_CHUNK = 500
+
+
+def bulk_upsert(
+    session: Session,
+    model: Any,
+    rows: List[Dict[str, Any]],
+    key_columns: Sequence[str],
+    track: bool = False,
+) -> Dict[Tuple[Any, ...], int]:
+    """
+    Insert or update rows keyed by a unique constraint.
+
+    Columns not in ``key_columns`` are overwritten on conflict, but only
+    for rows where at least one of them differs. ``updated_at`` is bumped
+    on those rows when the table has one.
+
+    Args:
+        session: Active session (the statements join its transaction)
+        model: ORM model class of the target table
+        rows: Column -> value dicts, all with the same columns
+        key_columns: Columns of the unique constraint to conflict on
+        track: Record written rows (and the rows their foreign keys
+            point at) in the change log
+
+    Returns:
+        Key tuple -> id for every row inserted or changed. Unchanged
+        rows are omitted; their ids are already known to the caller.
+    """
+    if not rows:
+        return {}
+
+    table: Table = model.__table__
+    unique = {tuple(row[c] for c in key_columns): row for row in rows}
+    update_columns = [c for c in next(iter(unique.values())) if c not in key_columns]
+
+    stmt = sqlite_insert(table)
+    if update_columns:
+        set_: Dict[str, Any] = {c: stmt.excluded[c] for c in update_columns}
+        if "updated_at" in table.c and "updated_at" not in set_:
+            set_["updated_at"] = datetime.now(timezone.utc)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(key_columns),
+            set_=set_,
+            where=or_(
+                *(table.c[c].is_distinct_from(stmt.excluded[c]) for c in update_columns)
+            ),
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=list(key_columns))
+    stmt = stmt.returning(table.c.id, *(table.c[c] for c in key_columns))
+
+    written = {
+        tuple(key): id_
+        for id_, *key in session.execute(stmt, list(unique.values()))
+    }
+
+    if track and written:
+        changes: List[Tuple[str, int, str]] = []
+        for key, id_ in written.items():
+            changes.append((table.name, id_, "update"))
+            row = unique.get(key, {})
+            for column in table.columns:
+                for fk in column.foreign_keys:
+                    value = row.get(column.name)
+                    if isinstance(value, int):
+                        changes.append((fk.column.table.name, value, "touch"))
+        record_changes(session, changes)
+
+    return written
+
+
+def replace_links(
+    session: Session,
+    table: Table,
+    parent_column: str,
+    child_column: str,
+    links: Dict[int, Set[int]],
+    track: bool = False,
+) -> int:
+    """
+    Make each parent's association rows match the desired children.
+
+    Only parents present in ``links`` are touched; an empty set clears
+    that parent's links.
+
+    Args:
+        session: Active session (the statements join its transaction)
+        table: Association table
+        parent_column: Column holding the parent id
+        child_column: Column holding the child id
+        links: Parent id -> desired child ids
+        track: Record changed parents (as updates) and the children
+            linked or unlinked (as touches) in the change log
+
+    Returns:
+        Number of association rows inserted or deleted
+    """
+    if not links:
+        return 0
+
+    parent_col, child_col = table.c[parent_column], table.c[child_column]
+    existing: Dict[int, Set[int]] = {parent: set() for parent in links}
+    parents = list(links)
+    for start in range(0, len(parents), LINK_QUERY_CHUNK):
+        chunk = parents[start:start + LINK_QUERY_CHUNK]
+        for parent, child in session.execute(
+            select(parent_col, child_col).where(parent_col.in_(chunk))
+        ):
+            existing[parent].add(child)
+
+    added = [
+        {parent_column: parent, child_column: child}
+        for parent, children in links.items()
+        for child in sorted(children - existing[parent])
+    ]
+    removed = [
+        {"b_parent": parent, "b_child": child}
+        for parent, children in existing.items()
+        for child in sorted(children - links[parent])
+    ]
+
+    if removed:
+        session.execute(
+            table.delete().where(
+                and_(
+                    parent_col == bindparam("b_parent"),
+                    child_col == bindparam("b_child"),
+                )
+            ),
+            removed,
+        )
+    if added:
+        session.execute(table.insert(), added)
+
+    if track and (added or removed):
+        parent_table = next(iter(parent_col.foreign_keys)).column.table.name
+        child_table = next(iter(child_col.foreign_keys)).column.table.name
+        pairs = [(row[parent_column], row[child_column]) for row in added]
+        pairs += [(row["b_parent"], row["b_child"]) for row in removed]
+        changes: List[Tuple[str, int, str]] = []
+        for parent, child in pairs:
+            changes.append((parent_table, parent, "update"))
+            changes.append((child_table, child, "touch"))
+        record_changes(session, changes)
+
+    return len(added) + len(removed)
+
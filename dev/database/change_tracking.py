@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+change_tracking.py
+------------------
+Record ORM writes in the entity_changes log and read them back.
+
+A session ``after_flush`` hook walks the flushed objects and appends one
+EntityChange row per written row, plus ``touch`` rows for the rows they
+reference (many-to-one targets and many-to-many partners). Consumers
+keep a ChangeWatermark and ask for everything after it, so incremental
+jobs cost O(changes) instead of O(archive).
+
+Key Features:
+    - Installed once per session factory by PalimpsestDB
+    - insert / update / delete rows for every mapped table with an
+      integer primary key (the log and watermark tables excluded)
+    - Touch rows make a child's insert, delete or update visible on its
+      parent, e.g. a new or renamed scene touches its entry
+    - Rows are written on the flush's own connection, so a rollback
+      discards them with the data they describe
+    - Rows below every consumer's watermark are pruned; a consumer that
+      falls more than WATERMARK_MAX_LAG changes or WATERMARK_MAX_AGE
+      behind loses its watermark, so one that is never run (a wiki
+      section nobody regenerates) cannot hold the log back forever.
+      Such a consumer sees no watermark next time and rebuilds in full
+
+Limitations:
+    - Core-level statements (``session.execute(update(...))``, raw SQL)
+      bypass the ORM flush; callers record them with record_changes()
+      (dev.database.bulk does so for its upserts)
+
+Usage:
+    from dev.database.change_tracking import changes_since, set_watermark
+
+    head, changed = changes_since(session, get_watermark(session, "json_export"))
+    # changed == {"entries": {12, 15}, "scenes": {40}}
+    set_watermark(session, "json_export", head)
+"""
+# --- Annotations ---
+from __future__ import annotations
+
+# --- Standard library imports ---
+import weakref
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# --- Third-party imports ---
+from sqlalchemy import event, func, inspect, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm.exc import UnmappedColumnError
+from sqlalchemy.orm.interfaces import MANYTOMANY, MANYTOONE
+from sqlalchemy.orm.state import InstanceState
+
+# --- Local imports ---
+from dev.database.models import ChangeWatermark, EntityChange
+
+
+# Tables never recorded in the log
+UNTRACKED_TABLES = frozenset({
+    EntityChange.__tablename__,
+    ChangeWatermark.__tablename__,
+    "schema_info",
+})
+
+# Factories the hook is installed on. event.contains() is keyed by id()
+# and can report a new factory reusing a collected one's address as
+# already listening, so installation is tracked here instead
+_TRACKED_FACTORIES: "weakref.WeakSet[sessionmaker]" = weakref.WeakSet()
+
+# Order rows are written within one flush; the last operation per row wins
+OPERATIONS = ("touch", "insert", "update", "delete")
+
+# A consumer further behind the log head than this, in changes or in time
+# since its watermark last moved, is dropped and rebuilds in full
+WATERMARK_MAX_LAG = 200_000
+WATERMARK_MAX_AGE = timedelta(days=90)
+
+
+def install_change_tracking(session_factory: sessionmaker, engine: Engine) -> bool:
+    """
+    Register the after_flush hook on a session factory.
+
+    Skipped when the database predates the change log (run
+    ``plm db upgrade`` to enable tracking).
+
+    Args:
+        session_factory: Factory whose sessions should be tracked
+        engine: Engine the factory is bound to
+
+    Returns:
+        True if tracking was installed
+    """
+    if not inspect(engine).has_table(EntityChange.__tablename__):
+        return False
+    if session_factory not in _TRACKED_FACTORIES:
+        event.listen(session_factory, "after_flush", record_flush_changes)
+        _TRACKED_FACTORIES.add(session_factory)
+    return True
+
+
+def _entity_id(state: InstanceState) -> Optional[int]:
+    """Return the integer primary key of a tracked row, without loading."""
+    mapper = state.mapper
+    if mapper.local_table.name in UNTRACKED_TABLES or len(mapper.primary_key) != 1:
+        return None
+    prop = mapper.get_property_by_column(mapper.primary_key[0])
+    value = state.dict.get(prop.key)
+    return value if isinstance(value, int) else None
+
+
+def _referenced_rows(state: InstanceState, operation: str) -> List[Tuple[str, int]]:
+    """
+    List the rows a flushed object points at.
+
+    Covers foreign-key columns (even when the relationship attribute was
+    never set) and many-to-one / many-to-many relationships. Updates
+    report references that were added or removed, plus the targets of
+    non-nullable foreign keys (the row's owners).
+
+    Args:
+        state: Instance state of a flushed object
+        operation: insert, update or delete
+
+    Returns:
+        (table_name, id) pairs to touch
+    """
+    mapper = state.mapper
+    rows: List[Tuple[str, int]] = []
+
+    for column in mapper.local_table.columns:
+        for fk in column.foreign_keys:
+            target = fk.column
+            if target.table.name in UNTRACKED_TABLES or not target.primary_key:
+                continue
+            try:
+                prop = mapper.get_property_by_column(column)
+            except UnmappedColumnError:
+                continue
+            history = state.attrs[prop.key].history
+            if operation != "update":
+                values = history.sum()
+            elif column.nullable:
+                values = list(history.added) + list(history.deleted)
+            else:
+                # A required FK names the row's owner (scenes.entry_id),
+                # whose view embeds this row even when the FK is unchanged
+                values = history.sum()
+            rows.extend(
+                (target.table.name, value) for value in values if isinstance(value, int)
+            )
+
+    for rel in mapper.relationships:
+        if rel.direction not in (MANYTOONE, MANYTOMANY):
+            continue
+        history = state.attrs[rel.key].history
+        related = (
+            list(history.added) + list(history.deleted)
+            if operation == "update"
+            else history.sum()
+        )
+        for obj in related:
+            if obj is None:
+                continue
+            related_state = inspect(obj)
+            related_id = _entity_id(related_state)
+            if related_id is not None:
+                rows.append((related_state.mapper.local_table.name, related_id))
+
+    return rows
+
+
+def record_flush_changes(session: Session, flush_context: Any) -> None:
+    """
+    after_flush hook: append EntityChange rows for the flushed objects.
+
+    Args:
+        session: Session being flushed
+        flush_context: Unit-of-work context of the flush
+    """
+    changes: Dict[str, Dict[Tuple[str, int], None]] = {op: {} for op in OPERATIONS}
+
+    def note(state: InstanceState, operation: str) -> None:
+        entity_id = _entity_id(state)
+        if entity_id is None:
+            return
+        changes[operation][(state.mapper.local_table.name, entity_id)] = None
+        for target in _referenced_rows(state, operation):
+            if target[0] not in UNTRACKED_TABLES:
+                changes["touch"][target] = None
+
+    for obj in session.new:
+        note(inspect(obj), "insert")
+    for obj in session.dirty:
+        state = inspect(obj)
+        if flush_context.states.get(state, (False, False))[0]:
+            # Orphan removed from a delete-orphan collection
+            note(state, "delete")
+        elif session.is_modified(obj):
+            note(state, "update")
+    for obj in session.deleted:
+        note(inspect(obj), "delete")
+
+    rows = [
+        {"table_name": table_name, "entity_id": entity_id, "operation": operation}
+        for operation in OPERATIONS
+        for table_name, entity_id in changes[operation]
+    ]
+    if rows:
+        session.connection().execute(EntityChange.__table__.insert(), rows)
+
+
+def record_changes(
+    session: Session, changes: Iterable[Tuple[str, int, str]]
+) -> None:
+    """
+    Append EntityChange rows for writes made outside the ORM flush.
+
+    Args:
+        session: Session whose transaction made the writes
+        changes: (table_name, entity_id, operation) triples; untracked
+            tables are ignored
+    """
+    rows = [
+        {"table_name": table_name, "entity_id": entity_id, "operation": operation}
+        for table_name, entity_id, operation in dict.fromkeys(changes)
+        if table_name not in UNTRACKED_TABLES
+    ]
+    if rows:
+        session.connection().execute(EntityChange.__table__.insert(), rows)
+
+
+def get_watermark(session: Session, consumer: str) -> Optional[int]:
+    """
+    Return the last change id a consumer processed.
+
+    Args:
+        session: Active session
+        consumer: Consumer name
+
+    Returns:
+        Change id, or None if the consumer has never run
+    """
+    watermark = session.get(ChangeWatermark, consumer)
+    return watermark.change_id if watermark is not None else None
+
+
+def latest_change_id(session: Session) -> int:
+    """
+    Return the id of the newest change (0 if nothing was ever recorded).
+
+    Falls back to the highest watermark when every row has been pruned.
+
+    Args:
+        session: Active session
+
+    Returns:
+        Newest change id
+    """
+    head = session.execute(select(func.max(EntityChange.id))).scalar()
+    if head is None:
+        head = session.execute(select(func.max(ChangeWatermark.change_id))).scalar()
+    return head or 0
+
+
+def changes_since(
+    session: Session, change_id: int
+) -> Tuple[int, Dict[str, Set[int]]]:
+    """
+    Collect the rows changed after a watermark.
+
+    Args:
+        session: Active session (read in the same transaction as the
+            data the consumer exports, so the snapshot is consistent)
+        change_id: Watermark to read after
+
+    Returns:
+        (head, changed) where head is the new watermark and changed maps
+        table name to the ids of changed rows (deleted rows included)
+    """
+    head = latest_change_id(session)
+    changed: Dict[str, Set[int]] = {}
+    rows = session.execute(
+        select(EntityChange.table_name, EntityChange.entity_id)
+        .where(EntityChange.id > change_id, EntityChange.id <= head)
+    )
+    for table_name, entity_id in rows:
+        changed.setdefault(table_name, set()).add(entity_id)
+    return max(head, change_id), changed
+
+
+def set_watermark(session: Session, consumer: str, change_id: int) -> None:
+    """
+    Move a consumer's watermark and prune rows every consumer has seen.
+
+    Other consumers behind the head by more than WATERMARK_MAX_LAG
+    changes, or behind it with a watermark unmoved for
+    WATERMARK_MAX_AGE, are dropped first (their next run starts from
+    scratch).
+
+    Args:
+        session: Active session (caller commits)
+        consumer: Consumer name
+        change_id: Last processed change id
+    """
+    watermark = session.get(ChangeWatermark, consumer)
+    if watermark is None:
+        session.add(ChangeWatermark(consumer=consumer, change_id=change_id))
+    else:
+        watermark.change_id = change_id
+    session.flush()
+
+    head = latest_change_id(session)
+    cutoff = datetime.now(timezone.utc) - WATERMARK_MAX_AGE
+    session.execute(
+        ChangeWatermark.__table__.delete().where(
+            ChangeWatermark.consumer != consumer,
+            ChangeWatermark.change_id < head,
+            (ChangeWatermark.change_id < head - WATERMARK_MAX_LAG)
+            | (ChangeWatermark.updated_at < cutoff),
+        )
+    )
+
+    oldest = session.execute(select(func.min(ChangeWatermark.change_id))).scalar()
+    if oldest:
+        session.execute(
+            EntityChange.__table__.delete().where(EntityChange.id <= oldest)
+        )
@@ -10,12 +10,19 @@ Key Features:
     - get_db(): Create PalimpsestDB from Click context
     - Command modules: setup, migration, backup, query, maintenance, prune
 """
-from dev.database import PalimpsestDB
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from dev.database.manager import PalimpsestDB
 
 
 def get_db(ctx) -> PalimpsestDB:
     """Get or create database instance from context."""
     if "db" not in ctx.obj:
+        from dev.database.manager import PalimpsestDB
+
         ctx.obj["db"] = PalimpsestDB(
             db_path=ctx.obj["db_path"],
             alembic_dir=ctx.obj["alembic_dir"],
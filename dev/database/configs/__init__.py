@@ -5,4 +5,5 @@ Database configuration modules.
 This package contains declarative configurations for database operations:
 - json_export_configs: Entity serialization for JSON export
 - integrity_check_configs: Database health check definitions
+- connection_profiles: SQLite PRAGMA presets applied on connect
 """
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+connection_profiles.py
+----------------------
+
+SQLite connection profiles applied to every new database connection.
+
+A profile is a named set of PRAGMAs (journal mode, cache and mmap sizes,
+busy timeout, ...) that PalimpsestDB installs through a SQLAlchemy
+``connect`` event. Two presets are shipped:
+
+- interactive: short-lived ``plm`` calls from the Neovim plugin; small
+  memory footprint, moderate busy timeout so concurrent calls wait for
+  each other instead of failing.
+- bulk_import: ``plm sync`` and other long-running imports; large page
+  cache and mmap window, long busy timeout and rarer WAL checkpoints.
+
+Both presets use WAL journaling, so readers never block on a running
+writer and a ``plm sync`` no longer locks out editor queries.
+
+The active profile defaults to ``database.profile`` in
+``.palimpsest.yaml`` (``interactive`` if unset); individual PRAGMAs can be
+overridden under ``database.pragmas``.
+"""
+# --- Annotations ---
+from __future__ import annotations
+
+# --- Standard library imports ---
+from dataclasses import dataclass, fields, replace
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# --- Local imports ---
+from dev.core.config import get_database_config
+from dev.core.exceptions import DatabaseError
+
+
+@dataclass(frozen=True)
+class ConnectionProfile:
+    """
+    Named set of SQLite PRAGMAs applied on connect.
+
+    Attributes:
+        name: Profile name (e.g., "interactive")
+        journal_mode: Journal mode (WAL lets readers run alongside a writer)
+        synchronous: Sync level (NORMAL is durable enough under WAL)
+        cache_size: Page cache size; negative values are KiB
+        mmap_size: Bytes of the database file to memory-map
+        temp_store: Where temporary tables and indices live
+        busy_timeout: Milliseconds to wait on a locked database
+        foreign_keys: Enforce foreign key constraints (ON DELETE CASCADE)
+        wal_autocheckpoint: Pages written before an automatic checkpoint
+    """
+
+    name: str
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    cache_size: int = -16_000
+    mmap_size: int = 64 * 1024 * 1024
+    temp_store: str = "MEMORY"
+    busy_timeout: int = 5_000
+    foreign_keys: bool = True
+    wal_autocheckpoint: int = 1_000
+
+    def pragmas(self) -> List[Tuple[str, Any]]:
+        """
+        List the PRAGMAs of this profile in application order.
+
+        Returns:
+            List of (pragma name, value) pairs
+        """
+        return [
+            ("busy_timeout", self.busy_timeout),
+            ("journal_mode", self.journal_mode),
+            ("synchronous", self.synchronous),
+            ("cache_size", self.cache_size),
+            ("mmap_size", self.mmap_size),
+            ("temp_store", self.temp_store),
+            ("foreign_keys", "ON" if self.foreign_keys else "OFF"),
+            ("wal_autocheckpoint", self.wal_autocheckpoint),
+        ]
+
+    def apply(self, dbapi_connection: Any) -> None:
+        """
+        Apply the profile to a raw DBAPI (sqlite3) connection.
+
+        Args:
+            dbapi_connection: Newly opened sqlite3 connection
+        """
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma, value in self.pragmas():
+                cursor.execute(f"PRAGMA {pragma}={value}")
+        finally:
+            cursor.close()
+
+    def with_overrides(self, overrides: Dict[str, Any]) -> "ConnectionProfile":
+        """
+        Return a copy of this profile with some PRAGMAs replaced.
+
+        Args:
+            overrides: Mapping of attribute name to new value
+
+        Returns:
+            New ConnectionProfile
+
+        Raises:
+            DatabaseError: If an override names an unknown PRAGMA
+        """
+        known = {f.name for f in fields(self)} - {"name"}
+        unknown = set(overrides) - known
+        if unknown:
+            raise DatabaseError(
+                f"Unknown connection pragma(s): {', '.join(sorted(unknown))}"
+            )
+        return replace(self, **overrides)
+
+
+INTERACTIVE_PROFILE = ConnectionProfile(name="interactive")
+
+BULK_IMPORT_PROFILE = ConnectionProfile(
+    name="bulk_import",
+    cache_size=-131_072,
+    mmap_size=512 * 1024 * 1024,
+    busy_timeout=30_000,
+    wal_autocheckpoint=10_000,
+)
+
+CONNECTION_PROFILES: Dict[str, ConnectionProfile] = {
+    INTERACTIVE_PROFILE.name: INTERACTIVE_PROFILE,
+    BULK_IMPORT_PROFILE.name: BULK_IMPORT_PROFILE,
+}
+
+
+def resolve_profile(
+    profile: Union[str, ConnectionProfile, None] = None,
+    overrides: Optional[Dict[str, Any]] = None,
+) -> ConnectionProfile:
+    """
+    Resolve a profile name or instance, applying configured overrides.
+
+    When ``profile`` is None, the ``database`` section of the project
+    config selects the preset and supplies PRAGMA overrides.
+
+    Args:
+        profile: Preset name, ConnectionProfile instance, or None
+        overrides: Extra PRAGMA overrides (take precedence over config)
+
+    Returns:
+        Resolved ConnectionProfile
+
+    Raises:
+        DatabaseError: If the preset name is unknown
+    """
+    cfg = get_database_config()
+    pragma_overrides: Dict[str, Any] = {}
+
+    if profile is None:
+        profile = cfg["profile"]
+        pragma_overrides.update(cfg["pragmas"])
+
+    if isinstance(profile, str):
+        if profile not in CONNECTION_PROFILES:
+            raise DatabaseError(
+                f"Unknown connection profile '{profile}'. "
+                f"Available: {', '.join(sorted(CONNECTION_PROFILES))}"
+            )
+        profile = CONNECTION_PROFILES[profile]
+
+    pragma_overrides.update(overrides or {})
+    if pragma_overrides:
+        profile = profile.with_overrides(pragma_overrides)
+    return profile
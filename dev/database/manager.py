@@ -19,6 +19,8 @@ Handles:
 Key Features:
     - Transaction management with automatic rollback
     - Retry logic for database lock handling
+    - Tuned SQLite connection profiles (WAL, cache, mmap, busy_timeout)
+    - Change log of ORM writes for incremental exports
     - Optimized relationship loading
     - Validation and normalization of inputs
     - Comprehensive error handling and logging
@@ -82,7 +84,7 @@ from pathlib import Path
 from typing import Any, Dict, Optional, Union, List, Type, TypeVar
 
 # --- Third party ---
-from sqlalchemy import create_engine, Engine
+from sqlalchemy import create_engine, event, Engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from alembic.config import Config
@@ -94,6 +96,8 @@ from dev.core.backup_manager import BackupManager
 from dev.core.exceptions import DatabaseError
 from dev.core.paths import ROOT
 from dev.core.logging_manager import PalimpsestLogger, safe_logger
+from .change_tracking import install_change_tracking
+from .configs.connection_profiles import ConnectionProfile, resolve_profile
 from .models import (
     Base,
     Location,
@@ -181,6 +185,7 @@ class PalimpsestDB:
         - alembic_dir (str | Path): Filesystem path to the Alembic directory.
         - engine (Engine): SQLAlchemy engine instance.
         - SessionLocal (sessionmaker): SQLAlchemy session factory.
+        - profile (ConnectionProfile): PRAGMAs applied to every connection.
 
     Handles:
         - Connection/session management
@@ -216,6 +221,7 @@ class PalimpsestDB:
         log_dir: Optional[Union[str, Path]] = None,
         backup_dir: Optional[Union[str, Path]] = None,
         enable_auto_backup: bool = True,
+        profile: Optional[Union[str, ConnectionProfile]] = None,
     ) -> None:
         """
         Initialize database engine and session factory.
@@ -226,10 +232,14 @@ class PalimpsestDB:
             log_dir (str | Path): Directory for log files (optional)
             backup_dir (str | Path): Directory for backups (optional)
             enable_auto_backup (bool): Whether to enable automatic backups
+            profile (str | ConnectionProfile): Connection profile name
+                ("interactive", "bulk_import") or instance; defaults to
+                the ``database.profile`` config value
 
         """
         self.db_path = Path(db_path).expanduser().resolve()
         self.alembic_dir = Path(alembic_dir).expanduser().resolve() if alembic_dir else None
+        self.profile: ConnectionProfile = resolve_profile(profile)
 
         # --- Logging ---
         if log_dir:
@@ -283,6 +293,7 @@ class PalimpsestDB:
                 {
                     "db_path": str(self.db_path),
                     "alembic_dir": str(self.alembic_dir),
+                    "profile": self.profile.name,
                 },
             )
 
@@ -293,7 +304,9 @@ class PalimpsestDB:
                 echo=False,
                 future=True,
                 pool_pre_ping=True,
+                connect_args={"timeout": self.profile.busy_timeout / 1000},
             )
+            event.listen(self.engine, "connect", self._apply_profile)
 
             self.SessionLocal: sessionmaker = sessionmaker(
                 bind=self.engine,
@@ -307,12 +320,22 @@ class PalimpsestDB:
             if not self.db_path.exists():
                 self.initialize_schema()
 
+            # Record ORM writes for incremental consumers (JSON export)
+            self.tracks_changes: bool = install_change_tracking(
+                self.SessionLocal, self.engine
+            )
+
             safe_logger(self.logger).log_operation("database_init_complete", {"success": True})
 
         except Exception as e:
             safe_logger(self.logger).log_error(e, {"operation": "database_init"})
             raise DatabaseError(f"Database initialization failed: {e}")
 
+    def _apply_profile(self, dbapi_connection: Any, connection_record: Any) -> None:
+        """Apply the connection profile PRAGMAs to a new DBAPI connection."""
+        del connection_record
+        self.profile.apply(dbapi_connection)
+
     # --- Session Management ---
     @contextmanager
     def session_scope(self):
@@ -171,6 +171,8 @@ class BaseManager(ABC):
             - For string-based columns, value should be a str
             - For dates or other types, pass the appropriate Python types
             - The new object is added to the session and flushed immediately
+            - A conflicting insert is rolled back to a savepoint, so
+              earlier uncommitted work in the session survives
         """
         # Try to get existing first
         obj = self.session.query(model_class).filter_by(**lookup_fields).first()
@@ -183,13 +185,14 @@ class BaseManager(ABC):
             fields.update(extra_fields)
 
         try:
-            obj = model_class(**fields)
-            self.session.add(obj)
-            self.session.flush()
+            # Savepoint: a conflict undoes only this insert, not the
+            # caller's transaction (e.g. an importer's uncommitted batch)
+            with self.session.begin_nested():
+                obj = model_class(**fields)
+                self.session.add(obj)
             return obj
         except IntegrityError:
             # Handle race condition - another process might have created it
-            self.session.rollback()
             obj = self.session.query(model_class).filter_by(**lookup_fields).first()
             if obj:
                 return obj
@@ -38,6 +38,12 @@ Manuscript Domain:
     - manuscript: Part, Chapter, Character, PersonCharacterMap,
                   ManuscriptScene, ManuscriptSource, ManuscriptReference
 
+Change Tracking:
+    - tracking: EntityChange, ChangeWatermark
+
+Aggregates:
+    - aggregates: EntityMonthCount, EntityCoOccurrence, WikilinkTarget
+
 Usage:
     from dev.database.models import Entry, Scene, Person, Chapter
 """
@@ -103,6 +109,12 @@ from .manuscript import (
     PersonCharacterMap,
 )
 
+# --- Change tracking models ---
+from .tracking import ChangeWatermark, EntityChange
+
+# --- Aggregate models ---
+from .aggregates import EntityCoOccurrence, EntityMonthCount, WikilinkTarget
+
 __all__ = [
     # Base
     "Base",
@@ -167,4 +179,11 @@ __all__ = [
     "ManuscriptSource",
     "Part",
     "PersonCharacterMap",
+    # Change tracking
+    "ChangeWatermark",
+    "EntityChange",
+    # Aggregates
+    "EntityCoOccurrence",
+    "EntityMonthCount",
+    "WikilinkTarget",
 ]
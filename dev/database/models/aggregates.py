@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+aggregates.py
+-------------
+Materialized aggregate models for the Palimpsest database.
+
+Models:
+    - EntityMonthCount: Entries per month for one entity (timelines)
+    - EntityCoOccurrence: Entries shared by two entities (co-mention and
+      co-occurrence matrices)
+    - WikilinkTarget: Wikilink name and wiki path of one entity
+
+All tables are derived data: dev.database.aggregates (counts) and
+dev.wiki.link_targets (wikilinks) rebuild the rows of the entities an
+import touched, so wiki pages, analytics and the linter read them
+instead of rescanning the journal.
+
+Design:
+    - Entities are keyed by table name and id (e.g. ``("tags", 4)``), so
+      one table holds the counts of every entity type
+    - No ORM relationships; rows are written with Core statements
+    - A pair is stored in both directions; the diagonal (an entity with
+      itself) holds the entity's own entry count
+"""
+# --- Annotations ---
+from __future__ import annotations
+
+# --- Third party imports ---
+from sqlalchemy import Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+# --- Local imports ---
+from .base import Base
+
+
+class EntityMonthCount(Base):
+    """
+    Number of entries of one entity in one month.
+
+    Attributes:
+        entity_type: Table name of the entity (e.g. "tags")
+        entity_id: Primary key of the entity
+        month: Month as "YYYY-MM"
+        entry_count: Entries of the entity dated in that month
+    """
+
+    __tablename__ = "agg_entity_months"
+
+    entity_type: Mapped[str] = mapped_column(
+        String(32), primary_key=True, doc="Table name of the entity"
+    )
+    entity_id: Mapped[int] = mapped_column(
+        Integer, primary_key=True, doc="Primary key of the entity"
+    )
+    month: Mapped[str] = mapped_column(
+        String(7), primary_key=True, doc="Month as YYYY-MM"
+    )
+    entry_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, doc="Entries in the month"
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<EntityMonthCount({self.entity_type}#{self.entity_id} "
+            f"{self.month}={self.entry_count})>"
+        )
+
+
+class EntityCoOccurrence(Base):
+    """
+    Number of entries two entities share.
+
+    Person-location pairs count entries where the person and the
+    location appear in the same scene; every other pair counts entries
+    linked to both entities.
+
+    Attributes:
+        entity_type: Table name of the subject entity
+        entity_id: Primary key of the subject entity
+        other_type: Table name of the co-occurring entity
+        other_id: Primary key of the co-occurring entity
+        entry_count: Shared entries
+    """
+
+    __tablename__ = "agg_co_occurrences"
+
+    entity_type: Mapped[str] = mapped_column(
+        String(32), primary_key=True, doc="Table name of the subject"
+    )
+    entity_id: Mapped[int] = mapped_column(
+        Integer, primary_key=True, doc="Primary key of the subject"
+    )
+    other_type: Mapped[str] = mapped_column(
+        String(32), primary_key=True, doc="Table name of the other entity"
+    )
+    other_id: Mapped[int] = mapped_column(
+        Integer, primary_key=True, doc="Primary key of the other entity"
+    )
+    entry_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, doc="Shared entries"
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<EntityCoOccurrence({self.entity_type}#{self.entity_id} "
+            f"{self.other_type}#{self.other_id}={self.entry_count})>"
+        )
+
+
+class WikilinkTarget(Base):
+    """
+    Wikilink name and absolute wiki path of one entity.
+
+    Attributes:
+        entity_type: Table name of the entity (e.g. "people")
+        entity_id: Primary key of the entity
+        name: Name wikilinks use (display name, title or ISO date)
+        path: Absolute wiki path without extension
+    """
+
+    __tablename__ = "wikilink_targets"
+
+    entity_type: Mapped[str] = mapped_column(
+        String(32), primary_key=True, doc="Table name of the entity"
+    )
+    entity_id: Mapped[int] = mapped_column(
+        Integer, primary_key=True, doc="Primary key of the entity"
+    )
+    name: Mapped[str] = mapped_column(
+        String(255), nullable=False, doc="Wikilink name"
+    )
+    path: Mapped[str] = mapped_column(
+        String(255), nullable=False, doc="Absolute wiki path"
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<WikilinkTarget({self.entity_type}#{self.entity_id} "
+            f"{self.name!r} -> {self.path})>"
+        )
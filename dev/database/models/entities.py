@@ -135,6 +135,32 @@ class Person(Base, SoftDeleteMixin):
         else:
             return name_slug
 
+    @staticmethod
+    def format_display_name(
+        name: str, lastname: Optional[str], disambiguator: Optional[str]
+    ) -> str:
+        """
+        Build a display name from name components.
+
+        Lets index queries that select name columns (not Person
+        instances) render the same names as ``display_name``.
+
+        Args:
+            name: First/given name
+            lastname: Last/family name
+            disambiguator: Context tag
+
+        Returns:
+            - "Name Lastname" if lastname exists
+            - "Name (disambiguator)" if no lastname but disambiguator exists
+            - "Name" otherwise
+        """
+        if lastname:
+            return f"{name} {lastname}"
+        if disambiguator:
+            return f"{name} ({disambiguator})"
+        return name
+
     # --- Relationships ---
     aliases: Mapped[List["PersonAlias"]] = relationship(
         "PersonAlias", back_populates="person", cascade="all, delete-orphan"
@@ -155,18 +181,10 @@ class Person(Base, SoftDeleteMixin):
     # --- Computed properties ---
     @property
     def display_name(self) -> str:
-        """Get display name for human readability.
-
-        Returns:
-            - "Name Lastname" if lastname exists
-            - "Name (disambiguator)" if no lastname but disambiguator exists
-            - "Name" otherwise
-        """
-        if self.lastname:
-            return f"{self.name} {self.lastname}"
-        if self.disambiguator:
-            return f"{self.name} ({self.disambiguator})"
-        return self.name
+        """Get display name for human readability (see format_display_name)."""
+        return self.format_display_name(
+            self.name, self.lastname, self.disambiguator
+        )
 
     @property
     def lookup_key(self) -> str:
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+tracking.py
+-----------
+Change tracking models for the Palimpsest database.
+
+Models:
+    - EntityChange: Append-only log of ORM writes, one row per changed row
+    - ChangeWatermark: Last change each downstream consumer has processed
+
+The log is fed by a session ``after_flush`` hook (see
+dev.database.change_tracking), so consumers such as the JSON exporter
+can ask "what changed since I last ran?" instead of rescanning every
+table.
+
+Design:
+    - ``id`` is a monotonically increasing sequence; watermarks store it
+    - Rows are keyed by table name and primary key, not by ORM class
+    - Rows older than every consumer's watermark are pruned
+"""
+# --- Annotations ---
+from __future__ import annotations
+
+# --- Standard library imports ---
+from datetime import datetime, timezone
+
+# --- Third party imports ---
+from sqlalchemy import DateTime, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+# --- Local imports ---
+from .base import Base
+
+
+class EntityChange(Base):
+    """
+    One recorded change to a tracked row.
+
+    Operations:
+        - insert / update / delete: The row itself was written
+        - touch: A row referencing this one was written (e.g. a scene
+          added to an entry touches the entry)
+
+    Attributes:
+        id: Change sequence number (primary key, autoincrement)
+        table_name: Name of the changed table
+        entity_id: Primary key of the changed row
+        operation: insert, update, delete or touch
+        changed_at: When the flush happened
+    """
+
+    __tablename__ = "entity_changes"
+    __table_args__ = (
+        Index("ix_entity_changes_table_entity", "table_name", "entity_id"),
+        # Never reuse ids after pruning, or watermarks would skip changes
+        {"sqlite_autoincrement": True},
+    )
+
+    id: Mapped[int] = mapped_column(
+        Integer, primary_key=True, autoincrement=True, doc="Change sequence number"
+    )
+    table_name: Mapped[str] = mapped_column(
+        String(64), nullable=False, doc="Name of the changed table"
+    )
+    entity_id: Mapped[int] = mapped_column(
+        Integer, nullable=False, doc="Primary key of the changed row"
+    )
+    operation: Mapped[str] = mapped_column(
+        String(8), nullable=False, doc="insert, update, delete or touch"
+    )
+    changed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        doc="Timestamp of the flush that recorded the change",
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<EntityChange(id={self.id}, {self.operation} "
+            f"{self.table_name}#{self.entity_id})>"
+        )
+
+
+class ChangeWatermark(Base):
+    """
+    Position of a downstream consumer in the change log.
+
+    Attributes:
+        consumer: Consumer name (primary key, e.g. "json_export")
+        change_id: Highest EntityChange.id the consumer has processed
+        updated_at: When the watermark last moved
+    """
+
+    __tablename__ = "change_watermarks"
+
+    consumer: Mapped[str] = mapped_column(
+        String(64), primary_key=True, doc="Consumer name"
+    )
+    change_id: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, doc="Last processed change id"
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        doc="Timestamp of the last watermark update",
+    )
+
+    def __repr__(self) -> str:
+        return f"<ChangeWatermark({self.consumer}={self.change_id})>"
@@ -43,6 +43,8 @@ Key Methods:
         - get_month_analytics: Detailed month statistics
         - _get_top_people: Most mentioned people
         - _get_top_locations: Most visited locations
+        - get_person_companions: People sharing the most entries with a person
+        - get_entity_timeline: Entries per month of any entity
 
 Usage:
     >>> analytics = QueryAnalytics(logger)
@@ -61,6 +63,8 @@ Usage:
 
 Notes:
     - Uses QueryOptimizer for efficient relationship loading
+    - Companion and timeline counts come from the precomputed aggregate
+      tables (dev.database.aggregates)
     - Supports hierarchical batching via HierarchicalBatcher
     - Returns comprehensive dictionaries with computed metrics
     - All date fields returned as ISO format strings
@@ -74,6 +78,7 @@ from sqlalchemy.orm import Session
 
 from dev.core.logging_manager import PalimpsestLogger, safe_logger
 
+from .aggregates import ENTRY_LINKS, Aggregates
 from .decorators import DatabaseOperation
 from .query_optimizer import QueryOptimizer, HierarchicalBatcher
 from .models import (
@@ -461,6 +466,77 @@ class QueryAnalytics:
             for name, count in location_count.most_common(limit)
         ]
 
+    def get_person_companions(
+        self, session: Session, person_name: str, limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the people sharing the most entries with a person.
+
+        Args:
+            session: SQLAlchemy session
+            person_name: Person name, lastname or slug (partial match)
+            limit: Maximum companions to return
+
+        Returns:
+            List of {"name", "shared_entries"} dicts, most shared first
+        """
+        with DatabaseOperation(self.logger, "get_person_companions"):
+            person = (
+                session.query(Person)
+                .filter(
+                    or_(
+                        Person.name.ilike(f"%{person_name}%"),
+                        Person.lastname.ilike(f"%{person_name}%"),
+                        Person.slug.ilike(f"%{person_name}%"),
+                    )
+                )
+                .first()
+            )
+            if person is None:
+                return []
+
+            counts = Aggregates(session).co_occurrences("people", person.id, "people")
+            counts.pop(person.id, None)
+            people = {
+                p.id: p
+                for p in session.query(Person).filter(Person.id.in_(list(counts)))
+            }
+            companions = sorted(
+                (
+                    {"name": people[pid].display_name, "shared_entries": count}
+                    for pid, count in counts.items()
+                    if pid in people
+                ),
+                key=lambda c: (-c["shared_entries"], c["name"]),
+            )
+            return companions[:limit]
+
+    def get_entity_timeline(
+        self, session: Session, entity_type: str, entity_id: int
+    ) -> Dict[str, int]:
+        """
+        Get entries per month of an entity.
+
+        Args:
+            session: SQLAlchemy session
+            entity_type: Table name: people, tags, themes, motifs,
+                cities, locations or arcs
+            entity_id: Entity primary key
+
+        Returns:
+            Dict mapping "YYYY-MM" to entry count, in month order
+
+        Raises:
+            ValueError: If entity_type has no timeline
+        """
+        if entity_type not in ENTRY_LINKS:
+            raise ValueError(
+                f"No timeline for '{entity_type}'; "
+                f"expected one of: {', '.join(ENTRY_LINKS)}"
+            )
+        with DatabaseOperation(self.logger, "get_entity_timeline"):
+            return Aggregates(session).monthly_counts(entity_type, entity_id)
+
     def get_timeline_overview(self, session: Session) -> Dict[str, Any]:
         """
         Get overview of entire journal timeline.
@@ -36,6 +36,14 @@ Classes:
         Preload relationships for existing entry collections
         Use when you already have Entry objects
 
+    QueryCounter:
+        Context manager counting SQL statements an engine executes
+        Use to verify that a batch operation's query count stays bounded
+
+    EntityStream:
+        Iterate a model's rows in fixed-size primary-key chunks
+        Releases chunks from the session so memory stays flat
+
     HierarchicalBatcher:
         Batch entries by natural date hierarchy (years/months)
         Provides meaningful, predictable batches
@@ -121,6 +129,16 @@ Usage Examples:
     >>> entries_2024 = QueryOptimizer.for_year(session, 2024)
     >>> analyze_year(entries_2024)
 
+    # Count statements issued by a batch operation
+    >>> with QueryCounter(db.engine) as counter:
+    ...     exporter.generate_all()
+    >>> print(f"{counter.count} queries")
+
+    # Stream every entry, 2000 at a time, with relationships preloaded
+    >>> stream = EntityStream(session, Entry, options, order_by=(Entry.date,))
+    >>> for entry in stream:
+    ...     render(entry)  # earlier chunks may be expunged
+
     # Hierarchical batching for export
     >>> batches = HierarchicalBatcher.create_batches(session, threshold=500)
     >>> for batch in batches:
@@ -163,9 +181,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 # from datetime import date
-from typing import List, Optional
+from typing import Any, Collection, Iterator, List, Optional, Sequence
 
-from sqlalchemy import extract
+from sqlalchemy import event, extract, select
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, selectinload
 
 from .models import (
@@ -421,6 +440,130 @@ class RelationshipLoader:
         ).all()
 
 
+class QueryCounter:
+    """
+    Count SQL statements executed on an engine within a block.
+
+    Listens to the engine's ``before_cursor_execute`` event, so every
+    statement is counted once, including lazy loads and eager-load
+    follow-ups. An ``executemany`` batch counts as one statement.
+
+    Attributes:
+        engine: Engine being observed
+        count: Statements executed so far
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        """
+        Initialize counter.
+
+        Args:
+            engine: Engine whose statements are counted
+        """
+        self.engine = engine
+        self.count = 0
+
+    def _on_execute(self, *args: Any) -> None:
+        """Increment the count (before_cursor_execute listener)."""
+        self.count += 1
+
+    def __enter__(self) -> QueryCounter:
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+
+# Rows loaded per chunk by EntityStream
+STREAM_CHUNK = 2000
+
+# Objects a session may hold before EntityStream releases a chunk
+STREAM_KEEP_OBJECTS = 20000
+
+
+class EntityStream:
+    """
+    Iterate a model's rows in fixed-size primary-key chunks.
+
+    The matching ids are read up front (one query); each chunk of ids
+    is then loaded with the given loader options and yielded. Before
+    the next chunk is loaded, a session holding more than ``keep``
+    objects is flushed and expunged, so memory is bounded by ``keep``
+    plus one chunk and its eager-loaded neighbours instead of growing
+    with the table. Below the limit (and after the last chunk) loaded
+    objects stay in the session, so neighbours shared with the next
+    chunk or the next stream are not rebuilt.
+
+    Objects from released chunks are detached: attributes loaded while
+    they were attached stay readable, lazy loads fail. Consumers must
+    finish with each object (or copy what they need) before moving on.
+
+    Attributes:
+        session: Session the chunks are loaded with
+        model: Mapped class being streamed
+        ids: Primary keys to load, in iteration order
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        model: Any,
+        options: Sequence[Any] = (),
+        ids: Optional[Collection[int]] = None,
+        order_by: Sequence[Any] = (),
+        chunk_size: Optional[int] = None,
+        keep: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize stream and read the ids to load.
+
+        Args:
+            session: Active SQLAlchemy session
+            model: Mapped class with an integer ``id`` primary key
+            options: Loader options applied to every chunk query
+            ids: Restrict to these primary keys (None = all rows)
+            order_by: Ordering columns (the id breaks ties)
+            chunk_size: Rows per chunk (None = STREAM_CHUNK)
+            keep: Release the session between chunks once it holds
+                more objects than this (None = STREAM_KEEP_OBJECTS;
+                0 = between every chunk)
+        """
+        self.session = session
+        self.model = model
+        self._options = tuple(options)
+        self._order_by = (*order_by, model.id)
+        self._chunk_size = chunk_size or STREAM_CHUNK
+        self._keep = STREAM_KEEP_OBJECTS if keep is None else keep
+
+        ordered = session.execute(
+            select(model.id).order_by(*self._order_by)
+        ).scalars().all()
+        if ids is not None:
+            wanted = set(ids)
+            ordered = [id_ for id_ in ordered if id_ in wanted]
+        self.ids: List[int] = ordered
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[Any]:
+        size = self._chunk_size
+        for start in range(0, len(self.ids), size):
+            if start and len(self.session.identity_map) > self._keep:
+                self.session.flush()
+                self.session.expunge_all()
+            chunk = self.ids[start:start + size]
+            rows = self.session.execute(
+                select(self.model)
+                .where(self.model.id.in_(chunk))
+                .options(*self._options)
+                .order_by(*self._order_by)
+            ).scalars().all()
+            yield from rows
+            del rows
+
+
 @dataclass
 class DateBatch:
     """
@@ -1,23 +1,31 @@
 -- Entity name cache for Palimpsest autocomplete
 --
--- Caches entity names from the database via the plm CLI for use
--- in autocompletion and entity resolution. Supports lazy refresh
--- and per-type invalidation.
+-- Caches entity names from the database via the plm daemon (or the
+-- plm CLI when no daemon is running) for use in autocompletion and
+-- entity resolution. Supports lazy refresh and per-type invalidation.
 local M = {}
 
 local get_project_root = require("palimpsest.utils").get_project_root
+local rpc = require("palimpsest.rpc")
 
 -- Internal cache: entity_type → list of names
 local _cache = {}
 
---- Refresh the cache for a specific entity type.
+-- Entity types refreshed by refresh_all()
+local ENTITY_TYPES = {
+	"people", "locations", "cities", "arcs", "parts",
+	"chapters", "characters", "scenes",
+	"entries", "journal_scenes", "threads",
+	"poems", "reference_sources",
+}
+
+--- Refresh one entity type by spawning the plm CLI.
 ---
---- Calls `plm metadata list --type {type} --format json`
---- and stores the result. Runs asynchronously via jobstart.
+--- Calls `plm metadata list --type {type} --format json` via jobstart.
 ---
---- @param entity_type string Entity type key (people, locations, etc.)
+--- @param entity_type string Entity type key
 --- @param callback function|nil Optional callback(names) on completion
-function M.refresh(entity_type, callback)
+local function refresh_via_cli(entity_type, callback)
 	local root = get_project_root()
 	local cmd = string.format(
 		"cd %s && plm metadata list --type %s --format json",
@@ -51,19 +59,42 @@ function M.refresh(entity_type, callback)
 	})
 end
 
+--- Refresh the cache for a specific entity type.
+---
+--- Asks the daemon for `metadata.list`; falls back to the plm CLI
+--- when no daemon is running.
+---
+--- @param entity_type string Entity type key (people, locations, etc.)
+--- @param callback function|nil Optional callback(names) on completion
+function M.refresh(entity_type, callback)
+	rpc.request("metadata.list", { entity_type = entity_type }, function(err, names)
+		if not err and type(names) == "table" then
+			_cache[entity_type] = names
+		end
+		if callback then
+			callback(_cache[entity_type] or {})
+		end
+	end, function()
+		refresh_via_cli(entity_type, callback)
+	end)
+end
+
 --- Refresh all entity types.
 ---
---- Triggers parallel refreshes for all known entity types.
+--- One daemon request lists every type; without a daemon, one CLI
+--- process per type is started in parallel.
 function M.refresh_all()
-	local types = {
-		"people", "locations", "cities", "arcs", "parts",
-		"chapters", "characters", "scenes",
-		"entries", "journal_scenes", "threads",
-		"poems", "reference_sources",
-	}
-	for _, entity_type in ipairs(types) do
-		M.refresh(entity_type)
-	end
+	rpc.request("metadata.list", { entity_types = ENTITY_TYPES }, function(err, lists)
+		if not err and type(lists) == "table" then
+			for entity_type, names in pairs(lists) do
+				_cache[entity_type] = names
+			end
+		end
+	end, function()
+		for _, entity_type in ipairs(ENTITY_TYPES) do
+			refresh_via_cli(entity_type)
+		end
+	end)
 end
 
 --- Get cached entity names for a type.
@@ -2,6 +2,7 @@
 local M = {}
 
 local get_project_root = require("palimpsest.utils").get_project_root
+local rpc = require("palimpsest.rpc")
 
 -- Helper: open a wiki file, generating first if it doesn't exist
 local function open_wiki_file(file_path, generate_opts)
@@ -15,21 +16,30 @@ local function open_wiki_file(file_path, generate_opts)
 	local root = get_project_root()
 	local cmd = "cd " .. root .. " && plm wiki generate"
 
-	if generate_opts and generate_opts.section then
-		cmd = cmd .. " --section " .. generate_opts.section
+	local section = generate_opts and generate_opts.section
+	if section then
+		cmd = cmd .. " --section " .. section
 	end
 
-	vim.fn.jobstart(cmd, {
-		on_exit = function(_, exit_code)
-			vim.schedule(function()
-				if exit_code == 0 and vim.fn.filereadable(file_path) == 1 then
-					vim.cmd("edit " .. file_path)
-				else
-					vim.notify("Failed to generate: " .. file_path, vim.log.levels.ERROR)
-				end
-			end)
-		end,
-	})
+	local function done(ok)
+		if ok and vim.fn.filereadable(file_path) == 1 then
+			vim.cmd("edit " .. file_path)
+		else
+			vim.notify("Failed to generate: " .. file_path, vim.log.levels.ERROR)
+		end
+	end
+
+	rpc.request("wiki.generate", { section = section }, function(err)
+		done(err == nil)
+	end, function()
+		vim.fn.jobstart(cmd, {
+			on_exit = function(_, exit_code)
+				vim.schedule(function()
+					done(exit_code == 0)
+				end)
+			end,
+		})
+	end)
 end
 
 -- Open wiki index
@@ -92,18 +102,29 @@ function M.wiki_generate(opts)
 		cmd = cmd .. " --type " .. opts.entity_type
 	end
 
+	local function done(ok)
+		if ok then
+			vim.notify("Wiki generation completed", vim.log.levels.INFO)
+		else
+			vim.notify("Wiki generation failed", vim.log.levels.ERROR)
+		end
+	end
+
 	vim.notify("Generating wiki pages...", vim.log.levels.INFO)
-	vim.fn.jobstart(cmd, {
-		on_exit = function(_, exit_code)
-			vim.schedule(function()
-				if exit_code == 0 then
-					vim.notify("Wiki generation completed", vim.log.levels.INFO)
-				else
-					vim.notify("Wiki generation failed", vim.log.levels.ERROR)
-				end
-			end)
-		end,
-	})
+	rpc.request("wiki.generate", {
+		section = opts.section,
+		entity_type = opts.entity_type,
+	}, function(err)
+		done(err == nil)
+	end, function()
+		vim.fn.jobstart(cmd, {
+			on_exit = function(_, exit_code)
+				vim.schedule(function()
+					done(exit_code == 0)
+				end)
+			end,
+		})
+	end)
 end
 
 -- Metadata export: run plm metadata export asynchronously
@@ -149,50 +170,62 @@ function M.validate_entry(entry_date)
 		root, entry_date
 	)
 
-	local output_lines = {}
-	vim.fn.jobstart(cmd, {
-		stdout_buffered = true,
-		on_stdout = function(_, data)
-			if data then
-				for _, line in ipairs(data) do
-					if line ~= "" then
-						table.insert(output_lines, line)
-					end
-				end
+	-- Show quickfix-format output (no output and ok = passed)
+	local function show(ok, output_lines)
+		if ok and #output_lines == 0 then
+			vim.notify("Entry validation passed", vim.log.levels.INFO)
+			return
+		end
+		local qf_items = {}
+		for _, line in ipairs(output_lines) do
+			local file, lnum, col, msg = line:match("^(.+):(%d+):(%d+): (.+)$")
+			if file then
+				table.insert(qf_items, {
+					filename = file,
+					lnum = tonumber(lnum),
+					col = tonumber(col),
+					text = msg,
+				})
 			end
-		end,
-		on_exit = function(_, exit_code)
-			vim.schedule(function()
-				if exit_code == 0 and #output_lines == 0 then
-					vim.notify("Entry validation passed", vim.log.levels.INFO)
-				else
-					-- Parse quickfix-format output
-					local qf_items = {}
-					for _, line in ipairs(output_lines) do
-						local file, lnum, col, msg = line:match("^(.+):(%d+):(%d+): (.+)$")
-						if file then
-							table.insert(qf_items, {
-								filename = file,
-								lnum = tonumber(lnum),
-								col = tonumber(col),
-								text = msg,
-							})
+		end
+		if #qf_items > 0 then
+			vim.fn.setqflist(qf_items, "r")
+			vim.cmd("copen")
+			vim.notify(
+				string.format("Entry validation: %d issues", #qf_items),
+				vim.log.levels.WARN
+			)
+		elseif #output_lines > 0 then
+			vim.notify(table.concat(output_lines, "\n"), vim.log.levels.WARN)
+		end
+	end
+
+	rpc.request("validate.entry", { date = entry_date }, function(err, result)
+		if err then
+			show(false, { err })
+		else
+			show(result.valid, vim.split(result.quickfix, "\n", { trimempty = true }))
+		end
+	end, function()
+		local output_lines = {}
+		vim.fn.jobstart(cmd, {
+			stdout_buffered = true,
+			on_stdout = function(_, data)
+				if data then
+					for _, line in ipairs(data) do
+						if line ~= "" then
+							table.insert(output_lines, line)
 						end
 					end
-					if #qf_items > 0 then
-						vim.fn.setqflist(qf_items, "r")
-						vim.cmd("copen")
-						vim.notify(
-							string.format("Entry validation: %d issues", #qf_items),
-							vim.log.levels.WARN
-						)
-					elseif #output_lines > 0 then
-						vim.notify(table.concat(output_lines, "\n"), vim.log.levels.WARN)
-					end
 				end
-			end)
-		end,
-	})
+			end,
+			on_exit = function(_, exit_code)
+				vim.schedule(function()
+					show(exit_code == 0, output_lines)
+				end)
+			end,
+		})
+	end)
 end
 
 -- Browse entity type completion list (shared by browse/search)
@@ -64,6 +64,7 @@ M.paths = setmetatable({}, {
 			journal = root .. "/data/journal/content/md",
 			metadata = root .. "/data/metadata",
 			templates = root .. "/dev/lua/palimpsest/templates",
+			socket = root .. "/tmp/plm.sock",
 		}
 		return paths[key]
 	end,
@@ -10,32 +10,42 @@ local context_mod = require("palimpsest.context")
 local float = require("palimpsest.float")
 local cache = require("palimpsest.cache")
 local get_project_root = require("palimpsest.utils").get_project_root
+local wiki_regenerate_cmd = require("palimpsest.utils").wiki_regenerate_cmd
+local import_yaml_steps = require("palimpsest.utils").import_yaml_steps
+local rpc = require("palimpsest.rpc")
 
---- Import a YAML file to the database, regenerate its section, and refresh cache.
+--- Import a YAML file to the database, regenerate its pages, and refresh cache.
 ---
---- Detects the wiki section (manuscript or journal) from the filepath
---- and only regenerates that section plus indexes.
+--- Per-entity files regenerate only that entity's pages plus indexes;
+--- shared files regenerate their section (manuscript or journal).
 ---
 --- @param filepath string Absolute path to the YAML file
 local function import_yaml(filepath)
 	local root = get_project_root()
-	local section = filepath:find("/manuscript/") and "manuscript" or "journal"
 	local cmd = string.format(
-		"cd %s && plm metadata import %s && plm wiki generate --section %s && plm wiki generate --section indexes && plm export --no-commit",
-		root, vim.fn.fnameescape(filepath), section
+		"cd %s && plm metadata import %s && %s && plm export --no-commit",
+		root, vim.fn.fnameescape(filepath), wiki_regenerate_cmd(filepath)
 	)
-	vim.fn.jobstart(cmd, {
-		on_exit = function(_, exit_code)
-			vim.schedule(function()
-				if exit_code == 0 then
-					vim.notify("Metadata imported · wiki regenerated", vim.log.levels.INFO)
-					cache.refresh_all()
-				else
-					vim.notify("Import or generation failed", vim.log.levels.ERROR)
-				end
-			end)
-		end,
-	})
+	local function done(ok)
+		if ok then
+			vim.notify("Metadata imported · wiki regenerated", vim.log.levels.INFO)
+			cache.refresh_all()
+		else
+			vim.notify("Import or generation failed", vim.log.levels.ERROR)
+		end
+	end
+
+	rpc.chain(import_yaml_steps(filepath), function(err)
+		done(err == nil)
+	end, function()
+		vim.fn.jobstart(cmd, {
+			on_exit = function(_, exit_code)
+				vim.schedule(function()
+					done(exit_code == 0)
+				end)
+			end,
+		})
+	end)
 end
 
 --- Import after a rename by reimporting the full entity type.
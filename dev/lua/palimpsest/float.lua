@@ -6,6 +6,9 @@
 local M = {}
 
 local get_project_root = require("palimpsest.utils").get_project_root
+local wiki_regenerate_cmd = require("palimpsest.utils").wiki_regenerate_cmd
+local import_yaml_steps = require("palimpsest.utils").import_yaml_steps
+local rpc = require("palimpsest.rpc")
 
 -- Diagnostic namespace for float validation
 local ns = vim.api.nvim_create_namespace("palimpsest_float")
@@ -124,57 +127,78 @@ function M.on_save(bufnr, filepath)
 
 	vim.diagnostic.reset(ns, bufnr)
 
-	local output_lines = {}
-	vim.fn.jobstart(cmd, {
-		stdout_buffered = true,
-		on_stdout = function(_, data)
-			if data then
-				for _, line in ipairs(data) do
-					if line ~= "" then
-						table.insert(output_lines, line)
-					end
-				end
+	-- Show diagnostics (parsed: list of diagnostic dicts, or nil)
+	local function show(ok, parsed)
+		if ok then
+			vim.diagnostic.reset(ns, bufnr)
+			vim.notify("Metadata valid", vim.log.levels.INFO)
+			return
+		end
+		if type(parsed) == "table" then
+			local diagnostics = {}
+			for _, diag in ipairs(parsed) do
+				table.insert(diagnostics, {
+					bufnr = bufnr,
+					lnum = (diag.line or 1) - 1,
+					col = (diag.col or 1) - 1,
+					severity = diag.severity == "error"
+						and vim.diagnostic.severity.ERROR
+						or vim.diagnostic.severity.WARN,
+					source = "palimpsest",
+					message = diag.message or "Validation error",
+				})
 			end
-		end,
-		on_exit = function(_, exit_code)
-			vim.schedule(function()
-				if exit_code == 0 then
-					vim.diagnostic.reset(ns, bufnr)
-					vim.notify("Metadata valid", vim.log.levels.INFO)
-				else
-					-- Try to parse JSON diagnostics
-					local json_str = table.concat(output_lines, "")
-					local ok, parsed = pcall(vim.fn.json_decode, json_str)
-					if ok and type(parsed) == "table" then
-						local diagnostics = {}
-						for _, diag in ipairs(parsed) do
-							table.insert(diagnostics, {
-								bufnr = bufnr,
-								lnum = (diag.line or 1) - 1,
-								col = (diag.col or 1) - 1,
-								severity = diag.severity == "error"
-									and vim.diagnostic.severity.ERROR
-									or vim.diagnostic.severity.WARN,
-								source = "palimpsest",
-								message = diag.message or "Validation error",
-							})
-						end
-						if #diagnostics > 0 then
-							vim.diagnostic.set(ns, bufnr, diagnostics, {})
+			if #diagnostics > 0 then
+				vim.diagnostic.set(ns, bufnr, diagnostics, {})
+			end
+		end
+		vim.notify("Validation errors found", vim.log.levels.WARN)
+	end
+
+	rpc.request("metadata.validate", { path = filepath }, function(err, diagnostics)
+		if err then
+			show(false, nil)
+			return
+		end
+		local has_error = false
+		for _, diag in ipairs(diagnostics) do
+			if diag.severity == "error" then
+				has_error = true
+			end
+		end
+		show(not has_error, diagnostics)
+	end, function()
+		local output_lines = {}
+		vim.fn.jobstart(cmd, {
+			stdout_buffered = true,
+			on_stdout = function(_, data)
+				if data then
+					for _, line in ipairs(data) do
+						if line ~= "" then
+							table.insert(output_lines, line)
 						end
 					end
-					vim.notify("Validation errors found", vim.log.levels.WARN)
 				end
-			end)
-		end,
-	})
+			end,
+			on_exit = function(_, exit_code)
+				vim.schedule(function()
+					local parsed
+					if exit_code ~= 0 then
+						local ok, decoded = pcall(vim.fn.json_decode, table.concat(output_lines, ""))
+						parsed = ok and decoded or nil
+					end
+					show(exit_code == 0, parsed)
+				end)
+			end,
+		})
+	end)
 end
 
---- Handle window close: import, regenerate section, and refresh cache.
+--- Handle window close: import, regenerate pages, and refresh cache.
 ---
---- Detects the wiki section from the filepath and only regenerates
---- that section plus indexes. Only called if the buffer was actually
---- saved during the float session.
+--- Per-entity files regenerate only that entity's pages plus indexes;
+--- shared files regenerate their section. Only called if the buffer
+--- was actually saved during the float session.
 ---
 --- @param bufnr number Buffer number
 --- @param filepath string Path to the YAML file
@@ -184,25 +208,32 @@ function M.on_close(bufnr, filepath)
 	end
 
 	local root = get_project_root()
-	local section = filepath:find("/manuscript/") and "manuscript" or "journal"
 	local cmd = string.format(
-		"cd %s && plm metadata import %s && plm wiki generate --section %s && plm wiki generate --section indexes && plm export --no-commit",
-		root, vim.fn.fnameescape(filepath), section
+		"cd %s && plm metadata import %s && %s && plm export --no-commit",
+		root, vim.fn.fnameescape(filepath), wiki_regenerate_cmd(filepath)
 	)
 
-	vim.fn.jobstart(cmd, {
-		on_exit = function(_, exit_code)
-			vim.schedule(function()
-				if exit_code == 0 then
-					vim.notify("Metadata imported · wiki regenerated", vim.log.levels.INFO)
-					local cache = require("palimpsest.cache")
-					cache.refresh_all()
-				else
-					vim.notify("Import or generation failed", vim.log.levels.ERROR)
-				end
-			end)
-		end,
-	})
+	local function done(ok)
+		if ok then
+			vim.notify("Metadata imported · wiki regenerated", vim.log.levels.INFO)
+			local cache = require("palimpsest.cache")
+			cache.refresh_all()
+		else
+			vim.notify("Import or generation failed", vim.log.levels.ERROR)
+		end
+	end
+
+	rpc.chain(import_yaml_steps(filepath), function(err)
+		done(err == nil)
+	end, function()
+		vim.fn.jobstart(cmd, {
+			on_exit = function(_, exit_code)
+				vim.schedule(function()
+					done(exit_code == 0)
+				end)
+			end,
+		})
+	end)
 end
 
 return M
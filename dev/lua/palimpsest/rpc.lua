@@ -0,0 +1,133 @@
+-- JSON-RPC client for the `plm serve` daemon
+--
+-- Sends requests over the daemon's Unix socket (tmp/plm.sock) so editor
+-- actions skip the seconds spent starting a fresh plm process. When no
+-- daemon is listening, the caller's fallback (the equivalent plm command)
+-- runs instead and the daemon is started in the background for the next
+-- request.
+local M = {}
+
+local config = require("palimpsest.config")
+local get_project_root = require("palimpsest.utils").get_project_root
+
+local uv = vim.uv or vim.loop
+
+local _next_id = 0
+local _starting = false
+
+--- Start `plm serve` in the background.
+---
+--- No-op while a daemon started by this session is still running.
+function M.start()
+	if _starting then
+		return
+	end
+	_starting = true
+	local cmd = string.format("cd %s && plm serve", get_project_root())
+	vim.fn.jobstart(cmd, {
+		detach = true,
+		on_exit = function()
+			_starting = false
+		end,
+	})
+end
+
+--- Send one request to the daemon.
+---
+--- The callback runs on the main loop with (err, result, data): err is
+--- nil on success, otherwise the daemon's error message (data carries
+--- structured details such as import diagnostics).
+---
+--- @param method string Method name, e.g. "metadata.list"
+--- @param params table|nil Keyword parameters
+--- @param callback function|nil Called with (err, result, data)
+--- @param fallback function|nil Called instead when no daemon is listening
+function M.request(method, params, callback, fallback)
+	callback = callback or function() end
+	_next_id = _next_id + 1
+	local request = vim.fn.json_encode({
+		jsonrpc = "2.0",
+		id = _next_id,
+		method = method,
+		params = (params and next(params)) and params or vim.empty_dict(),
+	})
+
+	local pipe = uv.new_pipe(false)
+	pipe:connect(config.paths.socket, function(connect_err)
+		if connect_err then
+			pipe:close()
+			vim.schedule(function()
+				M.start()
+				if fallback then
+					fallback()
+				else
+					callback("plm daemon not running")
+				end
+			end)
+			return
+		end
+
+		local chunks = {}
+		local function finish(read_err)
+			pipe:read_stop()
+			pipe:close()
+			vim.schedule(function()
+				if read_err then
+					callback(read_err)
+					return
+				end
+				local line = table.concat(chunks):match("^[^\n]*")
+				local ok, response = pcall(vim.fn.json_decode, line)
+				if not ok or type(response) ~= "table" then
+					callback("invalid response from plm daemon")
+				elseif response.error then
+					callback(response.error.message, nil, response.error.data)
+				else
+					callback(nil, response.result)
+				end
+			end)
+		end
+
+		pipe:read_start(function(read_err, data)
+			if read_err then
+				finish(read_err)
+			elseif not data then
+				finish(#chunks == 0 and "plm daemon closed the connection" or nil)
+			else
+				table.insert(chunks, data)
+				if data:find("\n", 1, true) then
+					finish(nil)
+				end
+			end
+		end)
+		pipe:write(request .. "\n")
+	end)
+end
+
+--- Send requests one after another, stopping at the first error.
+---
+--- Each step is { method, params }. The fallback only runs if the
+--- daemon is not listening for the first step.
+---
+--- @param steps table List of { method, params }
+--- @param callback function|nil Called with (err, data) after the last step
+--- @param fallback function|nil Called instead when no daemon is listening
+function M.chain(steps, callback, fallback)
+	callback = callback or function() end
+	local function run(i)
+		if i > #steps then
+			callback(nil)
+			return
+		end
+		M.request(steps[i][1], steps[i][2], function(err, _, data)
+			if err then
+				callback(err, data)
+			else
+				run(i + 1)
+			end
+		end, i == 1 and fallback or nil)
+	end
+	run(1)
+end
+
+return M
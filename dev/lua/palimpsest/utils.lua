@@ -11,4 +11,64 @@ function M.get_project_root()
 	return root or vim.fn.getcwd()
 end
 
+-- Metadata YAML path patterns → wiki entity type, for single-entity
+-- regeneration (the captured part is the wiki page key)
+local ENTITY_YAML_PATTERNS = {
+	{ "/metadata/people/([^/]+)%.yaml$", "people" },
+	{ "/metadata/locations/([^/]+/[^/]+)%.yaml$", "locations" },
+	{ "/metadata/manuscript/chapters/([^/]+)%.yaml$", "chapters" },
+	{ "/metadata/manuscript/characters/([^/]+)%.yaml$", "characters" },
+	{ "/metadata/manuscript/scenes/([^/]+)%.yaml$", "manuscript_scenes" },
+}
+
+--- Build the wiki regeneration command for an edited metadata YAML file.
+---
+--- Per-entity files regenerate only that entity's pages and indexes
+--- (`plm wiki generate --entity TYPE:KEY`); shared files (cities.yaml,
+--- arcs.yaml, parts.yaml, ...) regenerate their section plus indexes.
+---
+--- @param filepath string Path to the YAML file
+--- @return string Shell command (without the `cd`)
+function M.wiki_regenerate_cmd(filepath)
+	for _, pattern in ipairs(ENTITY_YAML_PATTERNS) do
+		local key = filepath:match(pattern[1])
+		if key then
+			return string.format("plm wiki generate --entity %s:%s", pattern[2], key)
+		end
+	end
+	local section = filepath:find("/manuscript/") and "manuscript" or "journal"
+	return string.format(
+		"plm wiki generate --section %s && plm wiki generate --section indexes",
+		section
+	)
+end
+
+--- Build the daemon requests equivalent to importing an edited YAML file.
+---
+--- Mirrors `plm metadata import FILE && <wiki_regenerate_cmd> &&
+--- plm export --no-commit` as `palimpsest.rpc` chain steps.
+---
+--- @param filepath string Path to the YAML file
+--- @return table List of { method, params }
+function M.import_yaml_steps(filepath)
+	local steps = { { "metadata.import", { path = filepath } } }
+	local entity
+	for _, pattern in ipairs(ENTITY_YAML_PATTERNS) do
+		local key = filepath:match(pattern[1])
+		if key then
+			entity = pattern[2] .. ":" .. key
+			break
+		end
+	end
+	if entity then
+		table.insert(steps, { "wiki.generate", { entity = entity } })
+	else
+		local section = filepath:find("/manuscript/") and "manuscript" or "journal"
+		table.insert(steps, { "wiki.generate", { section = section } })
+		table.insert(steps, { "wiki.generate", { section = "indexes" } })
+	end
+	table.insert(steps, { "export", {} })
+	return steps
+end
+
 return M
@@ -0,0 +1,52 @@
+"""Add entity change log and consumer watermarks.
+
+entity_changes records every ORM write (fed by a session after_flush
+hook); change_watermarks stores how far each consumer, such as the JSON
+exporter, has read it.
+
+Revision ID: 20261016_change_tracking
+Revises: 20260312_scene_order
+Create Date: 2026-10-16
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261016_change_tracking"
+down_revision = "20260312_scene_order"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create entity_changes and change_watermarks tables."""
+    op.create_table(
+        "entity_changes",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("table_name", sa.String(length=64), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("operation", sa.String(length=8), nullable=False),
+        sa.Column("changed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sqlite_autoincrement=True,
+    )
+    op.create_index(
+        "ix_entity_changes_table_entity",
+        "entity_changes",
+        ["table_name", "entity_id"],
+    )
+
+    op.create_table(
+        "change_watermarks",
+        sa.Column("consumer", sa.String(length=64), nullable=False),
+        sa.Column("change_id", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("consumer"),
+    )
+
+
+def downgrade() -> None:
+    """Drop change tracking tables."""
+    op.drop_table("change_watermarks")
+    op.drop_index("ix_entity_changes_table_entity", table_name="entity_changes")
+    op.drop_table("entity_changes")
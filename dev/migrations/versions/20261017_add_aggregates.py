@@ -0,0 +1,47 @@
+"""Add materialized aggregate tables.
+
+agg_entity_months holds per-month entry counts and agg_co_occurrences
+the entries shared by two entities. Both are derived from the journal
+tables and filled on first use by dev.database.aggregates.
+
+Revision ID: 20261017_aggregates
+Revises: 20261016_change_tracking
+Create Date: 2026-10-17
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261017_aggregates"
+down_revision = "20261016_change_tracking"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create agg_entity_months and agg_co_occurrences tables."""
+    op.create_table(
+        "agg_entity_months",
+        sa.Column("entity_type", sa.String(length=32), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("month", sa.String(length=7), nullable=False),
+        sa.Column("entry_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("entity_type", "entity_id", "month"),
+    )
+    op.create_table(
+        "agg_co_occurrences",
+        sa.Column("entity_type", sa.String(length=32), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("other_type", sa.String(length=32), nullable=False),
+        sa.Column("other_id", sa.Integer(), nullable=False),
+        sa.Column("entry_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint(
+            "entity_type", "entity_id", "other_type", "other_id"
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop aggregate tables."""
+    op.drop_table("agg_co_occurrences")
+    op.drop_table("agg_entity_months")
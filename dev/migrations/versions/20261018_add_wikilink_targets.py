@@ -0,0 +1,35 @@
+"""Add the wikilink target table.
+
+wikilink_targets maps every linkable entity to its wikilink name and
+wiki path. It is derived from the journal and manuscript tables and
+filled on first use by dev.wiki.link_targets.
+
+Revision ID: 20261018_wikilink_targets
+Revises: 20261017_aggregates
+Create Date: 2026-10-18
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261018_wikilink_targets"
+down_revision = "20261017_aggregates"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create wikilink_targets table."""
+    op.create_table(
+        "wikilink_targets",
+        sa.Column("entity_type", sa.String(length=32), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("path", sa.String(length=255), nullable=False),
+        sa.PrimaryKeyConstraint("entity_type", "entity_id"),
+    )
+
+
+def downgrade() -> None:
+    """Drop wikilink_targets table."""
+    op.drop_table("wikilink_targets")
@@ -16,6 +16,7 @@ Top-Level Commands:
     - convert: Convert formatted text to Markdown
     - sync: Synchronize DB with files (JSON import → entries → metadata → export → wiki)
     - export: Export DB entities to JSON
+    - serve: Run the JSON-RPC daemon used by the editor integration
     - status: Show pipeline status
 
 Command Groups:
@@ -26,6 +27,10 @@ Command Groups:
     - Metadata: metadata export, metadata import, metadata validate, metadata list
     - Validate: validate pipeline, validate entry, validate db, ...
 
+Command modules are imported only when their command runs (see
+dev.core.cli.LazyGroup), so ``plm --help`` starts without loading
+SQLAlchemy, Jinja2 or the PDF stack.
+
 Usage:
     # Synchronize after git pull (replaces entries import + json export + wiki generate)
     plm sync
@@ -56,10 +61,27 @@ import click
 from pathlib import Path
 
 from dev.core.paths import LOG_DIR, DB_PATH, ALEMBIC_DIR, BACKUP_DIR
-from dev.core.cli import setup_logger
-
-
-@click.group()
+from dev.core.cli import LazyGroup, setup_logger
+
+
+# Subcommand modules are imported only when their command is used, so
+# `plm --help` or `plm metadata list` never load pandoc, textstat or the
+# PDF stack. Command modules keep heavy imports inside command bodies.
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "inbox": "dev.pipeline.cli.sources:inbox",
+        "convert": "dev.pipeline.cli.text:convert",
+        "status": "dev.pipeline.cli.maintenance:status",
+        "sync": "dev.pipeline.cli.sync:sync",
+        "export": "dev.pipeline.cli.export:export_json",
+        "serve": "dev.pipeline.cli.serve:serve",
+        "validate": "dev.pipeline.cli.maintenance:validate",
+        "wiki": "dev.pipeline.cli.wiki:wiki",
+        "metadata": "dev.pipeline.cli.metadata_yaml:metadata",
+        "manuscript": "dev.pipeline.cli.manuscript:manuscript",
+    },
+)
 @click.option(
     "--log-dir",
     type=click.Path(),
@@ -78,21 +100,55 @@ def cli(ctx: click.Context, log_dir: str, verbose: bool) -> None:
 
 # --- Command groups ---
 
-@click.group()
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "pdf": "dev.pipeline.cli.pdf:build_pdf",
+        "metadata": "dev.pipeline.cli.metadata_pdf:build_metadata_pdf",
+    },
+)
 @click.pass_context
 def build(ctx: click.Context) -> None:
     """Build output files."""
     pass
 
 
-@click.group()
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "run": "dev.pipeline.cli.maintenance:run_pipeline",
+    },
+)
 @click.pass_context
 def pipeline(ctx: click.Context) -> None:
     """Pipeline orchestration."""
     pass
 
 
-@click.group()
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "init": "dev.database.cli.setup:init",
+        "reset": "dev.database.cli.setup:reset",
+        "backup": "dev.database.cli.backup:backup",
+        "backups": "dev.database.cli.backup:backups",
+        "restore": "dev.database.cli.backup:restore",
+        "stats": "dev.database.cli.maintenance:stats",
+        "health": "dev.database.cli.maintenance:health",
+        "optimize": "dev.database.cli.maintenance:optimize",
+        "analyze": "dev.database.cli.maintenance:analyze",
+        "prune": "dev.database.cli.prune:prune_orphans",
+        "create": "dev.database.cli.migration:create",
+        "upgrade": "dev.database.cli.migration:upgrade",
+        "downgrade": "dev.database.cli.migration:downgrade",
+        "migration-status": "dev.database.cli.migration:migration_status",
+        "history": "dev.database.cli.migration:history",
+        "show": "dev.database.cli.query:show",
+        "years": "dev.database.cli.query:years",
+        "months": "dev.database.cli.query:months",
+        "batches": "dev.database.cli.query:batches",
+    },
+)
 @click.option(
     "--db-path",
     type=click.Path(),
@@ -122,72 +178,10 @@ def db(ctx: click.Context, db_path: str, alembic_dir: str, backup_dir: str) -> N
     ctx.obj["backup_dir"] = Path(backup_dir)
 
 
-# Import and register commands from submodules
-# These imports must come after CLI group definition
-from .sources import inbox  # noqa: E402
-from .text import convert  # noqa: E402
-from .export import export_json  # noqa: E402
-from .pdf import build_pdf  # noqa: E402
-from .metadata_pdf import build_metadata_pdf  # noqa: E402
-from .maintenance import run_pipeline, status, validate  # noqa: E402
-from .wiki import wiki  # noqa: E402
-from .metadata_yaml import metadata  # noqa: E402
-from .sync import sync  # noqa: E402
-from .manuscript import manuscript  # noqa: E402
-
-# Import database CLI commands
-from dev.database.cli.setup import init, reset  # noqa: E402
-from dev.database.cli.migration import (  # noqa: E402
-    create, upgrade, downgrade, migration_status, history,
-)
-from dev.database.cli.backup import backup, backups, restore  # noqa: E402
-from dev.database.cli.query import show, years, months, batches  # noqa: E402
-from dev.database.cli.maintenance import (  # noqa: E402
-    stats as db_stats, health, optimize, analyze,
-)
-from dev.database.cli.prune import prune_orphans  # noqa: E402
-
-# Register top-level commands
-cli.add_command(inbox)
-cli.add_command(convert)
-cli.add_command(status)
-cli.add_command(sync)
-cli.add_command(export_json, "export")
-
-# Register command groups
+# Register command groups defined here; the rest load lazily
 cli.add_command(build)
 cli.add_command(pipeline)
 cli.add_command(db)
-cli.add_command(validate)
-cli.add_command(wiki)
-cli.add_command(metadata)
-cli.add_command(manuscript)
-
-# Register subcommands under groups
-build.add_command(build_pdf)
-build.add_command(build_metadata_pdf)
-pipeline.add_command(run_pipeline)
-
-# Register all DB subcommands (flattened from metadb)
-db.add_command(init)
-db.add_command(reset)
-db.add_command(backup)
-db.add_command(backups)
-db.add_command(restore)
-db.add_command(db_stats)
-db.add_command(health)
-db.add_command(optimize)
-db.add_command(analyze)
-db.add_command(prune_orphans)
-db.add_command(create)
-db.add_command(upgrade)
-db.add_command(downgrade)
-db.add_command(migration_status)
-db.add_command(history)
-db.add_command(show)
-db.add_command(years)
-db.add_command(months)
-db.add_command(batches)
 
 
 if __name__ == "__main__":
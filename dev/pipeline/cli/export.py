@@ -22,15 +22,21 @@ import click
 
 # --- Local imports ---
 from dev.core.logging_manager import handle_cli_error
-from dev.core.paths import DB_PATH, ALEMBIC_DIR, LOG_DIR, BACKUP_DIR
-from dev.database.manager import PalimpsestDB
-from dev.pipeline.export_json import JSONExporter
+from dev.core.paths import (
+    ALEMBIC_DIR,
+    BACKUP_DIR,
+    DB_PATH,
+    EXPORT_INDEX_PATH,
+    EXPORT_STATE_PATH,
+    LOG_DIR,
+)
 
 
 @click.command("export")
 @click.option("--no-commit", is_flag=True, help="Write JSON files without creating a git commit")
+@click.option("--full", is_flag=True, help="Wipe and rewrite every file instead of only changed ones")
 @click.pass_context
-def export_json(ctx: click.Context, no_commit: bool) -> None:
+def export_json(ctx: click.Context, no_commit: bool, full: bool) -> None:
     """
     Export database entities to JSON files for version control.
 
@@ -43,13 +49,26 @@ def export_json(ctx: click.Context, no_commit: bool) -> None:
     exports are machine-focused with ID-based relationships and automatic
     git commits with detailed README changelog.
 
+    Only entities changed in the database since the last export (and the
+    entities embedding their names) are re-exported, only changed files
+    are rewritten and only orphaned files are deleted, so a one-entry
+    edit touches a handful of files. Use --full to wipe the export tree
+    and rewrite everything.
+
     Examples:
         # Export all entities
         plm export-json
 
         # Export without committing (used by auto-sync)
         plm export-json --no-commit
+
+        # Rewrite every file from scratch
+        plm export-json --full
     """
+    from dev.database.manager import PalimpsestDB
+    from dev.pipeline.export_json import JSONExporter
+    from dev.utils.file_state import FileStateCache
+
     try:
         logger = ctx.obj["logger"]
 
@@ -61,11 +80,20 @@ def export_json(ctx: click.Context, no_commit: bool) -> None:
             backup_dir=BACKUP_DIR,
             enable_auto_backup=False,
         )
-        exporter = JSONExporter(db, logger=logger)
+        exporter = JSONExporter(
+            db,
+            logger=logger,
+            file_state=FileStateCache(EXPORT_STATE_PATH),
+            index_path=EXPORT_INDEX_PATH,
+        )
 
         # Execute export
         click.echo("Exporting all database entities to JSON...")
-        exporter.export_all(commit=not no_commit)
+        exporter.export_all(commit=not no_commit, incremental=not full)
+        click.echo(
+            f"  {exporter.files_written} files written, "
+            f"{exporter.files_deleted} deleted"
+        )
         click.echo("[OK] Export complete - see data/exports/README.md for details")
 
     except Exception as e:
@@ -29,13 +29,8 @@ from dev.core.paths import (
     LOG_DIR,
     BACKUP_DIR,
 )
+from dev.core.cli import LazyGroup
 from dev.core.logging_manager import PalimpsestLogger, handle_cli_error
-from dev.database.manager import PalimpsestDB
-from dev.database.query_analytics import QueryAnalytics
-from dev.validators.cli.database import db as validate_db
-from dev.validators.cli.markdown import md as validate_md
-from dev.validators.cli.frontmatter import frontmatter as validate_frontmatter
-from dev.validators.cli.consistency import consistency as validate_consistency
 
 
 @click.command("run")
@@ -64,6 +59,7 @@ def run_pipeline(
     from .text import convert
     from .sync import sync
     from .pdf import build_pdf
+    from dev.database.manager import PalimpsestDB
 
     click.echo("Starting complete pipeline...\n")
 
@@ -123,6 +119,8 @@ def run_pipeline(
 def status(ctx: click.Context) -> None:
     """Show pipeline and wiki status."""
     from dev.core.paths import DATA_DIR
+    from dev.database.manager import PalimpsestDB
+    from dev.database.query_analytics import QueryAnalytics
 
     logger: PalimpsestLogger = ctx.obj["logger"]
     click.echo("Pipeline Status\n")
@@ -181,7 +179,16 @@ def status(ctx: click.Context) -> None:
         click.echo("  Not generated yet")
 
 
-@click.group()
+# Validator command groups from dev.validators.cli load on first use
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "db": "dev.validators.cli.database:db",
+        "md": "dev.validators.cli.markdown:md",
+        "frontmatter": "dev.validators.cli.frontmatter:frontmatter",
+        "consistency": "dev.validators.cli.consistency:consistency",
+    },
+)
 def validate() -> None:
     """Validate pipeline, entries, database, markdown, frontmatter, and consistency."""
     pass
@@ -385,11 +392,4 @@ def validate_entry(
     raise SystemExit(exit_code)
 
 
-# Register validator command groups from dev.validators.cli
-validate.add_command(validate_db, "db")
-validate.add_command(validate_md, "md")
-validate.add_command(validate_frontmatter, "frontmatter")
-validate.add_command(validate_consistency, "consistency")
-
-
 __all__ = ["run_pipeline", "status", "validate"]
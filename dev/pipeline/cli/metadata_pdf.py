@@ -5,7 +5,7 @@ Metadata PDF Generation Commands
 Commands for generating metadata curation PDFs from YAML files.
 
 Commands:
-    - build-metadata-pdf: Build metadata PDF from YAML (yaml → pdf)
+    - build metadata: Build metadata PDF from YAML (yaml → pdf)
 
 Generates two-column PDF compilations of journal metadata (scenes, events,
 themes, arcs, threads) for manuscript curation decisions.
@@ -15,13 +15,12 @@ from __future__ import annotations
 import click
 from pathlib import Path
 
-from dev.core.paths import JOURNAL_YAML_DIR, PDF_DIR, TEX_DIR
-from dev.core.logging_manager import PalimpsestLogger, handle_cli_error
-from dev.pipeline import metadata2pdf
+from dev.core.paths import JOURNAL_YAML_DIR, MD_DIR, PDF_DIR, TEX_DIR
+from dev.core.logging_manager import handle_cli_error
 
 
 @click.command("metadata")
-@click.argument("year")
+@click.argument("year", metavar="YEARS")
 @click.option(
     "-i",
     "--input",
@@ -38,6 +37,12 @@ from dev.pipeline import metadata2pdf
 )
 @click.option("-f", "--force", is_flag=True, help="Force overwrite existing PDF")
 @click.option("--debug", is_flag=True, help="Keep temp files on error for debugging")
+@click.option(
+    "-j", "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Parallel PDF builds (default: CPU count; 1 builds serially)",
+)
 @click.pass_context
 def build_metadata_pdf(
     ctx: click.Context,
@@ -46,32 +51,30 @@ def build_metadata_pdf(
     output: str,
     force: bool,
     debug: bool,
+    jobs: int | None,
 ) -> None:
     """
-    Build metadata curation PDF for a year.
+    Build metadata curation PDFs for one or more years.
 
     Generates a two-column PDF compilation of metadata (scenes, events,
     themes, arcs, threads) from YAML files for manuscript curation decisions.
+    YEARS is a year, a range or a list (2024, 2015-2025, 2015,2018-2020).
     """
-    logger: PalimpsestLogger = ctx.obj["logger"]
-
-    click.echo(f"Building metadata PDF for {year}...")
+    from dev.pipeline.cli.pdf import run_batch
+    from dev.pipeline.pdf_batch import PdfBatchOptions, parse_years
 
     try:
-        stats = metadata2pdf.build_metadata_pdf(
-            year=year,
+        options = PdfBatchOptions(
+            md_dir=MD_DIR,
             yaml_dir=Path(input),
             pdf_dir=Path(output),
-            preamble=TEX_DIR / "preamble_metadata.tex",
+            preamble_metadata=TEX_DIR / "preamble_metadata.tex",
             force_overwrite=force,
             keep_temp_on_error=debug,
-            logger=logger,
         )
 
-        click.echo("\n[OK] Metadata PDF build complete:")
-        click.echo(f"  YAML files processed: {stats.files_processed}")
-        click.echo(f"  PDFs created: {stats.pdfs_created}")
-        click.echo(f"  Duration: {stats.duration():.2f}s")
+        click.echo(f"Building metadata PDFs for {year}...")
+        run_batch(ctx, parse_years(year), ("metadata",), options, jobs)
 
     except Exception as e:
         handle_cli_error(
@@ -5,7 +5,11 @@ PDF Generation Commands
 Commands for generating PDF compilations from Markdown entries.
 
 Commands:
-    - build-pdf: Build yearly PDFs from Markdown (md → pdf)
+    - build pdf: Build yearly PDFs from Markdown (md → pdf)
+
+Accepts one year or a spec covering many (``2015-2025``,
+``2015,2018-2020``); each PDF is an independent job scheduled across a
+process pool (see dev.pipeline.pdf_batch).
 
 This is a separate output pathway, independent of wiki operations.
 """
@@ -13,14 +17,81 @@ from __future__ import annotations
 
 import click
 from pathlib import Path
+from typing import TYPE_CHECKING, Sequence
 
-from dev.core.paths import MD_DIR, PDF_DIR, TEX_DIR
+from dev.core.paths import JOURNAL_YAML_DIR, MD_DIR, PDF_DIR, TEX_DIR
 from dev.core.logging_manager import PalimpsestLogger, handle_cli_error
-from dev.pipeline import md2pdf
+
+if TYPE_CHECKING:
+    from dev.pipeline.pdf_batch import PdfBatchOptions, PdfBatchStats, PdfJobResult
+
+
+def _echo_result(result: PdfJobResult) -> None:
+    """Print one finished job."""
+    if result.error is not None:
+        click.echo(f"  [FAIL] {result.job.label}: {result.error}")
+    elif result.pdfs_created:
+        click.echo(f"  [OK] {result.job.label} ({result.duration:.1f}s)")
+    else:
+        click.echo(f"  [--] {result.job.label} up to date")
+
+
+def run_batch(
+    ctx: click.Context,
+    years: Sequence[str],
+    kinds: Sequence[str],
+    options: PdfBatchOptions,
+    jobs: int | None,
+) -> PdfBatchStats:
+    """
+    Run a PDF batch, printing each job and the aggregate stats.
+
+    Args:
+        ctx: Click context (provides the logger)
+        years: Years to build
+        kinds: PDF kinds to build
+        options: Batch settings
+        jobs: Worker processes (None = CPU count)
+
+    Returns:
+        Aggregate stats
+
+    Raises:
+        PdfBuildError: If any job failed (after all jobs finished)
+    """
+    from dev.core.exceptions import PdfBuildError
+    from dev.pipeline.pdf_batch import build_pdfs
+
+    logger: PalimpsestLogger = ctx.obj["logger"]
+    stats = build_pdfs(
+        years, kinds, options, jobs=jobs, logger=logger, on_result=_echo_result
+    )
+
+    if stats.failures:
+        click.echo("\nPDF build finished with errors:")
+    else:
+        click.echo("\n[OK] PDF build complete:")
+    click.echo(f"  Source files: {stats.files_processed}")
+    click.echo(f"  PDFs created: {stats.pdfs_created}")
+    if stats.pdfs_up_to_date:
+        click.echo(f"  PDFs up to date: {stats.pdfs_up_to_date}")
+    if stats.months_converted or stats.months_cached:
+        click.echo(
+            f"  Months converted: {stats.months_converted} "
+            f"({stats.months_cached} cached)"
+        )
+    click.echo(f"  Duration: {stats.duration():.2f}s")
+
+    if stats.failures:
+        raise PdfBuildError(
+            f"{len(stats.failures)} of {stats.jobs} PDF builds failed: "
+            + ", ".join(r.job.label for r in stats.failures)
+        )
+    return stats
 
 
 @click.command("pdf")
-@click.argument("year")
+@click.argument("year", metavar="YEARS")
 @click.option(
     "-i",
     "--input",
@@ -35,8 +106,20 @@ from dev.pipeline import md2pdf
     default=str(PDF_DIR),
     help="Output directory for PDFs",
 )
-@click.option("-f", "--force", is_flag=True, help="Force overwrite existing PDFs")
+@click.option("-f", "--force", is_flag=True, help="Rebuild PDFs even if up to date")
 @click.option("--debug", is_flag=True, help="Keep temp files on error for debugging")
+@click.option(
+    "-j", "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Parallel PDF builds (default: CPU count; 1 builds serially)",
+)
+@click.option(
+    "-m", "--metadata",
+    "with_metadata",
+    is_flag=True,
+    help="Also build metadata curation PDFs",
+)
 @click.pass_context
 def build_pdf(
     ctx: click.Context,
@@ -45,33 +128,38 @@ def build_pdf(
     output: str,
     force: bool,
     debug: bool,
+    jobs: int | None,
+    with_metadata: bool,
 ) -> None:
     """
-    Build clean and notes PDFs for a year.
+    Build clean and notes PDFs for one or more years.
 
     Generates professional typeset PDF documents from Markdown entries
     using Pandoc + LaTeX. Creates two versions: clean and notes.
-    """
-    logger: PalimpsestLogger = ctx.obj["logger"]
+    YEARS is a year, a range or a list (2024, 2015-2025, 2015,2018-2020);
+    years in a range without entries are skipped.
 
-    click.echo(f"Building PDFs for {year}...")
+    PDFs are rebuilt only when their entries, preambles or settings
+    changed; months without edits reuse their cached parse.
+    """
+    from dev.pipeline.pdf_batch import PdfBatchOptions, parse_years
 
     try:
-        stats = md2pdf.build_pdf(
-            year=year,
+        years = parse_years(year)
+        kinds = ("clean", "notes", "metadata") if with_metadata else ("clean", "notes")
+        options = PdfBatchOptions(
             md_dir=Path(input),
+            yaml_dir=JOURNAL_YAML_DIR,
             pdf_dir=Path(output),
             preamble=TEX_DIR / "preamble.tex",
             preamble_notes=TEX_DIR / "preamble_notes.tex",
+            preamble_metadata=TEX_DIR / "preamble_metadata.tex",
             force_overwrite=force,
             keep_temp_on_error=debug,
-            logger=logger,
         )
 
-        click.echo("\n[OK] PDF build complete:")
-        click.echo(f"  Markdown entries: {stats.files_processed}")
-        click.echo(f"  PDFs created: {stats.pdfs_created}")
-        click.echo(f"  Duration: {stats.duration():.2f}s")
+        click.echo(f"Building PDFs for {year}...")
+        run_batch(ctx, years, kinds, options, jobs)
 
     except Exception as e:
         handle_cli_error(
@@ -82,4 +170,4 @@ def build_pdf(
         )
 
 
-__all__ = ["build_pdf"]
+__all__ = ["build_pdf", "run_batch"]
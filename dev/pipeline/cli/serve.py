@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+serve.py
+--------
+CLI command for the ``plm serve`` JSON-RPC daemon.
+
+Runs a long-lived process that keeps the database and wiki templates
+loaded and answers editor requests over a Unix socket (see
+dev/pipeline/server.py for the protocol and methods).
+
+Commands:
+    plm serve                 - Run the daemon in the foreground
+    plm serve --status        - Report whether a daemon is running
+    plm serve --stop          - Ask the running daemon to exit
+
+Usage:
+    plm serve &
+    plm serve --status
+    plm serve --stop
+"""
+# --- Annotations ---
+from __future__ import annotations
+
+# --- Standard library imports ---
+from pathlib import Path
+
+# --- Third-party imports ---
+import click
+
+# --- Local imports ---
+from dev.core.logging_manager import handle_cli_error
+from dev.core.paths import SERVER_SOCKET_PATH
+
+
+@click.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(),
+    default=str(SERVER_SOCKET_PATH),
+    help="Unix socket to listen on (defaults to tmp/plm.sock)",
+)
+@click.option("--status", is_flag=True, help="Report whether a daemon is running")
+@click.option("--stop", is_flag=True, help="Stop the running daemon")
+@click.pass_context
+def serve(ctx: click.Context, socket_path: str, status: bool, stop: bool) -> None:
+    """Serve metadata, wiki, validate and export requests over a socket."""
+    from dev.pipeline.server import PlmServer, RpcError, call
+
+    if status or stop:
+        try:
+            info = call("shutdown" if stop else "ping", socket_path=socket_path)
+        except (OSError, RpcError):
+            click.echo("No daemon running.")
+            if status:
+                raise SystemExit(1)
+            return
+        if stop:
+            click.echo("Daemon stopped.")
+        else:
+            click.echo(
+                f"Daemon running (pid {info['pid']}, "
+                f"{info['requests']} requests, up {info['uptime_s']}s)"
+            )
+        return
+
+    try:
+        server = PlmServer(Path(socket_path), logger=ctx.obj.get("logger"))
+        click.echo(f"Starting daemon on {socket_path}")
+        server.serve_forever()
+    except RuntimeError as e:
+        raise click.ClickException(str(e))
+    except Exception as e:
+        handle_cli_error(ctx, e, "serve")
+        raise
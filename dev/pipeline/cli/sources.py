@@ -16,7 +16,6 @@ from pathlib import Path
 
 from dev.core.paths import INBOX_DIR, ARCHIVE_DIR, TXT_DIR
 from dev.core.logging_manager import PalimpsestLogger, handle_cli_error
-from dev.pipeline.src2txt import process_inbox
 
 
 @click.command()
@@ -40,6 +39,8 @@ def inbox(ctx: click.Context, inbox: str, output: str) -> None:
     This is STEP 1 of the pipeline - transforms raw text exports into
     organized monthly text files.
     """
+    from dev.pipeline.src2txt import process_inbox
+
     logger: PalimpsestLogger = ctx.obj["logger"]
 
     click.echo("Processing inbox...")
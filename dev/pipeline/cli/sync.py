@@ -9,6 +9,7 @@ Runs the full sync workflow in the correct order so that a freshly-pulled
 
 1. JSON import   -- load shared DB state from ``data/exports/journal/``
 2. Entries import -- process MD+YAML files where the content hash changed
+   (followed by orphan pruning and an incremental search index update)
 3. Metadata import -- process entity YAML files (people, locations, etc.)
 4. JSON export   -- re-snapshot DB if steps 2 or 3 introduced changes
 5. Wiki generate -- regenerate wiki pages (skippable with ``--no-wiki``)
@@ -42,6 +43,7 @@ Dependencies:
     - dev.wiki.metadata.MetadataImporter
     - dev.pipeline.export_json.JSONExporter
     - dev.wiki.exporter.WikiExporter
+    - dev.search.search_index.SearchIndexManager
 """
 # --- Annotations ---
 from __future__ import annotations
@@ -61,8 +63,13 @@ from dev.core.paths import (
     BACKUP_DIR,
     DATA_DIR,
     DB_PATH,
+    EXPORT_INDEX_PATH,
+    EXPORT_STATE_PATH,
+    FILE_STATE_PATH,
     JOURNAL_YAML_DIR,
     LOG_DIR,
+    WIKI_INDEX_PATH,
+    WIKI_TEMPLATE_CACHE_DIR,
 )
 
 
@@ -111,6 +118,7 @@ def _run_json_import(
     logger: Any,
     verbose: bool,
     changed_files: Optional[Set[Path]] = None,
+    jobs: Optional[int] = None,
 ) -> int:
     """
     Step 1: Import shared DB state from JSON export files.
@@ -121,6 +129,8 @@ def _run_json_import(
         verbose: Print per-entity counts.
         changed_files: Set of changed file paths for incremental
             import. ``None`` means full import.
+        jobs: Threads reading JSON files, or the default pool size
+            if ``None``.
 
     Returns:
         Total number of entities imported across all types.
@@ -128,7 +138,7 @@ def _run_json_import(
     from dev.pipeline.import_json import JSONImporter
 
     importer = JSONImporter(db, logger=logger)
-    stats = importer.import_all(changed_files=changed_files)
+    stats = importer.import_all(changed_files=changed_files, workers=jobs)
 
     total = sum(stats.values())
     if verbose:
@@ -145,6 +155,8 @@ def _run_entries_import(
     dry_run: bool,
     verbose: bool,
     changed_files: Optional[Set[Path]] = None,
+    jobs: Optional[int] = None,
+    reset_file_state: bool = False,
 ) -> int:
     """
     Step 2: Import journal entries from MD+YAML where hashes changed.
@@ -157,11 +169,16 @@ def _run_entries_import(
         verbose: Print detailed summary.
         changed_files: Set of changed YAML paths for incremental
             import. ``None`` means full import (all files).
+        jobs: Worker processes for YAML/MD preparation, or CPU count
+            if ``None``.
+        reset_file_state: Discard the stat-signature hash cache first,
+            so every file is re-read and re-hashed.
 
     Returns:
         Number of entries processed (excluding skipped).
     """
     from dev.pipeline.metadata_importer import EntryImporter
+    from dev.utils.file_state import FileStateCache
 
     if changed_files is not None:
         yaml_files = sorted(changed_files)
@@ -171,13 +188,18 @@ def _run_entries_import(
         click.echo("  No YAML files found for entries import.")
         return 0
 
+    file_state = FileStateCache(FILE_STATE_PATH)
+    if reset_file_state:
+        file_state.invalidate()
+
     with db.session_scope() as session:
         importer = EntryImporter(
             session=session,
             dry_run=dry_run,
             logger=logger,
+            file_state=file_state,
         )
-        stats = importer.import_all(yaml_files, failed_only=False)
+        stats = importer.import_all(yaml_files, failed_only=False, workers=jobs)
 
     if verbose:
         click.echo(f"    {stats.summary()}")
@@ -211,6 +233,26 @@ def _run_auto_prune(db: Any, verbose: bool) -> int:
     return total_pruned
 
 
+def _run_search_index_update(db: Any, logger: Any) -> int:
+    """
+    Reindex entries whose MD body changed since they were last indexed.
+
+    No-op when the FTS5 index has not been created.
+
+    Args:
+        db: Initialised ``PalimpsestDB`` instance.
+        logger: Pipeline logger.
+
+    Returns:
+        Number of entries whose indexed body was rewritten.
+    """
+    from dev.search.search_index import SearchIndexManager
+
+    mgr = SearchIndexManager(db.engine, logger)
+    with db.session_scope() as session:
+        return mgr.update_index(session)
+
+
 def _run_metadata_import(
     db: Any,
     logger: Any,
@@ -257,19 +299,30 @@ def _run_json_export(
         verbose: Print export stats.
     """
     from dev.pipeline.export_json import JSONExporter
+    from dev.utils.file_state import FileStateCache
 
-    exporter = JSONExporter(db, logger=logger)
+    exporter = JSONExporter(
+        db,
+        logger=logger,
+        file_state=FileStateCache(EXPORT_STATE_PATH),
+        index_path=EXPORT_INDEX_PATH,
+    )
     exporter.export_all(commit=False)
 
     if verbose:
         for key, value in exporter.stats.items():
             click.echo(f"    {key}: {value}")
+        click.echo(
+            f"    files: {exporter.files_written} written, "
+            f"{exporter.files_deleted} deleted"
+        )
 
 
 def _run_wiki_generate(
     db: Any,
     logger: Any,
     verbose: bool,
+    jobs: Optional[int] = None,
 ) -> None:
     """
     Step 5: Regenerate wiki pages from DB.
@@ -278,10 +331,17 @@ def _run_wiki_generate(
         db: Initialised ``PalimpsestDB`` instance.
         logger: Pipeline logger.
         verbose: Print generation stats.
+        jobs: Render processes, or CPU count
     """
     from dev.wiki.exporter import WikiExporter
 
-    exporter = WikiExporter(db, logger=logger)
+    exporter = WikiExporter(
+        db,
+        logger=logger,
+        index_path=WIKI_INDEX_PATH,
+        workers=jobs,
+        cache_dir=WIKI_TEMPLATE_CACHE_DIR,
+    )
     exporter.generate_all()
 
     if verbose:
@@ -357,6 +417,13 @@ def _run_data_commit() -> bool:
     default=False,
     help="Force full reimport (ignore incremental state).",
 )
+@click.option(
+    "-j", "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Workers for JSON import, entries import and wiki rendering "
+    "(default: CPU count).",
+)
 @click.option(
     "-v", "--verbose",
     is_flag=True,
@@ -371,6 +438,7 @@ def sync(
     dry_run: bool,
     years: Optional[str],
     full: bool,
+    jobs: Optional[int],
     verbose: bool,
 ) -> None:
     """Run the full cross-machine synchronization workflow.
@@ -450,6 +518,7 @@ def sync(
         log_dir=LOG_DIR,
         backup_dir=BACKUP_DIR,
         enable_auto_backup=False,
+        profile="bulk_import",
     )
 
     click.echo(f"Sync mode: {sync_mode} ({reason})")
@@ -467,6 +536,7 @@ def sync(
             else:
                 json_total = _run_json_import(
                     db, logger, verbose, changed_files=json_changed,
+                    jobs=jobs,
                 )
                 click.echo(f"  Imported {json_total} entities from JSON.")
         else:
@@ -482,7 +552,8 @@ def sync(
         else:
             entries_changed = _run_entries_import(
                 db, logger, years_filter, dry_run, verbose,
-                changed_files=entry_changed,
+                changed_files=entry_changed, jobs=jobs,
+                reset_file_state=full,
             )
             click.echo(f"  Processed {entries_changed} entries.")
 
@@ -493,6 +564,12 @@ def sync(
             if pruned:
                 click.echo(f"  Pruned {pruned} orphans.")
 
+        # -- Step 2c: Incremental search index update --
+        if not dry_run and (json_total > 0 or entries_changed > 0):
+            reindexed = _run_search_index_update(db, logger)
+            if reindexed:
+                click.echo(f"  Reindexed {reindexed} entries for search.")
+
         # -- Step 3: Metadata import --
         click.echo("[3/6] Metadata import...")
         meta_total = 0
@@ -524,7 +601,7 @@ def sync(
             click.echo("[5/6] Wiki generate... skipped (dry-run).")
         else:
             click.echo("[5/6] Wiki generate...")
-            _run_wiki_generate(db, logger, verbose)
+            _run_wiki_generate(db, logger, verbose, jobs=jobs)
             click.echo("  Wiki pages regenerated.")
 
         # -- Step 6: Git commit in data/ submodule --
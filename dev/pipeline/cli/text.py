@@ -16,7 +16,6 @@ from pathlib import Path
 
 from dev.core.paths import TXT_DIR, MD_DIR, JOURNAL_YAML_DIR
 from dev.core.logging_manager import PalimpsestLogger, handle_cli_error
-from dev.pipeline.txt2md import convert_directory, convert_file
 
 
 @click.command()
@@ -92,6 +91,8 @@ def convert(
         click.echo("\n[TIP] Run without --dry-run to execute conversion")
         return
 
+    from dev.pipeline.txt2md import convert_directory, convert_file
+
     click.echo("Converting text to Markdown...")
 
     try:
@@ -12,6 +12,10 @@ Commands:
     plm wiki generate              - Generate all wiki pages
     plm wiki generate --section journal  - Journal pages only
     plm wiki generate --type people      - Specific entity type
+    plm wiki generate --full             - Re-render every page
+    plm wiki generate -j 4               - Render with 4 processes
+    plm wiki generate --entity people:clara - One entity's pages + indexes
+    plm wiki clear-cache              - Drop compiled template bytecode
     plm wiki lint <path>              - Lint file or directory
     plm wiki lint <path> --format json - JSON output
     plm wiki sync                     - Full manuscript sync cycle
@@ -36,7 +40,12 @@ import click
 
 # --- Local imports ---
 from dev.core.logging_manager import handle_cli_error
-from dev.core.paths import DB_PATH
+from dev.core.paths import (
+    DB_PATH,
+    WIKI_INDEX_PATH,
+    WIKI_LINT_CACHE_PATH,
+    WIKI_TEMPLATE_CACHE_DIR,
+)
 
 
 @click.group()
@@ -66,12 +75,35 @@ def wiki(ctx: click.Context) -> None:
     default=None,
     help="Output directory (defaults to data/wiki)",
 )
+@click.option(
+    "--full",
+    is_flag=True,
+    help="Re-render every page instead of only those affected by DB changes",
+)
+@click.option(
+    "-j", "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Render processes (default: CPU count; 1 renders in-process)",
+)
+@click.option(
+    "--entity",
+    "entity_spec",
+    type=str,
+    default=None,
+    metavar="TYPE:KEY",
+    help="Regenerate one entity's pages and its type's indexes "
+    "(e.g. people:clara, locations:montreal/cafe, entries:2024-03-05)",
+)
 @click.pass_context
 def generate(
     ctx: click.Context,
     section: Optional[str],
     entity_type: Optional[str],
     output_dir: Optional[str],
+    full: bool,
+    jobs: Optional[int],
+    entity_spec: Optional[str],
 ) -> None:
     """Generate wiki pages from database."""
     from dev.database.manager import PalimpsestDB
@@ -79,22 +111,45 @@ def generate(
 
     logger = ctx.obj.get("logger")
 
+    if entity_spec is not None:
+        if section or entity_type or full:
+            raise click.UsageError(
+                "--entity cannot be combined with --section, --type or --full"
+            )
+        entity_name, _, key = entity_spec.partition(":")
+        if not entity_name or not key:
+            raise click.BadParameter(
+                "expected TYPE:KEY (e.g. people:clara)", param_hint="--entity"
+            )
+
     try:
         db = PalimpsestDB(DB_PATH)
         exporter = WikiExporter(
             db,
             output_dir=Path(output_dir) if output_dir else None,
             logger=logger,
+            index_path=WIKI_INDEX_PATH,
+            workers=jobs,
+            cache_dir=WIKI_TEMPLATE_CACHE_DIR,
         )
-        exporter.generate_all(
-            section=section,
-            entity_type=entity_type,
-        )
+        if entity_spec is not None:
+            try:
+                exporter.generate_entity(entity_name, key)
+            except ValueError as e:
+                raise click.BadParameter(str(e), param_hint="--entity") from e
+        else:
+            exporter.generate_all(
+                section=section,
+                entity_type=entity_type,
+                full=full,
+            )
 
         click.echo("Wiki generation complete.")
         for key, value in exporter.stats.items():
             click.echo(f"  {key}: {value}")
 
+    except click.ClickException:
+        raise
     except Exception as e:
         handle_cli_error(ctx, e, "wiki_generate")
         raise
@@ -109,11 +164,24 @@ def generate(
     default=None,
     help="Output format (auto-detects: json for piped, text for TTY)",
 )
+@click.option(
+    "--full",
+    is_flag=True,
+    help="Re-check every file, ignoring cached diagnostics",
+)
+@click.option(
+    "-j", "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Lint threads (default: pool size; 1 lints serially)",
+)
 @click.pass_context
 def lint(
     ctx: click.Context,
     path: str,
     output_format: Optional[str],
+    full: bool,
+    jobs: Optional[int],
 ) -> None:
     """Lint wiki files for structural issues and broken wikilinks."""
     import json
@@ -128,7 +196,11 @@ def lint(
 
     try:
         db = PalimpsestDB(DB_PATH)
-        validator = WikiValidator(db)
+        if full:
+            WIKI_LINT_CACHE_PATH.unlink(missing_ok=True)
+        validator = WikiValidator(
+            db, cache_path=WIKI_LINT_CACHE_PATH, workers=jobs
+        )
         target = Path(path)
 
         if target.is_file():
@@ -141,6 +213,7 @@ def lint(
                 for k, v in raw.items()
                 if v  # only include files with diagnostics
             }
+        validator.save_cache()
 
         if output_format == "json":
             click.echo(json.dumps(results, indent=2))
@@ -201,7 +274,9 @@ def sync(
 
     try:
         db = PalimpsestDB(DB_PATH)
-        wiki_sync = WikiSync(db, logger=logger)
+        wiki_sync = WikiSync(
+            db, logger=logger, cache_dir=WIKI_TEMPLATE_CACHE_DIR
+        )
         result = wiki_sync.sync_manuscript(
             ingest_only=ingest_only,
             generate_only=generate_only,
@@ -216,3 +291,18 @@ def sync(
     except Exception as e:
         handle_cli_error(ctx, e, "wiki_sync")
         raise
+
+
+@wiki.command("clear-cache")
+@click.pass_context
+def clear_cache(ctx: click.Context) -> None:
+    """Delete compiled wiki templates (recompiled on next generate)."""
+    from dev.wiki.renderer import clear_template_cache
+
+    try:
+        removed = clear_template_cache(WIKI_TEMPLATE_CACHE_DIR)
+        click.echo(f"Removed {removed} compiled template(s).")
+
+    except Exception as e:
+        handle_cli_error(ctx, e, "wiki_clear_cache")
+        raise
@@ -10,6 +10,11 @@ are machine-generated, machine-focused files using natural keys for relationship
 
 Key Features:
     - One JSON file per entity instance (not per entry)
+    - Incremental writes: only added/changed files are rewritten
+      (atomically) and only orphaned files are deleted
+    - Dirty exports: with an export index, only entities recorded in the
+      DB change log since the last export (plus the entities embedding
+      their natural keys) are queried and serialized
     - Natural-key-based relationships (slugs, names, dates — no integer IDs)
     - Unidirectional relationship storage (zero redundancy)
     - README.md with human-readable change log
@@ -24,6 +29,8 @@ Architecture:
     - Thread owns: people, locations, referenced_entry
     - Entities don't store back-references (derived on import)
     - Lookup dicts built once per export for O(1) FK resolution
+    - Export index (id -> natural key + path) maps changed or deleted
+      rows to the files they own, so dirty exports never scan the tree
 
 Directory Structure:
     data/exports/journal/
@@ -43,27 +50,44 @@ Usage:
     db = PalimpsestDB()
     exporter = JSONExporter(db)
     exporter.export_all()  # Exports all entities + README + git commit
+
+    # Re-export only what changed since the last run
+    exporter = JSONExporter(db, index_path=EXPORT_INDEX_PATH)
+    exporter.export_all()
+
+    # Wipe and rewrite every file instead of syncing changes
+    exporter.export_all(incremental=False)
 """
 # --- Annotations ---
 from __future__ import annotations
 
 # --- Standard library imports ---
+import hashlib
 import json
+import os
 import shutil
 import subprocess
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 # --- Third-party imports ---
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 # --- Local imports ---
 from dev.core.logging_manager import PalimpsestLogger, safe_logger
 from dev.core.paths import ROOT
+from dev.database.change_tracking import (
+    changes_since,
+    get_watermark,
+    latest_change_id,
+    set_watermark,
+)
 from dev.database.manager import PalimpsestDB
 from dev.database.models import (
     Arc,
+    Base,
     Chapter,
     Character,
     City,
@@ -88,6 +112,7 @@ from dev.database.models import (
     ThemeInstance,
     Thread,
 )
+from dev.utils.file_state import FileStateCache
 from dev.utils.slugify import (
     slugify,
     generate_person_filename,
@@ -97,6 +122,53 @@ from dev.utils.slugify import (
 )
 
 
+# Entity types in the order their files are written
+ENTITY_TYPES = [
+    "entries", "people", "locations", "scenes", "events", "threads",
+    "arcs", "tags", "themes", "motifs", "poems", "references",
+    "reference_sources", "motif_instances", "theme_instances", "cities",
+    # Manuscript entities
+    "parts", "chapters", "characters", "person_character_maps",
+    "manuscript_scenes", "manuscript_sources", "manuscript_references",
+]
+
+# Planned export file: (entity_type, natural_key, json_data)
+PlannedFile = Tuple[str, str, Dict[str, Any]]
+
+# Model behind each entity type
+EXPORT_MODELS = {
+    "entries": Entry, "people": Person, "locations": Location,
+    "scenes": Scene, "events": Event, "threads": Thread, "arcs": Arc,
+    "tags": Tag, "themes": Theme, "motifs": Motif, "poems": PoemVersion,
+    "references": Reference, "reference_sources": ReferenceSource,
+    "motif_instances": MotifInstance, "theme_instances": ThemeInstance,
+    "cities": City, "parts": Part, "chapters": Chapter,
+    "characters": Character, "person_character_maps": PersonCharacterMap,
+    "manuscript_scenes": ManuscriptScene,
+    "manuscript_sources": ManuscriptSource,
+    "manuscript_references": ManuscriptReference,
+}
+
+# Entity type exported from each table
+TABLE_TYPES = {model.__tablename__: t for t, model in EXPORT_MODELS.items()}
+
+# Tables whose natural keys are embedded in other entities' JSON but
+# which are not exported themselves; any change re-exports dependents
+EMBEDDED_ONLY_TABLES = frozenset({Poem.__tablename__})
+
+# Exported rows whose names are embedded in their entry's JSON (scenes,
+# theme_instances via the theme name, ...); re-exporting one re-exports
+# the entry that owns it
+ENTRY_OWNER_COLUMNS = {
+    model.__tablename__: model.entry_id
+    for model in (Scene, Thread, ThemeInstance, MotifInstance, PoemVersion, Reference)
+}
+
+# Change-log consumer name and export index layout version
+WATERMARK_CONSUMER = "json_export"
+INDEX_VERSION = 1
+
+
 class JSONExporter:
     """
     Exports database entities to individual JSON files with README changelog.
@@ -111,6 +183,8 @@ class JSONExporter:
         db: PalimpsestDB,
         output_dir: Optional[Path] = None,
         logger: Optional[PalimpsestLogger] = None,
+        file_state: Optional[FileStateCache] = None,
+        index_path: Optional[Path] = None,
     ):
         """
         Initialize JSON exporter.
@@ -119,16 +193,26 @@ class JSONExporter:
             db: Database manager instance
             output_dir: Output directory (defaults to data/exports)
             logger: Optional logger for operation tracking
+            file_state: Stat-signature hash cache; lets incremental exports
+                skip reading unchanged files on disk
+            index_path: Export index file; enables dirty exports driven
+                by the DB change log (None = always export everything)
         """
         self.db = db
         self.output_dir = output_dir or (ROOT / "data" / "exports")
         self.journal_dir = self.output_dir / "journal"
         self.logger = logger
+        self.file_state = file_state
+        self.index_path = index_path
 
         # Track changes for README
         self.changes: List[str] = []
         self.stats: Dict[str, int] = {}
 
+        # Files touched by the last export
+        self.files_written = 0
+        self.files_deleted = 0
+
         # Lookup dicts for FK resolution (populated by _build_lookups)
         self._entry_dates: Dict[int, str] = {}
         self._person_slugs: Dict[int, str] = {}
@@ -148,46 +232,89 @@ class JSONExporter:
         self._character_names: Dict[int, str] = {}
         self._ms_scene_names: Dict[int, str] = {}
 
+        # Natural key -> id of every exported entity, per type
+        self._key_ids: Dict[str, Dict[str, int]] = {t: {} for t in ENTITY_TYPES}
+
+        # Export index: {entity_type: {id: [natural_key, relative_path]}}
+        self._index: Dict[str, Dict[str, List[str]]] = {}
+        self._index_change_id: Optional[int] = None
+
+        # Change-log position read with the exported data (None = untracked)
+        self._head: Optional[int] = None
+
     def _build_lookups(self, session: Session) -> None:
         """
         Build lookup dicts from all entity tables for O(1) FK resolution.
 
-        Queries each entity table once and builds {int_id: natural_key_string}
-        maps used by export methods to replace integer FK references with
-        deterministic natural keys.
+        Queries only the id and key columns of each entity table and builds
+        {int_id: natural_key_string} maps used by export methods to replace
+        integer FK references with deterministic natural keys.
 
         Args:
             session: Active SQLAlchemy session
         """
-        self._entry_dates = {e.id: e.date.isoformat() for e in session.query(Entry)}
-        self._person_slugs = {p.id: p.slug for p in session.query(Person)}
-        self._city_names = {c.id: c.name for c in session.query(City)}
+        self._entry_dates = {
+            id_: d.isoformat() for id_, d in session.query(Entry.id, Entry.date)
+        }
+        self._person_slugs = dict(session.query(Person.id, Person.slug).all())
+        self._city_names = dict(session.query(City.id, City.name).all())
         self._location_keys = {
-            loc.id: f"{loc.name}::{self._city_names[loc.city_id]}"
-            for loc in session.query(Location)
+            id_: f"{name}::{self._city_names[city_id]}"
+            for id_, name, city_id in session.query(
+                Location.id, Location.name, Location.city_id
+            )
         }
-        self._event_names = {e.id: e.name for e in session.query(Event)}
-        self._arc_names = {a.id: a.name for a in session.query(Arc)}
-        self._tag_names = {t.id: t.name for t in session.query(Tag)}
-        self._theme_names = {t.id: t.name for t in session.query(Theme)}
-        self._motif_names = {m.id: m.name for m in session.query(Motif)}
-        self._source_titles = {s.id: s.title for s in session.query(ReferenceSource)}
-        self._poem_titles = {p.id: p.title for p in session.query(Poem)}
+        self._event_names = dict(session.query(Event.id, Event.name).all())
+        self._arc_names = dict(session.query(Arc.id, Arc.name).all())
+        self._tag_names = dict(session.query(Tag.id, Tag.name).all())
+        self._theme_names = dict(session.query(Theme.id, Theme.name).all())
+        self._motif_names = dict(session.query(Motif.id, Motif.name).all())
+        self._source_titles = dict(
+            session.query(ReferenceSource.id, ReferenceSource.title).all()
+        )
+        self._poem_titles = dict(session.query(Poem.id, Poem.title).all())
         self._scene_keys = {
-            s.id: f"{s.name}::{self._entry_dates[s.entry_id]}"
-            for s in session.query(Scene)
+            id_: f"{name}::{self._entry_dates[entry_id]}"
+            for id_, name, entry_id in session.query(
+                Scene.id, Scene.name, Scene.entry_id
+            )
         }
         self._thread_keys = {
-            t.id: f"{t.name}::{self._entry_dates[t.entry_id]}"
-            for t in session.query(Thread)
+            id_: f"{name}::{self._entry_dates[entry_id]}"
+            for id_, name, entry_id in session.query(
+                Thread.id, Thread.name, Thread.entry_id
+            )
         }
         # Manuscript lookups
-        self._part_numbers = {p.id: p.number for p in session.query(Part)}
-        self._chapter_titles = {c.id: c.title for c in session.query(Chapter)}
-        self._character_names = {c.id: c.name for c in session.query(Character)}
-        self._ms_scene_names = {s.id: s.name for s in session.query(ManuscriptScene)}
+        self._part_numbers = dict(session.query(Part.id, Part.number).all())
+        self._chapter_titles = dict(session.query(Chapter.id, Chapter.title).all())
+        self._character_names = dict(
+            session.query(Character.id, Character.name).all()
+        )
+        self._ms_scene_names = dict(
+            session.query(ManuscriptScene.id, ManuscriptScene.name).all()
+        )
+
+    def _query(
+        self, session: Session, model: Any, ids: Optional[Set[int]]
+    ) -> List[Any]:
+        """
+        Load the rows of one entity table, optionally restricted by id.
+
+        Args:
+            session: Active SQLAlchemy session
+            model: ORM model class
+            ids: Primary keys to load (None = all rows)
+
+        Returns:
+            List of model instances
+        """
+        query = session.query(model)
+        if ids is not None:
+            query = query.filter(model.id.in_(ids))
+        return query.all()
 
-    def export_all(self, commit: bool = True) -> None:
+    def export_all(self, commit: bool = True, incremental: bool = True) -> None:
         """
         Export all entities to JSON files with README and optional git commit.
 
@@ -196,31 +323,64 @@ class JSONExporter:
 
         Args:
             commit: Whether to create a git commit after export (default True)
+            incremental: Rewrite only added/changed files and delete only
+                orphans (default True); False wipes and rewrites every file.
+                With an export index in sync with the change log, only
+                changed entities are exported at all.
         """
         safe_logger(self.logger).log_info("Starting full database export to JSON")
 
         try:
-            # Step 1: Load previous exports for diff
-            safe_logger(self.logger).log_info("Loading existing exports for comparison...")
-            old_exports = self._load_existing_exports()
-            old_count = sum(len(entities) for entities in old_exports.values())
-            safe_logger(self.logger).log_info(f"   Found {old_count} existing entities")
-
-            # Step 2: Export all entity types
-            safe_logger(self.logger).log_info("Exporting all entities from database...")
-            new_exports = self._export_all_entities()
-            new_count = sum(self.stats.values())
-            safe_logger(self.logger).log_info(f"   Exported {new_count} entities")
-
-            # Step 3: Generate change descriptions
-            safe_logger(self.logger).log_info("Detecting changes...")
-            self._generate_changes(old_exports, new_exports)
-            safe_logger(self.logger).log_info(f"   Detected {len(self.changes)} changes")
-
-            # Step 4: Write all JSON files
-            safe_logger(self.logger).log_info("Writing JSON files...")
-            self._write_exports(new_exports)
-            safe_logger(self.logger).log_info(f"   Wrote {new_count} files")
+            if incremental and self._can_export_changes():
+                # Steps 1-4: Export, write and delete only changed entities
+                safe_logger(self.logger).log_info("Exporting changed entities from database...")
+                refreshed = self._export_changes()
+                new_count = sum(self.stats.values())
+                safe_logger(self.logger).log_info(
+                    f"   Re-exported {refreshed} changed entities; "
+                    f"{len(self.changes)} changes: wrote "
+                    f"{self.files_written} files, deleted {self.files_deleted}"
+                )
+            elif incremental:
+                # Step 1: Export all entity types
+                safe_logger(self.logger).log_info("Exporting all entities from database...")
+                new_exports = self._export_all_entities()
+                new_count = sum(self.stats.values())
+                safe_logger(self.logger).log_info(f"   Exported {new_count} entities")
+
+                # Steps 2-4: Diff against disk, write changes, delete orphans
+                safe_logger(self.logger).log_info("Syncing JSON files...")
+                self._reindex(self._sync_exports(new_exports))
+                safe_logger(self.logger).log_info(
+                    f"   Detected {len(self.changes)} changes: wrote "
+                    f"{self.files_written} files, deleted {self.files_deleted}"
+                )
+            else:
+                # Step 1: Load previous exports for diff
+                safe_logger(self.logger).log_info("Loading existing exports for comparison...")
+                old_exports = self._load_existing_exports()
+                old_count = sum(len(entities) for entities in old_exports.values())
+                safe_logger(self.logger).log_info(f"   Found {old_count} existing entities")
+
+                # Step 2: Export all entity types
+                safe_logger(self.logger).log_info("Exporting all entities from database...")
+                new_exports = self._export_all_entities()
+                new_count = sum(self.stats.values())
+                safe_logger(self.logger).log_info(f"   Exported {new_count} entities")
+
+                # Step 3: Generate change descriptions
+                safe_logger(self.logger).log_info("Detecting changes...")
+                self._generate_changes(old_exports, new_exports)
+                safe_logger(self.logger).log_info(f"   Detected {len(self.changes)} changes")
+
+                # Step 4: Write all JSON files
+                safe_logger(self.logger).log_info("Writing JSON files...")
+                self._reindex(self._write_exports(new_exports))
+                safe_logger(self.logger).log_info(f"   Wrote {self.files_written} files")
+
+            if self.file_state is not None:
+                self.file_state.save()
+            self._save_index()
 
             # Step 5: Generate and write README
             safe_logger(self.logger).log_info("Generating README...")
@@ -259,6 +419,9 @@ class JSONExporter:
         exports = {}
 
         with self.db.session_scope() as session:
+            # Read the change-log head in the same snapshot as the data
+            self._head = self._read_head(session)
+
             # Build lookup dicts for FK resolution
             self._build_lookups(session)
 
@@ -291,11 +454,271 @@ class JSONExporter:
 
         return exports
 
+    # =========================================================================
+    # CHANGE-DRIVEN EXPORT
+    # =========================================================================
+
+    def _read_head(self, session: Session) -> Optional[int]:
+        """
+        Read the change-log head when dirty exports are enabled.
+
+        Args:
+            session: Session the export reads its data with
+
+        Returns:
+            Newest change id, or None without an index or change log
+        """
+        if self.index_path is None or not getattr(self.db, "tracks_changes", False):
+            return None
+        return latest_change_id(session)
+
+    def _can_export_changes(self) -> bool:
+        """
+        Check whether the export index is in sync with the change log.
+
+        Dirty exports need an index, a tracked database, an existing
+        export tree, and an index written at this consumer's watermark;
+        anything else falls back to a full export that rebuilds them.
+
+        Returns:
+            True if only changed entities need exporting
+        """
+        if self.index_path is None or not getattr(self.db, "tracks_changes", False):
+            return False
+        if not self.journal_dir.exists():
+            return False
+        self._load_index()
+        if self._index_change_id is None:
+            return False
+        with self.db.session_scope() as session:
+            watermark = get_watermark(session, WATERMARK_CONSUMER)
+        return watermark == self._index_change_id
+
+    def _export_changes(self) -> int:
+        """
+        Export, write and delete only the entities changed since last run.
+
+        Returns:
+            Number of entities re-exported (deleted ones included)
+        """
+        with self.db.session_scope() as session:
+            self._head, changed = changes_since(session, self._index_change_id)
+            self._build_lookups(session)
+            exports, refreshed = self._export_changed_entities(session, changed)
+            for entity_type, model in EXPORT_MODELS.items():
+                self.stats[entity_type] = session.query(func.count(model.id)).scalar()
+
+        files = self._plan_files(exports)
+        orphans = self._reindex(files, refreshed)
+        self._sync_files(files, orphans)
+        return sum(len(ids) for ids in refreshed.values())
+
+    def _export_changed_entities(
+        self, session: Session, changed: Dict[str, Set[int]]
+    ) -> Tuple[Dict[str, Dict[str, Dict[str, Any]]], Dict[str, Set[int]]]:
+        """
+        Export changed entities plus the entities embedding their keys.
+
+        Changed rows are re-exported by id. When a row's natural key
+        differs from the one in the export index (a rename, or a
+        deletion), every entity that embeds that key is re-exported
+        too, repeating until no more keys move (an entry's date change
+        renames its scenes, which are embedded in events). Re-exported
+        rows an entry embeds by name (scenes, threads, theme/motif
+        instances, poem versions, references) also re-export that
+        entry, so renaming a theme reaches the entries using it.
+
+        Args:
+            session: Active SQLAlchemy session (lookups already built)
+            changed: Table name -> changed ids, from the change log
+
+        Returns:
+            (exports, refreshed): exported data keyed by natural key, and
+            every id that was re-exported per entity type
+        """
+        pending: Dict[str, Set[int]] = {}
+        for table_name, ids in changed.items():
+            if table_name in TABLE_TYPES:
+                pending.setdefault(TABLE_TYPES[table_name], set()).update(ids)
+        moved = {t: ids for t, ids in changed.items() if t in EMBEDDED_ONLY_TABLES}
+
+        exports: Dict[str, Dict[str, Dict[str, Any]]] = {t: {} for t in ENTITY_TYPES}
+        refreshed: Dict[str, Set[int]] = {}
+
+        while pending or moved:
+            for table_name, ids in moved.items():
+                for dep_table, dep_ids in self._dependents(session, table_name, ids).items():
+                    pending.setdefault(TABLE_TYPES[dep_table], set()).update(dep_ids)
+            moved = {}
+            owners: Set[int] = set()
+
+            for entity_type, ids in pending.items():
+                done = refreshed.setdefault(entity_type, set())
+                ids = ids - done
+                if not ids:
+                    continue
+                done |= ids
+
+                export = getattr(self, f"_export_{entity_type}")
+                exports[entity_type].update(export(session, ids))
+
+                table_name = EXPORT_MODELS[entity_type].__tablename__
+                if table_name in ENTRY_OWNER_COLUMNS:
+                    owners.update(self._owning_entries(session, table_name, ids))
+
+                new_keys = {
+                    id_: key for key, id_ in self._key_ids[entity_type].items()
+                    if id_ in ids
+                }
+                old_index = self._index.get(entity_type, {})
+                renamed = {
+                    id_ for id_ in ids
+                    if str(id_) in old_index and old_index[str(id_)][0] != new_keys.get(id_)
+                }
+                if renamed:
+                    moved.setdefault(table_name, set()).update(renamed)
+            pending = {"entries": owners} if owners else {}
+
+        return exports, refreshed
+
+    @staticmethod
+    def _owning_entries(
+        session: Session, table_name: str, ids: Set[int]
+    ) -> Set[int]:
+        """
+        Find the entries owning the given rows of an entry-owned table.
+
+        Args:
+            session: Active SQLAlchemy session
+            table_name: Table in ENTRY_OWNER_COLUMNS
+            ids: Rows of that table (deleted rows are simply not found)
+
+        Returns:
+            Entry ids
+        """
+        column = ENTRY_OWNER_COLUMNS[table_name]
+        table = column.class_.__table__
+        rows = session.execute(select(column).where(table.c.id.in_(ids)))
+        return set(rows.scalars())
+
+    def _dependents(
+        self, session: Session, table_name: str, ids: Set[int]
+    ) -> Dict[str, Set[int]]:
+        """
+        Find exported rows that embed the natural keys of the given rows.
+
+        Follows foreign keys from exported tables (scenes.entry_id) and
+        association tables (entry_tags) pointing at ``table_name``.
+
+        Args:
+            session: Active SQLAlchemy session
+            table_name: Table whose keys moved
+            ids: Rows whose keys moved
+
+        Returns:
+            Exported table name -> dependent ids
+        """
+        dependents: Dict[str, Set[int]] = {}
+        for table in Base.metadata.sorted_tables:
+            for fk in table.foreign_keys:
+                if fk.column.table.name != table_name:
+                    continue
+                if table.name in TABLE_TYPES:
+                    targets = [(table.name, table.c.id)]
+                elif "id" not in table.c:
+                    # Association table: the rows on its other side
+                    targets = [
+                        (other.column.table.name, other.parent)
+                        for other in table.foreign_keys
+                        if other is not fk and other.column.table.name in TABLE_TYPES
+                    ]
+                else:
+                    continue
+                for dep_table, column in targets:
+                    rows = session.execute(select(column).where(fk.parent.in_(ids)))
+                    dependents.setdefault(dep_table, set()).update(rows.scalars())
+        return dependents
+
+    def _reindex(
+        self,
+        files: Dict[Path, PlannedFile],
+        refreshed: Optional[Dict[str, Set[int]]] = None,
+    ) -> Set[Path]:
+        """
+        Update the export index from planned files.
+
+        Args:
+            files: Planned files of the exported entities
+            refreshed: Ids re-exported by a dirty export; None means
+                ``files`` covers every entity and replaces the index
+
+        Returns:
+            Paths no longer owned by any entity (to delete)
+        """
+        entries: Dict[str, Dict[str, List[str]]] = {}
+        for rel_path, (entity_type, key, _data) in files.items():
+            id_ = self._key_ids[entity_type].get(key)
+            if id_ is not None:
+                entries.setdefault(entity_type, {})[str(id_)] = [key, rel_path.as_posix()]
+
+        if refreshed is None:
+            self._index = entries
+            return set()
+
+        old_paths: Set[str] = set()
+        for entity_type, ids in refreshed.items():
+            type_index = self._index.setdefault(entity_type, {})
+            for id_ in ids:
+                old = type_index.pop(str(id_), None)
+                if old is not None:
+                    old_paths.add(old[1])
+            type_index.update(entries.get(entity_type, {}))
+
+        live = {
+            path for type_index in self._index.values()
+            for _key, path in type_index.values()
+        }
+        return {Path(path) for path in old_paths - live}
+
+    def _load_index(self) -> None:
+        """Load the export index, treating a missing or stale one as absent."""
+        self._index, self._index_change_id = {}, None
+        if self.index_path is None or not self.index_path.exists():
+            return
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return
+        entities = data.get("entities")
+        if isinstance(entities, dict) and isinstance(data.get("change_id"), int):
+            self._index = entities
+            self._index_change_id = data["change_id"]
+
+    def _save_index(self) -> None:
+        """Write the export index, then move the change-log watermark."""
+        if self.index_path is None or self._head is None:
+            return
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_atomic(
+            self.index_path,
+            json.dumps({
+                "version": INDEX_VERSION,
+                "change_id": self._head,
+                "entities": self._index,
+            }).encode("utf-8"),
+        )
+        with self.db.session_scope() as session:
+            set_watermark(session, WATERMARK_CONSUMER, self._head)
+
     # =========================================================================
     # ENTITY EXPORT METHODS
     # =========================================================================
 
-    def _export_entries(self, session: Session) -> Dict[str, Dict[str, Any]]:
+    def _export_entries(
+        self, session: Session, ids: Optional[Set[int]] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Export all entries with their owned relationships.
 
@@ -304,16 +727,18 @@ class JSONExporter:
 
         Args:
             session: Active SQLAlchemy session
+            ids: Restrict the export to these primary keys (None = all)
 
         Returns:
             Dict mapping entry date to entry data
         """
-        entries = session.query(Entry).all()
+        entries = self._query(session, Entry, ids)
         result = {}
         total = len(entries)
 
         for i, entry in enumerate(entries, 1):
             key = entry.date.isoformat()
+            self._key_ids["entries"][key] = entry.id
             result[key] = {
                 "date": key,
                 "file_path": entry.file_path,
@@ -353,7 +778,9 @@ class JSONExporter:
         self.stats["entries"] = len(result)
         return result
 
-    def _export_people(self, session: Session) -> Dict[str, Dict[str, Any]]:
+    def _export_people(
+        self, session: Session, ids: Optional[Set[int]] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Export all people (no back-references to entries).
 
@@ -361,15 +788,17 @@ class JSONExporter:
 
         Args:
             session: Active SQLAlchemy session
+            ids: Restrict the export to these primary keys (None = all)
 
         Returns:
             Dict mapping person slug to person data
         """
-        people = session.query(Person).all()
+        people = self._query(session, Person, ids)
         result = {}
         total = len(people)
 
         for i, person in enumerate(people, 1):
+            self._key_ids["people"][person.slug] = person.id
             result[person.slug] = {
                 "slug": person.slug,
                 "name": person.name,
@@ -385,7 +814,9 @@ class JSONExporter:
         self.stats["people"] = len(result)
         return result
 
-    def _export_locations(self, session: Session) -> Dict[str, Dict[str, Any]]:
+    def _export_locations(
+        self, session: Session, ids: Optional[Set[int]] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Export all locations.
 
@@ -393,16 +824,18 @@ class JSONExporter:
 
         Args:
             session: Active SQLAlchemy session
+            ids: Restrict the export to these primary keys (None = all)
 
         Returns:
             Dict mapping location key to location data
         """
-        locations = session.query(Location).all()
+        locations = self._query(session, Location, ids)
         result = {}
         total = len(locations)
 
         for i, loc in enumerate(locations, 1):
             key = self._location_keys[loc.id]
+            self._key_ids["locations"][key] = loc.id
             result[key] = {
                 "name": loc.name,
                 "city": self._city_names[loc.city_id],
@@ -415,7 +848,9 @@ class JSONExporter:
         self.stats["locations"] = len(result)
         return result
 
-    def _export_cities(self, session: Session) -> Dict[str, Dict[str, Any]]:
+    def _export_cities(
+        self, session: Session, ids: Optional[Set[int]] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Export all cities.
 
@@ -423,14 +858,16 @@ class JSONExporter:
 
         Args:
             session: Active SQLAlchemy session
+            ids: Restrict the export to these primary keys (None = all)
 
         Returns:
             Dict mapping city name to city data
         """
-        cities = session.query(City).all()
+        cities = self._query(session, City, ids)
         result = {}
 
         for city in cities:
+            self._key_ids["cities"][city.name] = city.id
             result[city.name] = {
                 "name": city.name,
                 "country": city.country,
@@ -439,7 +876,9 @@ class JSONExporter:
         self.stats["cities"] = len(result)
         return result
 
-    def _export_scenes(self, session: Session) -> Dict[str, Dict[str, Any]]:
+    def _export_scenes(
+        self, session: Session, ids: Optional[Set[int]] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Export all scenes with their owned relationships.
 
@@ -447,11 +886,12 @@ class JSONExporter:
 
         Args:
             session: Active SQLAlchemy session
+            ids: Restrict the export to these primary keys (None = all)
 
         Returns:
             Dict mapping scene key to scene data
         """
-        scenes = session.query(Scene).all()
+        scenes = self._query(session, Scene, ids)
         result = {}
         total = len(scenes)
 
@@ -460,6 +900,7 @@ class JSONExporter:
             dates = sorted([sd.date for sd in scene.dates])
 
             key = self._scene_keys[scene.id]
+            self._key_ids["scenes"][key] = scene.id
             result[key] = {
                 "name": scene.name,
                 "description": scene.description,
@@ -476,7 +917,9 @@ class JSONExporter:
         self.stats["scenes"] = len(result)
         return result
 
-    def _export_events(self, session: Session) -> Dict[str, Dict[str, Any]]:
+    def _export_events(
+        self, session: Session, ids: Optional[Set[int]] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Export all events with their owned relationships.
 
@@ -484,15 +927,17 @@ class JSONExporter:
 
         Args:
             session: Active SQLAlchemy session
+            ids: Restrict the export to these primary keys (None = all)
 
         Returns:
             Dict mapping event name to event data
         """
-        events = session.query(Event).all()
+        events = self._query(session, Event, ids)
         result = {}
         total = len(events)
 
         for i, event in enumerate(events, 1):
+            self._key_ids["events"][event.name] = event.id
             result[event.name] = {
                 "name": event.name,
                 "scenes": sorted([self._scene_keys[s.id] for s in event.scenes]),
@@ -505,7 +950,9 @@ class JSONExporter:
         self.stats["events"] = len(result)
         return result
 
-    def _export_threads(self, session: Session) -> Dict[str, Dict[str, Any]]:
+    def _export_threads(
+        self, session: Session, ids: Optional[Set[int]] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Export all threads with their owned relationships.
 
@@ -513,16 +960,18 @@ class JSONExporter:
 
         Args:
             session: Active SQLAlchemy session
+            ids: Restrict the export to these primary keys (None = all)
 
         Returns:
             Dict mapping thread key to thread data
         """
-        threads = session.query(Thread).all()
+        threads = self._query(session, Thread, ids)
         result = {}
         total = len(threads)
 
         for i, thread in enumerate(threads, 1):
             key = self._thread_keys[thread.id]
+            self._key_ids["threads"][key] = thread.id
             result[key] = {
                 "name": thread.name,
                 "from_date": thread.from_date,
@@ -545,7 +994,9 @@ class JSONExporter:
         self.stats["threads"] = len(result)
         return result
 
-    def _export_arcs(self, session: Session) -> Dict[str, Dict[str, Any]]:
+    def _export_arcs(
+        self, session: Session, ids: Optional[Set[int]] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Export all arcs.
 
@@ -553,14 +1004,16 @@ class JSONExporter:
 
         Args:
             session: Active SQLAlchemy session
+            ids: Restrict the export to these primary keys (None = all)
 
         Returns:
             Dict mapping arc name to arc data
         """
-        arcs = session.query(Arc).all()
+        arcs = self._query(session, Arc, ids)
         result = {}
 
         for arc in arcs:
+            self._key_ids["arcs"][arc.name] = arc.id
             result[arc.name] = {
                 "name": arc.name,
                 "description": arc.description,
@@ -569,7 +1022,9 @@ class JSONExporter:
         self.stats["arcs"] = len(result)
         return result
 
-    def _export_poems(self, session: Session) -> Dict[str, Dict[str, Any]]:
+    def _export_poems(
+        self, session: Session, ids: Optional[Set[int]] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Export all poem versions.
 
@@ -577,11 +1032,12 @@ class JSONExporter:
 
         Args:
             session: Active SQLAlchemy session
+            ids: Restrict the export to these primary keys (None = all)
 
         Returns:
             Dict mapping poem version key to poem version data
         """
-        poem_versions = session.query(PoemVersion).all()
+        poem_versions = self._query(session, PoemVersion, ids)
         result = {}
         total = len(poem_versions)
 
@@ -589,6 +1045,7 @@ class JSONExporter:
             poem_title = self._poem_titles[pv.poem_id]
             entry_date = self._entry_dates[pv.entry_id]
             key = f"{poem_title}::{entry_date}"
+            self._key_ids["poems"][key] = pv.id
             result[key] = {
                 "content": pv.content,
                 "poem": poem_title,
@@ -602,7 +1059,9 @@ class JSONExporter:
         self.stats["poems"] = len(result)
         return result
 
-    def _export_references(self, session: Session) -> Dict[str, Dict[str, Any]]:
+    def _export_references(
+        self, session: Session, ids: Optional[Set[int]] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Export all references.
 
@@ -611,11 +1070,12 @@ class JSONExporter:
 
         Args:
             session: Active SQLAlchemy session
+            ids: Restrict the export to these primary keys (None = all)
 
         Returns:
             Dict mapping reference key to reference data
         """
-        references = session.query(Reference).all()
+        references = self._query(session, Reference, ids)
         result = {}
         total = len(references)
 
@@ -624,6 +1084,7 @@ class JSONExporter:
             mode = ref.mode.value if ref.mode else "unknown"
             entry_date = self._entry_dates[ref.entry_id]
             key = f"{source_title}::{mode}::{entry_date}"
+            self._key_ids["references"][key] = ref.id
             result[key] = {
                 "content": ref.content,
                 "description": ref.description,
@@ -639,7 +1100,9 @@ class JSONExporter:
         self.stats["references"] = len(result)
         return result
 
-    def _export_reference_sources(self, session: Session) -> Dict[str, Dict[str, Any]]:
+    def _export_reference_sources(
+        self, session: Session, ids: Optional[Set[int]] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Export all reference sources.
 
@@ -647,14 +1110,16 @@ class JSONExporter:
 
         Args:
             session: Active SQLAlchemy session
+            ids: Restrict the export to these primary keys (None = all)
 
         Returns:
             Dict mapping source title to source data
         """
-        sources = session.query(ReferenceSource).all()
+        sources = self._query(session, ReferenceSource, ids)
         result = {}
 
         for source in sources:
+            self._key_ids["reference_sources"][source.title] = source.id
             result[source.title] = {
                 "title": source.title,
                 "author": source.author,
@@ -665,7 +1130,9 @@ class JSONExporter:
         self.stats["reference_sources"] = len(result)
         return result
 
-    def _export_tags(self, session: Session) -> Dict[str, Dict[str, Any]]:
+    def _export_tags(
+        self, session: Session, ids: Optional[Set[int]] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Export all tags.
 
@@ -673,14 +1140,16 @@ class JSONExporter:
 
         Args:
             session: Active SQLAlchemy session
+            ids: Restrict the export to these primary keys (None = all)
 
         Returns:
             Dict mapping tag name to tag data
         """
-        tags = session.query(Tag).all()
+        tags = self._query(session, Tag, ids)
         result = {}
 
         for tag in tags:
+            self._key_ids["tags"][tag.name] = tag.id
             result[tag.name] = {
                 "name": tag.name,
             }
@@ -688,7 +1157,9 @@ class JSONExporter:
         self.stats["tags"] = len(result)
         return result
 
-    def _export_themes(self, session: Session) -> Dict[str, Dict[str, Any]]:
+    def _export_themes(
+        self, session: Session, ids: Optional[Set[int]] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Export all themes.
 
@@ -696,14 +1167,16 @@ class JSONExporter:
 
         Args:
             session: Active SQLAlchemy session
+            ids: Restrict the export to these primary keys (None = all)
 
         Returns:
             Dict mapping theme name to theme data
         """
-        themes = session.query(Theme).all()
+        themes = self._query(session, Theme, ids)
         result = {}
 
         for theme in themes:
+            self._key_ids["themes"][theme.name] = theme.id
             result[theme.name] = {
                 "name": theme.name,
             }
@@ -711,7 +1184,9 @@ class JSONExporter:
         self.stats["themes"] = len(result)
         return result
 
-    def _export_motifs(self, session: Session) -> Dict[str, Dict[str, Any]]:
+    def _export_motifs(
+        self, session: Session, ids: Optional[Set[int]] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Export all motifs.
 
@@ -719,14 +1194,16 @@ class JSONExporter:
 
         Args:
             session: Active SQLAlchemy session
+            ids: Restrict the export to these primary keys (None = all)
 
         Returns:
             Dict mapping motif name to motif data
         """
-        motifs = session.query(Motif).all()
+        motifs = self._query(session, Motif, ids)
         result = {}
 
         for motif in motifs:
+            self._key_ids["motifs"][motif.name] = motif.id
             result[motif.name] = {
                 "name": motif.name,
             }
@@ -734,7 +1211,9 @@ class JSONExporter:
         self.stats["motifs"] = len(result)
         return result
 
-    def _export_motif_instances(self, session: Session) -> Dict[str, Dict[str, Any]]:
+    def _export_motif_instances(
+        self, session: Session, ids: Optional[Set[int]] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Export all motif instances.
 
@@ -742,11 +1221,12 @@ class JSONExporter:
 
         Args:
             session: Active SQLAlchemy session
+            ids: Restrict the export to these primary keys (None = all)
 
         Returns:
             Dict mapping motif instance key to motif instance data
         """
-        instances = session.query(MotifInstance).all()
+        instances = self._query(session, MotifInstance, ids)
         result = {}
         total = len(instances)
 
@@ -754,6 +1234,7 @@ class JSONExporter:
             motif_name = self._motif_names[mi.motif_id]
             entry_date = self._entry_dates[mi.entry_id]
             key = f"{motif_name}::{entry_date}"
+            self._key_ids["motif_instances"][key] = mi.id
             result[key] = {
                 "description": mi.description,
                 "motif": motif_name,
@@ -767,7 +1248,9 @@ class JSONExporter:
         self.stats["motif_instances"] = len(result)
         return result
 
-    def _export_theme_instances(self, session: Session) -> Dict[str, Dict[str, Any]]:
+    def _export_theme_instances(
+        self, session: Session, ids: Optional[Set[int]] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Export all theme instances.
 
@@ -775,11 +1258,12 @@ class JSONExporter:
 
         Args:
             session: Active SQLAlchemy session
+            ids: Restrict the export to these primary keys (None = all)
 
         Returns:
             Dict mapping theme instance key to theme instance data
         """
-        instances = session.query(ThemeInstance).all()
+        instances = self._query(session, ThemeInstance, ids)
         result = {}
         total = len(instances)
 
@@ -787,6 +1271,7 @@ class JSONExporter:
             theme_name = self._theme_names[ti.theme_id]
             entry_date = self._entry_dates[ti.entry_id]
             key = f"{theme_name}::{entry_date}"
+            self._key_ids["theme_instances"][key] = ti.id
             result[key] = {
                 "description": ti.description,
                 "theme": theme_name,
@@ -803,7 +1288,9 @@ class JSONExporter:
     # MANUSCRIPT ENTITY EXPORT METHODS
     # =========================================================================
 
-    def _export_parts(self, session: Session) -> Dict[str, Dict[str, Any]]:
+    def _export_parts(
+        self, session: Session, ids: Optional[Set[int]] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Export all parts.
 
@@ -811,15 +1298,17 @@ class JSONExporter:
 
         Args:
             session: Active SQLAlchemy session
+            ids: Restrict the export to these primary keys (None = all)
 
         Returns:
             Dict mapping part key to part data
         """
-        parts = session.query(Part).all()
+        parts = self._query(session, Part, ids)
         result = {}
 
         for part in parts:
             key = str(part.number) if part.number is not None else (part.title or f"part-{part.id}")
+            self._key_ids["parts"][key] = part.id
             result[key] = {
                 "number": part.number,
                 "title": part.title,
@@ -828,7 +1317,9 @@ class JSONExporter:
         self.stats["parts"] = len(result)
         return result
 
-    def _export_chapters(self, session: Session) -> Dict[str, Dict[str, Any]]:
+    def _export_chapters(
+        self, session: Session, ids: Optional[Set[int]] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Export all chapters with type/status enums and relationship natural keys.
 
@@ -836,14 +1327,16 @@ class JSONExporter:
 
         Args:
             session: Active SQLAlchemy session
+            ids: Restrict the export to these primary keys (None = all)
 
         Returns:
             Dict mapping chapter title to chapter data
         """
-        chapters = session.query(Chapter).all()
+        chapters = self._query(session, Chapter, ids)
         result = {}
 
         for chapter in chapters:
+            self._key_ids["chapters"][chapter.title] = chapter.id
             result[chapter.title] = {
                 "title": chapter.title,
                 "number": chapter.number,
@@ -860,7 +1353,9 @@ class JSONExporter:
         self.stats["chapters"] = len(result)
         return result
 
-    def _export_characters(self, session: Session) -> Dict[str, Dict[str, Any]]:
+    def _export_characters(
+        self, session: Session, ids: Optional[Set[int]] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Export all characters.
 
@@ -868,14 +1363,16 @@ class JSONExporter:
 
         Args:
             session: Active SQLAlchemy session
+            ids: Restrict the export to these primary keys (None = all)
 
         Returns:
             Dict mapping character name to character data
         """
-        characters = session.query(Character).all()
+        characters = self._query(session, Character, ids)
         result = {}
 
         for char in characters:
+            self._key_ids["characters"][char.name] = char.id
             result[char.name] = {
                 "name": char.name,
                 "description": char.description,
@@ -886,7 +1383,9 @@ class JSONExporter:
         self.stats["characters"] = len(result)
         return result
 
-    def _export_person_character_maps(self, session: Session) -> Dict[str, Dict[str, Any]]:
+    def _export_person_character_maps(
+        self, session: Session, ids: Optional[Set[int]] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Export all person-character mappings.
 
@@ -895,17 +1394,19 @@ class JSONExporter:
 
         Args:
             session: Active SQLAlchemy session
+            ids: Restrict the export to these primary keys (None = all)
 
         Returns:
             Dict mapping mapping key to mapping data
         """
-        mappings = session.query(PersonCharacterMap).all()
+        mappings = self._query(session, PersonCharacterMap, ids)
         result = {}
 
         for mapping in mappings:
             person_slug = self._person_slugs[mapping.person_id]
             character_name = self._character_names[mapping.character_id]
             key = f"{person_slug}::{character_name}"
+            self._key_ids["person_character_maps"][key] = mapping.id
             result[key] = {
                 "person": person_slug,
                 "character": character_name,
@@ -916,7 +1417,9 @@ class JSONExporter:
         self.stats["person_character_maps"] = len(result)
         return result
 
-    def _export_manuscript_scenes(self, session: Session) -> Dict[str, Dict[str, Any]]:
+    def _export_manuscript_scenes(
+        self, session: Session, ids: Optional[Set[int]] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Export all manuscript scenes with origin/status enums.
 
@@ -924,14 +1427,16 @@ class JSONExporter:
 
         Args:
             session: Active SQLAlchemy session
+            ids: Restrict the export to these primary keys (None = all)
 
         Returns:
             Dict mapping scene name to scene data
         """
-        scenes = session.query(ManuscriptScene).all()
+        scenes = self._query(session, ManuscriptScene, ids)
         result = {}
 
         for scene in scenes:
+            self._key_ids["manuscript_scenes"][scene.name] = scene.id
             result[scene.name] = {
                 "name": scene.name,
                 "description": scene.description,
@@ -946,7 +1451,9 @@ class JSONExporter:
         self.stats["manuscript_scenes"] = len(result)
         return result
 
-    def _export_manuscript_sources(self, session: Session) -> Dict[str, Dict[str, Any]]:
+    def _export_manuscript_sources(
+        self, session: Session, ids: Optional[Set[int]] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Export all manuscript sources with source_type polymorphism.
 
@@ -956,11 +1463,12 @@ class JSONExporter:
 
         Args:
             session: Active SQLAlchemy session
+            ids: Restrict the export to these primary keys (None = all)
 
         Returns:
             Dict mapping source key to source data
         """
-        sources = session.query(ManuscriptSource).all()
+        sources = self._query(session, ManuscriptSource, ids)
         result = {}
 
         for source in sources:
@@ -979,6 +1487,7 @@ class JSONExporter:
                 ref_key = slugify(source.external_note)[:50]
 
             key = f"{ms_scene_name}::{source_type}::{ref_key}"
+            self._key_ids["manuscript_sources"][key] = source.id
             result[key] = {
                 "manuscript_scene": ms_scene_name,
                 "source_type": source_type,
@@ -992,7 +1501,9 @@ class JSONExporter:
         self.stats["manuscript_sources"] = len(result)
         return result
 
-    def _export_manuscript_references(self, session: Session) -> Dict[str, Dict[str, Any]]:
+    def _export_manuscript_references(
+        self, session: Session, ids: Optional[Set[int]] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Export all manuscript references with mode enum.
 
@@ -1001,17 +1512,19 @@ class JSONExporter:
 
         Args:
             session: Active SQLAlchemy session
+            ids: Restrict the export to these primary keys (None = all)
 
         Returns:
             Dict mapping reference key to reference data
         """
-        refs = session.query(ManuscriptReference).all()
+        refs = self._query(session, ManuscriptReference, ids)
         result = {}
 
         for ref in refs:
             chapter_title = self._chapter_titles[ref.chapter_id]
             source_title = self._source_titles[ref.source_id]
             key = f"{chapter_title}::{source_title}"
+            self._key_ids["manuscript_references"][key] = ref.id
             result[key] = {
                 "chapter": chapter_title,
                 "source": source_title,
@@ -1047,12 +1560,7 @@ class JSONExporter:
         safe_logger(self.logger).log_debug("Loading existing exports for comparison")
 
         # Initialize all entity type dicts
-        for entity_type in ["entries", "people", "locations", "cities", "scenes",
-                           "events", "threads", "arcs", "poems", "references",
-                           "reference_sources", "tags", "themes", "motifs",
-                           "motif_instances", "theme_instances",
-                           "parts", "chapters", "characters", "person_character_maps",
-                           "manuscript_scenes", "manuscript_sources", "manuscript_references"]:
+        for entity_type in ENTITY_TYPES:
             old_exports[entity_type] = {}
 
         # Scan all JSON files in journal directory
@@ -1319,195 +1827,273 @@ class JSONExporter:
 
         return ", ".join(changes[:5])  # Limit to first 5 changes per entity
 
-    def _write_exports(self, exports: Dict[str, Dict[str, Dict[str, Any]]]) -> None:
+    def _write_exports(
+        self, exports: Dict[str, Dict[str, Dict[str, Any]]]
+    ) -> Dict[Path, PlannedFile]:
         """
-        Write all JSON files to disk with proper directory structure and filenames.
+        Wipe the export tree and write every JSON file from scratch.
 
-        Implements design spec:
-        - People: people/{first}_{last|disambig}.json
-        - Locations: locations/{city}/{location}.json
-        - Scenes: scenes/{YYYY-MM-DD}/{scene-name}.json
-        - Entries: entries/{YYYY}/{YYYY-MM-DD}.json
-        - Others: {entity_type}/{slug}.json
+        Paths follow _entity_path(). Used by non-incremental exports.
 
         Args:
             exports: All entity data keyed by natural keys
+
+        Returns:
+            The planned files (relative path -> entity)
         """
         # Wipe and recreate — export is a complete snapshot of DB state
         if self.journal_dir.exists():
             shutil.rmtree(self.journal_dir)
         self.journal_dir.mkdir(parents=True, exist_ok=True)
 
-        # Write each entity type with proper paths
-        self._write_entries(exports.get("entries", {}))
-        self._write_people(exports.get("people", {}))
-        self._write_locations(exports.get("locations", {}))
-        self._write_scenes(exports.get("scenes", {}))
-        self._write_simple_entities("events", exports.get("events", {}))
-        self._write_simple_entities("threads", exports.get("threads", {}))
-        self._write_simple_entities("arcs", exports.get("arcs", {}))
-        self._write_simple_entities("tags", exports.get("tags", {}))
-        self._write_simple_entities("themes", exports.get("themes", {}))
-        self._write_simple_entities("motifs", exports.get("motifs", {}))
-        self._write_simple_entities("poems", exports.get("poems", {}))
-        self._write_simple_entities("references", exports.get("references", {}))
-        self._write_simple_entities("reference_sources", exports.get("reference_sources", {}))
-        self._write_simple_entities("motif_instances", exports.get("motif_instances", {}))
-        self._write_simple_entities("theme_instances", exports.get("theme_instances", {}))
-        self._write_simple_entities("cities", exports.get("cities", {}))
-
-        # Manuscript entities
-        self._write_simple_entities("parts", exports.get("parts", {}))
-        self._write_simple_entities("chapters", exports.get("chapters", {}))
-        self._write_simple_entities("characters", exports.get("characters", {}))
-        self._write_simple_entities("person_character_maps", exports.get("person_character_maps", {}))
-        self._write_simple_entities("manuscript_scenes", exports.get("manuscript_scenes", {}))
-        self._write_simple_entities("manuscript_sources", exports.get("manuscript_sources", {}))
-        self._write_simple_entities("manuscript_references", exports.get("manuscript_references", {}))
-
-    def _write_entries(self, entries: Dict[str, Dict[str, Any]]) -> None:
-        """
-        Write entries to entries/YYYY/YYYY-MM-DD.json.
-
-        Args:
-            entries: Dict mapping entry date to entry data
-        """
-        entries_dir = self.journal_dir / "entries"
-
-        total = len(entries)
-        for i, (key, entry_data) in enumerate(entries.items(), 1):
+        files = self._plan_files(exports)
+        total = len(files)
+        for i, (rel_path, (entity_type, key, data)) in enumerate(files.items(), 1):
             try:
-                entry_date = entry_data["date"]
-                filepath = entries_dir / generate_entry_path(entry_date)
+                filepath = self.journal_dir / rel_path
                 filepath.parent.mkdir(parents=True, exist_ok=True)
+                filepath.write_text(self._serialize(data), encoding="utf-8")
+                self.files_written += 1
+            except OSError as e:
+                safe_logger(self.logger).log_warning(
+                    f"Failed to write {entity_type} {key}: {e}"
+                )
 
-                with open(filepath, "w", encoding="utf-8") as f:
-                    json.dump(entry_data, f, indent=2, ensure_ascii=False, sort_keys=True)
+            # Progress feedback every 1000 files
+            if i % 1000 == 0 or i == total:
+                safe_logger(self.logger).log_debug(f"   Writing files: {i}/{total}")
 
-                # Progress feedback every 100 files
-                if i % 100 == 0 or i == total:
-                    safe_logger(self.logger).log_debug(f"   Writing entry files: {i}/{total}")
+        return files
 
-            except (KeyError, OSError) as e:
-                safe_logger(self.logger).log_warning(
-                    f"Failed to write entry {key}: {e}"
-                )
+    def _sync_exports(
+        self, exports: Dict[str, Dict[str, Dict[str, Any]]]
+    ) -> Dict[Path, PlannedFile]:
+        """
+        Bring the export tree in line with the DB, touching only differences.
+
+        Args:
+            exports: All entity data keyed by natural keys
+
+        Returns:
+            The planned files (relative path -> entity)
+        """
+        files = self._plan_files(exports)
+        self._sync_files(files)
+        return files
 
-    def _write_people(self, people: Dict[str, Dict[str, Any]]) -> None:
+    def _sync_files(
+        self, files: Dict[Path, PlannedFile], orphans: Optional[Set[Path]] = None
+    ) -> None:
         """
-        Write people to people/{first}_{last|disambig}.json.
+        Write changed files and delete orphans.
+
+        Each entity is serialized and compared with the file on disk (via
+        the file-state cache when available, so unchanged files are not
+        even read). Added or changed files are written atomically. Change
+        descriptions are generated from the differing files only.
 
         Args:
-            people: Dict mapping person slug to person data
+            files: Planned files to write
+            orphans: Relative paths to delete; None scans the whole tree
+                and deletes every file no planned entity maps to
         """
-        people_dir = self.journal_dir / "people"
-        people_dir.mkdir(parents=True, exist_ok=True)
+        self.journal_dir.mkdir(parents=True, exist_ok=True)
+        if orphans is None:
+            on_disk = {
+                path.relative_to(self.journal_dir)
+                for path in self.journal_dir.rglob("*.json")
+            }
+            orphans = on_disk - files.keys()
+        else:
+            on_disk = {
+                rel_path for rel_path in files.keys() | orphans
+                if (self.journal_dir / rel_path).exists()
+            }
+            orphans = orphans & on_disk
 
-        total = len(people)
-        for i, (slug, person_data) in enumerate(people.items(), 1):
-            try:
-                filename = generate_person_filename(
-                    person_data["name"],
-                    person_data.get("lastname"),
-                    person_data.get("disambiguator"),
-                )
-                filepath = people_dir / filename
+        old_changed: Dict[str, Dict[str, Dict[str, Any]]] = {t: {} for t in ENTITY_TYPES}
+        new_changed: Dict[str, Dict[str, Dict[str, Any]]] = {t: {} for t in ENTITY_TYPES}
+
+        for rel_path, (entity_type, key, data) in files.items():
+            filepath = self.journal_dir / rel_path
+            content = self._serialize(data).encode("utf-8")
 
-                with open(filepath, "w", encoding="utf-8") as f:
-                    json.dump(person_data, f, indent=2, ensure_ascii=False, sort_keys=True)
+            if rel_path in on_disk:
+                digest = hashlib.sha256(content).hexdigest()
+                if self.file_state is not None and self.file_state.lookup(filepath) == digest:
+                    continue
+
+                stat_result = os.stat(filepath)
+                old_content = filepath.read_bytes()
+                if old_content == content:
+                    if self.file_state is not None:
+                        self.file_state.record(filepath, digest, stat_result)
+                    continue
+                self._collect_old(old_changed, rel_path, old_content)
 
-                # Progress feedback every 100 files
-                if i % 100 == 0 or i == total:
-                    safe_logger(self.logger).log_debug(f"   Writing people files: {i}/{total}")
+            new_changed[entity_type][key] = data
+            try:
+                self._write_atomic(filepath, content)
+                self.files_written += 1
+            except OSError as e:
+                safe_logger(self.logger).log_warning(
+                    f"Failed to write {entity_type} {key}: {e}"
+                )
 
-            except ValueError as e:
-                # Person violates lastname OR disambiguator requirement
+        for rel_path in sorted(orphans):
+            filepath = self.journal_dir / rel_path
+            try:
+                self._collect_old(old_changed, rel_path, filepath.read_bytes())
+                filepath.unlink()
+                self.files_deleted += 1
+            except OSError as e:
                 safe_logger(self.logger).log_warning(
-                    f"Skipping person {slug} ({person_data['name']}): {e}"
+                    f"Failed to delete orphan {rel_path}: {e}"
                 )
+                continue
+            if self.file_state is not None:
+                self.file_state.invalidate(filepath)
+            self._prune_empty_dirs(filepath.parent)
 
-    def _write_locations(self, locations: Dict[str, Dict[str, Any]]) -> None:
+        self._generate_changes(old_changed, new_changed)
+
+    def _plan_files(
+        self, exports: Dict[str, Dict[str, Dict[str, Any]]]
+    ) -> Dict[Path, PlannedFile]:
         """
-        Write locations to locations/{city}/{location}.json.
+        Map every exported entity to its file path under journal/.
+
+        Entities whose path cannot be built are logged and skipped.
 
         Args:
-            locations: Dict mapping location key to location data
+            exports: All entity data keyed by natural keys
+
+        Returns:
+            Dict of relative path -> (entity_type, natural_key, data)
+        """
+        files: Dict[Path, PlannedFile] = {}
+        for entity_type in ENTITY_TYPES:
+            for key, data in exports.get(entity_type, {}).items():
+                try:
+                    rel_path = self._entity_path(entity_type, key, data)
+                except ValueError as e:
+                    # Person violates lastname OR disambiguator requirement
+                    safe_logger(self.logger).log_warning(
+                        f"Skipping {entity_type} {key} ({data.get('name')}): {e}"
+                    )
+                    continue
+                except KeyError as e:
+                    safe_logger(self.logger).log_warning(
+                        f"Failed to write {entity_type} {key}: {e}"
+                    )
+                    continue
+                files[rel_path] = (entity_type, key, data)
+        return files
+
+    def _entity_path(
+        self, entity_type: str, key: str, data: Dict[str, Any]
+    ) -> Path:
         """
-        locations_dir = self.journal_dir / "locations"
+        Build the path of an entity's JSON file, relative to journal/.
 
-        total = len(locations)
-        for i, (key, loc_data) in enumerate(locations.items(), 1):
-            try:
-                city_name = loc_data["city"]
-                filepath = locations_dir / generate_location_path(city_name, loc_data["name"])
-                filepath.parent.mkdir(parents=True, exist_ok=True)
+        Implements design spec:
+        - People: people/{first}_{last|disambig}.json
+        - Locations: locations/{city}/{location}.json
+        - Scenes: scenes/{YYYY-MM-DD}/{scene-name}.json
+        - Entries: entries/{YYYY}/{YYYY-MM-DD}.json
+        - Others: {entity_type}/{slug}.json
 
-                with open(filepath, "w", encoding="utf-8") as f:
-                    json.dump(loc_data, f, indent=2, ensure_ascii=False, sort_keys=True)
+        Args:
+            entity_type: Entity type name
+            key: Natural key of the entity
+            data: Entity JSON data
 
-                # Progress feedback every 100 files
-                if i % 100 == 0 or i == total:
-                    safe_logger(self.logger).log_debug(f"   Writing location files: {i}/{total}")
+        Returns:
+            Relative path of the JSON file
 
-            except (KeyError, OSError) as e:
-                safe_logger(self.logger).log_warning(
-                    f"Failed to write location {key}: {e}"
-                )
+        Raises:
+            KeyError: If a field required for the path is missing
+            ValueError: If a person has neither lastname nor disambiguator
+        """
+        base = Path(entity_type)
+        if entity_type == "entries":
+            return base / generate_entry_path(data["date"])
+        if entity_type == "people":
+            return base / generate_person_filename(
+                data["name"], data.get("lastname"), data.get("disambiguator"),
+            )
+        if entity_type == "locations":
+            return base / generate_location_path(data["city"], data["name"])
+        if entity_type == "scenes":
+            return base / generate_scene_path(data["entry_date"], data["name"])
+        name = data.get("name") or data.get("title") or key
+        return base / f"{slugify(str(name))}.json"
 
-    def _write_scenes(self, scenes: Dict[str, Dict[str, Any]]) -> None:
+    def _serialize(self, data: Dict[str, Any]) -> str:
         """
-        Write scenes to scenes/{YYYY-MM-DD}/{scene-name}.json.
+        Serialize entity data exactly as it is stored on disk.
 
         Args:
-            scenes: Dict mapping scene key to scene data
+            data: Entity JSON data
+
+        Returns:
+            Pretty-printed JSON with sorted keys
         """
-        scenes_dir = self.journal_dir / "scenes"
+        return json.dumps(data, indent=2, ensure_ascii=False, sort_keys=True)
 
-        total = len(scenes)
-        for i, (key, scene_data) in enumerate(scenes.items(), 1):
-            try:
-                entry_date = scene_data["entry_date"]
-                filepath = scenes_dir / generate_scene_path(entry_date, scene_data["name"])
-                filepath.parent.mkdir(parents=True, exist_ok=True)
+    def _collect_old(
+        self,
+        old_exports: Dict[str, Dict[str, Dict[str, Any]]],
+        rel_path: Path,
+        content: bytes,
+    ) -> None:
+        """
+        Parse a file about to be replaced or deleted for the change log.
 
-                with open(filepath, "w", encoding="utf-8") as f:
-                    json.dump(scene_data, f, indent=2, ensure_ascii=False, sort_keys=True)
+        Args:
+            old_exports: Dict of old entities to add to
+            rel_path: Path of the file relative to journal/
+            content: Current file contents
+        """
+        entity_type = rel_path.parts[0]
+        if entity_type not in old_exports:
+            return
+        try:
+            data = json.loads(content)
+        except ValueError:
+            return
+        natural_key = self._extract_natural_key(entity_type, data)
+        if natural_key is not None:
+            old_exports[entity_type][natural_key] = data
 
-                # Progress feedback every 100 files
-                if i % 100 == 0 or i == total:
-                    safe_logger(self.logger).log_debug(f"   Writing scene files: {i}/{total}")
+    def _write_atomic(self, filepath: Path, content: bytes) -> None:
+        """
+        Replace a file's contents atomically (temp file + rename).
 
-            except (KeyError, OSError) as e:
-                safe_logger(self.logger).log_warning(
-                    f"Failed to write scene {key}: {e}"
-                )
+        Args:
+            filepath: Destination file
+            content: Bytes to write
+        """
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = filepath.with_name(f".{filepath.name}.tmp")
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, filepath)
 
-    def _write_simple_entities(self, entity_type: str, entities: Dict[str, Dict[str, Any]]) -> None:
+    def _prune_empty_dirs(self, directory: Path) -> None:
         """
-        Write entities with simple slug-based filenames.
+        Remove empty directories left behind by deleted orphans.
 
-        Uses the natural key (dict key) to generate filenames.
+        Walks upwards from ``directory`` and stops at journal/.
 
         Args:
-            entity_type: Entity type name (used as directory)
-            entities: Dict mapping natural key to entity data
+            directory: Directory of a deleted file
         """
-        entity_dir = self.journal_dir / entity_type
-        entity_dir.mkdir(parents=True, exist_ok=True)
-
-        for key, entity_data in entities.items():
+        while directory != self.journal_dir and self.journal_dir in directory.parents:
             try:
-                name = entity_data.get("name") or entity_data.get("title") or key
-                filename = f"{slugify(str(name))}.json"
-                filepath = entity_dir / filename
-
-                with open(filepath, "w", encoding="utf-8") as f:
-                    json.dump(entity_data, f, indent=2, ensure_ascii=False, sort_keys=True)
-
-            except (KeyError, OSError) as e:
-                safe_logger(self.logger).log_warning(
-                    f"Failed to write {entity_type} {key}: {e}"
-                )
+                directory.rmdir()
+            except OSError:
+                return
+            directory = directory.parent
 
     def _write_readme(self) -> None:
         """
@@ -14,13 +14,18 @@ Key Features:
     - FK-dependency-ordered import (leaf entities first, dependents last)
     - Natural-key-based relationship resolution (slugs, names, dates)
     - Enum string-to-instance conversion for all typed fields
-    - Single-transaction import with flush-based ID resolution
+    - Single-transaction import with set-based writes: one
+      ``INSERT ... ON CONFLICT DO UPDATE ... RETURNING`` per entity type
+      and batched association-table diffs (see dev.database.bulk)
+    - Files bucketed by entity type in one pass and parsed across a
+      thread pool before the import transaction starts
 
 Architecture:
-    - Builds natural_key -> DB_id lookup dicts as entities are created
-    - Each _import_* method returns a lookup dict for downstream methods
+    - Each phase reads a natural_key -> DB_id lookup once (key columns
+      only) and its _import_* method adds the ids the upsert returns
     - Import order respects FK dependencies so lookups are available
-    - M2M relationships resolved via ORM relationship attributes
+    - M2M relationships written by diffing association rows per parent
+    - Parts and ManuscriptSources (no usable unique key) use the ORM
 
 Import Order (respects FK dependencies):
     1. Cities, Tags, Themes, Motifs, Arcs, Poems, ReferenceSources, Parts
@@ -58,16 +63,21 @@ from __future__ import annotations
 
 # --- Standard library imports ---
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Type, TypeVar
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 # --- Third-party imports ---
+from sqlalchemy import Table
 from sqlalchemy.orm import Session
 
 # --- Local imports ---
 from dev.core.logging_manager import PalimpsestLogger, safe_logger
 from dev.core.paths import ROOT
+from dev.database.aggregates import refresh_aggregates
+from dev.database.bulk import LINK_QUERY_CHUNK, bulk_upsert, replace_links
 from dev.database.manager import PalimpsestDB
 from dev.database.models import (
     Arc,
@@ -92,6 +102,19 @@ from dev.database.models import (
     Tag,
     Theme,
     Thread,
+    arc_entries,
+    chapter_poems,
+    entry_cities,
+    entry_locations,
+    entry_people,
+    entry_tags,
+    event_entries,
+    event_scenes,
+    scene_characters,
+    scene_locations,
+    scene_people,
+    thread_locations,
+    thread_people,
 )
 from dev.database.models.metadata import Motif, MotifInstance, ThemeInstance
 from dev.database.models.enums import (
@@ -107,34 +130,41 @@ from dev.database.models.enums import (
 )
 
 
-_T = TypeVar("_T")
+# Below this many files, reading serially beats starting a thread pool
+PARALLEL_MIN_FILES = 16
 
 
-def _resolve_m2m(
-    session: Session,
-    model: Type[_T],
-    lookup: Dict[str, int],
-    keys: List[str],
-) -> List[_T]:
+def _read_json(path: Path) -> Tuple[Any, Optional[Exception]]:
     """
-    Resolve a list of natural keys to ORM instances via lookup dict.
+    Read and parse one JSON file.
+
+    Errors are returned rather than raised so a pool can read every
+    file and the caller can log failures in file order.
+
+    Args:
+        path: JSON file to read
+
+    Returns:
+        (data, None) on success, (None, error) on failure
+    """
+    try:
+        return json.loads(path.read_bytes()), None
+    except (ValueError, OSError) as e:
+        return None, e
+
+
+def _resolve_ids(lookup: Dict[str, int], keys: List[str]) -> Set[int]:
+    """
+    Resolve a list of natural keys to IDs via lookup dict.
 
     Args:
-        session: SQLAlchemy session
-        model: ORM model class
         lookup: Natural key to ID mapping
         keys: Natural keys to resolve
 
     Returns:
-        List of resolved ORM instances (skips missing)
+        Set of resolved IDs (skips missing)
     """
-    result: List[_T] = []
-    for key in keys:
-        if key in lookup:
-            entity = session.get(model, lookup[key])
-            if entity is not None:
-                result.append(entity)
-    return result
+    return {lookup[key] for key in keys if key in lookup}
 
 
 class JSONImporter:
@@ -166,9 +196,13 @@ class JSONImporter:
         self.logger = logger
         self.stats: Dict[str, int] = {}
 
+        # Bulk Core writes bypass the flush hook, so log them explicitly
+        self._track: bool = getattr(db, "tracks_changes", False)
+
     def import_all(
         self,
         changed_files: Optional[Set[Path]] = None,
+        workers: Optional[int] = None,
     ) -> Dict[str, int]:
         """
         Import entity types from JSON files in dependency order.
@@ -184,6 +218,8 @@ class JSONImporter:
         Args:
             changed_files: Set of changed file paths for incremental
                 import.  ``None`` means full import (all files loaded).
+            workers: Threads reading JSON files (None = default pool
+                size; 1 = serial)
 
         Returns:
             Dict mapping entity type names to count of imported entities
@@ -195,98 +231,107 @@ class JSONImporter:
         mode = "incremental" if incremental else "full"
         safe_logger(self.logger).log_info(f"Starting {mode} JSON import")
 
+        # Bucket and parse every file up front, in a single pass
+        loaded = self._load_json_files(self._collect_files(changed_files), workers)
+
         def _should_import(entity_type: str) -> bool:
             """Check if this entity type needs importing."""
             if changed_files is None:
                 return True
-            return self._has_changes(entity_type, changed_files)
+            return entity_type in loaded
 
         def _load(entity_type: str) -> List[Dict[str, Any]]:
-            """Load JSON files, filtered in incremental mode."""
-            return self._load_json_files(entity_type, changed_files)
+            """Return the parsed files of an entity type."""
+            return loaded.get(entity_type, [])
 
         with self.db.session_scope() as session:
+            # Each phase reads its lookup once, then the import adds the
+            # ids of rows it inserts, so downstream phases see them.
+
             # --- Phase 1: Leaf entities (no FK dependencies) ---
-            if _should_import("cities"):
-                self._import_cities(session, _load("cities"))
             city_lk = self._db_lookup_cities(session)
+            if _should_import("cities"):
+                self._import_cities(session, _load("cities"), city_lk)
 
-            if _should_import("tags"):
-                self._import_tags(session, _load("tags"))
             tag_lk = self._db_lookup_tags(session)
+            if _should_import("tags"):
+                self._import_tags(session, _load("tags"), tag_lk)
 
-            if _should_import("themes"):
-                self._import_themes(session, _load("themes"))
             theme_lk = self._db_lookup_themes(session)
+            if _should_import("themes"):
+                self._import_themes(session, _load("themes"), theme_lk)
 
-            if _should_import("motifs"):
-                self._import_motifs(session, _load("motifs"))
             motif_lk = self._db_lookup_motifs(session)
+            if _should_import("motifs"):
+                self._import_motifs(session, _load("motifs"), motif_lk)
 
-            if _should_import("arcs"):
-                self._import_arcs(session, _load("arcs"))
             arc_lk = self._db_lookup_arcs(session)
+            if _should_import("arcs"):
+                self._import_arcs(session, _load("arcs"), arc_lk)
 
-            if _should_import("poems"):
-                self._import_poems(session, _load("poems"))
             poem_lk = self._db_lookup_poems(session)
+            if _should_import("poems"):
+                self._import_poems(session, _load("poems"), poem_lk)
 
-            if _should_import("reference_sources"):
-                self._import_reference_sources(session, _load("reference_sources"))
             source_lk = self._db_lookup_sources(session)
+            if _should_import("reference_sources"):
+                self._import_reference_sources(
+                    session, _load("reference_sources"), source_lk
+                )
 
-            if _should_import("parts"):
-                self._import_parts(session, _load("parts"))
             part_lk = self._db_lookup_parts(session)
+            if _should_import("parts"):
+                self._import_parts(session, _load("parts"), part_lk)
 
             # --- Phase 2: People (no FK deps) ---
-            if _should_import("people"):
-                self._import_people(session, _load("people"))
             people_lk = self._db_lookup_people(session)
+            if _should_import("people"):
+                self._import_people(session, _load("people"), people_lk)
 
             # --- Phase 3: Locations (FK to City) ---
+            location_lk = self._db_lookup_locations(session)
             if _should_import("locations"):
                 self._import_locations(
-                    session, _load("locations"), city_lk
+                    session, _load("locations"), location_lk, city_lk
                 )
-            location_lk = self._db_lookup_locations(session)
 
             # --- Phase 4: Entries (M2M to many entities) ---
+            entry_lk = self._db_lookup_entries(session)
             entries_data = _load("entries")
             if entries_data:
                 self._import_entries(
                     session,
                     entries_data,
+                    entry_lk,
                     people_lk,
                     location_lk,
                     city_lk,
                     arc_lk,
                     tag_lk,
                 )
-            entry_lk = self._db_lookup_entries(session)
 
             # --- Phase 5: Scenes (FK to Entry) ---
+            scene_lk = self._db_lookup_scenes(session)
             if _should_import("scenes"):
                 self._import_scenes(
-                    session, _load("scenes"),
+                    session, _load("scenes"), scene_lk,
                     entry_lk, people_lk, location_lk,
                 )
-            scene_lk = self._db_lookup_scenes(session)
 
             # --- Phase 6: Threads (FK to Entry) ---
+            thread_lk = self._db_lookup_threads(session)
             if _should_import("threads"):
                 self._import_threads(
-                    session, _load("threads"),
+                    session, _load("threads"), thread_lk,
                     entry_lk, people_lk, location_lk,
                 )
-            thread_lk = self._db_lookup_threads(session)
 
             # --- Phase 7: Events (M2M to Scenes + Entries) ---
+            event_lk = self._db_lookup_events(session)
             if _should_import("events"):
                 self._import_events(
-                    session, _load("events"), scene_lk
+                    session, _load("events"), event_lk, scene_lk
                 )
-            event_lk = self._db_lookup_events(session)
 
             # Link entries to events (only for changed entries)
             if entries_data:
@@ -320,16 +365,18 @@ class JSONImporter:
                 )
 
             # --- Phase 11: Chapters (FK to Part, M2M to Poems) ---
+            chapter_lk = self._db_lookup_chapters(session)
             if _should_import("chapters"):
                 self._import_chapters(
-                    session, _load("chapters"), part_lk, poem_lk
+                    session, _load("chapters"), chapter_lk, part_lk, poem_lk
                 )
-            chapter_lk = self._db_lookup_chapters(session)
 
             # --- Phase 12: Characters ---
-            if _should_import("characters"):
-                self._import_characters(session, _load("characters"))
             character_lk = self._db_lookup_characters(session)
+            if _should_import("characters"):
+                self._import_characters(
+                    session, _load("characters"), character_lk
+                )
 
             # --- Phase 13: PersonCharacterMaps ---
             if _should_import("person_character_maps"):
@@ -339,12 +386,12 @@ class JSONImporter:
                 )
 
             # --- Phase 14: ManuscriptScenes (FK to Chapter, M2M Characters) ---
+            ms_scene_lk = self._db_lookup_ms_scenes(session)
             if _should_import("manuscript_scenes"):
                 self._import_manuscript_scenes(
-                    session, _load("manuscript_scenes"),
+                    session, _load("manuscript_scenes"), ms_scene_lk,
                     chapter_lk, character_lk,
                 )
-            ms_scene_lk = self._db_lookup_ms_scenes(session)
 
             # --- Phase 15: ManuscriptSources ---
             if _should_import("manuscript_sources"):
@@ -360,6 +407,10 @@ class JSONImporter:
                     chapter_lk, source_lk,
                 )
 
+            # Keep derived tables current on the write path, so wiki and
+            # analytics reads do not have to refresh them
+            refresh_aggregates(session)
+
         total = sum(self.stats.values())
         safe_logger(self.logger).log_info(
             f"Import complete ({mode}): {total} entities imported"
@@ -370,308 +421,375 @@ class JSONImporter:
     # JSON FILE LOADING
     # =========================================================================
 
-    def _load_json_files(
-        self,
-        entity_type: str,
-        changed_files: Optional[Set[Path]] = None,
-    ) -> List[Dict[str, Any]]:
+    def _collect_files(
+        self, changed_files: Optional[Set[Path]] = None
+    ) -> Dict[str, List[Path]]:
         """
-        Load JSON files for an entity type from the export directory.
+        Bucket JSON files by entity type in a single pass.
 
-        Recursively globs *.json from journal/{entity_type}/ and parses
-        each file into a dict.  When ``changed_files`` is provided, only
-        files present in that set are loaded (incremental mode).
+        Full mode walks journal/ once; incremental mode only classifies
+        the changed paths. The entity type is the first directory under
+        journal/ (e.g. journal/scenes/2024/...json -> "scenes").
 
         Args:
-            entity_type: Subdirectory name (e.g. "entries", "people")
-            changed_files: If provided, only load files in this set.
-                ``None`` loads all files (full import mode).
+            changed_files: If provided, only bucket existing files in this
+                set. ``None`` buckets every file (full import mode).
 
         Returns:
-            List of parsed JSON dicts, one per file
+            Dict mapping entity type to its sorted JSON file paths
         """
-        entity_dir = self.journal_dir / entity_type
-        if not entity_dir.exists():
-            safe_logger(self.logger).log_debug(
-                f"No directory for {entity_type}, skipping"
+        if changed_files is None:
+            candidates: Iterable[Path] = self.journal_dir.rglob("*.json")
+        else:
+            candidates = (
+                path for path in changed_files
+                if path.suffix == ".json" and path.is_file()
             )
-            return []
 
-        results: List[Dict[str, Any]] = []
-        for json_file in sorted(entity_dir.rglob("*.json")):
-            if changed_files is not None and json_file not in changed_files:
-                continue
+        buckets: Dict[str, List[Path]] = {}
+        for path in candidates:
             try:
-                with open(json_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                results.append(data)
-            except (json.JSONDecodeError, OSError) as e:
-                safe_logger(self.logger).log_warning(
-                    f"Skipping corrupted file {json_file}: {e}"
-                )
-        return results
+                parts = path.relative_to(self.journal_dir).parts
+            except ValueError:
+                continue
+            if len(parts) > 1:
+                buckets.setdefault(parts[0], []).append(path)
+        for paths in buckets.values():
+            paths.sort()
+        return buckets
 
-    def _has_changes(
+    def _load_json_files(
         self,
-        entity_type: str,
-        changed_files: Set[Path],
-    ) -> bool:
+        files: Dict[str, List[Path]],
+        workers: Optional[int] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
         """
-        Check if any changed files belong to an entity type subdirectory.
+        Read and parse bucketed JSON files, across a thread pool.
+
+        Every file of every entity type goes through one pool, so small
+        incremental imports spread over many types still overlap their
+        reads. Results keep the per-type file order.
 
         Args:
-            entity_type: Subdirectory name (e.g. "entries", "people")
-            changed_files: Set of changed file paths.
+            files: Entity type to file paths, from _collect_files()
+            workers: Reader threads (None = default pool size; 1 = serial)
 
         Returns:
-            ``True`` if at least one changed file is under the entity dir.
+            Dict mapping entity type to parsed JSON dicts, one per file
         """
-        entity_dir = self.journal_dir / entity_type
-        return any(entity_dir in f.parents for f in changed_files)
+        tasks = [
+            (entity_type, path)
+            for entity_type, paths in files.items()
+            for path in paths
+        ]
+        paths = [path for _entity_type, path in tasks]
+
+        workers = workers or min(32, (os.cpu_count() or 1) + 4)
+        if workers <= 1 or len(paths) < PARALLEL_MIN_FILES:
+            results = [_read_json(path) for path in paths]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_read_json, paths))
+
+        loaded: Dict[str, List[Dict[str, Any]]] = {t: [] for t in files}
+        for (entity_type, path), (data, error) in zip(tasks, results):
+            if error is not None:
+                safe_logger(self.logger).log_warning(
+                    f"Skipping corrupted file {path}: {error}"
+                )
+                continue
+            loaded[entity_type].append(data)
+        return loaded
 
     # =========================================================================
-    # DB LOOKUP BUILDERS (for incremental mode)
+    # DB LOOKUP BUILDERS
     # =========================================================================
 
     @staticmethod
     def _db_lookup_cities(session: Session) -> Dict[str, int]:
         """Build city name-to-ID lookup from database."""
-        return {c.name: c.id for c in session.query(City).all()}
+        return dict(session.query(City.name, City.id).all())
 
     @staticmethod
     def _db_lookup_tags(session: Session) -> Dict[str, int]:
         """Build tag name-to-ID lookup from database."""
-        return {t.name: t.id for t in session.query(Tag).all()}
+        return dict(session.query(Tag.name, Tag.id).all())
 
     @staticmethod
     def _db_lookup_themes(session: Session) -> Dict[str, int]:
         """Build theme name-to-ID lookup from database."""
-        return {t.name: t.id for t in session.query(Theme).all()}
+        return dict(session.query(Theme.name, Theme.id).all())
 
     @staticmethod
     def _db_lookup_motifs(session: Session) -> Dict[str, int]:
         """Build motif name-to-ID lookup from database."""
-        return {m.name: m.id for m in session.query(Motif).all()}
+        return dict(session.query(Motif.name, Motif.id).all())
 
     @staticmethod
     def _db_lookup_arcs(session: Session) -> Dict[str, int]:
         """Build arc name-to-ID lookup from database."""
-        return {a.name: a.id for a in session.query(Arc).all()}
+        return dict(session.query(Arc.name, Arc.id).all())
 
     @staticmethod
     def _db_lookup_poems(session: Session) -> Dict[str, int]:
         """Build poem title-to-ID lookup from database."""
-        return {p.title: p.id for p in session.query(Poem).all()}
+        return dict(session.query(Poem.title, Poem.id).all())
 
     @staticmethod
     def _db_lookup_sources(session: Session) -> Dict[str, int]:
         """Build reference source title-to-ID lookup from database."""
-        return {s.title: s.id for s in session.query(ReferenceSource).all()}
+        return dict(session.query(ReferenceSource.title, ReferenceSource.id).all())
 
     @staticmethod
     def _db_lookup_parts(session: Session) -> Dict[str, int]:
         """Build part number-to-ID lookup from database."""
-        return {str(p.number): p.id for p in session.query(Part).all()}
+        return {
+            str(number): id_
+            for number, id_ in session.query(Part.number, Part.id)
+        }
 
     @staticmethod
     def _db_lookup_people(session: Session) -> Dict[str, int]:
         """Build person slug-to-ID lookup from database."""
-        return {p.slug: p.id for p in session.query(Person).all()}
+        return dict(session.query(Person.slug, Person.id).all())
 
     @staticmethod
     def _db_lookup_locations(session: Session) -> Dict[str, int]:
         """Build location 'name::city'-to-ID lookup from database."""
         return {
-            f"{loc.name}::{loc.city.name}": loc.id
-            for loc in session.query(Location).all()
-            if loc.city
+            f"{name}::{city}": id_
+            for name, city, id_ in session.query(
+                Location.name, City.name, Location.id
+            ).join(City, Location.city_id == City.id)
         }
 
     @staticmethod
     def _db_lookup_entries(session: Session) -> Dict[str, int]:
         """Build entry date-to-ID lookup from database."""
         return {
-            e.date.isoformat(): e.id
-            for e in session.query(Entry).all()
+            entry_date.isoformat(): id_
+            for entry_date, id_ in session.query(Entry.date, Entry.id)
         }
 
     @staticmethod
     def _db_lookup_scenes(session: Session) -> Dict[str, int]:
         """Build scene 'name::entry_date'-to-ID lookup from database."""
         return {
-            f"{s.name}::{s.entry.date.isoformat()}": s.id
-            for s in session.query(Scene).all()
-            if s.entry
+            f"{name}::{entry_date.isoformat()}": id_
+            for name, entry_date, id_ in session.query(
+                Scene.name, Entry.date, Scene.id
+            ).join(Entry, Scene.entry_id == Entry.id)
         }
 
     @staticmethod
     def _db_lookup_threads(session: Session) -> Dict[str, int]:
         """Build thread 'name::entry_date'-to-ID lookup from database."""
         return {
-            f"{t.name}::{t.entry.date.isoformat()}": t.id
-            for t in session.query(Thread).all()
-            if t.entry
+            f"{name}::{entry_date.isoformat()}": id_
+            for name, entry_date, id_ in session.query(
+                Thread.name, Entry.date, Thread.id
+            ).join(Entry, Thread.entry_id == Entry.id)
         }
 
     @staticmethod
     def _db_lookup_events(session: Session) -> Dict[str, int]:
         """Build event name-to-ID lookup from database."""
-        return {e.name: e.id for e in session.query(Event).all()}
+        return dict(session.query(Event.name, Event.id).all())
 
     @staticmethod
     def _db_lookup_chapters(session: Session) -> Dict[str, int]:
         """Build chapter title-to-ID lookup from database."""
-        return {c.title: c.id for c in session.query(Chapter).all()}
+        return dict(session.query(Chapter.title, Chapter.id).all())
 
     @staticmethod
     def _db_lookup_characters(session: Session) -> Dict[str, int]:
         """Build character name-to-ID lookup from database."""
-        return {c.name: c.id for c in session.query(Character).all()}
+        return dict(session.query(Character.name, Character.id).all())
 
     @staticmethod
     def _db_lookup_ms_scenes(session: Session) -> Dict[str, int]:
         """Build manuscript scene name-to-ID lookup from database."""
-        return {
-            ms.name: ms.id
-            for ms in session.query(ManuscriptScene).all()
+        return dict(session.query(ManuscriptScene.name, ManuscriptScene.id).all())
+
+    # =========================================================================
+    # BULK WRITE HELPERS
+    # =========================================================================
+
+    def _upsert(
+        self,
+        session: Session,
+        model: Any,
+        rows: List[Dict[str, Any]],
+        key_columns: Tuple[str, ...],
+        keys: Optional[List[str]] = None,
+        lookup: Optional[Dict[str, int]] = None,
+    ) -> int:
+        """
+        Bulk-upsert rows and record the ids of written ones in a lookup.
+
+        Args:
+            session: Active SQLAlchemy session
+            model: ORM model class
+            rows: Column dicts to write
+            key_columns: Unique-constraint columns identifying a row
+            keys: Natural-key string of each row (parallel to ``rows``)
+            lookup: Natural key -> ID dict to update with written rows
+
+        Returns:
+            Number of distinct rows imported
+        """
+        by_key = {
+            tuple(row[c] for c in key_columns): key
+            for row, key in zip(rows, keys or [None] * len(rows))
         }
+        written = bulk_upsert(session, model, rows, key_columns, self._track)
+        if lookup is not None:
+            for key_values, id_ in written.items():
+                lookup[by_key[key_values]] = id_
+        return len(by_key)
+
+    def _link(
+        self,
+        session: Session,
+        table: Table,
+        parent_column: str,
+        child_column: str,
+        links: Dict[int, Set[int]],
+    ) -> None:
+        """
+        Replace the association rows of the given parents.
+
+        Args:
+            session: Active SQLAlchemy session
+            table: Association table
+            parent_column: Column holding the parent ID
+            child_column: Column holding the child ID
+            links: Parent ID -> desired child IDs
+        """
+        replace_links(session, table, parent_column, child_column, links, self._track)
 
     # =========================================================================
     # LEAF ENTITY IMPORTS
     # =========================================================================
 
     def _import_cities(
-        self, session: Session, data: List[Dict[str, Any]]
-    ) -> Dict[str, int]:
+        self,
+        session: Session,
+        data: List[Dict[str, Any]],
+        lookup: Dict[str, int],
+    ) -> None:
         """
         Import cities from JSON data.
 
         Args:
             session: Active SQLAlchemy session
             data: List of city JSON dicts
+            lookup: City name-to-ID mapping, updated in place
+        """
+        rows = [{"name": item["name"], "country": item.get("country")} for item in data]
+        self.stats["cities"] = self._upsert(
+            session, City, rows, ("name",), [r["name"] for r in rows], lookup
+        )
 
-        Returns:
-            Lookup dict mapping city name to database ID
+    def _import_named(
+        self,
+        session: Session,
+        model: Any,
+        entity_type: str,
+        data: List[Dict[str, Any]],
+        lookup: Dict[str, int],
+    ) -> None:
         """
-        lookup: Dict[str, int] = {}
-        for item in data:
-            name = item["name"]
-            city = session.query(City).filter(City.name == name).first()
-            if city:
-                city.country = item.get("country")
-            else:
-                city = City(name=name, country=item.get("country"))
-                session.add(city)
-            session.flush()
-            lookup[name] = city.id
-        self.stats["cities"] = len(lookup)
-        return lookup
+        Import name-only entities (tags, themes, motifs).
+
+        Args:
+            session: Active SQLAlchemy session
+            model: ORM model class with a unique ``name``
+            entity_type: Stats key
+            data: List of JSON dicts with a "name"
+            lookup: Name-to-ID mapping, updated in place
+        """
+        rows = [{"name": item["name"]} for item in data]
+        self.stats[entity_type] = self._upsert(
+            session, model, rows, ("name",), [r["name"] for r in rows], lookup
+        )
 
     def _import_tags(
-        self, session: Session, data: List[Dict[str, Any]]
-    ) -> Dict[str, int]:
+        self,
+        session: Session,
+        data: List[Dict[str, Any]],
+        lookup: Dict[str, int],
+    ) -> None:
         """
         Import tags from JSON data.
 
         Args:
             session: Active SQLAlchemy session
             data: List of tag JSON dicts
-
-        Returns:
-            Lookup dict mapping tag name to database ID
+            lookup: Tag name-to-ID mapping, updated in place
         """
-        lookup: Dict[str, int] = {}
-        for item in data:
-            name = item["name"]
-            tag = session.query(Tag).filter(Tag.name == name).first()
-            if not tag:
-                tag = Tag(name=name)
-                session.add(tag)
-                session.flush()
-            lookup[name] = tag.id
-        self.stats["tags"] = len(lookup)
-        return lookup
+        self._import_named(session, Tag, "tags", data, lookup)
 
     def _import_themes(
-        self, session: Session, data: List[Dict[str, Any]]
-    ) -> Dict[str, int]:
+        self,
+        session: Session,
+        data: List[Dict[str, Any]],
+        lookup: Dict[str, int],
+    ) -> None:
         """
         Import themes from JSON data.
 
         Args:
             session: Active SQLAlchemy session
             data: List of theme JSON dicts
-
-        Returns:
-            Lookup dict mapping theme name to database ID
+            lookup: Theme name-to-ID mapping, updated in place
         """
-        lookup: Dict[str, int] = {}
-        for item in data:
-            name = item["name"]
-            theme = session.query(Theme).filter(Theme.name == name).first()
-            if not theme:
-                theme = Theme(name=name)
-                session.add(theme)
-                session.flush()
-            lookup[name] = theme.id
-        self.stats["themes"] = len(lookup)
-        return lookup
+        self._import_named(session, Theme, "themes", data, lookup)
 
     def _import_motifs(
-        self, session: Session, data: List[Dict[str, Any]]
-    ) -> Dict[str, int]:
+        self,
+        session: Session,
+        data: List[Dict[str, Any]],
+        lookup: Dict[str, int],
+    ) -> None:
         """
         Import motifs from JSON data.
 
         Args:
             session: Active SQLAlchemy session
             data: List of motif JSON dicts
-
-        Returns:
-            Lookup dict mapping motif name to database ID
+            lookup: Motif name-to-ID mapping, updated in place
         """
-        lookup: Dict[str, int] = {}
-        for item in data:
-            name = item["name"]
-            motif = session.query(Motif).filter(Motif.name == name).first()
-            if not motif:
-                motif = Motif(name=name)
-                session.add(motif)
-                session.flush()
-            lookup[name] = motif.id
-        self.stats["motifs"] = len(lookup)
-        return lookup
+        self._import_named(session, Motif, "motifs", data, lookup)
 
     def _import_arcs(
-        self, session: Session, data: List[Dict[str, Any]]
-    ) -> Dict[str, int]:
+        self,
+        session: Session,
+        data: List[Dict[str, Any]],
+        lookup: Dict[str, int],
+    ) -> None:
         """
         Import arcs from JSON data.
 
         Args:
             session: Active SQLAlchemy session
             data: List of arc JSON dicts
-
-        Returns:
-            Lookup dict mapping arc name to database ID
+            lookup: Arc name-to-ID mapping, updated in place
         """
-        lookup: Dict[str, int] = {}
-        for item in data:
-            name = item["name"]
-            arc = session.query(Arc).filter(Arc.name == name).first()
-            if arc:
-                arc.description = item.get("description")
-            else:
-                arc = Arc(name=name, description=item.get("description"))
-                session.add(arc)
-            session.flush()
-            lookup[name] = arc.id
-        self.stats["arcs"] = len(lookup)
-        return lookup
+        rows = [
+            {"name": item["name"], "description": item.get("description")}
+            for item in data
+        ]
+        self.stats["arcs"] = self._upsert(
+            session, Arc, rows, ("name",), [r["name"] for r in rows], lookup
+        )
 
     def _import_poems(
-        self, session: Session, data: List[Dict[str, Any]]
-    ) -> Dict[str, int]:
+        self,
+        session: Session,
+        data: List[Dict[str, Any]],
+        lookup: Dict[str, int],
+    ) -> None:
         """
         Import poem parent entities from PoemVersion JSON data.
 
@@ -682,79 +800,66 @@ class JSONImporter:
         Args:
             session: Active SQLAlchemy session
             data: List of poem version JSON dicts (from poems/ directory)
-
-        Returns:
-            Lookup dict mapping poem title to database ID
-        """
-        lookup: Dict[str, int] = {}
-        # Extract unique poem titles from version data
-        titles = {item["poem"] for item in data if "poem" in item}
-        for title in sorted(titles):
-            poem = session.query(Poem).filter(Poem.title == title).first()
-            if not poem:
-                poem = Poem(title=title)
-                session.add(poem)
-                session.flush()
-            lookup[title] = poem.id
-        self.stats["poems"] = len(lookup)
-        return lookup
+            lookup: Poem title-to-ID mapping, updated in place
+        """
+        titles = sorted({item["poem"] for item in data if "poem" in item})
+        rows = [{"title": title} for title in titles]
+        self.stats["poems"] = self._upsert(
+            session, Poem, rows, ("title",), titles, lookup
+        )
 
     def _import_reference_sources(
-        self, session: Session, data: List[Dict[str, Any]]
-    ) -> Dict[str, int]:
+        self,
+        session: Session,
+        data: List[Dict[str, Any]],
+        lookup: Dict[str, int],
+    ) -> None:
         """
         Import reference sources from JSON data.
 
         Args:
             session: Active SQLAlchemy session
             data: List of reference source JSON dicts
-
-        Returns:
-            Lookup dict mapping source title to database ID
+            lookup: Source title-to-ID mapping, updated in place
         """
-        lookup: Dict[str, int] = {}
-        for item in data:
-            title = item["title"]
-            source = (
-                session.query(ReferenceSource)
-                .filter(ReferenceSource.title == title)
-                .first()
-            )
-            if source:
-                source.author = item.get("author")
-                source.type = ReferenceType(item["type"]) if item.get("type") else source.type
-                source.url = item.get("url")
-            else:
-                source = ReferenceSource(
-                    title=title,
-                    author=item.get("author"),
-                    type=ReferenceType(item["type"]) if item.get("type") else ReferenceType.OTHER,
-                    url=item.get("url"),
-                )
-                session.add(source)
-            session.flush()
-            lookup[title] = source.id
-        self.stats["reference_sources"] = len(lookup)
-        return lookup
+        rows = [
+            {
+                "title": item["title"],
+                "author": item.get("author"),
+                "type": (
+                    ReferenceType(item["type"])
+                    if item.get("type")
+                    else ReferenceType.OTHER
+                ),
+                "url": item.get("url"),
+            }
+            for item in data
+        ]
+        self.stats["reference_sources"] = self._upsert(
+            session, ReferenceSource, rows, ("title",),
+            [r["title"] for r in rows], lookup,
+        )
 
     def _import_parts(
-        self, session: Session, data: List[Dict[str, Any]]
-    ) -> Dict[str, int]:
+        self,
+        session: Session,
+        data: List[Dict[str, Any]],
+        lookup: Dict[str, int],
+    ) -> None:
         """
         Import parts from JSON data.
 
         The natural key for parts is the number (as string) or title if
-        no number is set.
+        no number is set. Parts are few and may lack a number (which has
+        no unique constraint to upsert on), so they go through the ORM.
 
         Args:
             session: Active SQLAlchemy session
             data: List of part JSON dicts
-
-        Returns:
-            Lookup dict mapping part number (int) to database ID.
-            Parts without numbers are keyed by title string.
+            lookup: Part number-to-ID mapping, updated in place. Parts
+                without numbers are keyed by title string.
         """
-        lookup: Dict[str, int] = {}
+        imported: Set[str] = set()
         for item in data:
             number = item.get("number")
             title = item.get("title")
@@ -779,72 +884,63 @@ class JSONImporter:
             session.flush()
             key = str(number) if number is not None else (title or f"part-{part.id}")
             lookup[key] = part.id
-        self.stats["parts"] = len(lookup)
-        return lookup
+            imported.add(key)
+        self.stats["parts"] = len(imported)
 
     # =========================================================================
     # PEOPLE AND LOCATIONS
     # =========================================================================
 
     def _import_people(
-        self, session: Session, data: List[Dict[str, Any]]
-    ) -> Dict[str, int]:
+        self,
+        session: Session,
+        data: List[Dict[str, Any]],
+        lookup: Dict[str, int],
+    ) -> None:
         """
         Import people from JSON data.
 
         Args:
             session: Active SQLAlchemy session
             data: List of person JSON dicts
-
-        Returns:
-            Lookup dict mapping person slug to database ID
+            lookup: Person slug-to-ID mapping, updated in place
         """
-        lookup: Dict[str, int] = {}
-        for item in data:
-            slug = item["slug"]
-            person = session.query(Person).filter(Person.slug == slug).first()
-            relation = (
-                RelationType(item["relation_type"])
-                if item.get("relation_type")
-                else None
-            )
-            if person:
-                person.name = item["name"]
-                person.lastname = item.get("lastname")
-                person.disambiguator = item.get("disambiguator")
-                person.relation_type = relation
-            else:
-                person = Person(
-                    name=item["name"],
-                    lastname=item.get("lastname"),
-                    disambiguator=item.get("disambiguator"),
-                    slug=slug,
-                    relation_type=relation,
-                )
-                session.add(person)
-            session.flush()
-            lookup[slug] = person.id
-        self.stats["people"] = len(lookup)
-        return lookup
+        rows = [
+            {
+                "slug": item["slug"],
+                "name": item["name"],
+                "lastname": item.get("lastname"),
+                "disambiguator": item.get("disambiguator"),
+                "relation_type": (
+                    RelationType(item["relation_type"])
+                    if item.get("relation_type")
+                    else None
+                ),
+            }
+            for item in data
+        ]
+        self.stats["people"] = self._upsert(
+            session, Person, rows, ("slug",), [r["slug"] for r in rows], lookup
+        )
 
     def _import_locations(
         self,
         session: Session,
         data: List[Dict[str, Any]],
+        lookup: Dict[str, int],
         city_lookup: Dict[str, int],
-    ) -> Dict[str, int]:
+    ) -> None:
         """
         Import locations from JSON data, resolving city FK via lookup.
 
         Args:
             session: Active SQLAlchemy session
             data: List of location JSON dicts
+            lookup: "name::city"-to-ID mapping, updated in place
             city_lookup: Mapping of city name to city ID
-
-        Returns:
-            Lookup dict mapping "name::city" to database ID
         """
-        lookup: Dict[str, int] = {}
+        rows: List[Dict[str, Any]] = []
+        keys: List[str] = []
         for item in data:
             name = item["name"]
             city_name = item["city"]
@@ -854,19 +950,11 @@ class JSONImporter:
                     f"Skipping location '{name}': city '{city_name}' not found"
                 )
                 continue
-            location = (
-                session.query(Location)
-                .filter(Location.name == name, Location.city_id == city_id)
-                .first()
-            )
-            if not location:
-                location = Location(name=name, city_id=city_id)
-                session.add(location)
-                session.flush()
-            key = f"{name}::{city_name}"
-            lookup[key] = location.id
-        self.stats["locations"] = len(lookup)
-        return lookup
+            rows.append({"name": name, "city_id": city_id})
+            keys.append(f"{name}::{city_name}")
+        self.stats["locations"] = self._upsert(
+            session, Location, rows, ("name", "city_id"), keys, lookup
+        )
 
     # =========================================================================
     # ENTRIES
@@ -876,12 +964,13 @@ class JSONImporter:
         self,
         session: Session,
         data: List[Dict[str, Any]],
+        lookup: Dict[str, int],
         people_lk: Dict[str, int],
         location_lk: Dict[str, int],
         city_lk: Dict[str, int],
         arc_lk: Dict[str, int],
         tag_lk: Dict[str, int],
-    ) -> Dict[str, int]:
+    ) -> None:
         """
         Import entries with all scalar fields and M2M relationships.
 
@@ -892,84 +981,49 @@ class JSONImporter:
         Args:
             session: Active SQLAlchemy session
             data: List of entry JSON dicts
+            lookup: Date-to-ID mapping for entries, updated in place
             people_lk: Slug-to-ID mapping for people
             location_lk: "name::city"-to-ID mapping for locations
             city_lk: Name-to-ID mapping for cities
             arc_lk: Name-to-ID mapping for arcs
             tag_lk: Name-to-ID mapping for tags
-
-        Returns:
-            Lookup dict mapping entry date string to database ID
         """
-        lookup: Dict[str, int] = {}
-        total = len(data)
-
-        for i, item in enumerate(data, 1):
-            entry_date = date.fromisoformat(item["date"])
-            entry = (
-                session.query(Entry)
-                .filter(Entry.date == entry_date)
-                .first()
-            )
-            if entry:
-                # Update scalar fields
-                entry.file_path = item["file_path"]
-                entry.file_hash = item.get("file_hash")
-                entry.metadata_hash = item.get("metadata_hash")
-                entry.word_count = item.get("word_count", 0)
-                entry.reading_time = item.get("reading_time", 0.0)
-                entry.summary = item.get("summary")
-                entry.rating = item.get("rating")
-                entry.rating_justification = item.get("rating_justification")
-            else:
-                entry = Entry(
-                    date=entry_date,
-                    file_path=item["file_path"],
-                    file_hash=item.get("file_hash"),
-                    metadata_hash=item.get("metadata_hash"),
-                    word_count=item.get("word_count", 0),
-                    reading_time=item.get("reading_time", 0.0),
-                    summary=item.get("summary"),
-                    rating=item.get("rating"),
-                    rating_justification=item.get("rating_justification"),
-                )
-                session.add(entry)
-            session.flush()
-
-            # Resolve M2M: people
-            entry.people = _resolve_m2m(  # type: ignore[assignment]
-                session, Person, people_lk, item.get("people", [])
-            )
-
-            # Resolve M2M: locations
-            entry.locations = _resolve_m2m(  # type: ignore[assignment]
-                session, Location, location_lk, item.get("locations", [])
-            )
-
-            # Resolve M2M: cities
-            entry.cities = _resolve_m2m(  # type: ignore[assignment]
-                session, City, city_lk, item.get("cities", [])
-            )
-
-            # Resolve M2M: arcs
-            entry.arcs = _resolve_m2m(  # type: ignore[assignment]
-                session, Arc, arc_lk, item.get("arcs", [])
-            )
-
-            # Resolve M2M: tags
-            entry.tags = _resolve_m2m(  # type: ignore[assignment]
-                session, Tag, tag_lk, item.get("tags", [])
-            )
-
-            lookup[item["date"]] = entry.id
-
-            if i % 100 == 0 or i == total:
-                safe_logger(self.logger).log_debug(
-                    f"   Importing entries: {i}/{total}"
-                )
+        rows = [
+            {
+                "date": date.fromisoformat(item["date"]),
+                "file_path": item["file_path"],
+                "file_hash": item.get("file_hash"),
+                "metadata_hash": item.get("metadata_hash"),
+                "word_count": item.get("word_count", 0),
+                "reading_time": item.get("reading_time", 0.0),
+                "summary": item.get("summary"),
+                "rating": item.get("rating"),
+                "rating_justification": item.get("rating_justification"),
+            }
+            for item in data
+        ]
+        self.stats["entries"] = self._upsert(
+            session, Entry, rows, ("date",), [item["date"] for item in data], lookup
+        )
 
-        self.stats["entries"] = len(lookup)
-        return lookup
+        people: Dict[int, Set[int]] = {}
+        locations: Dict[int, Set[int]] = {}
+        cities: Dict[int, Set[int]] = {}
+        arcs: Dict[int, Set[int]] = {}
+        tags: Dict[int, Set[int]] = {}
+        for item in data:
+            entry_id = lookup[item["date"]]
+            people[entry_id] = _resolve_ids(people_lk, item.get("people", []))
+            locations[entry_id] = _resolve_ids(location_lk, item.get("locations", []))
+            cities[entry_id] = _resolve_ids(city_lk, item.get("cities", []))
+            arcs[entry_id] = _resolve_ids(arc_lk, item.get("arcs", []))
+            tags[entry_id] = _resolve_ids(tag_lk, item.get("tags", []))
+
+        self._link(session, entry_people, "entry_id", "person_id", people)
+        self._link(session, entry_locations, "entry_id", "location_id", locations)
+        self._link(session, entry_cities, "entry_id", "city_id", cities)
+        self._link(session, arc_entries, "entry_id", "arc_id", arcs)
+        self._link(session, entry_tags, "entry_id", "tag_id", tags)
 
     def _link_entry_events(
         self,
@@ -991,19 +1045,14 @@ class JSONImporter:
             entry_lk: Date-to-ID mapping for entries
             event_lk: Name-to-ID mapping for events
         """
+        links: Dict[int, Set[int]] = {}
         for item in entries_data:
             entry_id = entry_lk.get(item["date"])
-            if entry_id is None:
-                continue
             event_names = item.get("events", [])
-            if not event_names:
-                continue
-            entry = session.get(Entry, entry_id)
-            if entry is None:
+            if entry_id is None or not event_names:
                 continue
-            entry.events = _resolve_m2m(  # type: ignore[assignment]
-                session, Event, event_lk, event_names
-            )
+            links[entry_id] = _resolve_ids(event_lk, event_names)
+        self._link(session, event_entries, "entry_id", "event_id", links)
 
     # =========================================================================
     # SCENES AND THREADS
@@ -1013,10 +1062,11 @@ class JSONImporter:
         self,
         session: Session,
         data: List[Dict[str, Any]],
+        lookup: Dict[str, int],
         entry_lk: Dict[str, int],
         people_lk: Dict[str, int],
         location_lk: Dict[str, int],
-    ) -> Dict[str, int]:
+    ) -> None:
         """
         Import scenes with FK to Entry and M2M to People/Locations.
 
@@ -1025,17 +1075,15 @@ class JSONImporter:
         Args:
             session: Active SQLAlchemy session
             data: List of scene JSON dicts
+            lookup: "name::entry_date"-to-ID mapping, updated in place
             entry_lk: Date-to-ID mapping for entries
             people_lk: Slug-to-ID mapping for people
             location_lk: "name::city"-to-ID mapping for locations
-
-        Returns:
-            Lookup dict mapping "name::entry_date" to database ID
         """
-        lookup: Dict[str, int] = {}
-        total = len(data)
-
-        for i, item in enumerate(data, 1):
+        rows: List[Dict[str, Any]] = []
+        items: List[Dict[str, Any]] = []
+        keys: List[str] = []
+        for item in data:
             name = item["name"]
             entry_date = item["entry_date"]
             entry_id = entry_lk.get(entry_date)
@@ -1044,75 +1092,86 @@ class JSONImporter:
                     f"Skipping scene '{name}': entry '{entry_date}' not found"
                 )
                 continue
+            rows.append({
+                "name": name,
+                "entry_id": entry_id,
+                "description": item["description"],
+            })
+            items.append(item)
+            keys.append(f"{name}::{entry_date}")
+        self.stats["scenes"] = self._upsert(
+            session, Scene, rows, ("name", "entry_id"), keys, lookup
+        )
 
-            scene = (
-                session.query(Scene)
-                .filter(Scene.name == name, Scene.entry_id == entry_id)
-                .first()
-            )
-            if scene:
-                scene.description = item["description"]
-            else:
-                scene = Scene(
-                    name=name,
-                    description=item["description"],
-                    entry_id=entry_id,
-                )
-                session.add(scene)
-            session.flush()
-
-            # Upsert scene dates
-            existing_dates = {sd.date for sd in scene.dates}
-            for date_str in item.get("dates", []):
-                if date_str not in existing_dates:
-                    session.add(SceneDate(date=date_str, scene_id=scene.id))
+        people: Dict[int, Set[int]] = {}
+        locations: Dict[int, Set[int]] = {}
+        dates: Dict[int, List[str]] = {}
+        for item, key in zip(items, keys):
+            scene_id = lookup[key]
+            people[scene_id] = _resolve_ids(people_lk, item.get("people", []))
+            locations[scene_id] = _resolve_ids(location_lk, item.get("locations", []))
+            dates.setdefault(scene_id, []).extend(item.get("dates", []))
+
+        self._link(session, scene_people, "scene_id", "person_id", people)
+        self._link(session, scene_locations, "scene_id", "location_id", locations)
+        self._add_scene_dates(session, dates)
+
+    def _add_scene_dates(
+        self, session: Session, dates: Dict[int, List[str]]
+    ) -> None:
+        """
+        Add the scene dates that are not in the database yet.
 
-            # Resolve M2M: people
-            scene.people = _resolve_m2m(  # type: ignore[assignment]
-                session, Person, people_lk, item.get("people", [])
-            )
+        Existing dates are kept, so a scene's dates only ever grow.
 
-            # Resolve M2M: locations
-            scene.locations = _resolve_m2m(  # type: ignore[assignment]
-                session, Location, location_lk, item.get("locations", [])
+        Args:
+            session: Active SQLAlchemy session
+            dates: Scene ID -> date strings from the JSON
+        """
+        existing: Set[Tuple[int, str]] = set()
+        scene_ids = list(dates)
+        for start in range(0, len(scene_ids), LINK_QUERY_CHUNK):
+            chunk = scene_ids[start:start + LINK_QUERY_CHUNK]
+            existing.update(
+                session.query(SceneDate.scene_id, SceneDate.date)
+                .filter(SceneDate.scene_id.in_(chunk))
+                .all()
             )
 
-            key = f"{name}::{entry_date}"
-            lookup[key] = scene.id
-
-            if i % 100 == 0 or i == total:
-                safe_logger(self.logger).log_debug(
-                    f"   Importing scenes: {i}/{total}"
-                )
-
-        self.stats["scenes"] = len(lookup)
-        return lookup
+        new_dates = [
+            SceneDate(date=date_str, scene_id=scene_id)
+            for scene_id, date_strs in dates.items()
+            for date_str in dict.fromkeys(date_strs)
+            if (scene_id, date_str) not in existing
+        ]
+        if new_dates:
+            session.add_all(new_dates)
+            session.flush()
 
     def _import_threads(
         self,
         session: Session,
         data: List[Dict[str, Any]],
+        lookup: Dict[str, int],
         entry_lk: Dict[str, int],
         people_lk: Dict[str, int],
         location_lk: Dict[str, int],
-    ) -> Dict[str, int]:
+    ) -> None:
         """
         Import threads with FK to Entry and M2M to People/Locations.
 
         Args:
             session: Active SQLAlchemy session
             data: List of thread JSON dicts
+            lookup: "name::entry_date"-to-ID mapping, updated in place
             entry_lk: Date-to-ID mapping for entries
             people_lk: Slug-to-ID mapping for people
             location_lk: "name::city"-to-ID mapping for locations
-
-        Returns:
-            Lookup dict mapping "name::entry_date" to database ID
         """
-        lookup: Dict[str, int] = {}
-        total = len(data)
-
-        for i, item in enumerate(data, 1):
+        rows: List[Dict[str, Any]] = []
+        items: List[Dict[str, Any]] = []
+        keys: List[str] = []
+        for item in data:
             name = item["name"]
             entry_date = item["entry_date"]
             entry_id = entry_lk.get(entry_date)
@@ -1121,55 +1180,33 @@ class JSONImporter:
                     f"Skipping thread '{name}': entry '{entry_date}' not found"
                 )
                 continue
+            rows.append({
+                "name": name,
+                "entry_id": entry_id,
+                "from_date": item["from_date"],
+                "to_date": item["to_date"],
+                "referenced_entry_date": (
+                    date.fromisoformat(item["referenced_entry_date"])
+                    if item.get("referenced_entry_date")
+                    else None
+                ),
+                "content": item["content"],
+            })
+            items.append(item)
+            keys.append(f"{name}::{entry_date}")
+        self.stats["threads"] = self._upsert(
+            session, Thread, rows, ("name", "entry_id"), keys, lookup
+        )
 
-            ref_entry_date = (
-                date.fromisoformat(item["referenced_entry_date"])
-                if item.get("referenced_entry_date")
-                else None
-            )
-
-            thread = (
-                session.query(Thread)
-                .filter(Thread.name == name, Thread.entry_id == entry_id)
-                .first()
-            )
-            if thread:
-                thread.from_date = item["from_date"]
-                thread.to_date = item["to_date"]
-                thread.referenced_entry_date = ref_entry_date
-                thread.content = item["content"]
-            else:
-                thread = Thread(
-                    name=name,
-                    from_date=item["from_date"],
-                    to_date=item["to_date"],
-                    referenced_entry_date=ref_entry_date,
-                    content=item["content"],
-                    entry_id=entry_id,
-                )
-                session.add(thread)
-            session.flush()
-
-            # Resolve M2M: people
-            thread.people = _resolve_m2m(  # type: ignore[assignment]
-                session, Person, people_lk, item.get("people", [])
-            )
-
-            # Resolve M2M: locations
-            thread.locations = _resolve_m2m(  # type: ignore[assignment]
-                session, Location, location_lk, item.get("locations", [])
-            )
-
-            key = f"{name}::{entry_date}"
-            lookup[key] = thread.id
-
-            if i % 100 == 0 or i == total:
-                safe_logger(self.logger).log_debug(
-                    f"   Importing threads: {i}/{total}"
-                )
+        people: Dict[int, Set[int]] = {}
+        locations: Dict[int, Set[int]] = {}
+        for item, key in zip(items, keys):
+            thread_id = lookup[key]
+            people[thread_id] = _resolve_ids(people_lk, item.get("people", []))
+            locations[thread_id] = _resolve_ids(location_lk, item.get("locations", []))
 
-        self.stats["threads"] = len(lookup)
-        return lookup
+        self._link(session, thread_people, "thread_id", "person_id", people)
+        self._link(session, thread_locations, "thread_id", "location_id", locations)
 
     # =========================================================================
     # EVENTS (depend on scenes)
@@ -1179,36 +1216,24 @@ class JSONImporter:
         self,
         session: Session,
         data: List[Dict[str, Any]],
+        lookup: Dict[str, int],
         scene_lk: Dict[str, int],
-    ) -> Dict[str, int]:
+    ) -> None:
         """
         Import events with M2M to scenes.
 
         Args:
             session: Active SQLAlchemy session
             data: List of event JSON dicts
+            lookup: Event name-to-ID mapping, updated in place
             scene_lk: "name::entry_date"-to-ID mapping for scenes
-
-        Returns:
-            Lookup dict mapping event name to database ID
         """
-        lookup: Dict[str, int] = {}
-        for item in data:
-            name = item["name"]
-            event = session.query(Event).filter(Event.name == name).first()
-            if not event:
-                event = Event(name=name)
-                session.add(event)
-                session.flush()
-
-            # Resolve M2M: scenes
-            event.scenes = _resolve_m2m(  # type: ignore[assignment]
-                session, Scene, scene_lk, item.get("scenes", [])
-            )
-
-            lookup[name] = event.id
-        self.stats["events"] = len(lookup)
-        return lookup
+        self._import_named(session, Event, "events", data, lookup)
+        links = {
+            lookup[item["name"]]: _resolve_ids(scene_lk, item.get("scenes", []))
+            for item in data
+        }
+        self._link(session, event_scenes, "event_id", "scene_id", links)
 
     # =========================================================================
     # INSTANCE ENTITIES (FK to parent + Entry)
@@ -1230,7 +1255,7 @@ class JSONImporter:
             theme_lk: Name-to-ID mapping for themes
             entry_lk: Date-to-ID mapping for entries
         """
-        count = 0
+        rows: List[Dict[str, Any]] = []
         for item in data:
             theme_name = item["theme"]
             entry_date = item["entry_date"]
@@ -1242,27 +1267,14 @@ class JSONImporter:
                     "missing theme or entry"
                 )
                 continue
-
-            instance = (
-                session.query(ThemeInstance)
-                .filter(
-                    ThemeInstance.theme_id == theme_id,
-                    ThemeInstance.entry_id == entry_id,
-                )
-                .first()
-            )
-            if instance:
-                instance.description = item["description"]
-            else:
-                instance = ThemeInstance(
-                    description=item["description"],
-                    theme_id=theme_id,
-                    entry_id=entry_id,
-                )
-                session.add(instance)
-            count += 1
-        session.flush()
-        self.stats["theme_instances"] = count
+            rows.append({
+                "theme_id": theme_id,
+                "entry_id": entry_id,
+                "description": item["description"],
+            })
+        self.stats["theme_instances"] = self._upsert(
+            session, ThemeInstance, rows, ("theme_id", "entry_id")
+        )
 
     def _import_motif_instances(
         self,
@@ -1280,7 +1292,7 @@ class JSONImporter:
             motif_lk: Name-to-ID mapping for motifs
             entry_lk: Date-to-ID mapping for entries
         """
-        count = 0
+        rows: List[Dict[str, Any]] = []
         for item in data:
             motif_name = item["motif"]
             entry_date = item["entry_date"]
@@ -1292,27 +1304,14 @@ class JSONImporter:
                     "missing motif or entry"
                 )
                 continue
-
-            instance = (
-                session.query(MotifInstance)
-                .filter(
-                    MotifInstance.motif_id == motif_id,
-                    MotifInstance.entry_id == entry_id,
-                )
-                .first()
-            )
-            if instance:
-                instance.description = item["description"]
-            else:
-                instance = MotifInstance(
-                    description=item["description"],
-                    motif_id=motif_id,
-                    entry_id=entry_id,
-                )
-                session.add(instance)
-            count += 1
-        session.flush()
-        self.stats["motif_instances"] = count
+            rows.append({
+                "motif_id": motif_id,
+                "entry_id": entry_id,
+                "description": item["description"],
+            })
+        self.stats["motif_instances"] = self._upsert(
+            session, MotifInstance, rows, ("motif_id", "entry_id")
+        )
 
     # =========================================================================
     # POEM VERSIONS (FK to Poem + Entry)
@@ -1337,7 +1336,7 @@ class JSONImporter:
             poem_lk: Title-to-ID mapping for poems
             entry_lk: Date-to-ID mapping for entries
         """
-        count = 0
+        rows: List[Dict[str, Any]] = []
         for item in data:
             poem_title = item["poem"]
             entry_date = item["entry_date"]
@@ -1349,27 +1348,14 @@ class JSONImporter:
                     "missing poem or entry"
                 )
                 continue
-
-            pv = (
-                session.query(PoemVersion)
-                .filter(
-                    PoemVersion.poem_id == poem_id,
-                    PoemVersion.entry_id == entry_id,
-                )
-                .first()
-            )
-            if pv:
-                pv.content = item["content"]
-            else:
-                pv = PoemVersion(
-                    content=item["content"],
-                    poem_id=poem_id,
-                    entry_id=entry_id,
-                )
-                session.add(pv)
-            count += 1
-        session.flush()
-        self.stats["poem_versions"] = count
+            rows.append({
+                "poem_id": poem_id,
+                "entry_id": entry_id,
+                "content": item["content"],
+            })
+        self.stats["poem_versions"] = self._upsert(
+            session, PoemVersion, rows, ("poem_id", "entry_id")
+        )
 
     # =========================================================================
     # REFERENCES (FK to ReferenceSource + Entry)
@@ -1391,11 +1377,10 @@ class JSONImporter:
             source_lk: Title-to-ID mapping for reference sources
             entry_lk: Date-to-ID mapping for entries
         """
-        count = 0
+        rows: List[Dict[str, Any]] = []
         for item in data:
             source_title = item["source"]
             entry_date = item["entry_date"]
-            mode_str = item["mode"]
             source_id = source_lk.get(source_title)
             entry_id = entry_lk.get(entry_date)
             if source_id is None or entry_id is None:
@@ -1404,33 +1389,16 @@ class JSONImporter:
                     "missing source or entry"
                 )
                 continue
-
-            mode = ReferenceMode(mode_str)
-
-            ref = (
-                session.query(Reference)
-                .filter(
-                    Reference.source_id == source_id,
-                    Reference.entry_id == entry_id,
-                    Reference.mode == mode,
-                )
-                .first()
-            )
-            if ref:
-                ref.content = item.get("content")
-                ref.description = item.get("description")
-            else:
-                ref = Reference(
-                    content=item.get("content"),
-                    description=item.get("description"),
-                    mode=mode,
-                    source_id=source_id,
-                    entry_id=entry_id,
-                )
-                session.add(ref)
-            count += 1
-        session.flush()
-        self.stats["references"] = count
+            rows.append({
+                "source_id": source_id,
+                "entry_id": entry_id,
+                "mode": ReferenceMode(item["mode"]),
+                "content": item.get("content"),
+                "description": item.get("description"),
+            })
+        self.stats["references"] = self._upsert(
+            session, Reference, rows, ("source_id", "entry_id", "mode")
+        )
 
     # =========================================================================
     # MANUSCRIPT ENTITIES
@@ -1440,108 +1408,78 @@ class JSONImporter:
         self,
         session: Session,
         data: List[Dict[str, Any]],
+        lookup: Dict[str, int],
         part_lk: Dict[str, int],
         poem_lk: Dict[str, int],
-    ) -> Dict[str, int]:
+    ) -> None:
         """
         Import chapters with FK to Part and M2M to Poems.
 
         Args:
             session: Active SQLAlchemy session
             data: List of chapter JSON dicts
+            lookup: Chapter title-to-ID mapping, updated in place
             part_lk: Part-number-to-ID mapping
             poem_lk: Poem-title-to-ID mapping
-
-        Returns:
-            Lookup dict mapping chapter title to database ID
         """
-        lookup: Dict[str, int] = {}
-        for item in data:
-            title = item["title"]
-            chapter = (
-                session.query(Chapter)
-                .filter(Chapter.title == title)
-                .first()
-            )
-
-            # Resolve part FK
-            part_id = None
-            if item.get("part") is not None:
-                part_key = str(item["part"])
-                part_id = part_lk.get(part_key)
-
-            chapter_type = ChapterType(item["type"]) if item.get("type") else ChapterType.PROSE
-            chapter_status = ChapterStatus(item["status"]) if item.get("status") else ChapterStatus.DRAFT
-            chapter_date = date.fromisoformat(item["date"]) if item.get("date") else None
-
-            if chapter:
-                chapter.number = item.get("number")
-                chapter.date = chapter_date
-                chapter.part_id = part_id
-                chapter.type = chapter_type
-                chapter.status = chapter_status
-                chapter.content = item.get("content")
-                chapter.draft_path = item.get("draft_path")
-            else:
-                chapter = Chapter(
-                    title=title,
-                    number=item.get("number"),
-                    date=chapter_date,
-                    part_id=part_id,
-                    type=chapter_type,
-                    status=chapter_status,
-                    content=item.get("content"),
-                    draft_path=item.get("draft_path"),
-                )
-                session.add(chapter)
-            session.flush()
-
-            # Resolve M2M: poems
-            chapter.poems = _resolve_m2m(  # type: ignore[assignment]
-                session, Poem, poem_lk, item.get("poems", [])
-            )
-
-            lookup[title] = chapter.id
-        self.stats["chapters"] = len(lookup)
-        return lookup
+        rows = [
+            {
+                "title": item["title"],
+                "number": item.get("number"),
+                "date": date.fromisoformat(item["date"]) if item.get("date") else None,
+                "part_id": (
+                    part_lk.get(str(item["part"]))
+                    if item.get("part") is not None
+                    else None
+                ),
+                "type": (
+                    ChapterType(item["type"]) if item.get("type") else ChapterType.PROSE
+                ),
+                "status": (
+                    ChapterStatus(item["status"])
+                    if item.get("status")
+                    else ChapterStatus.DRAFT
+                ),
+                "content": item.get("content"),
+                "draft_path": item.get("draft_path"),
+            }
+            for item in data
+        ]
+        self.stats["chapters"] = self._upsert(
+            session, Chapter, rows, ("title",), [r["title"] for r in rows], lookup
+        )
+        links = {
+            lookup[item["title"]]: _resolve_ids(poem_lk, item.get("poems", []))
+            for item in data
+        }
+        self._link(session, chapter_poems, "chapter_id", "poem_id", links)
 
     def _import_characters(
-        self, session: Session, data: List[Dict[str, Any]]
-    ) -> Dict[str, int]:
+        self,
+        session: Session,
+        data: List[Dict[str, Any]],
+        lookup: Dict[str, int],
+    ) -> None:
         """
         Import characters from JSON data.
 
         Args:
             session: Active SQLAlchemy session
             data: List of character JSON dicts
-
-        Returns:
-            Lookup dict mapping character name to database ID
+            lookup: Character name-to-ID mapping, updated in place
         """
-        lookup: Dict[str, int] = {}
-        for item in data:
-            name = item["name"]
-            character = (
-                session.query(Character)
-                .filter(Character.name == name)
-                .first()
-            )
-            if character:
-                character.description = item.get("description")
-                character.role = item.get("role")
-                character.is_narrator = item.get("is_narrator", False)
-            else:
-                character = Character(
-                    name=name,
-                    description=item.get("description"),
-                    role=item.get("role"),
-                    is_narrator=item.get("is_narrator", False),
-                )
-                session.add(character)
-            session.flush()
-            lookup[name] = character.id
-        self.stats["characters"] = len(lookup)
-        return lookup
+        rows = [
+            {
+                "name": item["name"],
+                "description": item.get("description"),
+                "role": item.get("role"),
+                "is_narrator": item.get("is_narrator", False),
+            }
+            for item in data
+        ]
+        self.stats["characters"] = self._upsert(
+            session, Character, rows, ("name",), [r["name"] for r in rows], lookup
+        )
 
     def _import_person_character_maps(
         self,
@@ -1559,7 +1497,7 @@ class JSONImporter:
             people_lk: Slug-to-ID mapping for people
             character_lk: Name-to-ID mapping for characters
         """
-        count = 0
+        rows: List[Dict[str, Any]] = []
         for item in data:
             person_slug = item["person"]
             char_name = item["character"]
@@ -1571,99 +1509,71 @@ class JSONImporter:
                     "missing person or character"
                 )
                 continue
-
-            contribution = (
-                ContributionType(item["contribution"])
-                if item.get("contribution")
-                else ContributionType.PRIMARY
-            )
-
-            mapping = (
-                session.query(PersonCharacterMap)
-                .filter(
-                    PersonCharacterMap.person_id == person_id,
-                    PersonCharacterMap.character_id == character_id,
-                )
-                .first()
-            )
-            if mapping:
-                mapping.contribution = contribution
-                mapping.notes = item.get("notes")
-            else:
-                mapping = PersonCharacterMap(
-                    person_id=person_id,
-                    character_id=character_id,
-                    contribution=contribution,
-                    notes=item.get("notes"),
-                )
-                session.add(mapping)
-            count += 1
-        session.flush()
-        self.stats["person_character_maps"] = count
+            rows.append({
+                "person_id": person_id,
+                "character_id": character_id,
+                "contribution": (
+                    ContributionType(item["contribution"])
+                    if item.get("contribution")
+                    else ContributionType.PRIMARY
+                ),
+                "notes": item.get("notes"),
+            })
+        self.stats["person_character_maps"] = self._upsert(
+            session, PersonCharacterMap, rows, ("person_id", "character_id")
+        )
 
     def _import_manuscript_scenes(
         self,
         session: Session,
         data: List[Dict[str, Any]],
+        lookup: Dict[str, int],
         chapter_lk: Dict[str, int],
         character_lk: Dict[str, int],
-    ) -> Dict[str, int]:
+    ) -> None:
         """
         Import manuscript scenes with FK to Chapter and M2M to Characters.
 
         Args:
             session: Active SQLAlchemy session
             data: List of manuscript scene JSON dicts
+            lookup: Manuscript scene name-to-ID mapping, updated in place
             chapter_lk: Title-to-ID mapping for chapters
             character_lk: Name-to-ID mapping for characters
-
-        Returns:
-            Lookup dict mapping manuscript scene name to database ID
         """
-        lookup: Dict[str, int] = {}
-        for item in data:
-            name = item["name"]
-            chapter_id = (
-                chapter_lk.get(item["chapter"])
-                if item.get("chapter")
-                else None
-            )
-            origin = SceneOrigin(item["origin"]) if item.get("origin") else SceneOrigin.JOURNALED
-            status = SceneStatus(item["status"]) if item.get("status") else SceneStatus.FRAGMENT
-
-            ms_scene = (
-                session.query(ManuscriptScene)
-                .filter(ManuscriptScene.name == name)
-                .first()
-            )
-            if ms_scene:
-                ms_scene.description = item.get("description")
-                ms_scene.chapter_id = chapter_id
-                ms_scene.origin = origin
-                ms_scene.status = status
-                ms_scene.notes = item.get("notes")
-                ms_scene.order = item.get("order")
-            else:
-                ms_scene = ManuscriptScene(
-                    name=name,
-                    description=item.get("description"),
-                    chapter_id=chapter_id,
-                    origin=origin,
-                    status=status,
-                    notes=item.get("notes"),
-                    order=item.get("order"),
-                )
-                session.add(ms_scene)
-            session.flush()
-
-            # Resolve M2M: characters
-            ms_scene.characters = _resolve_m2m(  # type: ignore[assignment]
-                session, Character, character_lk, item.get("characters", [])
-            )
-
-            lookup[name] = ms_scene.id
-        self.stats["manuscript_scenes"] = len(lookup)
-        return lookup
+        rows = [
+            {
+                "name": item["name"],
+                "description": item.get("description"),
+                "chapter_id": (
+                    chapter_lk.get(item["chapter"]) if item.get("chapter") else None
+                ),
+                "origin": (
+                    SceneOrigin(item["origin"])
+                    if item.get("origin")
+                    else SceneOrigin.JOURNALED
+                ),
+                "status": (
+                    SceneStatus(item["status"])
+                    if item.get("status")
+                    else SceneStatus.FRAGMENT
+                ),
+                "notes": item.get("notes"),
+                "order": item.get("order"),
+            }
+            for item in data
+        ]
+        self.stats["manuscript_scenes"] = self._upsert(
+            session, ManuscriptScene, rows, ("name",),
+            [r["name"] for r in rows], lookup,
+        )
+        links = {
+            lookup[item["name"]]: _resolve_ids(character_lk, item.get("characters", []))
+            for item in data
+        }
+        self._link(
+            session, scene_characters, "manuscript_scene_id", "character_id", links
+        )
 
     def _import_manuscript_sources(
         self,
@@ -1764,7 +1674,7 @@ class JSONImporter:
             chapter_lk: Title-to-ID mapping for chapters
             source_lk: Title-to-ID mapping for reference sources
         """
-        count = 0
+        rows: List[Dict[str, Any]] = []
         for item in data:
             chapter_title = item["chapter"]
             source_title = item["source"]
@@ -1777,34 +1687,17 @@ class JSONImporter:
                     "missing chapter or source"
                 )
                 continue
-
-            mode = (
-                ReferenceMode(item["mode"])
-                if item.get("mode")
-                else ReferenceMode.THEMATIC
-            )
-
-            ref = (
-                session.query(ManuscriptReference)
-                .filter(
-                    ManuscriptReference.chapter_id == chapter_id,
-                    ManuscriptReference.source_id == source_id,
-                )
-                .first()
-            )
-            if ref:
-                ref.mode = mode
-                ref.content = item.get("content")
-                ref.notes = item.get("notes")
-            else:
-                ref = ManuscriptReference(
-                    chapter_id=chapter_id,
-                    source_id=source_id,
-                    mode=mode,
-                    content=item.get("content"),
-                    notes=item.get("notes"),
-                )
-                session.add(ref)
-            count += 1
-        session.flush()
-        self.stats["manuscript_references"] = count
+            rows.append({
+                "chapter_id": chapter_id,
+                "source_id": source_id,
+                "mode": (
+                    ReferenceMode(item["mode"])
+                    if item.get("mode")
+                    else ReferenceMode.THEMATIC
+                ),
+                "content": item.get("content"),
+                "notes": item.get("notes"),
+            })
+        self.stats["manuscript_references"] = self._upsert(
+            session, ManuscriptReference, rows, ("chapter_id", "source_id")
+        )
@@ -9,6 +9,9 @@ Builds two PDF versions from daily Markdown files:
 2. Notes PDF - Annotation version with line numbers
 
 Uses Pandoc with custom LaTeX preambles for professional typography.
+Builds go through a content-addressed cache (tmp/pdf-cache): a PDF is
+rebuilt only when its entries, preamble or settings change, and only
+months with edited entries are re-converted by pandoc.
 
 Programmatic API:
     from dev.pipeline.md2pdf import build_pdf
@@ -26,7 +29,7 @@ from typing import Optional
 # --- Local imports ---
 from dev.core.exceptions import PdfBuildError
 from dev.core.logging_manager import PalimpsestLogger
-from dev.core.paths import TEX_DIR
+from dev.core.paths import PDF_CACHE_DIR, TEX_DIR
 from dev.builders.pdfbuilder import PdfBuilder, PdfBuildStats
 
 
@@ -41,6 +44,7 @@ def build_pdf(
     preamble_notes: Optional[Path] = None,
     force_overwrite: bool = False,
     keep_temp_on_error: bool = False,
+    cache_dir: Optional[Path] = PDF_CACHE_DIR,
     logger: Optional[PalimpsestLogger] = None,
 ) -> PdfBuildStats:
     """
@@ -56,8 +60,10 @@ def build_pdf(
         pdf_dir: PDF output directory
         preamble: LaTeX preamble for clean PDF (defaults to TEX_DIR/preamble.tex)
         preamble_notes: LaTeX preamble for notes PDF (defaults to TEX_DIR/preamble_notes.tex)
-        force_overwrite: Force overwrite existing PDFs
+        force_overwrite: Rebuild PDFs even when they are up to date
         keep_temp_on_error: Keep temp files on error for debugging
+        cache_dir: Build cache directory (None disables caching, so
+            existing PDFs are only replaced with force_overwrite)
         logger: Optional logger instance
 
     Returns:
@@ -85,6 +91,7 @@ def build_pdf(
         preamble_notes=preamble_notes,
         force_overwrite=force_overwrite,
         keep_temp_on_error=keep_temp_on_error,
+        cache_dir=cache_dir,
         logger=logger,
     )
 
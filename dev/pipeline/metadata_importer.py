@@ -8,23 +8,34 @@ This module provides the EntryImporter class which handles importing
 metadata YAML files into the database, combining them with MD frontmatter
 data for a complete Entry import.
 
-Delegates all entity creation and relationship processing to EntryManager,
-which provides a single codepath for database writes.
+Import is a two-stage pipeline:
+    - Preparation (EntryPreparer): YAML parsing, MD frontmatter parsing,
+      hashing, people/scene validation and metadata merging. Pure and
+      session-free, so it runs across a process pool.
+    - Writing (EntryImporter): a single writer applies prepared entries
+      to the database in file order, delegating all entity creation and
+      relationship processing to EntryManager.
 
 Data Sources:
     - MD Frontmatter: people, locations, narrated_dates (entry-level, full set)
     - Metadata YAML: summary, rating, scenes, events, threads, etc. (analysis)
 
 Key Features:
-    - Per-file transactions (each YAML = one commit)
+    - Parallel preparation across CPU cores, single DB writer
+    - Stat-signature fast path: unchanged files are neither read nor hashed
+    - Batched transactions with one SAVEPOINT per YAML file
     - Delegates to EntryManager for all entity creation
     - Pre-import validation (people consistency, scene subsets)
     - Fatal vs recoverable error handling with thresholds
     - Retry capability for failed imports
     - Detailed statistics and failure tracking
+    - Keeps the FTS5 search index current for each imported entry
+    - Refreshes the aggregate tables once the import is committed
 
 Transaction Strategy:
-    - Each YAML file is imported in a single transaction
+    - Each YAML file is written inside its own SAVEPOINT; a failure rolls
+      back that file only
+    - Successful files are committed every ``batch_size`` files
     - Failures are logged to failed_imports.json for retry
     - Stop at 5 consecutive failures OR 5% failure rate
 
@@ -37,7 +48,7 @@ Usage:
     from dev.pipeline.metadata_importer import EntryImporter
 
     importer = EntryImporter(session)
-    stats = importer.import_all(yaml_files)
+    stats = importer.import_all(yaml_files, workers=4)
 """
 # --- Annotations ---
 from __future__ import annotations
@@ -45,10 +56,14 @@ from __future__ import annotations
 # --- Standard library imports ---
 import hashlib
 import json
+import os
 import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import date, datetime
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set
 
 # --- Third-party imports ---
 import yaml
@@ -57,217 +72,164 @@ from sqlalchemy.orm import Session
 # --- Local imports ---
 from dev.core.logging_manager import PalimpsestLogger
 from dev.core.paths import LOG_DIR, MD_DIR
+from dev.database.aggregates import refresh_aggregates
 from dev.database.managers.entry_manager import EntryManager
+from dev.database.models import Entry
 from dev.pipeline.models import FailedImport, ImportStats
+from dev.search.search_index import SearchIndexManager
+from dev.utils.file_state import FileStateCache
+
+
+# Files committed per transaction by the writer
+DEFAULT_BATCH_SIZE = 50
+
+# Below this many files, preparing in-process beats spawning a pool
+PARALLEL_MIN_FILES = 8
 
 
 # =============================================================================
-# Metadata Importer
+# Entry Preparation
 # =============================================================================
 
-class EntryImporter:
+class PreparationError(Exception):
     """
-    Import metadata YAML files into the database.
+    Picklable error raised while preparing an entry in a worker process.
 
-    Handles loading YAML files, validating data, building merged metadata,
-    and delegating to EntryManager for entity creation and relationship
-    processing.
+    Carries the original exception's type name so failure records and
+    logs look the same as for in-process errors.
 
     Attributes:
-        session: Database session
-        dry_run: If True, don't commit changes
-        stats: ImportStats tracking progress
-        failed_imports: List of FailedImport records
-        logger: PalimpsestLogger for operation tracking
+        error_type: Class name of the original exception
     """
 
-    def __init__(
-        self,
-        session: Session,
-        dry_run: bool = False,
-        logger: Optional[PalimpsestLogger] = None,
-    ):
-        """
-        Initialize the importer.
-
-        Args:
-            session: Database session
-            dry_run: If True, don't commit changes
-            logger: Optional logger for operation tracking
-        """
-        self.session = session
-        self.dry_run = dry_run
-        self.stats = ImportStats()
-        self.failed_imports: List[FailedImport] = []
-
-        if logger is None:
-            log_dir = LOG_DIR / "operations"
-            log_dir.mkdir(parents=True, exist_ok=True)
-            self.logger = PalimpsestLogger(log_dir, component_name="importer")
-        else:
-            self.logger = logger
+    def __init__(self, message: str, error_type: str = "PreparationError"):
+        super().__init__(message)
+        self.error_type = error_type
 
-        self._entry_mgr = EntryManager(session, self.logger)
+    def __reduce__(self):
+        return (type(self), (str(self), self.error_type))
 
-    def import_all(
-        self, yaml_files: List[Path], failed_only: bool = False
-    ) -> ImportStats:
+    @classmethod
+    def from_exception(cls, error: Exception) -> "PreparationError":
         """
-        Import all YAML files.
+        Wrap an arbitrary exception.
 
         Args:
-            yaml_files: List of YAML file paths to import
-            failed_only: If True, only retry previously failed imports
+            error: Exception raised during preparation
 
         Returns:
-            ImportStats with results
+            PreparationError with the same message and type name
         """
-        self.stats.total_files = len(yaml_files)
+        return cls(str(error), type(error).__name__)
 
-        # Load failed imports if retrying
-        failed_paths: Set[str] = set()
-        if failed_only:
-            failed_paths = self._load_failed_imports()
-            if not failed_paths:
-                self.logger.log_info("No failed imports to retry.")
-                return self.stats
 
-        for yaml_path in yaml_files:
-            # Skip if not in failed list (when retrying)
-            if failed_only and str(yaml_path) not in failed_paths:
-                self.stats.skipped += 1
-                continue
+@dataclass
+class PreparedEntry:
+    """
+    Result of preparing one metadata YAML file.
 
-            # Check thresholds
-            if self.stats.should_stop():
-                self.logger.log_warning(
-                    f"Stopping due to failure threshold: "
-                    f"{self.stats.consecutive_failures} consecutive failures, "
-                    f"{self.stats.failure_rate:.1%} failure rate"
-                )
-                break
+    Attributes:
+        yaml_path: Path to the metadata YAML file
+        entry_date: Date of the entry (None if preparation failed early)
+        md_path: Path to the MD file
+        md_hash: SHA256 of the MD file
+        yaml_hash: SHA256 of the metadata YAML file
+        md_stat: Stat of the MD file taken before it was read
+        yaml_stat: Stat of the YAML file taken before it was read
+        metadata: Merged metadata dict ready for EntryManager
+        error: Fatal error (unreadable files, missing MD, bad date)
+        validation_error: Validation error, only raised if the entry changed
+    """
 
-            try:
-                self._import_file(yaml_path)
-                self.stats.succeeded += 1
-                self.stats.consecutive_failures = 0
-            except Exception as e:
-                # Rollback partial changes from failed file
-                self.session.rollback()
-                self.stats.failed += 1
-                self.stats.consecutive_failures += 1
-                self._record_failure(yaml_path, e)
-                self.logger.log_error(e, {"file": yaml_path.name})
-
-            self.stats.processed += 1
+    yaml_path: Path
+    entry_date: Optional[date] = None
+    md_path: Optional[Path] = None
+    md_hash: Optional[str] = None
+    yaml_hash: Optional[str] = None
+    md_stat: Optional[os.stat_result] = None
+    yaml_stat: Optional[os.stat_result] = None
+    metadata: Optional[Dict[str, Any]] = None
+    error: Optional[PreparationError] = None
+    validation_error: Optional[PreparationError] = None
 
-        # Save failed imports for retry
-        if self.failed_imports:
-            self._save_failed_imports()
 
-        # In dry-run mode, rollback all changes at the end
-        if self.dry_run:
-            self.session.rollback()
-            self.logger.log_info("Dry-run complete, all changes rolled back")
+class EntryPreparer:
+    """
+    Parse, hash, validate and merge one entry's YAML and MD files.
 
-        return self.stats
+    Holds no database state, so instances can run in worker processes.
 
-    def _import_file(self, yaml_path: Path) -> None:
-        """
-        Import a single YAML file.
+    Attributes:
+        md_dir: Root directory of the MD journal files
+    """
 
-        Loads YAML and MD frontmatter, validates consistency, builds
-        merged metadata, and delegates to EntryManager for creation
-        or update.
+    def __init__(self, md_dir: Path = MD_DIR):
+        """
+        Initialize the preparer.
 
         Args:
-            yaml_path: Path to the metadata YAML file
-
-        Raises:
-            Various exceptions on failure (caught by import_all)
+            md_dir: Root directory of the MD journal files
         """
-        self.logger.log_info(f"Importing {yaml_path.name}...")
-
-        # Load metadata YAML
-        with open(yaml_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        self.md_dir = md_dir
 
-        if not data:
-            raise ValueError("Empty YAML file")
-
-        # Extract date from filename or data
-        entry_date = self._parse_date(data.get("date"), yaml_path)
-
-        # Find corresponding MD file
-        md_path = self._find_md_file(entry_date)
-        if not md_path:
-            raise FileNotFoundError(f"No MD file for date {entry_date}")
-
-        # Parse MD frontmatter for entry-level people/locations/narrated_dates
-        md_frontmatter = self._parse_md_frontmatter(md_path)
-
-        # Compute hashes for change detection
-        md_hash = self._compute_file_hash(md_path)
-        yaml_hash = self._compute_file_hash(yaml_path)
-
-        # Check if entry already exists
-        existing = self._entry_mgr.get(entry_date=entry_date)
-
-        if existing:
-            # Check if either MD file or metadata YAML has changed
-            md_changed = existing.file_hash != md_hash
-            yaml_changed = existing.metadata_hash != yaml_hash
-
-            if not md_changed and not yaml_changed:
-                self.logger.log_info("  SKIPPED (unchanged)")
-                self.stats.skipped += 1
-                return
-
-        # Validate before any DB writes
-        self._validate_people_consistency(data, md_frontmatter)
+    def prepare(self, yaml_path: Path) -> PreparedEntry:
+        """
+        Prepare a single YAML file for import.
 
-        scenes_data = data.get("scenes", [])
-        for scene_data in scenes_data:
-            self._validate_scene_subsets(
-                data, md_frontmatter, scene_data,
-                scene_data.get("name", "Unnamed Scene"),
-            )
+        Each file is read once; hashes, frontmatter and word count are
+        derived from the same bytes. Errors are captured on the result
+        rather than raised.
 
-        # Build merged metadata
-        merged = self._build_entry_metadata(
-            entry_date, md_path, data, md_frontmatter, yaml_hash,
-        )
+        Args:
+            yaml_path: Path to the metadata YAML file
 
-        if existing:
-            change_type = []
-            if existing.file_hash != md_hash:
-                change_type.append("MD")
-            if existing.metadata_hash != yaml_hash:
-                change_type.append("YAML")
-            self.logger.log_info(
-                f"  UPDATING ({', '.join(change_type)} changed)"
-            )
-            self._entry_mgr.update(
-                existing, merged,
-                sync_source="metadata-import",
-                removed_by="import-metadata",
-            )
-        else:
-            self._entry_mgr.create(
-                merged,
-                sync_source="metadata-import",
-                removed_by="import-metadata",
+        Returns:
+            PreparedEntry with merged metadata or captured errors
+        """
+        prepared = PreparedEntry(yaml_path=yaml_path)
+
+        try:
+            yaml_stat = os.stat(yaml_path)
+            yaml_bytes = yaml_path.read_bytes()
+            data = yaml.safe_load(yaml_bytes.decode("utf-8"))
+            if not data:
+                raise ValueError("Empty YAML file")
+
+            entry_date = self._parse_date(data.get("date"), yaml_path)
+            md_path = self._find_md_file(entry_date)
+            if not md_path:
+                raise FileNotFoundError(f"No MD file for date {entry_date}")
+
+            md_stat = os.stat(md_path)
+            md_bytes = md_path.read_bytes()
+            md_content = md_bytes.decode("utf-8")
+            md_frontmatter = self._parse_md_frontmatter(md_content)
+        except Exception as e:
+            prepared.error = PreparationError.from_exception(e)
+            return prepared
+
+        prepared.entry_date = entry_date
+        prepared.md_path = md_path
+        prepared.md_hash = self._compute_hash(md_bytes)
+        prepared.yaml_hash = self._compute_hash(yaml_bytes)
+        prepared.md_stat = md_stat
+        prepared.yaml_stat = yaml_stat
+
+        try:
+            self._validate_people_consistency(data, md_frontmatter)
+            for scene_data in data.get("scenes", []):
+                self._validate_scene_subsets(
+                    data, md_frontmatter, scene_data,
+                    scene_data.get("name", "Unnamed Scene"),
+                )
+            prepared.metadata = self._build_entry_metadata(
+                entry_date, md_path, md_content, prepared.md_hash,
+                data, md_frontmatter, prepared.yaml_hash,
             )
+        except Exception as e:
+            prepared.validation_error = PreparationError.from_exception(e)
 
-        self.stats.entries_created += 1
-
-        # Commit or flush (dry-run keeps in session without committing)
-        if self.dry_run:
-            self.session.flush()
-            self.logger.log_info("  OK (dry-run)")
-        else:
-            self.session.commit()
-            self.logger.log_info("  OK")
+        return prepared
 
     # =========================================================================
     # Metadata Building
@@ -277,6 +239,8 @@ class EntryImporter:
         self,
         entry_date: date,
         md_path: Path,
+        md_content: str,
+        md_hash: str,
         data: Dict[str, Any],
         md_frontmatter: Dict[str, Any],
         metadata_hash: str,
@@ -290,6 +254,8 @@ class EntryImporter:
         Args:
             entry_date: Date of the entry
             md_path: Path to the MD file
+            md_content: Text of the MD file
+            md_hash: Hash of the MD file
             data: Parsed metadata YAML dict
             md_frontmatter: Parsed MD frontmatter dict
             metadata_hash: Hash of the metadata YAML file
@@ -297,7 +263,7 @@ class EntryImporter:
         Returns:
             Merged metadata dict ready for EntryManager
         """
-        word_count = self._compute_word_count(md_path)
+        word_count = self._compute_word_count(md_content)
         reading_time = word_count / 250.0
 
         # Normalize people: convert string entries to dicts
@@ -312,8 +278,8 @@ class EntryImporter:
         return {
             # Scalar fields
             "date": entry_date,
-            "file_path": str(md_path.relative_to(MD_DIR.parent.parent)),
-            "file_hash": self._compute_file_hash(md_path),
+            "file_path": str(md_path.relative_to(self.md_dir.parent.parent)),
+            "file_hash": md_hash,
             "metadata_hash": metadata_hash,
             "word_count": word_count,
             "reading_time": reading_time,
@@ -361,6 +327,18 @@ class EntryImporter:
         date_str = stem.replace("_analysis", "")  # Handle both formats
         return date.fromisoformat(date_str)
 
+    def md_path_for(self, entry_date: date) -> Path:
+        """
+        Return the expected MD file path for a date (may not exist).
+
+        Args:
+            entry_date: Date of the entry
+
+        Returns:
+            Path under md_dir/YYYY/
+        """
+        return self.md_dir / str(entry_date.year) / f"{entry_date.isoformat()}.md"
+
     def _find_md_file(self, entry_date: date) -> Optional[Path]:
         """
         Find the MD file for a given date.
@@ -371,37 +349,33 @@ class EntryImporter:
         Returns:
             Path to MD file, or None if not found
         """
-        year_dir = MD_DIR / str(entry_date.year)
-        md_path = year_dir / f"{entry_date.isoformat()}.md"
+        md_path = self.md_path_for(entry_date)
         if md_path.exists():
             return md_path
         return None
 
-    def _compute_file_hash(self, file_path: Path) -> str:
+    def _compute_hash(self, content: bytes) -> str:
         """
         Compute SHA256 hash of file contents.
 
         Args:
-            file_path: Path to file
+            content: Raw file bytes
 
         Returns:
             Hex-encoded hash string
         """
-        content = file_path.read_bytes()
         return hashlib.sha256(content).hexdigest()
 
-    def _compute_word_count(self, file_path: Path) -> int:
+    def _compute_word_count(self, content: str) -> int:
         """
-        Count words in MD file (excluding frontmatter).
+        Count words in MD content (excluding frontmatter).
 
         Args:
-            file_path: Path to MD file
+            content: Text of the MD file
 
         Returns:
             Word count
         """
-        content = file_path.read_text(encoding="utf-8")
-
         # Remove frontmatter
         if content.startswith("---"):
             parts = content.split("---", 2)
@@ -410,18 +384,16 @@ class EntryImporter:
 
         return len(content.split())
 
-    def _parse_md_frontmatter(self, md_path: Path) -> Dict[str, Any]:
+    def _parse_md_frontmatter(self, content: str) -> Dict[str, Any]:
         """
-        Parse YAML frontmatter from an MD file.
+        Parse YAML frontmatter from MD content.
 
         Args:
-            md_path: Path to the MD file
+            content: Text of the MD file
 
         Returns:
             Dictionary of frontmatter fields
         """
-        content = md_path.read_text(encoding="utf-8")
-
         if not content.startswith("---"):
             return {}
 
@@ -704,6 +676,381 @@ class EntryImporter:
                         f"not in entry narrated_dates"
                     )
 
+
+def prepare_entry(yaml_path: Path, md_dir: Path) -> PreparedEntry:
+    """
+    Prepare one YAML file (process pool worker entry point).
+
+    Args:
+        yaml_path: Path to the metadata YAML file
+        md_dir: Root directory of the MD journal files
+
+    Returns:
+        PreparedEntry for the file
+    """
+    return EntryPreparer(md_dir).prepare(yaml_path)
+
+
+# =============================================================================
+# Metadata Importer
+# =============================================================================
+
+class EntryImporter:
+    """
+    Import metadata YAML files into the database.
+
+    Prepares files with EntryPreparer (optionally across a process pool)
+    and applies the results as the single database writer, delegating
+    to EntryManager for entity creation and relationship processing.
+
+    Attributes:
+        session: Database session
+        dry_run: If True, don't commit changes
+        stats: ImportStats tracking progress
+        failed_imports: List of FailedImport records
+        logger: PalimpsestLogger for operation tracking
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        dry_run: bool = False,
+        logger: Optional[PalimpsestLogger] = None,
+        md_dir: Path = MD_DIR,
+        file_state: Optional[FileStateCache] = None,
+    ):
+        """
+        Initialize the importer.
+
+        Args:
+            session: Database session
+            dry_run: If True, don't commit changes
+            logger: Optional logger for operation tracking
+            md_dir: Root directory of the MD journal files
+            file_state: Stat-signature hash cache; when given, files whose
+                stat is unchanged and whose cached hashes match the DB
+                are skipped without being read (saved after import_all)
+        """
+        self.session = session
+        self.dry_run = dry_run
+        self.stats = ImportStats()
+        self.failed_imports: List[FailedImport] = []
+
+        if logger is None:
+            log_dir = LOG_DIR / "operations"
+            log_dir.mkdir(parents=True, exist_ok=True)
+            self.logger = PalimpsestLogger(log_dir, component_name="importer")
+        else:
+            self.logger = logger
+
+        self._preparer = EntryPreparer(md_dir)
+        self._file_state = file_state
+        self._entry_mgr = EntryManager(session, self.logger)
+        self._search_index = SearchIndexManager(session.get_bind(), self.logger)
+        self._batch_entry_ids: List[int] = []
+
+    def import_all(
+        self,
+        yaml_files: List[Path],
+        failed_only: bool = False,
+        workers: Optional[int] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> ImportStats:
+        """
+        Import all YAML files.
+
+        Files are prepared in parallel but written strictly in the given
+        order, so failure thresholds trip at the same file as a
+        sequential import would.
+
+        Args:
+            yaml_files: List of YAML file paths to import
+            failed_only: If True, only retry previously failed imports
+            workers: Preparation processes (default: CPU count; 1 = in-process)
+            batch_size: Files committed per transaction
+
+        Returns:
+            ImportStats with results
+        """
+        self.stats.total_files = len(yaml_files)
+
+        # Load failed imports if retrying
+        failed_paths: Set[str] = set()
+        if failed_only:
+            failed_paths = self._load_failed_imports()
+            if not failed_paths:
+                self.logger.log_info("No failed imports to retry.")
+                return self.stats
+
+        to_import: List[Path] = []
+        for yaml_path in yaml_files:
+            # Skip if not in failed list (when retrying)
+            if failed_only and str(yaml_path) not in failed_paths:
+                self.stats.skipped += 1
+                continue
+            to_import.append(yaml_path)
+
+        # Stat-only pass: unchanged files never reach the preparers
+        unchanged = self._find_unchanged(to_import)
+
+        pending = 0
+        prepared_entries = self._prepare_all(
+            [p for p in to_import if p not in unchanged], workers
+        )
+        try:
+            for yaml_path in to_import:
+                # Check thresholds
+                if self.stats.should_stop():
+                    self.logger.log_warning(
+                        f"Stopping due to failure threshold: "
+                        f"{self.stats.consecutive_failures} consecutive failures, "
+                        f"{self.stats.failure_rate:.1%} failure rate"
+                    )
+                    break
+
+                if yaml_path in unchanged:
+                    self.stats.skipped += 1
+                    self.stats.succeeded += 1
+                    self.stats.consecutive_failures = 0
+                    self.stats.processed += 1
+                    continue
+
+                prepared = next(prepared_entries)
+                self._record_file_state(prepared)
+
+                savepoint = self.session.begin_nested()
+                try:
+                    entry_id = self._import_prepared(prepared)
+                    savepoint.commit()
+                    if entry_id is not None:
+                        self._batch_entry_ids.append(entry_id)
+                    self.stats.succeeded += 1
+                    self.stats.consecutive_failures = 0
+                except Exception as e:
+                    # Rollback partial changes from failed file only
+                    if savepoint.is_active:
+                        savepoint.rollback()
+                    self.stats.failed += 1
+                    self.stats.consecutive_failures += 1
+                    self._record_failure(prepared.yaml_path, e)
+                    self.logger.log_error(e, {
+                        "file": prepared.yaml_path.name,
+                        "error_type": getattr(e, "error_type", type(e).__name__),
+                    })
+
+                self.stats.processed += 1
+                pending += 1
+                if pending >= batch_size:
+                    self._commit_batch()
+                    pending = 0
+        finally:
+            # Cancels outstanding preparation work if we stopped early
+            prepared_entries.close()
+
+        self._commit_batch()
+        self._refresh_aggregates()
+        if self._file_state is not None:
+            self._file_state.save()
+
+        # Save failed imports for retry
+        if self.failed_imports:
+            self._save_failed_imports()
+
+        # In dry-run mode, rollback all changes at the end
+        if self.dry_run:
+            self.session.rollback()
+            self.logger.log_info("Dry-run complete, all changes rolled back")
+
+        return self.stats
+
+    def _find_unchanged(self, yaml_files: List[Path]) -> Set[Path]:
+        """
+        Find files whose cached hashes prove the entry is up to date.
+
+        Uses only ``stat()``: a file qualifies when the stat signatures
+        of its YAML and MD files match the file-state cache and the
+        cached hashes equal the entry's metadata_hash and file_hash.
+
+        Args:
+            yaml_files: YAML files about to be imported
+
+        Returns:
+            Set of YAML paths that can be skipped without reading
+        """
+        if self._file_state is None or not yaml_files:
+            return set()
+
+        known = {
+            row.date: (row.file_hash, row.metadata_hash)
+            for row in self.session.query(
+                Entry.date, Entry.file_hash, Entry.metadata_hash
+            ).filter(Entry.deleted_at.is_(None))
+        }
+
+        unchanged: Set[Path] = set()
+        for yaml_path in yaml_files:
+            try:
+                entry_date = self._preparer._parse_date(None, yaml_path)
+            except ValueError:
+                continue
+            hashes = known.get(entry_date)
+            if hashes is None:
+                continue
+
+            md_path = self._preparer.md_path_for(entry_date)
+            if (
+                self._file_state.lookup(yaml_path) == hashes[1]
+                and self._file_state.lookup(md_path) == hashes[0]
+            ):
+                unchanged.add(yaml_path)
+
+        return unchanged
+
+    def _record_file_state(self, prepared: PreparedEntry) -> None:
+        """
+        Remember the hashes a preparer computed, keyed by stat signature.
+
+        Args:
+            prepared: Result of EntryPreparer.prepare()
+        """
+        if self._file_state is None:
+            return
+        if prepared.yaml_stat is not None:
+            self._file_state.record(
+                prepared.yaml_path, prepared.yaml_hash, prepared.yaml_stat
+            )
+        if prepared.md_stat is not None:
+            self._file_state.record(
+                prepared.md_path, prepared.md_hash, prepared.md_stat
+            )
+
+    def _prepare_all(
+        self, yaml_files: List[Path], workers: Optional[int]
+    ) -> Iterator[PreparedEntry]:
+        """
+        Prepare files in order, across a process pool when worthwhile.
+
+        Args:
+            yaml_files: YAML files to prepare
+            workers: Number of worker processes (None = CPU count)
+
+        Yields:
+            PreparedEntry for each file, in input order
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(yaml_files) < PARALLEL_MIN_FILES:
+            for yaml_path in yaml_files:
+                yield self._preparer.prepare(yaml_path)
+            return
+
+        chunksize = max(1, len(yaml_files) // (workers * 4))
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            yield from executor.map(
+                prepare_entry,
+                yaml_files,
+                repeat(self._preparer.md_dir),
+                chunksize=chunksize,
+            )
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _commit_batch(self) -> None:
+        """
+        Commit the current batch of imported files.
+
+        Reindexes the bodies of the batch's entries in the same
+        transaction (no-op without FTS). Dry-run keeps everything in
+        the session for the final rollback.
+        """
+        if self.dry_run:
+            return
+        if self._batch_entry_ids:
+            self._search_index.update_index(
+                self.session, entry_ids=self._batch_entry_ids
+            )
+        self.session.commit()
+        self._batch_entry_ids = []
+
+    def _refresh_aggregates(self) -> None:
+        """
+        Bring the aggregate tables up to date with the imported entries.
+
+        Done on the write path so wiki and analytics reads find them
+        current instead of refreshing them. Dry-run leaves them alone.
+        """
+        if self.dry_run:
+            return
+        refresh_aggregates(self.session)
+        self.session.commit()
+
+    def _import_prepared(self, prepared: PreparedEntry) -> Optional[int]:
+        """
+        Write a single prepared entry.
+
+        Skips unchanged entries, raises preparation or validation errors
+        for changed ones, and delegates to EntryManager for creation or
+        update.
+
+        Args:
+            prepared: Result of EntryPreparer.prepare()
+
+        Returns:
+            ID of the written entry, or None if skipped
+
+        Raises:
+            Various exceptions on failure (caught by import_all)
+        """
+        self.logger.log_info(f"Importing {prepared.yaml_path.name}...")
+
+        if prepared.error is not None:
+            raise prepared.error
+
+        md_hash = prepared.md_hash
+        yaml_hash = prepared.yaml_hash
+
+        # Check if entry already exists
+        existing = self._entry_mgr.get(entry_date=prepared.entry_date)
+
+        if existing:
+            # Check if either MD file or metadata YAML has changed
+            md_changed = existing.file_hash != md_hash
+            yaml_changed = existing.metadata_hash != yaml_hash
+
+            if not md_changed and not yaml_changed:
+                self.logger.log_info("  SKIPPED (unchanged)")
+                self.stats.skipped += 1
+                return None
+
+        # Validation ran during preparation; surface it only for changes
+        if prepared.validation_error is not None:
+            raise prepared.validation_error
+
+        if existing:
+            change_type = []
+            if md_changed:
+                change_type.append("MD")
+            if yaml_changed:
+                change_type.append("YAML")
+            self.logger.log_info(
+                f"  UPDATING ({', '.join(change_type)} changed)"
+            )
+            entry = self._entry_mgr.update(
+                existing, prepared.metadata,
+                sync_source="metadata-import",
+                removed_by="import-metadata",
+            )
+        else:
+            entry = self._entry_mgr.create(
+                prepared.metadata,
+                sync_source="metadata-import",
+                removed_by="import-metadata",
+            )
+
+        self.stats.entries_created += 1
+        self.logger.log_info("  OK (dry-run)" if self.dry_run else "  OK")
+        return entry.id
+
     # =========================================================================
     # Failure Tracking
     # =========================================================================
@@ -719,7 +1066,7 @@ class EntryImporter:
         self.failed_imports.append(
             FailedImport(
                 file_path=str(yaml_path),
-                error_type=type(error).__name__,
+                error_type=getattr(error, "error_type", type(error).__name__),
                 error_message=str(error),
             )
         )
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+pdf_batch.py
+------------
+Build PDFs for many years across a bounded process pool.
+
+Splits a multi-year build into independent jobs, one per (year, kind)
+where kind is ``clean``, ``notes`` or ``metadata``, and schedules them
+across worker processes. Rebuilding the whole archive after a preamble
+change then uses every core instead of typesetting one PDF at a time.
+
+Key Features:
+    - Year specs: ``2024``, ``2015-2025``, ``2015,2018-2020``
+    - One job per PDF, each with its own TemporalFileManager scratch dir
+    - A failed job is reported without stopping the others
+    - Aggregate PdfBuildStats across all jobs
+    - The shared build cache is pruned once, after every job finished
+    - jobs=1 (or a single job) runs in-process with the caller's logger
+
+Usage:
+    from dev.pipeline.pdf_batch import PdfBatchOptions, build_pdfs, parse_years
+
+    options = PdfBatchOptions(md_dir=MD_DIR, yaml_dir=JOURNAL_YAML_DIR,
+                              pdf_dir=PDF_DIR)
+    stats = build_pdfs(parse_years("2015-2025"), ("clean", "notes"),
+                       options, jobs=8)
+"""
+# --- Annotations ---
+from __future__ import annotations
+
+# --- Standard library imports ---
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence
+
+# --- Local imports ---
+from dev.builders.metadata_pdfbuilder import MetadataPdfBuilder
+from dev.builders.pdf_cache import PdfBuildCache
+from dev.builders.pdfbuilder import PdfBuilder, PdfBuildStats
+from dev.core.exceptions import PdfBuildError
+from dev.core.logging_manager import PalimpsestLogger, safe_logger
+from dev.core.paths import PDF_CACHE_DIR, TEX_DIR
+from dev.core.temporal_files import TemporalFileManager
+
+
+PDF_KINDS = ("clean", "notes", "metadata")
+"""Kinds of PDF a job can build, in scheduling order within a year."""
+
+_YEAR_SPEC = re.compile(r"^(\d{4})(?:-(\d{4}))?$")
+
+
+def parse_years(spec: str) -> List[str]:
+    """
+    Expand a year spec into sorted, unique years.
+
+    Args:
+        spec: Comma-separated years or inclusive ranges
+            (e.g. '2024', '2015-2025', '2015,2018-2020')
+
+    Returns:
+        List of four-digit year strings
+
+    Raises:
+        PdfBuildError: If the spec is malformed or a range is reversed
+    """
+    years = set()
+    for part in spec.split(","):
+        match = _YEAR_SPEC.match(part.strip())
+        if not match:
+            raise PdfBuildError(
+                f"Invalid year spec: {spec!r} (expected YYYY, YYYY-YYYY or a list)"
+            )
+        start = int(match.group(1))
+        end = int(match.group(2) or start)
+        if end < start:
+            raise PdfBuildError(f"Invalid year range: {part.strip()}")
+        years.update(str(year) for year in range(start, end + 1))
+    return sorted(years)
+
+
+@dataclass(frozen=True)
+class PdfJob:
+    """
+    One PDF to build.
+
+    Attributes:
+        year: Four-digit year
+        kind: 'clean', 'notes' or 'metadata'
+    """
+    year: str
+    kind: str
+
+    @property
+    def label(self) -> str:
+        """Short display name, e.g. '2024 notes'."""
+        return f"{self.year} {self.kind}"
+
+
+@dataclass
+class PdfBatchOptions:
+    """
+    Settings shared by every job of a batch (must stay picklable).
+
+    Attributes:
+        md_dir: Markdown source directory (YYYY/ subdirectories)
+        yaml_dir: Metadata YAML directory (YYYY/ subdirectories)
+        pdf_dir: PDF output directory
+        preamble: LaTeX preamble for clean PDFs
+        preamble_notes: LaTeX preamble for notes PDFs
+        preamble_metadata: LaTeX preamble for metadata PDFs
+        force_overwrite: Rebuild PDFs even when up to date or existing
+        keep_temp_on_error: Keep a failed job's scratch dir for debugging
+        cache_dir: Build cache for clean/notes PDFs (None disables it)
+        scratch_dir: Parent of the per-job scratch dirs (None = system temp)
+    """
+    md_dir: Path
+    yaml_dir: Path
+    pdf_dir: Path
+    preamble: Path = TEX_DIR / "preamble.tex"
+    preamble_notes: Path = TEX_DIR / "preamble_notes.tex"
+    preamble_metadata: Path = TEX_DIR / "preamble_metadata.tex"
+    force_overwrite: bool = False
+    keep_temp_on_error: bool = False
+    cache_dir: Optional[Path] = PDF_CACHE_DIR
+    scratch_dir: Optional[Path] = None
+
+    def source_dir(self, kind: str) -> Path:
+        """Directory holding a kind's YYYY/ source subdirectories."""
+        return self.yaml_dir if kind == "metadata" else self.md_dir
+
+
+@dataclass
+class PdfJobResult:
+    """
+    Outcome of one job.
+
+    Attributes:
+        job: The job that ran
+        files_processed: Source files read
+        pdfs_created: PDFs written (0 or 1)
+        pdfs_up_to_date: PDFs skipped as up to date or existing
+        months_converted: Month fragments converted by pandoc
+        months_cached: Month fragments reused from the cache
+        duration: Wall time in seconds
+        error: Error message if the job failed
+    """
+    job: PdfJob
+    files_processed: int = 0
+    pdfs_created: int = 0
+    pdfs_up_to_date: int = 0
+    months_converted: int = 0
+    months_cached: int = 0
+    duration: float = 0.0
+    error: Optional[str] = None
+
+
+class PdfBatchStats(PdfBuildStats):
+    """
+    Aggregate statistics across the jobs of a batch.
+
+    Attributes:
+        jobs: Number of jobs run
+        results: Per-job results, in completion order
+    """
+
+    def __init__(self) -> None:
+        """Initialize batch statistics."""
+        super().__init__()
+        self.jobs: int = 0
+        self.results: List[PdfJobResult] = []
+
+    @property
+    def failures(self) -> List[PdfJobResult]:
+        """Results of the jobs that failed."""
+        return [r for r in self.results if r.error is not None]
+
+    def add(self, result: PdfJobResult) -> None:
+        """
+        Fold one job's result into the totals.
+
+        Args:
+            result: Finished job
+        """
+        self.jobs += 1
+        self.results.append(result)
+        self.files_processed += result.files_processed
+        self.pdfs_created += result.pdfs_created
+        self.pdfs_up_to_date += result.pdfs_up_to_date
+        self.months_converted += result.months_converted
+        self.months_cached += result.months_cached
+        if result.error is not None:
+            self.errors += 1
+
+    def summary(self) -> str:
+        """
+        Get formatted summary of the batch.
+
+        Returns:
+            Summary string with job count followed by the build totals
+        """
+        return f"{self.jobs} jobs: " + super().summary()
+
+
+def plan_jobs(
+    years: Sequence[str],
+    kinds: Sequence[str],
+    options: PdfBatchOptions,
+    logger: Optional[PalimpsestLogger] = None,
+) -> List[PdfJob]:
+    """
+    List the jobs for a set of years and kinds.
+
+    For multi-year batches, years without a source directory for a kind
+    are skipped (ranges may span gaps); a single year is always planned
+    so its builder reports the missing directory.
+
+    Args:
+        years: Four-digit years
+        kinds: PDF kinds to build (subset of PDF_KINDS)
+        options: Batch settings
+        logger: Optional logger
+
+    Returns:
+        Jobs ordered by year, then kind
+
+    Raises:
+        PdfBuildError: If a kind is unknown
+    """
+    unknown = set(kinds) - set(PDF_KINDS)
+    if unknown:
+        raise PdfBuildError(f"Unknown PDF kind(s): {', '.join(sorted(unknown))}")
+
+    jobs = []
+    for year in years:
+        for kind in (k for k in PDF_KINDS if k in kinds):
+            if len(years) > 1 and not (options.source_dir(kind) / year).is_dir():
+                safe_logger(logger).log_debug(
+                    f"No sources for {year} {kind}, skipping"
+                )
+                continue
+            jobs.append(PdfJob(year, kind))
+    return jobs
+
+
+def run_job(
+    job: PdfJob,
+    options: PdfBatchOptions,
+    logger: Optional[PalimpsestLogger] = None,
+) -> PdfJobResult:
+    """
+    Build one PDF in its own scratch directory.
+
+    Module-level so a process pool can pickle it. Failures are caught
+    and returned in the result rather than raised.
+
+    Args:
+        job: PDF to build
+        options: Batch settings
+        logger: Optional logger (None inside pool workers)
+
+    Returns:
+        PdfJobResult for the job
+    """
+    result = PdfJobResult(job)
+    start = time.monotonic()
+    scratch = TemporalFileManager(base_dir=options.scratch_dir)
+    failed = False
+
+    try:
+        job_dir = scratch.create_temp_dir(prefix=f"palimpsest_{job.year}_{job.kind}_")
+        if job.kind == "metadata":
+            builder = MetadataPdfBuilder(
+                year=job.year,
+                yaml_dir=options.yaml_dir,
+                pdf_dir=options.pdf_dir,
+                preamble=options.preamble_metadata,
+                force_overwrite=options.force_overwrite,
+                keep_temp_on_error=options.keep_temp_on_error,
+                temp_dir=job_dir,
+                logger=logger,
+            )
+        else:
+            notes = job.kind == "notes"
+            builder = PdfBuilder(
+                year=job.year,
+                md_dir=options.md_dir,
+                pdf_dir=options.pdf_dir,
+                preamble=None if notes else options.preamble,
+                preamble_notes=options.preamble_notes if notes else None,
+                force_overwrite=options.force_overwrite,
+                keep_temp_on_error=options.keep_temp_on_error,
+                cache_dir=options.cache_dir,
+                temp_dir=job_dir,
+                prune=False,
+                logger=logger,
+            )
+
+        stats = builder.build()
+        result.files_processed = stats.files_processed
+        result.pdfs_created = stats.pdfs_created
+        result.pdfs_up_to_date = getattr(stats, "pdfs_up_to_date", 0)
+        result.months_converted = getattr(stats, "months_converted", 0)
+        result.months_cached = getattr(stats, "months_cached", 0)
+        if not stats.pdfs_created and not result.pdfs_up_to_date:
+            # Builders without a cache skip existing PDFs uncounted
+            result.pdfs_up_to_date = 1
+
+    except Exception as e:
+        failed = True
+        result.error = str(e) or type(e).__name__
+        safe_logger(logger).log_error(e, {"operation": "pdf_job", "job": job.label})
+
+    finally:
+        if not (failed and options.keep_temp_on_error):
+            scratch.cleanup()
+
+    result.duration = time.monotonic() - start
+    return result
+
+
+def build_pdfs(
+    years: Sequence[str],
+    kinds: Sequence[str],
+    options: PdfBatchOptions,
+    jobs: Optional[int] = None,
+    logger: Optional[PalimpsestLogger] = None,
+    on_result: Optional[Callable[[PdfJobResult], None]] = None,
+) -> PdfBatchStats:
+    """
+    Build PDFs for several years and kinds across a process pool.
+
+    Args:
+        years: Four-digit years
+        kinds: PDF kinds to build (subset of PDF_KINDS)
+        options: Batch settings
+        jobs: Worker processes (None = CPU count; 1 builds in-process)
+        logger: Optional logger (used directly only for in-process builds)
+        on_result: Called in the parent with each result as it finishes
+
+    Returns:
+        PdfBatchStats aggregated over all jobs (check .failures)
+
+    Raises:
+        PdfBuildError: If the kinds are invalid or no job was planned
+    """
+    stats = PdfBatchStats()
+    planned = plan_jobs(years, kinds, options, logger)
+    if not planned:
+        raise PdfBuildError(
+            f"Nothing to build for {', '.join(years)} ({', '.join(kinds)})"
+        )
+
+    workers = min(jobs or os.cpu_count() or 1, len(planned))
+    safe_logger(logger).log_operation(
+        "pdf_batch_start",
+        {"jobs": [job.label for job in planned], "workers": workers},
+    )
+
+    def collect(result: PdfJobResult) -> None:
+        stats.add(result)
+        if on_result is not None:
+            on_result(result)
+
+    if workers <= 1:
+        for job in planned:
+            collect(run_job(job, options, logger))
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = [executor.submit(run_job, job, options) for job in planned]
+            for future in as_completed(futures):
+                collect(future.result())
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    if options.cache_dir is not None:
+        # Jobs skip pruning: a concurrent job's fresh fragments are not
+        # referenced until its PDF is recorded
+        pruned = PdfBuildCache(options.cache_dir).prune()
+        if pruned:
+            safe_logger(logger).log_debug(f"Pruned {pruned} unused month fragments")
+
+    safe_logger(logger).log_operation("pdf_batch_complete", {"stats": stats.summary()})
+    return stats
@@ -0,0 +1,680 @@
+#!/usr/bin/env python3
+"""
+server.py
+---------
+Long-running ``plm serve`` daemon answering JSON-RPC on a Unix socket.
+
+Every editor action used to spawn a fresh ``plm`` process that imports
+click, SQLAlchemy, Jinja2, all ORM models and every CLI submodule before
+doing a few milliseconds of work. The daemon pays that cost once and
+keeps a warm PalimpsestDB (engine, connection pool, mappers) and
+WikiRenderer (compiled templates) between requests.
+
+Protocol:
+    JSON-RPC 2.0 over a stream socket, one request object per line and
+    one response object per line. A connection may carry several
+    requests; requests without an ``id`` are notifications and get no
+    response.
+
+Methods:
+    ping                 -> {"pid", "db_path", "uptime_s", "requests"}
+    metadata.list        entity_type | entity_types -> names
+    metadata.import      path | entity_type -> import result
+    metadata.validate    path -> diagnostics
+    wiki.generate        section, entity_type, full, entity, jobs -> stats
+    wiki.lint            path, full -> {file: diagnostics}
+    validate.entry       date | path -> {"valid", "diagnostics", "quickfix"}
+    export               full -> {"files_written", "files_deleted"}
+    shutdown             -> null (the daemon exits after replying)
+
+Key Features:
+    - Requests are served one at a time, so database writes never overlap
+    - The engine is disposed when the database file is replaced
+      (``plm db reset``/``restore``) so connections never read a stale file
+    - Compiled templates whose source changed are reloaded before a
+      wiki method runs
+    - ``call`` is a thin stdlib client; ``is_running`` lets callers fall
+      back to spawning ``plm`` when no daemon is listening
+
+Usage:
+    # Daemon (foreground; editors start it detached)
+    plm serve
+
+    # Client
+    from dev.pipeline.server import call, is_running
+
+    if is_running():
+        names = call("metadata.list", {"entity_type": "people"})
+"""
+# --- Annotations ---
+from __future__ import annotations
+
+# --- Standard library imports ---
+import inspect
+import json
+import os
+import signal
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
+
+# --- Local imports ---
+from dev.core.logging_manager import PalimpsestLogger, safe_logger
+from dev.core.paths import DB_PATH, SERVER_SOCKET_PATH
+
+if TYPE_CHECKING:
+    from dev.database.manager import PalimpsestDB
+    from dev.wiki.renderer import WikiRenderer
+
+
+# ==================== Constants ====================
+
+JSONRPC_VERSION = "2.0"
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+SERVER_ERROR = -32000
+
+# Seconds a client waits for a response (full wiki runs take a while)
+CLIENT_TIMEOUT = 600.0
+
+
+class RpcError(Exception):
+    """
+    A JSON-RPC error, raised by method handlers and by ``call``.
+
+    Attributes:
+        code: JSON-RPC error code
+        message: Human-readable description
+        data: Optional structured details (e.g. import diagnostics)
+    """
+
+    def __init__(self, code: int, message: str, data: Any = None) -> None:
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.data = data
+
+
+# ==================== Client ====================
+
+def call(
+    method: str,
+    params: Optional[Dict[str, Any]] = None,
+    socket_path: Union[str, Path] = SERVER_SOCKET_PATH,
+    timeout: float = CLIENT_TIMEOUT,
+) -> Any:
+    """
+    Send one request to a running daemon and return its result.
+
+    Args:
+        method: Method name, e.g. "metadata.list"
+        params: Keyword parameters for the method
+        socket_path: Daemon socket
+        timeout: Seconds to wait for the response
+
+    Returns:
+        The method's result
+
+    Raises:
+        OSError: If no daemon is listening (callers fall back to ``plm``)
+        RpcError: If the daemon answered with an error
+    """
+    request = {
+        "jsonrpc": JSONRPC_VERSION,
+        "id": 1,
+        "method": method,
+        "params": params or {},
+    }
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as stream:
+            line = stream.readline()
+
+    if not line:
+        raise ConnectionError("Daemon closed the connection without a response")
+    response = json.loads(line)
+    if "error" in response:
+        error = response["error"]
+        raise RpcError(error["code"], error["message"], error.get("data"))
+    return response["result"]
+
+
+def is_running(socket_path: Union[str, Path] = SERVER_SOCKET_PATH) -> bool:
+    """
+    Check whether a daemon answers on the socket.
+
+    Args:
+        socket_path: Daemon socket
+
+    Returns:
+        True if a ``ping`` succeeded
+    """
+    try:
+        call("ping", socket_path=socket_path, timeout=2.0)
+    except (OSError, ValueError, RpcError):
+        return False
+    return True
+
+
+# ==================== Server ====================
+
+class _ConnectionHandler(socketserver.StreamRequestHandler):
+    """Read newline-delimited requests and write one response per request."""
+
+    def handle(self) -> None:
+        plm: PlmServer = self.server.plm  # type: ignore[attr-defined]
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response = plm.handle_line(line)
+            if response is not None:
+                self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+                self.wfile.flush()
+            if plm.stop_requested:
+                plm.stop()
+                return
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded Unix socket server; PlmServer serializes the method calls."""
+
+    daemon_threads = True
+
+
+class PlmServer:
+    """
+    JSON-RPC daemon over a warm database and wiki renderer.
+
+    Attributes:
+        socket_path: Unix socket the daemon listens on
+        db: PalimpsestDB shared by all requests (created by ``warm``)
+        renderer: WikiRenderer shared by wiki requests
+        logger: Optional logger
+        requests: Number of method calls served
+        stop_requested: Set by ``shutdown``; the daemon stops once the
+            reply has been written
+    """
+
+    def __init__(
+        self,
+        socket_path: Union[str, Path] = SERVER_SOCKET_PATH,
+        db: Optional[PalimpsestDB] = None,
+        logger: Optional[PalimpsestLogger] = None,
+    ) -> None:
+        """
+        Initialize the daemon (nothing is imported or opened yet).
+
+        Args:
+            socket_path: Unix socket to listen on
+            db: PalimpsestDB to serve (None = open DB_PATH in ``warm``)
+            logger: Optional logger for request and error logging
+        """
+        self.socket_path = Path(socket_path)
+        self.db = db
+        self.renderer: Optional[WikiRenderer] = None
+        self.logger = logger
+        self.requests = 0
+        self.stop_requested = False
+
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+        self._server: Optional[_UnixServer] = None
+        self._db_inode: Optional[int] = None
+        self._methods: Dict[str, Callable[..., Any]] = {
+            "ping": self.ping,
+            "metadata.list": self.metadata_list,
+            "metadata.import": self.metadata_import,
+            "metadata.validate": self.metadata_validate,
+            "wiki.generate": self.wiki_generate,
+            "wiki.lint": self.wiki_lint,
+            "validate.entry": self.validate_entry,
+            "export": self.export,
+            "shutdown": self.shutdown,
+        }
+
+    # ==============================================================
+    #  LIFECYCLE
+    # ==============================================================
+
+    def warm(self) -> None:
+        """
+        Import the heavy modules and load the database and templates.
+
+        Runs once before the socket opens, so the first request is as
+        fast as the rest.
+        """
+        from dev.core.paths import (
+            ALEMBIC_DIR,
+            BACKUP_DIR,
+            LOG_DIR,
+            WIKI_TEMPLATE_CACHE_DIR,
+            WIKI_TEMPLATES_DIR,
+        )
+        from dev.database.manager import PalimpsestDB
+        from dev.wiki.renderer import WikiRenderer
+
+        # Imported for their cost only; handlers import them lazily
+        import dev.pipeline.export_json  # noqa: F401
+        import dev.validators.entry  # noqa: F401
+        import dev.wiki.exporter  # noqa: F401
+        import dev.wiki.metadata  # noqa: F401
+        import dev.wiki.validator  # noqa: F401
+
+        if self.db is None:
+            self.db = PalimpsestDB(
+                db_path=DB_PATH,
+                alembic_dir=ALEMBIC_DIR,
+                log_dir=LOG_DIR,
+                backup_dir=BACKUP_DIR,
+                enable_auto_backup=False,
+            )
+        self._db_inode = self._current_db_inode()
+
+        self.renderer = WikiRenderer(
+            WIKI_TEMPLATES_DIR, cache_dir=WIKI_TEMPLATE_CACHE_DIR
+        )
+        for name in self.renderer.env.list_templates(extensions=["jinja2"]):
+            self.renderer.get_template(name)
+
+        safe_logger(self.logger).log_info(
+            "Daemon warmed up", self.renderer.timings
+        )
+
+    def serve_forever(self) -> None:
+        """
+        Listen on the socket until ``shutdown`` or SIGTERM/SIGINT.
+
+        A stale socket file left by a crashed daemon is replaced; a
+        live one means another daemon already serves this project.
+
+        Raises:
+            RuntimeError: If another daemon answers on the socket
+        """
+        if self.socket_path.exists():
+            if is_running(self.socket_path):
+                raise RuntimeError(
+                    f"A daemon is already listening on {self.socket_path}"
+                )
+            self.socket_path.unlink()
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if self.db is None or self.renderer is None:
+            self.warm()
+
+        self._server = _UnixServer(str(self.socket_path), _ConnectionHandler)
+        self._server.plm = self  # type: ignore[attr-defined]
+        os.chmod(self.socket_path, 0o600)
+
+        if threading.current_thread() is threading.main_thread():
+            for signum in (signal.SIGTERM, signal.SIGINT):
+                signal.signal(signum, lambda *_: self.stop())
+
+        safe_logger(self.logger).log_info(
+            f"Serving on {self.socket_path} (pid {os.getpid()})"
+        )
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            self._server = None
+            self.socket_path.unlink(missing_ok=True)
+            safe_logger(self.logger).log_info("Daemon stopped")
+
+    def stop(self) -> None:
+        """Make serve_forever return (safe to call from any thread)."""
+        server = self._server
+        if server is not None:
+            threading.Thread(target=server.shutdown, daemon=True).start()
+
+    # ==============================================================
+    #  DISPATCH
+    # ==============================================================
+
+    def handle_line(self, line: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Answer one request line.
+
+        Args:
+            line: Raw JSON-RPC request
+
+        Returns:
+            Response object, or None for notifications
+        """
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return _error_response(None, PARSE_ERROR, f"Parse error: {e}")
+        if not isinstance(request, dict) or not isinstance(
+            request.get("method"), str
+        ):
+            request_id = request.get("id") if isinstance(request, dict) else None
+            return _error_response(request_id, INVALID_REQUEST, "Invalid request")
+
+        request_id = request.get("id")
+        try:
+            result = self.dispatch(request["method"], request.get("params"))
+        except RpcError as e:
+            response = _error_response(request_id, e.code, e.message, e.data)
+        except Exception as e:
+            safe_logger(self.logger).log_error(
+                e, {"operation": "serve", "method": request["method"]}
+            )
+            response = _error_response(
+                request_id, SERVER_ERROR, f"{type(e).__name__}: {e}"
+            )
+        else:
+            response = {
+                "jsonrpc": JSONRPC_VERSION,
+                "id": request_id,
+                "result": result,
+            }
+        return response if "id" in request else None
+
+    def dispatch(self, method: str, params: Optional[Dict[str, Any]]) -> Any:
+        """
+        Run a method with keyword parameters, one call at a time.
+
+        Args:
+            method: Method name
+            params: Keyword parameters (None = no parameters)
+
+        Returns:
+            JSON-serializable method result
+
+        Raises:
+            RpcError: For unknown methods or parameters that do not fit
+                the method's signature
+        """
+        handler = self._methods.get(method)
+        if handler is None:
+            raise RpcError(METHOD_NOT_FOUND, f"Unknown method '{method}'")
+        params = params if params is not None else {}
+        if not isinstance(params, dict):
+            raise RpcError(INVALID_PARAMS, "params must be an object")
+        try:
+            inspect.signature(handler).bind(**params)
+        except TypeError as e:
+            raise RpcError(INVALID_PARAMS, str(e)) from e
+
+        with self._lock:
+            self.requests += 1
+            started = time.perf_counter()
+            self._check_db()
+            result = handler(**params)
+            safe_logger(self.logger).log_debug(
+                f"{method} served",
+                {"ms": round((time.perf_counter() - started) * 1000, 1)},
+            )
+            return result
+
+    def _current_db_inode(self) -> Optional[int]:
+        """Inode of the database file (None if it does not exist)."""
+        try:
+            return os.stat(self.db.db_path).st_ino
+        except (AttributeError, OSError):
+            return None
+
+    def _check_db(self) -> None:
+        """Drop pooled connections if the database file was replaced."""
+        inode = self._current_db_inode()
+        if inode != self._db_inode:
+            self.db.engine.dispose()
+            self._db_inode = inode
+            safe_logger(self.logger).log_info(
+                "Database file replaced; connection pool reset"
+            )
+
+    # ==============================================================
+    #  METHODS
+    # ==============================================================
+
+    def ping(self) -> Dict[str, Any]:
+        """Report daemon identity and uptime."""
+        return {
+            "pid": os.getpid(),
+            "db_path": str(self.db.db_path),
+            "uptime_s": round(time.monotonic() - self._started, 1),
+            "requests": self.requests,
+        }
+
+    def metadata_list(
+        self,
+        entity_type: Optional[str] = None,
+        entity_types: Optional[List[str]] = None,
+    ) -> Union[List[str], Dict[str, List[str]]]:
+        """
+        List entity names for autocomplete (``plm metadata list``).
+
+        Args:
+            entity_type: One entity type
+            entity_types: Several types in one round-trip
+
+        Returns:
+            Names of entity_type, or {type: names} for entity_types
+        """
+        from dev.wiki.metadata import MetadataExporter
+
+        exporter = MetadataExporter(self.db)
+        try:
+            if entity_types is not None:
+                return {t: exporter.list_entities(t) for t in entity_types}
+            if entity_type is None:
+                raise RpcError(
+                    INVALID_PARAMS, "expected 'entity_type' or 'entity_types'"
+                )
+            return exporter.list_entities(entity_type)
+        except ValueError as e:
+            raise RpcError(INVALID_PARAMS, str(e)) from e
+
+    def metadata_import(
+        self,
+        path: Optional[str] = None,
+        entity_type: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Import YAML metadata into the database (``plm metadata import``).
+
+        Args:
+            path: One YAML file
+            entity_type: Import every file of a type (neither = all)
+
+        Returns:
+            {"imported": path} for a file, or {"stats": ...} otherwise
+
+        Raises:
+            RpcError: With the error diagnostics as data if the file
+                did not import
+        """
+        from dev.wiki.metadata import MetadataImporter
+
+        importer = MetadataImporter(self.db, logger=self.logger)
+        if path is None:
+            return {"stats": importer.import_all(entity_type=entity_type)}
+
+        diagnostics = importer.import_file(Path(path))
+        errors = [d.to_dict() for d in diagnostics if d.severity == "error"]
+        if errors:
+            raise RpcError(SERVER_ERROR, f"Import failed: {path}", errors)
+        return {"imported": path}
+
+    def metadata_validate(self, path: str) -> List[Dict[str, Any]]:
+        """
+        Validate a YAML metadata file (``plm metadata validate``).
+
+        Args:
+            path: YAML file
+
+        Returns:
+            Diagnostics as dicts (empty when valid)
+        """
+        from dev.wiki.metadata import MetadataValidator
+
+        return [d.to_dict() for d in MetadataValidator().validate_file(Path(path))]
+
+    def wiki_generate(
+        self,
+        section: Optional[str] = None,
+        entity_type: Optional[str] = None,
+        full: bool = False,
+        entity: Optional[str] = None,
+        jobs: int = 1,
+    ) -> Dict[str, int]:
+        """
+        Generate wiki pages (``plm wiki generate``).
+
+        Renders in the daemon by default: editor-triggered runs are
+        incremental and small, so a process pool would cost more than
+        it saves.
+
+        Args:
+            section: "journal", "manuscript" or "indexes"
+            entity_type: Only this entity type
+            full: Re-render every page
+            entity: "TYPE:KEY" to regenerate one entity's pages
+            jobs: Render processes
+
+        Returns:
+            Generation stats
+        """
+        from dev.core.paths import WIKI_INDEX_PATH
+        from dev.wiki.exporter import WikiExporter
+
+        self.renderer.drop_stale()
+        exporter = WikiExporter(
+            self.db,
+            logger=self.logger,
+            index_path=WIKI_INDEX_PATH,
+            workers=jobs,
+            renderer=self.renderer,
+        )
+        try:
+            if entity is not None:
+                entity_name, _, key = entity.partition(":")
+                if not entity_name or not key:
+                    raise ValueError("expected TYPE:KEY (e.g. people:clara)")
+                exporter.generate_entity(entity_name, key)
+            else:
+                exporter.generate_all(
+                    section=section, entity_type=entity_type, full=full
+                )
+        except ValueError as e:
+            raise RpcError(INVALID_PARAMS, str(e)) from e
+        return exporter.stats
+
+    def wiki_lint(
+        self, path: str, full: bool = False
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Lint wiki files (``plm wiki lint``).
+
+        Args:
+            path: File or directory
+            full: Ignore cached diagnostics
+
+        Returns:
+            {file: diagnostics} for files with diagnostics
+        """
+        from dev.core.paths import WIKI_LINT_CACHE_PATH
+        from dev.wiki.validator import WikiValidator
+
+        if full:
+            WIKI_LINT_CACHE_PATH.unlink(missing_ok=True)
+        validator = WikiValidator(self.db, cache_path=WIKI_LINT_CACHE_PATH)
+        target = Path(path)
+        if target.is_file():
+            raw = {str(target): validator.validate_file(target)}
+        else:
+            raw = validator.validate_directory(target)
+        validator.save_cache()
+        return {k: [d.to_dict() for d in v] for k, v in raw.items() if v}
+
+    def validate_entry(
+        self, date: Optional[str] = None, path: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Validate a journal entry's MD and YAML (``plm validate entry``).
+
+        Args:
+            date: Entry date (YYYY-MM-DD)
+            path: MD or YAML file instead of a date
+
+        Returns:
+            {"valid": bool, "diagnostics": [...], "quickfix": str}
+        """
+        from dev.validators.entry import (
+            validate_entry as do_validate_entry,
+            validate_file as do_validate_file,
+        )
+
+        if path is not None:
+            report = do_validate_file(Path(path))
+        elif date is not None:
+            report = do_validate_entry(date)
+        else:
+            raise RpcError(INVALID_PARAMS, "expected 'date' or 'path'")
+        return {
+            "valid": report.is_valid,
+            "diagnostics": [d.to_dict() for d in report.diagnostics],
+            "quickfix": report.quickfix_output(),
+        }
+
+    def export(self, full: bool = False) -> Dict[str, int]:
+        """
+        Export the database to JSON without committing
+        (``plm export --no-commit``).
+
+        Args:
+            full: Rewrite every file
+
+        Returns:
+            {"files_written": n, "files_deleted": n}
+        """
+        from dev.core.paths import EXPORT_INDEX_PATH, EXPORT_STATE_PATH
+        from dev.pipeline.export_json import JSONExporter
+        from dev.utils.file_state import FileStateCache
+
+        exporter = JSONExporter(
+            self.db,
+            logger=self.logger,
+            file_state=FileStateCache(EXPORT_STATE_PATH),
+            index_path=EXPORT_INDEX_PATH,
+        )
+        exporter.export_all(commit=False, incremental=not full)
+        return {
+            "files_written": exporter.files_written,
+            "files_deleted": exporter.files_deleted,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the daemon once this response has been sent."""
+        self.stop_requested = True
+
+
+def _error_response(
+    request_id: Any, code: int, message: str, data: Any = None
+) -> Dict[str, Any]:
+    """
+    Build a JSON-RPC error response.
+
+    Args:
+        request_id: Id of the failed request (None if unknown)
+        code: JSON-RPC error code
+        message: Error description
+        data: Optional structured details
+
+    Returns:
+        Response object
+    """
+    error: Dict[str, Any] = {"code": code, "message": message}
+    if data is not None:
+        error["data"] = data
+    return {"jsonrpc": JSONRPC_VERSION, "id": request_id, "error": error}
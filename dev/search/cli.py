@@ -10,6 +10,7 @@ for fast full-text queries with filters.
 Commands:
     plm-search query "search text" [options]
     plm-search index create
+    plm-search index update
     plm-search index rebuild
     plm-search index status
 
@@ -28,9 +29,12 @@ Examples:
     plm-search index rebuild
     plm-search index status
 """
+# --- Annotations ---
+from __future__ import annotations
+
 # --- Standard library imports ---
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 # --- Third party imports ---
 import click
@@ -39,11 +43,19 @@ import click
 from dev.core.paths import DB_PATH, ALEMBIC_DIR, LOG_DIR, BACKUP_DIR
 from dev.core.logging_manager import PalimpsestLogger
 from dev.core.cli import setup_logger
-from dev.database.manager import PalimpsestDB
+
+if TYPE_CHECKING:
+    from dev.database.manager import PalimpsestDB
+
+
+# Rows fetched per round trip when streaming query results
+STREAM_PAGE_SIZE = 25
 
 
 def _get_db() -> PalimpsestDB:
     """Get database instance with standard configuration."""
+    from dev.database.manager import PalimpsestDB
+
     return PalimpsestDB(
         db_path=DB_PATH,
         alembic_dir=ALEMBIC_DIR,
@@ -85,9 +97,17 @@ def cli(ctx: click.Context, log_dir: str, verbose: bool) -> None:
     type=click.Choice(["relevance", "date", "word_count"]),
     help="Sort order (default: relevance)"
 )
+@click.option("--all", "show_all", is_flag=True, help="Stream every match (ignore --limit)")
 @click.option("-v", "--verbose", is_flag=True, help="Show detailed metadata")
 @click.pass_context
-def search_query(ctx: click.Context, query: tuple, limit: Optional[int], sort: Optional[str], verbose: bool) -> None:
+def search_query(
+    ctx: click.Context,
+    query: tuple,
+    limit: Optional[int],
+    sort: Optional[str],
+    show_all: bool,
+    verbose: bool,
+) -> None:
     """
     Search journal entries with full-text search and filters.
 
@@ -112,6 +132,12 @@ def search_query(ctx: click.Context, query: tuple, limit: Optional[int], sort: O
 
         # Verbose output with metadata
         plm-search query "creative writing" --verbose --limit 20
+
+        # Stream every match of a broad query
+        plm-search query tag:reflection year:2019 --all
+
+    Results are streamed in pages as they are found, so the first hits
+    print immediately and memory use stays flat on broad queries.
     """
     from dev.search.search_engine import SearchQueryParser, SearchEngine
 
@@ -127,53 +153,65 @@ def search_query(ctx: click.Context, query: tuple, limit: Optional[int], sort: O
 
     db = _get_db()
 
-    # Execute search
+    # Stream results page by page
     session = db.get_session()
     engine = SearchEngine(session)
-    results = engine.search(parsed_query)
-    session.close()
-
-    # Display results
-    if not results:
-        click.echo("No results found.")
-        return
-
-    click.echo(f"Found {len(results)} results:\n")
-
-    for result in results:
-        entry = result['entry']
-        score = result['score']
-        snippet = result['snippet']
-
-        # Date and score
-        date_str = entry.date.isoformat()
-        if score > 0:
-            click.echo(f"{date_str} (score: {score:.2f})")
+    max_results = None if show_all else parsed_query.limit
+    shown = 0
+
+    try:
+        for result in engine.iter_results(
+            parsed_query, page_size=STREAM_PAGE_SIZE, max_results=max_results
+        ):
+            entry = result['entry']
+            score = result['score']
+            snippet = result['snippet']
+            shown += 1
+
+            # Date and score
+            date_str = entry.date.isoformat()
+            if score > 0:
+                click.echo(f"{date_str} (score: {score:.2f})")
+            else:
+                click.echo(f"{date_str}")
+
+            # Snippet
+            if snippet:
+                clean_snippet = snippet.replace('\n', ' ').strip()
+                click.echo(f"   {clean_snippet}")
+
+            # Metadata (verbose mode)
+            if verbose:
+                click.echo(f"   Words: {entry.word_count}, Time: {entry.reading_time}m")
+
+                if entry.people:
+                    people_str = ", ".join(p.name for p in entry.people)
+                    click.echo(f"   People: {people_str}")
+
+                if entry.tags:
+                    tags_str = ", ".join(t.name for t in entry.tags)
+                    click.echo(f"   Tags: {tags_str}")
+
+            click.echo()  # Blank line between results
+
+        # Summary
+        if not shown:
+            click.echo("No results found.")
+        elif max_results is not None and shown == max_results:
+            total = engine.count(parsed_query)
+            if total > shown:
+                click.echo(
+                    f"(Showing first {shown} of {total} results. "
+                    "Use --limit or --all to see more)"
+                )
+            else:
+                click.echo(f"Found {total} results.")
         else:
-            click.echo(f"{date_str}")
-
-        # Snippet
-        if snippet:
-            clean_snippet = snippet.replace('\n', ' ').strip()
-            click.echo(f"   {clean_snippet}")
-
-        # Metadata (verbose mode)
-        if verbose:
-            click.echo(f"   Words: {entry.word_count}, Time: {entry.reading_time}m")
-
-            if entry.people:
-                people_str = ", ".join(p.name for p in entry.people)
-                click.echo(f"   People: {people_str}")
-
-            if entry.tags:
-                tags_str = ", ".join(t.tag for t in entry.tags)
-                click.echo(f"   Tags: {tags_str}")
-
-        click.echo()  # Blank line between results
-
-    # Summary
-    if len(results) == parsed_query.limit:
-        click.echo(f"(Showing first {parsed_query.limit} results. Use --limit to see more)")
+            click.echo(f"Found {shown} results.")
+    except ValueError as e:
+        raise click.UsageError(str(e)) from e
+    finally:
+        session.close()
 
 
 @cli.group("index")
@@ -188,6 +226,7 @@ def index_group(ctx: click.Context) -> None:
 
     Commands:
         create   - Create new FTS5 index
+        update   - Reindex only entries whose body changed
         rebuild  - Rebuild existing index
         status   - Check if index exists and entry count
     """
@@ -242,6 +281,41 @@ def index_create(ctx: click.Context) -> None:
     click.echo(f"[OK]Created search index: {count} entries indexed")
 
 
+@index_group.command("update")
+@click.option(
+    "--verify",
+    is_flag=True,
+    help="Re-read every MD file, not only entries whose file_hash changed",
+)
+@click.pass_context
+def index_update(ctx: click.Context, verify: bool) -> None:
+    """
+    Incrementally update full-text search index.
+
+    Re-reads the MD files of entries that were never indexed or whose
+    file_hash changed since they were last indexed, and rewrites only
+    the FTS rows whose body text actually differs. Much faster than a
+    full rebuild on a large archive; `plm sync` runs this automatically.
+
+    Use --verify after editing MD files outside the import pipeline
+    (the body hash of every entry is then recomputed).
+    """
+    from dev.search.search_index import SearchIndexManager
+
+    logger: PalimpsestLogger = ctx.obj["logger"]
+    db = _get_db()
+    mgr = SearchIndexManager(db.engine, logger)
+
+    if not mgr.index_exists():
+        click.echo("[WARN]Search index does not exist. Run: plm-search index create")
+        return
+
+    with db.session_scope() as session:
+        count = mgr.update_index(session, verify=verify)
+
+    click.echo(f"[OK]Updated search index: {count} entries reindexed")
+
+
 @index_group.command("rebuild")
 @click.pass_context
 def index_rebuild(ctx: click.Context) -> None:
@@ -6,6 +6,19 @@ Full-text search with advanced metadata filtering.
 
 Combines SQLite FTS5 for text search with SQL filters for metadata.
 
+Query Planning:
+    Text matching, metadata filters, ranking and pagination all run in a
+    single SQLite statement: ``entries_fts`` is joined to ``entries``,
+    relationship filters become EXISTS subqueries over the association
+    tables, and ``ORDER BY bm25(...)`` with ``LIMIT/OFFSET`` selects the
+    page. Relationships are then loaded only for the entries on that page.
+
+Streaming:
+    ``SearchEngine.iter_pages`` / ``iter_results`` walk a result set with
+    keyset pagination on the sort key plus (date, id), so each page is an
+    indexed range scan instead of a growing OFFSET, and memory stays
+    constant however many entries match.
+
 Query Syntax Examples:
     "alice therapy"                    # Text search
     "alice AND therapy"                # Boolean AND
@@ -28,18 +41,47 @@ Usage:
 # --- Standard library imports ---
 from dataclasses import dataclass, field
 from datetime import date as Date
-from typing import List, Optional, Dict, Any
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from calendar import monthrange
 
 # --- Third party imports ---
-from sqlalchemy import select, and_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import (
+    Row,
+    Select,
+    and_,
+    column,
+    func,
+    literal_column,
+    or_,
+    select,
+    table,
+)
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, selectinload
 
 # --- Local imports ---
-from dev.database.models import Entry, Person, Tag, Event, City, Theme
+from dev.database.models import (
+    Entry,
+    Person,
+    Tag,
+    Event,
+    City,
+    Theme,
+    ThemeInstance,
+)
 from dev.search.search_index import SearchIndexManager
 
 
+# FTS5 virtual table as a lightweight Core construct
+entries_fts = table("entries_fts", column("entry_id"))
+
+# SQLite messages for MATCH expressions FTS5 cannot parse
+FTS_SYNTAX_ERRORS = ("fts5:", "unterminated string", "unknown special query")
+
+# (row attribute, SQL expression, ascending) triples defining result order
+SortKey = Tuple[str, Any, bool]
+
+
 @dataclass
 class SearchQuery:
     """Represents a parsed search query with text and filters."""
@@ -212,6 +254,9 @@ class SearchEngine:
         """
         Execute search query and return results.
 
+        Filtering, ranking and pagination happen in SQLite; only the
+        entries on the requested page are loaded as ORM objects.
+
         Args:
             query: SearchQuery object
 
@@ -220,55 +265,229 @@ class SearchEngine:
                 - entry: Entry object
                 - score: Relevance score (if text search)
                 - snippet: Highlighted snippet (if text search)
+
+        Raises:
+            ValueError: If the text is not valid full-text query syntax
+        """
+        use_fts = self._use_fts(query)
+        stmt = self._plan(query, use_fts)
+        rows = self._execute(
+            stmt.limit(query.limit).offset(query.offset), use_fts
+        ).all()
+        return self._hydrate(rows)
+
+    def count(self, query: SearchQuery) -> int:
+        """
+        Count all entries matching a query (ignoring pagination).
+
+        Args:
+            query: SearchQuery object
+
+        Returns:
+            Total number of matching entries
+
+        Raises:
+            ValueError: If the text is not valid full-text query syntax
+        """
+        use_fts = self._use_fts(query)
+        stmt = self._plan(query, use_fts, ordered=False)
+        return self._execute(
+            select(func.count()).select_from(stmt.subquery()), use_fts
+        ).scalar_one()
+
+    def iter_pages(
+        self,
+        query: SearchQuery,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream results page by page using keyset pagination.
+
+        Each page resumes strictly after the last (sort key, date, id) of
+        the previous one, so no page re-scans earlier matches. Only the
+        current page is hydrated; the session's identity map holds weak
+        references, so pages the caller drops are freed.
+
+        Args:
+            query: SearchQuery object (``offset`` skips leading results;
+                ``limit`` is ignored in favour of ``page_size``)
+            page_size: Rows per page (default: ``query.limit``)
+            max_results: Stop after this many results (default: all)
+
+        Yields:
+            Lists of result dicts, as returned by ``search``
+
+        Raises:
+            ValueError: If the text is not valid full-text query syntax
+        """
+        page_size = page_size or query.limit
+        use_fts = self._use_fts(query)
+        after: Optional[Row] = None
+        offset = query.offset
+        remaining = max_results
+
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            stmt = self._plan(query, use_fts, after=after).limit(size)
+            if offset:
+                stmt = stmt.offset(offset)
+                offset = 0
+
+            rows = self._execute(stmt, use_fts).all()
+            if not rows:
+                return
+
+            yield self._hydrate(rows)
+
+            if remaining is not None:
+                remaining -= len(rows)
+            if len(rows) < size:
+                return
+            after = rows[-1]
+
+    def iter_results(
+        self,
+        query: SearchQuery,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
         """
-        # Start with FTS query if text search
-        fts_results = None
-        entry_ids = None
-
-        if query.text:
-            # Execute FTS search
-            bind = self.session.bind
-            if bind is None:
-                raise ValueError("Database session has no bind (engine)")
-            from sqlalchemy import Connection
-            if isinstance(bind, Connection):
-                engine = bind.engine
-            else:
-                engine = bind
-            search_mgr = SearchIndexManager(engine)
-
-            try:
-                fts_results = search_mgr.search(
-                    query.text,
-                    limit=1000,  # Get large set, filter later
-                    highlight=True
+        Stream individual results; see ``iter_pages``.
+
+        Args:
+            query: SearchQuery object
+            page_size: Rows fetched per round trip
+            max_results: Stop after this many results (default: all)
+
+        Yields:
+            Result dicts, as returned by ``search``
+        """
+        for page in self.iter_pages(query, page_size, max_results):
+            yield from page
+
+    def _execute(self, stmt: Select, use_fts: bool) -> Any:
+        """
+        Execute a planned statement.
+
+        Only errors FTS5 raises while parsing the MATCH expression are
+        reported as invalid syntax; locking, I/O and schema errors (and
+        anything from a metadata-only plan) propagate unchanged.
+
+        Args:
+            stmt: Planned statement
+            use_fts: Whether the plan matches against the FTS index
+
+        Raises:
+            ValueError: If SQLite rejects the full-text query syntax
+                (e.g. an unterminated quote)
+            OperationalError: For any other database error
+        """
+        try:
+            return self.session.execute(stmt)
+        except OperationalError as e:
+            if use_fts and str(e.orig).startswith(FTS_SYNTAX_ERRORS):
+                raise ValueError(f"Invalid search syntax: {e.orig}") from e
+            raise
+
+    # -------------------------------------------------------------------------
+    # Query planning
+    # -------------------------------------------------------------------------
+
+    def _use_fts(self, query: SearchQuery) -> bool:
+        """Whether the text part of the query can use the FTS index."""
+        if not query.text:
+            return False
+
+        bind = self.session.bind
+        if bind is None:
+            raise ValueError("Database session has no bind (engine)")
+        from sqlalchemy import Connection
+        if isinstance(bind, Connection):
+            engine = bind.engine
+        else:
+            engine = bind
+
+        # FTS index might not exist: fall back to metadata filters only
+        return SearchIndexManager(engine).index_exists(self.session)
+
+    def _plan(
+        self,
+        query: SearchQuery,
+        use_fts: bool,
+        ordered: bool = True,
+        after: Optional[Row] = None,
+    ) -> Select:
+        """
+        Build the single SELECT that filters, ranks and orders entries.
+
+        Selected columns: entry id, date, word count, score and snippet
+        (score and snippet are constant when there is no text search).
+
+        Args:
+            query: SearchQuery object
+            use_fts: Match ``query.text`` against the FTS index
+            ordered: Apply the ORDER BY clause
+            after: Keyset cursor; only rows sorting after it are returned
+
+        Returns:
+            SQLAlchemy Select statement
+        """
+        if use_fts:
+            fts_ref = literal_column("entries_fts")
+            rank = func.bm25(fts_ref)
+            stmt = (
+                select(
+                    Entry.id,
+                    Entry.date,
+                    Entry.word_count,
+                    rank.label("rank"),
+                    func.snippet(
+                        fts_ref, 2, "<mark>", "</mark>", "...", 30
+                    ).label("snippet"),
                 )
+                .select_from(Entry)
+                .join(entries_fts, entries_fts.c.entry_id == Entry.id)
+                .where(fts_ref.op("MATCH")(query.text))
+            )
+        else:
+            rank = None
+            stmt = select(
+                Entry.id,
+                Entry.date,
+                Entry.word_count,
+                literal_column("0").label("rank"),
+                literal_column("''").label("snippet"),
+            )
 
-                entry_ids = [r['entry_id'] for r in fts_results]
+        conditions = self._conditions(query)
+        keys = self._sort_keys(query, rank)
+        if after is not None:
+            conditions.append(self._keyset_after(keys, after))
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
 
-                if not entry_ids:
-                    # No FTS matches
-                    return []
+        if ordered:
+            stmt = stmt.order_by(
+                *(expr.asc() if asc else expr.desc() for _, expr, asc in keys)
+            )
 
-            except Exception:
-                # FTS index might not exist
-                fts_results = None
-                entry_ids = None
+        return stmt
 
-        # Build SQL query
-        stmt = select(Entry).options(
-            joinedload(Entry.people),
-            joinedload(Entry.tags),
-            joinedload(Entry.events),
-            joinedload(Entry.cities),
-        )
+    def _conditions(self, query: SearchQuery) -> List[Any]:
+        """
+        Build WHERE conditions for metadata and relationship filters.
 
-        # Apply FTS filter if applicable
-        if entry_ids is not None:
-            stmt = stmt.where(Entry.id.in_(entry_ids))
+        Relationship filters are EXISTS subqueries over the association
+        tables, so an entry matching several filter values appears once.
 
-        # Apply metadata filters
-        conditions = []
+        Args:
+            query: SearchQuery object
+
+        Returns:
+            List of SQL conditions
+        """
+        conditions: List[Any] = []
 
         # Date filters
         if query.date_from:
@@ -308,78 +527,111 @@ class SearchEngine:
         if query.max_reading_time:
             conditions.append(Entry.reading_time <= query.max_reading_time)
 
-        # Apply basic conditions
-        if conditions:
-            stmt = stmt.where(and_(*conditions))
-
-        # Relationship filters (require joins)
+        # Relationship filters
         if query.people:
-            stmt = stmt.join(Entry.people)
-            stmt = stmt.where(Person.name.in_(query.people))
+            conditions.append(Entry.people.any(Person.name.in_(query.people)))
 
         if query.tags:
-            stmt = stmt.join(Entry.tags)
-            stmt = stmt.where(Tag.name.in_(query.tags))
+            conditions.append(Entry.tags.any(Tag.name.in_(query.tags)))
 
         if query.events:
-            stmt = stmt.join(Entry.events)
-            stmt = stmt.where(Event.name.in_(query.events))
+            conditions.append(Entry.events.any(Event.name.in_(query.events)))
 
         if query.cities:
-            stmt = stmt.join(Entry.cities)
-            stmt = stmt.where(City.name.in_(query.cities))
+            conditions.append(Entry.cities.any(City.name.in_(query.cities)))
 
         if query.themes:
-            # Themes are M2M with entries
-            stmt = stmt.join(Entry.themes)
-            stmt = stmt.where(Theme.name.in_(query.themes))
-
-        # Execute query
-        entries = self.session.execute(stmt).unique().scalars().all()
-
-        # Combine with FTS results
-        if fts_results:
-            # Create score map
-            score_map = {r['entry_id']: r for r in fts_results}
-
-            results = []
-            for entry in entries:
-                fts_data = score_map.get(entry.id, {})
-                results.append({
-                    'entry': entry,
-                    'score': abs(fts_data.get('rank', 0)),  # BM25 returns negative scores
-                    'snippet': fts_data.get('snippet', ''),
-                })
-
-            # Sort by relevance
-            if query.sort_by == 'relevance':
-                results.sort(key=lambda x: x['score'], reverse=(query.sort_order == 'desc'))
-
-        else:
-            # No FTS, just metadata filters
-            results = [
-                {
-                    'entry': entry,
-                    'score': 0,
-                    'snippet': '',
-                }
-                for entry in entries
-            ]
-
-        # Apply sorting (if not relevance)
-        if query.sort_by == 'date':
-            results.sort(
-                key=lambda x: x['entry'].date,
-                reverse=(query.sort_order == 'desc')
+            # Themes link to entries through ThemeInstance
+            conditions.append(
+                Entry.theme_instances.any(
+                    ThemeInstance.theme.has(Theme.name.in_(query.themes))
+                )
             )
-        elif query.sort_by == 'word_count':
-            results.sort(
-                key=lambda x: x['entry'].word_count,
-                reverse=(query.sort_order == 'desc')
+
+        return conditions
+
+    def _sort_keys(self, query: SearchQuery, rank: Optional[Any]) -> List[SortKey]:
+        """
+        Build the ordering keys; (date, id) break ties deterministically.
+
+        BM25 scores are negative (lower is better), so descending
+        relevance is ascending rank.
+
+        Args:
+            query: SearchQuery object
+            rank: bm25() expression, or None without text search
+
+        Returns:
+            List of (row attribute, expression, ascending) triples
+        """
+        desc = query.sort_order == "desc"
+
+        keys: List[SortKey] = []
+        if query.sort_by == "word_count":
+            keys.append(("word_count", Entry.word_count, not desc))
+        elif query.sort_by == "relevance" and rank is not None:
+            keys.append(("rank", rank, desc))
+
+        keys.append(("date", Entry.date, not desc))
+        keys.append(("id", Entry.id, not desc))
+        return keys
+
+    def _keyset_after(self, keys: List[SortKey], row: Row) -> Any:
+        """
+        Build the condition selecting rows that sort strictly after ``row``.
+
+        Expands the lexicographic comparison so each key can have its own
+        direction: k1 > v1 OR (k1 = v1 AND (k2 > v2 OR (...))).
+
+        Args:
+            keys: Ordering keys from ``_sort_keys``
+            row: Last row of the previous page
+
+        Returns:
+            SQL condition
+        """
+        condition = None
+        for name, expr, asc in reversed(keys):
+            value = getattr(row, name)
+            beyond = expr > value if asc else expr < value
+            condition = (
+                beyond if condition is None
+                else or_(beyond, and_(expr == value, condition))
             )
+        return condition
 
-        # Apply pagination
-        start = query.offset
-        end = start + query.limit
+    def _hydrate(self, rows: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Load Entry objects (with relationships) for one page of rows.
 
-        return results[start:end]
+        Args:
+            rows: (id, date, rank, snippet) rows in result order
+
+        Returns:
+            List of result dicts in the same order as ``rows``
+        """
+        if not rows:
+            return []
+
+        ids = [row.id for row in rows]
+        entries = self.session.execute(
+            select(Entry)
+            .where(Entry.id.in_(ids))
+            .options(
+                selectinload(Entry.people),
+                selectinload(Entry.tags),
+                selectinload(Entry.events),
+                selectinload(Entry.cities),
+            )
+        ).scalars().all()
+        by_id = {entry.id: entry for entry in entries}
+
+        return [
+            {
+                'entry': by_id[row.id],
+                'score': abs(row.rank or 0),  # BM25 returns negative scores
+                'snippet': row.snippet or '',
+            }
+            for row in rows
+            if row.id in by_id
+        ]
@@ -10,6 +10,15 @@ Features:
 - Porter stemming for word variations
 - Unicode support for international text
 - Snippet generation with highlighting
+- Incremental reindexing driven by per-entry body hashes
+
+Incremental Indexing:
+    The ``entries_fts_state`` companion table records, for each indexed
+    entry, the ``Entry.file_hash`` seen at index time and a SHA-256 hash
+    of the indexed body. ``update_index`` only re-reads MD files for
+    entries whose ``file_hash`` moved (or that were never indexed, e.g.
+    rows inserted by the ``entries_ai`` trigger with an empty body), and
+    only rewrites FTS rows whose body text actually changed.
 
 Usage:
     # Initialize index (one-time setup)
@@ -20,11 +29,17 @@ Usage:
     # Update index for specific entry
     manager.update_entry_body(entry_id, body_text)
 
+    # Reindex only entries whose MD file changed
+    manager.update_index(session)
+    session.commit()
+
     # Rebuild entire index
     manager.rebuild_index(session)
 """
 # --- Standard library imports ---
-from typing import Optional, List, Dict, Any
+import hashlib
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Iterable
 
 # --- Third party imports ---
 from sqlalchemy import text, Engine
@@ -35,9 +50,41 @@ from dev.core.logging_manager import PalimpsestLogger, safe_logger
 from dev.core.paths import JOURNAL_DIR
 
 
+def extract_body(content: str) -> str:
+    """
+    Extract the indexable body from markdown content.
+
+    Args:
+        content: Full markdown file content
+
+    Returns:
+        Body text with the YAML frontmatter removed
+    """
+    if content.startswith('---'):
+        parts = content.split('---', 2)
+        if len(parts) >= 3:
+            return parts[2].strip()
+    return content
+
+
+def body_hash(body_text: str) -> str:
+    """
+    Compute SHA-256 hash of indexed body text.
+
+    Args:
+        body_text: Body text as stored in the FTS index
+
+    Returns:
+        Hex-encoded hash string
+    """
+    return hashlib.sha256(body_text.encode('utf-8')).hexdigest()
+
+
 class SearchIndexManager:
     """Manages FTS5 full-text search index."""
 
+    STATE_TABLE = "entries_fts_state"
+
     def __init__(self, engine: Engine, logger: Optional[PalimpsestLogger] = None):
         self.engine = engine
         self.logger = logger
@@ -55,8 +102,9 @@ class SearchIndexManager:
         Uses Porter stemming and Unicode tokenization.
         """
         with self.engine.connect() as conn:
-            # Drop existing table if present
+            # Drop existing table (and its index state) if present
             conn.execute(text("DROP TABLE IF EXISTS entries_fts"))
+            conn.execute(text(f"DROP TABLE IF EXISTS {self.STATE_TABLE}"))
 
             # Create FTS5 virtual table
             conn.execute(text("""
@@ -68,6 +116,7 @@ class SearchIndexManager:
                     tokenize='porter unicode61'
                 )
             """))
+            conn.execute(text(self._state_table_ddl()))
 
             conn.commit()
 
@@ -91,27 +140,10 @@ class SearchIndexManager:
         indexed_count = 0
 
         with self.engine.connect() as conn:
+            conn.execute(text(self._state_table_ddl()))
+
             for entry in entries:
-                # Read body text from file
-                body_text = ""
-                if entry.file_path:
-                    try:
-                        file_path = JOURNAL_DIR / entry.file_path
-                        if file_path.exists():
-                            # Read markdown content
-                            content = file_path.read_text(encoding='utf-8')
-
-                            # Extract body (skip YAML frontmatter)
-                            if content.startswith('---'):
-                                parts = content.split('---', 2)
-                                if len(parts) >= 3:
-                                    body_text = parts[2].strip()
-                                else:
-                                    body_text = content
-                            else:
-                                body_text = content
-                    except Exception as e:
-                        safe_logger(self.logger).log_warning(f"Could not read {entry.file_path}: {e}")
+                body_text = self._read_body(entry.file_path) or ""
 
                 # Insert into FTS index
                 conn.execute(
@@ -126,6 +158,7 @@ class SearchIndexManager:
                         'summary': entry.summary or '',
                     }
                 )
+                self._write_state(conn, entry.id, entry.file_hash, body_text)
 
                 indexed_count += 1
 
@@ -135,6 +168,165 @@ class SearchIndexManager:
 
         return indexed_count
 
+    def update_index(
+        self,
+        session: Session,
+        entry_ids: Optional[Iterable[int]] = None,
+        verify: bool = False,
+    ) -> int:
+        """
+        Incrementally bring the FTS index up to date.
+
+        Only entries that were never indexed, or whose ``file_hash``
+        differs from the one recorded at index time, have their MD file
+        re-read. Their FTS row is rewritten only if the body hash changed.
+        State rows of deleted entries are dropped.
+
+        Runs on the session's connection so it can share a transaction
+        with pending entry writes; the caller is responsible for commit.
+
+        Args:
+            session: Database session
+            entry_ids: Restrict the check to these entries (default: all)
+            verify: Re-read every candidate MD file even if its
+                ``file_hash`` is unchanged (catches edits made outside
+                the import pipeline)
+
+        Returns:
+            Number of entries whose FTS body was rewritten
+        """
+        if not self.index_exists(session):
+            return 0
+
+        session.flush()
+        session.execute(text(self._state_table_ddl()))
+
+        sql = f"""
+            SELECT e.id, e.date, e.file_path, e.file_hash, e.summary,
+                   s.body_hash
+            FROM entries e
+            LEFT JOIN {self.STATE_TABLE} s ON s.entry_id = e.id
+        """
+        conditions = []
+        params: Dict[str, Any] = {}
+        if not verify:
+            conditions.append(
+                "(s.entry_id IS NULL OR s.file_hash IS NOT e.file_hash)"
+            )
+        if entry_ids is not None:
+            ids = [int(i) for i in entry_ids]
+            if not ids:
+                return 0
+            placeholders = ", ".join(f":id{i}" for i in range(len(ids)))
+            conditions.append(f"e.id IN ({placeholders})")
+            params.update({f"id{i}": v for i, v in enumerate(ids)})
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+
+        candidates = session.execute(text(sql), params).fetchall()
+
+        reindexed = 0
+        for entry_id, entry_date, file_path, file_hash, summary, old_hash in candidates:
+            body_text = self._read_body(file_path)
+            if body_text is None:
+                continue
+
+            if body_hash(body_text) != old_hash:
+                self._write_fts_row(session, entry_id, entry_date, body_text, summary)
+                reindexed += 1
+            self._write_state(session, entry_id, file_hash, body_text)
+
+        if entry_ids is None:
+            session.execute(text(f"""
+                DELETE FROM {self.STATE_TABLE}
+                WHERE entry_id NOT IN (SELECT id FROM entries)
+            """))
+
+        safe_logger(self.logger).log_debug(
+            f"Search index update: {len(candidates)} checked, {reindexed} reindexed"
+        )
+        return reindexed
+
+    def _state_table_ddl(self) -> str:
+        """DDL for the per-entry index state table."""
+        return f"""
+            CREATE TABLE IF NOT EXISTS {self.STATE_TABLE} (
+                entry_id INTEGER PRIMARY KEY,
+                file_hash TEXT,
+                body_hash TEXT NOT NULL
+            )
+        """
+
+    def _read_body(self, file_path: Optional[str]) -> Optional[str]:
+        """
+        Read the indexable body of an entry's MD file.
+
+        Args:
+            file_path: Entry file path, relative to JOURNAL_DIR
+
+        Returns:
+            Body text, or None if the file is missing or unreadable
+        """
+        if not file_path:
+            return None
+        try:
+            path = JOURNAL_DIR / Path(file_path)
+            if not path.exists():
+                return None
+            return extract_body(path.read_text(encoding='utf-8'))
+        except Exception as e:
+            safe_logger(self.logger).log_warning(f"Could not read {file_path}: {e}")
+            return None
+
+    def _write_fts_row(
+        self,
+        executor: Any,
+        entry_id: int,
+        entry_date: Any,
+        body_text: str,
+        summary: Optional[str],
+    ) -> None:
+        """Replace the FTS row for an entry (insert if missing)."""
+        executor.execute(
+            text("DELETE FROM entries_fts WHERE entry_id = :entry_id"),
+            {'entry_id': entry_id},
+        )
+        executor.execute(
+            text("""
+                INSERT INTO entries_fts (entry_id, date, body, summary)
+                VALUES (:entry_id, :date, :body, :summary)
+            """),
+            {
+                'entry_id': entry_id,
+                'date': str(entry_date),
+                'body': body_text,
+                'summary': summary or '',
+            }
+        )
+
+    def _write_state(
+        self,
+        executor: Any,
+        entry_id: int,
+        file_hash: Optional[str],
+        body_text: str,
+    ) -> None:
+        """Record the file hash and body hash an entry was indexed with."""
+        executor.execute(
+            text(f"""
+                INSERT INTO {self.STATE_TABLE} (entry_id, file_hash, body_hash)
+                VALUES (:entry_id, :file_hash, :body_hash)
+                ON CONFLICT(entry_id) DO UPDATE SET
+                    file_hash = excluded.file_hash,
+                    body_hash = excluded.body_hash
+            """),
+            {
+                'entry_id': entry_id,
+                'file_hash': file_hash,
+                'body_hash': body_hash(body_text),
+            }
+        )
+
     def setup_triggers(self) -> None:
         """
         Set up database triggers to keep FTS index in sync.
@@ -290,12 +482,22 @@ class SearchIndexManager:
 
             return results
 
-    def index_exists(self) -> bool:
-        """Check if FTS index exists."""
+    def index_exists(self, session: Optional[Session] = None) -> bool:
+        """
+        Check if FTS index exists.
+
+        Args:
+            session: Check on this session's connection instead of opening
+                a new one (avoids lock contention inside a write transaction)
+        """
+        sql = text("""
+            SELECT name FROM sqlite_master
+            WHERE type='table' AND name='entries_fts'
+        """)
+        if session is not None:
+            return session.execute(sql).fetchone() is not None
+
         with self.engine.connect() as conn:
-            result = conn.execute(text("""
-                SELECT name FROM sqlite_master
-                WHERE type='table' AND name='entries_fts'
-            """))
+            result = conn.execute(sql)
 
             return result.fetchone() is not None
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+file_state.py
+-------------------
+Persistent stat-signature cache for file content hashes.
+
+Maps each file path to its last seen stat signature (mtime_ns, size,
+inode) and the content digests computed for it. While the signature is
+unchanged, a digest can be returned without reading the file, so a
+no-op ``plm sync`` only has to ``stat()`` every entry instead of reading
+and hashing it.
+
+Safety:
+    - The file is stat-ed *before* it is read, so an edit racing the
+      read leaves a stale signature behind and is rehashed next time
+    - Files modified within the last RACY_WINDOW_NS are not cached,
+      since a same-size edit inside one mtime tick would be invisible
+    - A missing, corrupt, or older-version cache file is treated as
+      empty; writes are atomic (temp file + rename)
+
+Usage:
+    from dev.utils.file_state import FileStateCache
+
+    cache = FileStateCache(FILE_STATE_PATH)
+    digest = cache.get_hash(md_path)   # reads only if stat changed
+    cache.save()
+"""
+# --- Annotations ---
+from __future__ import annotations
+
+# --- Standard library imports ---
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+# Bump when the on-disk layout changes; older caches are discarded
+CACHE_VERSION = 1
+
+# Files younger than this are hashed but not cached (racy mtime window)
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def stat_signature(stat_result: os.stat_result) -> List[int]:
+    """
+    Build the change signature of a stat result.
+
+    Args:
+        stat_result: Result of ``os.stat()``
+
+    Returns:
+        [mtime_ns, size, inode]
+    """
+    return [stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino]
+
+
+class FileStateCache:
+    """
+    Cache of file content digests keyed by path and stat signature.
+
+    Attributes:
+        path: JSON file backing the cache (None keeps it in memory only)
+        hits: Digests served without reading the file
+        misses: Digests that required reading the file
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Initialize the cache, loading any existing state.
+
+        Args:
+            path: JSON file backing the cache (None = in-memory only)
+        """
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load(self) -> None:
+        """Load the cache from disk, discarding it if unreadable or stale."""
+        self._entries = {}
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return
+        files = data.get("files")
+        if isinstance(files, dict):
+            self._entries = files
+
+    def save(self) -> None:
+        """Atomically write the cache to disk if it changed."""
+        if self.path is None or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        tmp_path.write_text(
+            json.dumps({"version": CACHE_VERSION, "files": self._entries}),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def lookup(self, file_path: Path, algorithm: str = "sha256") -> Optional[str]:
+        """
+        Return the cached digest if the file's stat signature is unchanged.
+
+        Args:
+            file_path: File to look up
+            algorithm: hashlib algorithm name
+
+        Returns:
+            Cached hex digest, or None if unknown, changed, or missing
+        """
+        entry = self._entries.get(str(file_path))
+        if entry is None:
+            return None
+        try:
+            signature = stat_signature(os.stat(file_path))
+        except OSError:
+            return None
+        if entry.get("sig") != signature:
+            return None
+        return entry.get("hashes", {}).get(algorithm)
+
+    def record(
+        self,
+        file_path: Path,
+        digest: str,
+        stat_result: os.stat_result,
+        algorithm: str = "sha256",
+    ) -> None:
+        """
+        Store a digest computed from a read that followed ``stat_result``.
+
+        Args:
+            file_path: File the digest belongs to
+            digest: Hex digest of the file contents
+            stat_result: ``os.stat()`` taken before the file was read
+            algorithm: hashlib algorithm name
+        """
+        key = str(file_path)
+        if time.time_ns() - stat_result.st_mtime_ns < RACY_WINDOW_NS:
+            # Too fresh to trust; drop any older entry instead
+            if self._entries.pop(key, None) is not None:
+                self._dirty = True
+            return
+
+        signature = stat_signature(stat_result)
+        entry = self._entries.get(key)
+        if entry is None or entry.get("sig") != signature:
+            entry = {"sig": signature, "hashes": {}}
+            self._entries[key] = entry
+        if entry["hashes"].get(algorithm) != digest:
+            entry["hashes"][algorithm] = digest
+            self._dirty = True
+
+    def get_hash(self, file_path: Path, algorithm: str = "sha256") -> str:
+        """
+        Return the file's digest, reading it only if its stat changed.
+
+        Args:
+            file_path: File to hash
+            algorithm: hashlib algorithm name
+
+        Returns:
+            Hex digest of the file contents
+
+        Raises:
+            OSError: If the file cannot be stat-ed or read
+        """
+        cached = self.lookup(file_path, algorithm)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        stat_result = os.stat(file_path)
+        digest = hashlib.new(algorithm, Path(file_path).read_bytes()).hexdigest()
+        self.record(file_path, digest, stat_result, algorithm)
+        return digest
+
+    def invalidate(self, file_path: Optional[Path] = None) -> None:
+        """
+        Forget one file, or every file when ``file_path`` is None.
+
+        Args:
+            file_path: File to forget (None clears the whole cache)
+        """
+        if file_path is None:
+            if self._entries:
+                self._entries = {}
+                self._dirty = True
+        elif self._entries.pop(str(file_path), None) is not None:
+            self._dirty = True
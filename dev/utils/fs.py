@@ -33,7 +33,10 @@ from __future__ import annotations
 import hashlib
 from pathlib import Path
 from datetime import date
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
+
+if TYPE_CHECKING:
+    from dev.utils.file_state import FileStateCache
 
 
 def find_markdown_files(directory: Path, pattern: str = "**/*.md") -> List[Path]:
@@ -53,7 +56,9 @@ def should_skip_file(
     return current_hash == existing_hash
 
 
-def get_file_hash(file_path: str | Path) -> str:
+def get_file_hash(
+    file_path: str | Path, cache: Optional[FileStateCache] = None
+) -> str:
     """
     Compute MD5 hash of a file for change detection.
 
@@ -61,6 +66,8 @@ def get_file_hash(file_path: str | Path) -> str:
 
     Args:
         file_path (str | Path): Path to the file.
+        cache (FileStateCache, optional): Stat-signature cache; the file
+            is only read if its mtime/size/inode changed.
 
     Returns:
         str: Hexadecimal MD5 hash of the file contents.
@@ -72,6 +79,9 @@ def get_file_hash(file_path: str | Path) -> str:
     if not path.is_file():
         raise FileNotFoundError(f"File not found or not a regular file: {path}")
 
+    if cache is not None:
+        return cache.get_hash(path, "md5")
+
     file_bytes = path.read_bytes()
     return hashlib.md5(file_bytes).hexdigest()
 
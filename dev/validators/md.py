@@ -42,6 +42,7 @@ from dev.core.logging_manager import PalimpsestLogger, safe_logger
 from dev.validators.schema import SchemaValidator
 from dev.validators.frontmatter import FrontmatterValidator
 from dev.validators.diagnostic import Diagnostic, ValidationReport
+from dev.validators.scanner import scan_markdown
 
 
 # Map diagnostic code prefixes to frontmatter field names for line lookup
@@ -328,7 +329,7 @@ class MarkdownValidator:
         placeholders = ["TODO", "FIXME", "XXX", "PLACEHOLDER"]
         for placeholder in placeholders:
             if placeholder in body:
-                line_no = body[:body.index(placeholder)].count('\n') + frontmatter_lines + 3
+                line_no = body.count('\n', 0, body.index(placeholder)) + frontmatter_lines + 3
                 diagnostics.append(Diagnostic(
                     file=str(file_path),
                     line=line_no, col=0, end_line=line_no, end_col=0,
@@ -361,19 +362,22 @@ class MarkdownValidator:
         """
         Validate internal markdown links between files.
 
+        Links come from the shared line scanner, which reports each
+        link's line directly.
+
         Returns:
             List of BROKEN_LINK diagnostics
         """
         diagnostics: List[Diagnostic] = []
 
-        # Pattern for markdown links: [text](path)
-        link_pattern = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
-
         for md_file in self.md_dir.glob("**/*.md"):
             try:
                 content = md_file.read_text(encoding="utf-8")
-                for match in link_pattern.finditer(content):
-                    link_text, link_path = match.groups()
+                for link in scan_markdown(content).links:
+                    if link.kind != "link":
+                        continue
+                    link_text, link_path = link.text, link.target
+                    line_no = link.line
 
                     # Skip external links
                     if link_path.startswith(('http://', 'https://', 'mailto:')):
@@ -383,7 +387,6 @@ class MarkdownValidator:
                     try:
                         target_path = (md_file.parent / link_path).resolve()
                         if not target_path.exists():
-                            line_no = content[:match.start()].count('\n') + 1
                             diagnostics.append(Diagnostic(
                                 file=str(md_file),
                                 line=line_no, col=0, end_line=line_no, end_col=0,
@@ -391,7 +394,6 @@ class MarkdownValidator:
                                 message=f"Broken link: [{link_text}]({link_path})",
                             ))
                     except (ValueError, OSError) as e:
-                        line_no = content[:match.start()].count('\n') + 1
                         diagnostics.append(Diagnostic(
                             file=str(md_file),
                             line=line_no, col=0, end_line=line_no, end_col=0,
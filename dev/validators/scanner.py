@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+scanner.py
+----------
+One-pass, line-indexed tokenizer for markdown validation.
+
+Walks a document once, line by line, and records the constructs the
+validators check: ATX headings and link-like tokens. Every token
+carries its 1-based line and column, so validators never recount
+newlines to locate a match.
+
+Key Features:
+    - Headings: level and title of every ``#``..``######`` line
+    - Links: WikiLink0 (``[[target]]``, ``[[target|display]]``),
+      WikiLink1 (``[display][target]``, ``[target][]``) and inline
+      markdown links (``[text](path)``), matched by one alternation
+      so a span is claimed by exactly one token
+    - Lines without ``#`` or ``[`` are skipped without running a regex
+
+Usage:
+    from dev.validators.scanner import scan_markdown
+
+    scan = scan_markdown(content)
+    for heading in scan.headings:
+        print(heading.line, heading.level, heading.title)
+    for link in scan.links:
+        if link.kind == "wikilink":
+            print(link.line, link.col, link.target)
+"""
+# --- Annotations ---
+from __future__ import annotations
+
+# --- Standard library imports ---
+import re
+from dataclasses import dataclass, field
+from typing import List
+
+
+# ==================== Constants ====================
+
+HEADING_PATTERN = re.compile(r'^(#{1,6}) (.+)')
+
+# Alternatives are tried left to right at each position
+LINK_PATTERN = re.compile(
+    r'\[\[(?P<wikilink>[^\]|]+)(?:\|[^\]]+)?\]\]'
+    r'|\[(?P<ref_text>[^\]]*)\]\[(?P<ref_target>[^\]]*)\]'
+    r'|\[(?P<link_text>[^\]]+)\]\((?P<link_path>[^)]+)\)'
+)
+
+
+# ==================== Tokens ====================
+
+@dataclass
+class Heading:
+    """
+    An ATX heading line.
+
+    Attributes:
+        line: 1-based line number
+        level: Number of leading ``#`` (1-6)
+        title: Heading text after the marker
+    """
+
+    line: int
+    level: int
+    title: str
+
+
+@dataclass
+class Link:
+    """
+    A link-like token on one line.
+
+    Attributes:
+        kind: "wikilink" (``[[target|display]]``), "wikilink1"
+            (``[text][target]``) or "link" (``[text](path)``)
+        line: 1-based line number
+        col: 1-based start column
+        end_col: 1-based column just past the token
+        target: Raw link target (wikilink target, reference target
+            or link path; empty for ``[target][]``)
+        text: Raw display text (empty for WikiLink0)
+    """
+
+    kind: str
+    line: int
+    col: int
+    end_col: int
+    target: str
+    text: str = ""
+
+
+@dataclass
+class MarkdownScan:
+    """
+    Tokens found in one document.
+
+    Attributes:
+        lines: Document split on newlines
+        headings: Headings in document order
+        links: Link tokens in document order
+    """
+
+    lines: List[str]
+    headings: List[Heading] = field(default_factory=list)
+    links: List[Link] = field(default_factory=list)
+
+    @property
+    def has_title(self) -> bool:
+        """Whether the document has an H1 heading."""
+        return any(heading.level == 1 for heading in self.headings)
+
+
+# ==================== Scanner ====================
+
+def scan_markdown(content: str) -> MarkdownScan:
+    """
+    Tokenize a markdown document in a single pass over its lines.
+
+    Args:
+        content: Document text
+
+    Returns:
+        MarkdownScan with the document's lines, headings and links
+    """
+    scan = MarkdownScan(lines=content.split("\n"))
+
+    for line_num, line in enumerate(scan.lines, start=1):
+        if line.startswith("#"):
+            match = HEADING_PATTERN.match(line)
+            if match:
+                scan.headings.append(
+                    Heading(line_num, len(match.group(1)), match.group(2))
+                )
+
+        if "[" not in line:
+            continue
+        for match in LINK_PATTERN.finditer(line):
+            col, end_col = match.start() + 1, match.end() + 1
+            if match.group("wikilink") is not None:
+                link = Link(
+                    "wikilink", line_num, col, end_col, match.group("wikilink")
+                )
+            elif match.group("ref_target") is not None:
+                link = Link(
+                    "wikilink1", line_num, col, end_col,
+                    match.group("ref_target"), match.group("ref_text"),
+                )
+            else:
+                link = Link(
+                    "link", line_num, col, end_col,
+                    match.group("link_path"), match.group("link_text"),
+                )
+            scan.links.append(link)
+
+    return scan
@@ -13,12 +13,17 @@ Key Features:
     - Filename generation using slugify utilities
     - Tier-based visibility filtering (tags with 1 entry get no page)
     - Overflow page configuration for high-frequency entities
+    - Dependency paths: the relationships each page's context reads,
+      so incremental generation knows which pages a changed row affects
+    - Loader plans: the same paths as ``selectinload`` chains, so an
+      entity type's pages are built from a bounded number of queries
 
 Usage:
     from dev.wiki.configs import JOURNAL_CONFIGS, INDEX_CONFIGS
 
     for config in JOURNAL_CONFIGS:
-        entities = session.query(config.model).all()
+        query = session.query(config.model).options(*config.load_options())
+        entities = query.all()
         for entity in entities:
             if config.should_generate(entity):
                 ctx = config.build_context(builder, entity)
@@ -29,7 +34,12 @@ from __future__ import annotations
 
 # --- Standard library imports ---
 from dataclasses import dataclass
-from typing import Any, Callable, List, Optional, Type
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+# --- Third-party imports ---
+from sqlalchemy import inspect
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.strategy_options import Load
 
 # --- Local imports ---
 from dev.database.models import (
@@ -63,6 +73,9 @@ class EntityConfig:
         filename_fn: Function to generate filename from entity
         context_method: Name of WikiContextBuilder method to call
         should_generate_fn: Optional filter (returns False to skip entity)
+        depends_on: Dotted relationship paths the context method reads
+            (e.g. ``"entries.people"``); every row along them is a
+            dependency of the entity's pages
     """
 
     name: str
@@ -72,6 +85,7 @@ class EntityConfig:
     filename_fn: Callable[[Any], str]
     context_method: str
     should_generate_fn: Optional[Callable[[Any], bool]] = None
+    depends_on: Tuple[str, ...] = ()
 
     def should_generate(self, entity: Any) -> bool:
         """
@@ -87,6 +101,15 @@ class EntityConfig:
             return self.should_generate_fn(entity)
         return True
 
+    def load_options(self) -> List[Load]:
+        """
+        Build the eager-loading plan for this entity type's query.
+
+        Returns:
+            ``selectinload`` options covering ``depends_on``
+        """
+        return loader_options(self.model, self.depends_on)
+
 
 @dataclass
 class IndexConfig:
@@ -98,12 +121,52 @@ class IndexConfig:
         template: Template path relative to templates root
         output_path: Output file path relative to wiki root
         context_method: Name of WikiExporter method that builds context
+        tables: Tables the context reads; an incremental run keeps the
+            page unless one of them changed (empty = always regenerate)
     """
 
     name: str
     template: str
     output_path: str
     context_method: str
+    tables: Tuple[str, ...] = ()
+
+
+# ==================== Loader Plans ====================
+
+def loader_options(model: Type[Any], paths: Tuple[str, ...]) -> List[Load]:
+    """
+    Turn dotted relationship paths into ``selectinload`` chains.
+
+    Each relationship level costs one ``SELECT ... WHERE id IN (...)``
+    for the whole batch of parents, instead of one lazy load per
+    parent. A path stops at the first segment that is a plain Python
+    property (e.g. ``Chapter.characters``), whose underlying
+    relationships are listed as paths of their own.
+
+    Args:
+        model: Root model class
+        paths: Dotted relationship paths (e.g. ``"scenes.events"``)
+
+    Returns:
+        Loader options for ``Query.options()``
+    """
+    options: List[Load] = []
+    for path in paths:
+        cls, option = model, None
+        for attr in path.split("."):
+            relationship = inspect(cls).relationships.get(attr)
+            if relationship is None:
+                break
+            target = getattr(cls, attr)
+            option = (
+                selectinload(target) if option is None
+                else option.selectinload(target)
+            )
+            cls = relationship.mapper.class_
+        if option is not None:
+            options.append(option)
+    return options
 
 
 # ==================== Filename Generators ====================
@@ -160,6 +223,25 @@ def _part_filename(part: Any) -> str:
 
 # ==================== Configurations ====================
 
+# Relationship paths read by WikiContextBuilder.build_entry_context
+# (entries have no EntityConfig; see WikiExporter._generate_journal_entries)
+ENTRY_DEPENDS_ON: Tuple[str, ...] = (
+    "people",
+    "locations.city",
+    "cities",
+    "scenes.dates",
+    "events.entries",
+    "events.scenes",
+    "arcs.entries",
+    "threads.people",
+    "threads.locations.city",
+    "theme_instances.theme.instances",
+    "tags",
+    "references.source",
+    "poems.poem.versions.entry",
+    "motif_instances.motif",
+)
+
 JOURNAL_CONFIGS: List[EntityConfig] = [
     EntityConfig(
         name="people",
@@ -168,6 +250,16 @@ JOURNAL_CONFIGS: List[EntityConfig] = [
         output_subdir="journal/people",
         filename_fn=_person_filename,
         context_method="build_person_context",
+        depends_on=(
+            "aliases",
+            "character_mappings.character",
+            "entries.people",
+            "scenes.events.entries",
+            "scenes.events.scenes",
+            "scenes.locations.city",
+            "threads.people",
+            "threads.locations.city",
+        ),
     ),
     EntityConfig(
         name="locations",
@@ -176,6 +268,16 @@ JOURNAL_CONFIGS: List[EntityConfig] = [
         output_subdir="journal/locations",
         filename_fn=_location_filename,
         context_method="build_location_context",
+        depends_on=(
+            "city",
+            "entries",
+            "scenes.entry",
+            "scenes.people",
+            "scenes.events.entries",
+            "scenes.events.scenes",
+            "threads.people",
+            "threads.locations.city",
+        ),
     ),
     EntityConfig(
         name="cities",
@@ -184,6 +286,11 @@ JOURNAL_CONFIGS: List[EntityConfig] = [
         output_subdir="journal/cities",
         filename_fn=_city_filename,
         context_method="build_city_context",
+        depends_on=(
+            "entries",
+            "locations.entries",
+            "locations.scenes.people",
+        ),
     ),
     EntityConfig(
         name="events",
@@ -192,6 +299,13 @@ JOURNAL_CONFIGS: List[EntityConfig] = [
         output_subdir="journal/events",
         filename_fn=_named_entity_filename,
         context_method="build_event_context",
+        depends_on=(
+            "entries.arcs.entries",
+            "scenes.dates",
+            "scenes.entry",
+            "scenes.people",
+            "scenes.locations.city",
+        ),
     ),
     EntityConfig(
         name="arcs",
@@ -200,6 +314,11 @@ JOURNAL_CONFIGS: List[EntityConfig] = [
         output_subdir="journal/arcs",
         filename_fn=_named_entity_filename,
         context_method="build_arc_context",
+        depends_on=(
+            "entries.people",
+            "entries.events.entries",
+            "entries.events.scenes",
+        ),
     ),
     EntityConfig(
         name="tags",
@@ -208,6 +327,11 @@ JOURNAL_CONFIGS: List[EntityConfig] = [
         output_subdir="journal/tags",
         filename_fn=_named_entity_filename,
         context_method="build_tag_context",
+        depends_on=(
+            "entries.people",
+            "entries.tags",
+            "entries.theme_instances.theme",
+        ),
     ),
     EntityConfig(
         name="themes",
@@ -217,6 +341,11 @@ JOURNAL_CONFIGS: List[EntityConfig] = [
         filename_fn=_named_entity_filename,
         context_method="build_theme_context",
         should_generate_fn=lambda t: t.usage_count > 1,
+        depends_on=(
+            "instances.entry.people",
+            "instances.entry.tags",
+            "instances.entry.theme_instances.theme",
+        ),
     ),
     EntityConfig(
         name="poems",
@@ -225,6 +354,10 @@ JOURNAL_CONFIGS: List[EntityConfig] = [
         output_subdir="journal/poems",
         filename_fn=_poem_filename,
         context_method="build_poem_context",
+        depends_on=(
+            "versions.entry",
+            "chapters",
+        ),
     ),
     EntityConfig(
         name="reference_sources",
@@ -233,6 +366,9 @@ JOURNAL_CONFIGS: List[EntityConfig] = [
         output_subdir="journal/references",
         filename_fn=_reference_source_filename,
         context_method="build_reference_source_context",
+        depends_on=(
+            "references.entry",
+        ),
     ),
     EntityConfig(
         name="motifs",
@@ -241,6 +377,9 @@ JOURNAL_CONFIGS: List[EntityConfig] = [
         output_subdir="journal/motifs",
         filename_fn=_named_entity_filename,
         context_method="build_motif_context",
+        depends_on=(
+            "instances.entry",
+        ),
     ),
 ]
 
@@ -253,6 +392,15 @@ MANUSCRIPT_CONFIGS: List[EntityConfig] = [
         output_subdir="manuscript/chapters",
         filename_fn=_chapter_filename,
         context_method="build_chapter_context",
+        depends_on=(
+            "part",
+            "poems",
+            "references.source",
+            "scenes.characters",
+            "scenes.sources.entry",
+            "scenes.sources.scene.entry",
+            "scenes.sources.thread.entry",
+        ),
     ),
     EntityConfig(
         name="characters",
@@ -261,6 +409,10 @@ MANUSCRIPT_CONFIGS: List[EntityConfig] = [
         output_subdir="manuscript/characters",
         filename_fn=_character_filename,
         context_method="build_character_context",
+        depends_on=(
+            "person_mappings.person",
+            "scenes.chapter",
+        ),
     ),
     EntityConfig(
         name="manuscript_scenes",
@@ -269,6 +421,13 @@ MANUSCRIPT_CONFIGS: List[EntityConfig] = [
         output_subdir="manuscript/scenes",
         filename_fn=_named_entity_filename,
         context_method="build_manuscript_scene_context",
+        depends_on=(
+            "chapter",
+            "characters",
+            "sources.entry",
+            "sources.scene.entry",
+            "sources.thread.entry",
+        ),
     ),
     EntityConfig(
         name="parts",
@@ -277,6 +436,9 @@ MANUSCRIPT_CONFIGS: List[EntityConfig] = [
         output_subdir="manuscript/parts",
         filename_fn=_part_filename,
         context_method="build_part_context",
+        depends_on=(
+            "chapters.scenes",
+        ),
     ),
 ]
 
@@ -287,77 +449,118 @@ INDEX_CONFIGS: List[IndexConfig] = [
         template="indexes/main.jinja2",
         output_path="index.md",
         context_method="_build_main_index_context",
+        tables=(
+            "entries", "people", "locations", "cities", "events", "arcs",
+            "tags", "poems", "reference_sources", "motifs", "chapters",
+            "characters", "manuscript_scenes",
+        ),
     ),
     IndexConfig(
         name="people",
         template="indexes/people.jinja2",
         output_path="indexes/people-index.md",
         context_method="_build_people_index_context",
+        tables=("people", "entries"),
     ),
     IndexConfig(
         name="places",
         template="indexes/places.jinja2",
         output_path="indexes/places-index.md",
         context_method="_build_places_index_context",
+        tables=("cities", "locations", "entries"),
     ),
     IndexConfig(
         name="entries",
         template="indexes/entries.jinja2",
         output_path="indexes/entry-index.md",
         context_method="_build_entries_index_context",
+        tables=("entries",),
     ),
     IndexConfig(
         name="events",
         template="indexes/events.jinja2",
         output_path="indexes/event-index.md",
         context_method="_build_events_index_context",
+        tables=("events", "entries", "scenes"),
     ),
     IndexConfig(
         name="arcs",
         template="indexes/arcs.jinja2",
         output_path="indexes/arc-index.md",
         context_method="_build_arcs_index_context",
+        tables=("arcs", "entries"),
     ),
     IndexConfig(
         name="tags",
         template="indexes/tags.jinja2",
         output_path="indexes/tags-index.md",
         context_method="_build_tags_index_context",
+        tables=("tags", "entries"),
     ),
     IndexConfig(
         name="motifs",
         template="indexes/motifs.jinja2",
         output_path="indexes/motifs-index.md",
         context_method="_build_motifs_index_context",
+        tables=("motifs", "motif_instances", "entries"),
     ),
     IndexConfig(
         name="poems",
         template="indexes/poems.jinja2",
         output_path="indexes/poems-index.md",
         context_method="_build_poems_index_context",
+        tables=("poems", "poem_versions", "entries"),
     ),
     IndexConfig(
         name="references",
         template="indexes/references.jinja2",
         output_path="indexes/references-index.md",
         context_method="_build_references_index_context",
+        tables=("reference_sources", "references", "entries"),
     ),
     IndexConfig(
         name="manuscript",
         template="indexes/manuscript.jinja2",
         output_path="indexes/manuscript-index.md",
         context_method="_build_manuscript_index_context",
+        tables=("parts", "chapters", "manuscript_scenes", "characters"),
     ),
     IndexConfig(
         name="characters",
         template="indexes/characters.jinja2",
         output_path="indexes/characters-index.md",
         context_method="_build_characters_index_context",
+        tables=(
+            "characters", "manuscript_scenes", "chapters",
+            "person_character_map", "people",
+        ),
     ),
     IndexConfig(
         name="manuscript_scenes",
         template="indexes/manuscript-scenes.jinja2",
         output_path="indexes/manuscript-scenes-index.md",
         context_method="_build_manuscript_scenes_index_context",
+        tables=("manuscript_scenes", "chapters", "parts"),
     ),
 ]
+
+
+# Index pages listing each entity type, regenerated by single-entity runs
+# (the main index holds every type's count)
+ENTITY_INDEXES: Dict[str, Tuple[str, ...]] = {
+    "entries": ("main", "entries"),
+    "people": ("main", "people"),
+    "locations": ("main", "places"),
+    "cities": ("main", "places"),
+    "events": ("main", "events"),
+    "arcs": ("main", "arcs"),
+    "tags": ("main", "tags"),
+    "themes": (),
+    "motifs": ("main", "motifs"),
+    "poems": ("main", "poems"),
+    "reference_sources": ("main", "references"),
+    "chapters": ("main", "manuscript", "manuscript_scenes"),
+    "characters": ("main", "manuscript", "characters"),
+    "manuscript_scenes": ("main", "manuscript", "manuscript_scenes"),
+    "parts": ("manuscript",),
+}
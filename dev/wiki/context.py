@@ -11,7 +11,8 @@ timeline distributions) needed by the wiki page templates.
 
 Key Features:
     - One builder method per entity type (Entry, Person, Location, etc.)
-    - Aggregate helpers for timeline tables, co-occurrences, frequent people
+    - Aggregate helpers for timeline tables, co-occurrences, frequent people,
+      reading the precomputed counts of dev.database.aggregates
     - Tier-aware rendering (narrator/frequent/infrequent for people, etc.)
     - Narrator exclusion from frequency lists
     - All computation is batch-friendly (no lazy queries in templates)
@@ -39,12 +40,13 @@ from __future__ import annotations
 import calendar
 from collections import Counter, defaultdict
 from datetime import date
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 # --- Third-party imports ---
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 # --- Local imports ---
+from dev.database.aggregates import Aggregates
 from dev.database.models import (
     Arc,
     City,
@@ -103,6 +105,8 @@ class WikiContextBuilder:
             session: Active SQLAlchemy session with entities loaded
         """
         self.session = session
+        self.aggregates = Aggregates(session)
+        self._sources_by_entry: Optional[Dict[int, List[ManuscriptSource]]] = None
 
     # ==============================================================
     #  ENTRY
@@ -580,30 +584,12 @@ class WikiContextBuilder:
         Returns:
             List of relation groups with companion lists
         """
-        # Count co-appearances via shared entries
-        co_counts: Counter = Counter()
-        for entry in person.entries:
-            for other in entry.people:
-                if other.id != person.id:
-                    co_counts[other.id] = co_counts.get(other.id, 0) + 1
-
-        # Get top people
-        top_ids = [pid for pid, _ in co_counts.most_common(limit)]
-        top_people = [
-            p for p in self.session.query(Person).filter(
-                Person.id.in_(top_ids)
-            ).all()
-        ] if top_ids else []
-
-        # Build lookup
-        people_by_id = {p.id: p for p in top_people}
+        # Co-appearances via shared entries
+        companions = self._co_mentions(person, exclude_narrator=False)
 
         # Group by relation
         groups: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
-        for pid, count in co_counts.most_common(limit):
-            p = people_by_id.get(pid)
-            if not p:
-                continue
+        for p, count in companions[:limit]:
             rel = p.relation_type.value.capitalize() if p.relation_type else "Uncategorized"
             groups[rel].append({
                 "name": p.display_name,
@@ -633,7 +619,8 @@ class WikiContextBuilder:
         """
         Compute top locations for a person, nested by city.
 
-        Uses scene-level data (scene_people + scene_locations join).
+        Uses the precomputed scene-level counts (entries where the
+        person and the location share a scene).
 
         Args:
             person: Person entity
@@ -642,16 +629,17 @@ class WikiContextBuilder:
         Returns:
             List of city dicts with location lists and counts
         """
-        loc_entries: Dict[tuple, set] = defaultdict(set)
+        loc_counts: Counter = Counter()
         loc_hoods: Dict[tuple, Optional[str]] = {}
-        for scene in person.scenes:
-            for loc in scene.locations:
-                key = (loc.city.name, loc.name)
-                loc_entries[key].add(scene.entry_id)
-                loc_hoods[key] = loc.neighborhood
-        loc_counts: Counter = Counter(
-            {key: len(eids) for key, eids in loc_entries.items()}
-        )
+        for loc_id, count in sorted(self.aggregates.co_occurrences(
+            "people", person.id, "locations"
+        ).items()):
+            loc = self.session.get(Location, loc_id)
+            if loc is None:
+                continue
+            key = (loc.city.name, loc.name)
+            loc_counts[key] = count
+            loc_hoods[key] = loc.neighborhood
 
         # Group by city, then by neighborhood
         city_hood_locs: Dict[
@@ -806,32 +794,42 @@ class WikiContextBuilder:
         Returns:
             List of dicts with name and shared count
         """
-        co_counts: Counter = Counter()
-        for entry in person.entries:
-            for other in entry.people:
-                if (
-                    other.id != person.id
-                    and other.relation_type != RelationType.SELF
-                ):
-                    co_counts[other.id] += 1
-
-        top_ids = [pid for pid, _ in co_counts.most_common(limit)]
-        people_by_id = {
-            p.id: p
-            for p in self.session.query(Person).filter(
-                Person.id.in_(top_ids)
-            ).all()
-        } if top_ids else {}
-
         return [
             {
-                "name": people_by_id[pid].display_name,
+                "name": other.display_name,
                 "count": count,
             }
-            for pid, count in co_counts.most_common(limit)
-            if pid in people_by_id
+            for other, count in self._co_mentions(person)[:limit]
         ]
 
+    def _co_mentions(
+        self, person: Person, exclude_narrator: bool = True
+    ) -> List[Tuple[Person, int]]:
+        """
+        List people sharing entries with a person, most shared first.
+
+        Reads the precomputed co-mention counts; ties are ordered by
+        display name.
+
+        Args:
+            person: Person entity
+            exclude_narrator: Leave out the narrator (relation SELF)
+
+        Returns:
+            List of (person, shared entry count), the person excluded
+        """
+        companions = []
+        for pid, count in self.aggregates.co_occurrences(
+            "people", person.id, "people"
+        ).items():
+            other = self.session.get(Person, pid)
+            if other is None or other.id == person.id:
+                continue
+            if exclude_narrator and other.relation_type == RelationType.SELF:
+                continue
+            companions.append((other, count))
+        return sorted(companions, key=lambda c: (-c[1], c[0].display_name))
+
     def _build_character_mappings(
         self, person: Person
     ) -> List[Dict[str, Any]]:
@@ -896,8 +894,8 @@ class WikiContextBuilder:
             base["date_range"] = self._date_range_str(
                 location.first_visit, location.last_visit
             )
-            base["timeline"] = self._compute_monthly_counts(
-                location.entries
+            base["timeline"] = self.aggregates.monthly_counts(
+                "locations", location.id
             )
             loc_events: Dict[int, Event] = {}
             for scene in location.scenes:
@@ -966,33 +964,18 @@ class WikiContextBuilder:
             entry_ids. Narrator excluded.
         """
         people_entries: Dict[int, set] = defaultdict(set)
+        people_by_id: Dict[int, Person] = {}
+        entry_date_map: Dict[int, str] = {}
         for scene in location.scenes:
             for person in scene.people:
                 if person.relation_type != RelationType.SELF:
                     people_entries[person.id].add(scene.entry_id)
+                    people_by_id[person.id] = person
+                    entry_date_map[scene.entry_id] = scene.entry.date.isoformat()
         people_counts: Counter = Counter(
             {pid: len(eids) for pid, eids in people_entries.items()}
         )
 
-        top_ids = [pid for pid, _ in people_counts.most_common(limit)]
-        people_by_id = {
-            p.id: p
-            for p in self.session.query(Person).filter(
-                Person.id.in_(top_ids)
-            ).all()
-        } if top_ids else {}
-
-        # Resolve entry dates for each person
-        all_entry_ids: Set[int] = set()
-        for pid in top_ids:
-            all_entry_ids.update(people_entries[pid])
-        entry_date_map: Dict[int, str] = {}
-        if all_entry_ids:
-            for entry in self.session.query(Entry).filter(
-                Entry.id.in_(all_entry_ids)
-            ).all():
-                entry_date_map[entry.id] = entry.date.isoformat()
-
         result = []
         for pid, count in people_counts.most_common(limit):
             person = people_by_id.get(pid)
@@ -1098,7 +1081,7 @@ class WikiContextBuilder:
             "date_range": self._date_range_str(
                 city.first_mentioned, city.last_mentioned
             ),
-            "timeline": self._compute_monthly_counts(city.entries),
+            "timeline": self.aggregates.monthly_counts("cities", city.id),
             "any_neighborhoods": any_neighborhoods,
             "neighborhoods": neighborhoods,
             "top_locations": ungrouped,
@@ -1119,19 +1102,13 @@ class WikiContextBuilder:
             List of dicts with name and count
         """
         people_counts: Counter = Counter()
+        people_by_id: Dict[int, Person] = {}
         for loc in city.locations:
             for scene in loc.scenes:
                 for person in scene.people:
                     if person.relation_type != RelationType.SELF:
                         people_counts[person.id] += 1
-
-        top_ids = [pid for pid, _ in people_counts.most_common(limit)]
-        people_by_id = {
-            p.id: p
-            for p in self.session.query(Person).filter(
-                Person.id.in_(top_ids)
-            ).all()
-        } if top_ids else {}
+                        people_by_id[person.id] = person
 
         return [
             {"name": people_by_id[pid].display_name, "count": count}
@@ -1208,30 +1185,21 @@ class WikiContextBuilder:
             Dict with arc overview, timeline, events, key people/places
         """
         # Collect events in this arc
-        arc_entry_ids = {e.id for e in arc.entries}
-        all_events = self.session.query(Event).all()
-        arc_events = []
-        for event in all_events:
-            event_entry_ids = {e.id for e in event.entries}
-            if event_entry_ids & arc_entry_ids:
-                arc_events.append(event)
+        events_by_id: Dict[int, Event] = {
+            event.id: event
+            for entry in arc.entries
+            for event in entry.events
+        }
+        arc_events = [events_by_id[eid] for eid in sorted(events_by_id)]
 
         # Key people across arc entries
         people_counts: Counter = Counter()
+        people_by_id: Dict[int, Person] = {}
         for entry in arc.entries:
             for person in entry.people:
                 if person.relation_type != RelationType.SELF:
                     people_counts[person.id] += 1
-
-        top_people_ids = [
-            pid for pid, _ in people_counts.most_common(10)
-        ]
-        people_by_id = {
-            p.id: p
-            for p in self.session.query(Person).filter(
-                Person.id.in_(top_people_ids)
-            ).all()
-        } if top_people_ids else {}
+                    people_by_id[person.id] = person
 
         # Chronological events for entries subpage
         arc_events_dict = {e.id: e for e in arc_events}
@@ -1245,7 +1213,7 @@ class WikiContextBuilder:
             "date_range": self._date_range_str(
                 arc.first_entry_date, arc.last_entry_date
             ),
-            "timeline": self._compute_monthly_counts(arc.entries),
+            "timeline": self.aggregates.monthly_counts("arcs", arc.id),
             "events": sorted(
                 [
                     {
@@ -1314,9 +1282,13 @@ class WikiContextBuilder:
             base["recent_dates"] = [
                 e.date.isoformat() for e in entries[:5]
             ]
-            base["timeline"] = self._compute_monthly_counts(entries)
-            base["patterns"] = self._compute_co_occurrences(entries)
-            base["frequent_people"] = self._compute_frequent_people(entries)
+            base["timeline"] = self.aggregates.monthly_counts("tags", tag.id)
+            base["patterns"] = self._compute_co_occurrences(
+                "tags", tag.id, entry_count
+            )
+            base["frequent_people"] = self._compute_frequent_people(
+                "tags", tag.id
+            )
         else:
             base["tier"] = "minimal"
 
@@ -1379,9 +1351,15 @@ class WikiContextBuilder:
             base["recent_dates"] = [
                 e.date.isoformat() for e in entries[:5]
             ]
-            base["timeline"] = self._compute_monthly_counts(entries)
-            base["patterns"] = self._compute_co_occurrences(entries)
-            base["frequent_people"] = self._compute_frequent_people(entries)
+            base["timeline"] = self.aggregates.monthly_counts(
+                "themes", theme.id
+            )
+            base["patterns"] = self._compute_co_occurrences(
+                "themes", theme.id, entry_count
+            )
+            base["frequent_people"] = self._compute_frequent_people(
+                "themes", theme.id
+            )
 
             if len(all_instances) >= MOTIF_SUBPAGE_THRESHOLD:
                 base["recent_instances"] = all_instances[:10]
@@ -1529,7 +1507,7 @@ class WikiContextBuilder:
                 entries[-1].date if entries else None,
                 entries[0].date if entries else None,
             ),
-            "timeline": self._compute_monthly_counts(entries),
+            "timeline": self.aggregates.monthly_counts("motifs", motif.id),
             "instances": all_instances,
             "entries": self._build_entry_listing(
                 sorted(entries, key=lambda e: e.date, reverse=True)
@@ -1757,9 +1735,9 @@ class WikiContextBuilder:
         """
         Find manuscript scenes that cite this entry as source material.
 
-        Queries ManuscriptSource for any references to this entry
-        (either as direct entry source or via its journal scenes),
-        returning manuscript scene names with chapter assignments.
+        Looks up ManuscriptSource references to this entry (either as
+        direct entry source or via its journal scenes), returning
+        manuscript scene names with chapter assignments.
 
         Args:
             entry: Entry model instance
@@ -1767,29 +1745,10 @@ class WikiContextBuilder:
         Returns:
             List of dicts with keys: name, chapter, origin, status
         """
-        from dev.database.models.enums import SourceType
-
-        sources = (
-            self.session.query(ManuscriptSource)
-            .filter(
-                (
-                    (ManuscriptSource.source_type == SourceType.ENTRY)
-                    & (ManuscriptSource.entry_id == entry.id)
-                )
-                | (
-                    (ManuscriptSource.source_type == SourceType.SCENE)
-                    & (ManuscriptSource.scene_id.in_(
-                        [s.id for s in entry.scenes]
-                    ))
-                )
-            )
-            .all()
-        )
-
         # Deduplicate by manuscript scene id
         seen: Set[int] = set()
         result: List[Dict[str, Any]] = []
-        for src in sources:
+        for src in self._entry_sources().get(entry.id, []):
             ms = src.manuscript_scene
             if ms.id in seen:
                 continue
@@ -1803,6 +1762,45 @@ class WikiContextBuilder:
 
         return sorted(result, key=lambda x: x["name"])
 
+    def _entry_sources(self) -> Dict[int, List[ManuscriptSource]]:
+        """
+        Map entry ids to the ManuscriptSources citing them.
+
+        Loaded once per builder in a single query (with scenes and
+        chapters eager-loaded), so entry pages do not each query the
+        sources table.
+
+        Returns:
+            Entry id -> entry and scene sources citing that entry
+        """
+        if self._sources_by_entry is None:
+            from dev.database.models.enums import SourceType
+
+            sources_by_entry: Dict[int, List[ManuscriptSource]] = (
+                defaultdict(list)
+            )
+            sources = (
+                self.session.query(ManuscriptSource)
+                .filter(ManuscriptSource.source_type.in_(
+                    [SourceType.ENTRY, SourceType.SCENE]
+                ))
+                .options(
+                    selectinload(ManuscriptSource.manuscript_scene)
+                    .selectinload(ManuscriptScene.chapter),
+                    selectinload(ManuscriptSource.scene),
+                )
+                .order_by(ManuscriptSource.id)
+            )
+            for src in sources:
+                if src.source_type == SourceType.ENTRY:
+                    entry_id = src.entry_id
+                else:
+                    entry_id = src.scene.entry_id if src.scene else None
+                if entry_id is not None:
+                    sources_by_entry[entry_id].append(src)
+            self._sources_by_entry = dict(sources_by_entry)
+        return self._sources_by_entry
+
     def _build_chapter_scene_blocks(
         self, scenes: List[ManuscriptScene]
     ) -> List[Dict[str, str]]:
@@ -1933,26 +1931,8 @@ class WikiContextBuilder:
     #  SHARED HELPERS
     # ==============================================================
 
-    def _compute_monthly_counts(
-        self, entries: List[Entry]
-    ) -> Dict[str, int]:
-        """
-        Compute monthly entry counts for timeline_table filter.
-
-        Args:
-            entries: List of Entry entities
-
-        Returns:
-            Dict mapping "YYYY-MM" → count
-        """
-        counts: Dict[str, int] = {}
-        for entry in entries:
-            key = entry.date.strftime("%Y-%m")
-            counts[key] = counts.get(key, 0) + 1
-        return counts
-
     def _compute_co_occurrences(
-        self, entries: List[Entry]
+        self, entity_type: str, entity_id: int, entry_count: int
     ) -> Dict[str, List[Dict[str, Any]]]:
         """
         Compute tag and theme co-occurrence for patterns section.
@@ -1961,69 +1941,57 @@ class WikiContextBuilder:
         Only computed when entity has 5+ entries.
 
         Args:
-            entries: List of Entry entities
+            entity_type: "tags" or "themes"
+            entity_id: Primary key of the tag or theme
+            entry_count: Entries of the tag or theme
 
         Returns:
             Dict with "tags" and "themes" lists of {name, count}
         """
-        if len(entries) < CO_OCCURRENCE_MIN_ENTRIES:
+        if entry_count < CO_OCCURRENCE_MIN_ENTRIES:
             return {}
 
-        tag_counts: Counter = Counter()
-        theme_counts: Counter = Counter()
-
-        for entry in entries:
-            for tag in entry.tags:
-                tag_counts[tag.name] += 1
-            for ti in entry.theme_instances:
-                if ti.theme:
-                    theme_counts[ti.theme.name] += 1
-
         result: Dict[str, List[Dict[str, Any]]] = {}
-
-        tag_list = [
-            {"name": name, "count": count}
-            for name, count in tag_counts.most_common()
-            if count >= CO_OCCURRENCE_MIN_OVERLAP
-        ]
-        if tag_list:
-            result["tags"] = tag_list
-
-        theme_list = [
-            {"name": name, "count": count}
-            for name, count in theme_counts.most_common()
-            if count >= CO_OCCURRENCE_MIN_OVERLAP
-        ]
-        if theme_list:
-            result["themes"] = theme_list
+        for key, model in (("tags", Tag), ("themes", Theme)):
+            items = []
+            for other_id, count in self.aggregates.co_occurrences(
+                entity_type, entity_id, key
+            ).items():
+                other = self.session.get(model, other_id)
+                if other is not None and count >= CO_OCCURRENCE_MIN_OVERLAP:
+                    items.append({"name": other.name, "count": count})
+            if items:
+                result[key] = sorted(
+                    items, key=lambda x: (-x["count"], x["name"])
+                )
 
         return result
 
     def _compute_frequent_people(
-        self, entries: List[Entry], limit: int = 10
+        self, entity_type: str, entity_id: int, limit: int = 10
     ) -> List[Dict[str, Any]]:
         """
-        Compute most frequent people across a set of entries.
+        Compute most frequent people across an entity's entries.
 
         Narrator excluded.
 
         Args:
-            entries: List of Entry entities
+            entity_type: "tags" or "themes"
+            entity_id: Primary key of the tag or theme
             limit: Max people to return
 
         Returns:
             List of dicts with name and count
         """
-        people_counts: Counter = Counter()
-        for entry in entries:
-            for person in entry.people:
-                if person.relation_type != RelationType.SELF:
-                    people_counts[person.display_name] += 1
+        people = []
+        for pid, count in self.aggregates.co_occurrences(
+            entity_type, entity_id, "people"
+        ).items():
+            person = self.session.get(Person, pid)
+            if person is not None and person.relation_type != RelationType.SELF:
+                people.append({"name": person.display_name, "count": count})
 
-        return [
-            {"name": name, "count": count}
-            for name, count in people_counts.most_common(limit)
-        ]
+        return sorted(people, key=lambda x: (-x["count"], x["name"]))[:limit]
 
     def _build_entry_listing(
         self, entries: List[Entry]
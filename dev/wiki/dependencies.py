@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+dependencies.py
+---------------
+Page dependency graph for incremental wiki generation.
+
+Every generated wiki page belongs to one entity (its "page key", e.g.
+``people:12``): the entity's main page plus its subpages. While a page
+is built, the rows its context reads are collected by walking the
+relationship paths declared on its EntityConfig. The page index stores,
+per key, the files written and those rows; joined with the DB change
+log it tells WikiExporter which pages a set of changed rows affects.
+
+Key Features:
+    - collect_dependencies: walk dotted relationship paths from an
+      entity, recording (table, id) for every row on the way
+    - PageIndex: JSON sidecar of page key -> files + dependencies,
+      one change-log watermark per wiki section
+    - A template fingerprint and the output directory are stored with
+      the index; a mismatch invalidates it (full regeneration)
+
+Usage:
+    from dev.wiki.dependencies import PageIndex, collect_dependencies
+
+    deps = collect_dependencies(person, ("entries.people", "threads"))
+    # deps == {"people": {12, 14}, "entries": {3}, "threads": {7}}
+
+    index = PageIndex(path, output_dir, template_fingerprint(templates))
+    if index.load():
+        affected = index.affected("journal", changed)
+        # affected == {"people": {12}, "entries": {3}}
+"""
+# --- Annotations ---
+from __future__ import annotations
+
+# --- Standard library imports ---
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+# --- Third-party imports ---
+from sqlalchemy import inspect
+
+
+# Page index layout version
+INDEX_VERSION = 1
+
+
+@dataclass
+class PageRecord:
+    """
+    Files and row dependencies of one page key.
+
+    Attributes:
+        files: Output paths relative to the wiki root (POSIX form)
+        deps: Table name -> ids of rows the page's context read
+    """
+
+    files: Set[str] = field(default_factory=set)
+    deps: Dict[str, Set[int]] = field(default_factory=dict)
+
+
+def collect_dependencies(
+    entity: Any, paths: Sequence[str]
+) -> Dict[str, Set[int]]:
+    """
+    Collect the rows reachable from an entity along relationship paths.
+
+    The entity itself and every row on each path are included, so
+    ``"entries.people"`` yields the entity, its entries, and the people
+    of those entries.
+
+    Args:
+        entity: Root ORM instance
+        paths: Dotted relationship paths (e.g. ``"scenes.events"``)
+
+    Returns:
+        Table name -> ids of the rows read
+    """
+    deps: Dict[str, Set[int]] = {}
+
+    def note(obj: Any) -> None:
+        state = inspect(obj)
+        if state.identity and isinstance(state.identity[0], int):
+            table = state.mapper.local_table.name
+            deps.setdefault(table, set()).add(state.identity[0])
+
+    note(entity)
+    for path in paths:
+        layer: List[Any] = [entity]
+        for attr in path.split("."):
+            reached: Dict[int, Any] = {}
+            for obj in layer:
+                value = getattr(obj, attr)
+                if value is None:
+                    continue
+                items = value if isinstance(value, Iterable) else (value,)
+                for item in items:
+                    reached[id(item)] = item
+            layer = list(reached.values())
+            for obj in layer:
+                note(obj)
+    return deps
+
+
+def template_fingerprint(templates_dir: Path) -> str:
+    """
+    Hash every template file, so template edits invalidate the index.
+
+    Args:
+        templates_dir: Root of the Jinja2 templates
+
+    Returns:
+        Hex digest over the relative paths and contents
+    """
+    digest = hashlib.sha256()
+    for path in sorted(templates_dir.rglob("*.jinja2")):
+        digest.update(path.relative_to(templates_dir).as_posix().encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class PageIndex:
+    """
+    Persistent page key -> (files, dependencies) map of one wiki tree.
+
+    Sections ("journal", "manuscript", "indexes") are tracked apart,
+    each with the change-log id its pages were generated at, since
+    ``plm wiki generate --section`` regenerates them independently.
+
+    Attributes:
+        path: Index file
+        output_dir: Wiki root the index describes
+        fingerprint: Template fingerprint the pages were rendered with
+        sections: Section -> change id the section is current at
+        pages: Section -> page key -> PageRecord
+    """
+
+    def __init__(self, path: Path, output_dir: Path, fingerprint: str) -> None:
+        """
+        Initialize an empty page index.
+
+        Args:
+            path: Index file
+            output_dir: Wiki root the index describes
+            fingerprint: Current template fingerprint
+        """
+        self.path = path
+        self.output_dir = output_dir
+        self.fingerprint = fingerprint
+        self.sections: Dict[str, int] = {}
+        self.pages: Dict[str, Dict[str, PageRecord]] = {}
+
+    def load(self) -> bool:
+        """
+        Load the index, treating a missing, stale or foreign one as empty.
+
+        Returns:
+            True if an index for this wiki root and templates was loaded
+        """
+        self.sections, self.pages = {}, {}
+        if not self.path.exists() or not self.output_dir.exists():
+            return False
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != INDEX_VERSION
+            or data.get("output_dir") != str(self.output_dir.resolve())
+            or data.get("templates") != self.fingerprint
+        ):
+            return False
+        self.sections = dict(data.get("sections", {}))
+        self.pages = {
+            section: {
+                key: PageRecord(
+                    set(record["files"]),
+                    {table: set(ids) for table, ids in record["deps"].items()},
+                )
+                for key, record in pages.items()
+            }
+            for section, pages in data.get("pages", {}).items()
+        }
+        return True
+
+    def save(self) -> None:
+        """Write the index atomically."""
+        data = {
+            "version": INDEX_VERSION,
+            "output_dir": str(self.output_dir.resolve()),
+            "templates": self.fingerprint,
+            "sections": self.sections,
+            "pages": {
+                section: {
+                    key: {
+                        "files": sorted(record.files),
+                        "deps": {
+                            table: sorted(ids)
+                            for table, ids in record.deps.items()
+                        },
+                    }
+                    for key, record in pages.items()
+                }
+                for section, pages in self.pages.items()
+            },
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(data, handle)
+            os.replace(tmp, self.path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def change_id(self, section: str) -> Optional[int]:
+        """
+        Return the change id a section was last generated at.
+
+        Args:
+            section: Section name
+
+        Returns:
+            Change id, or None if the section is not indexed
+        """
+        return self.sections.get(section)
+
+    def affected(
+        self, section: str, changed: Dict[str, Set[int]]
+    ) -> Dict[str, Set[int]]:
+        """
+        Find the indexed pages that read any changed row.
+
+        Args:
+            section: Section name
+            changed: Table name -> changed ids, from the change log
+
+        Returns:
+            Entity type (page key prefix) -> entity ids to regenerate
+        """
+        affected: Dict[str, Set[int]] = {}
+        for key, record in self.pages.get(section, {}).items():
+            if any(
+                not ids.isdisjoint(record.deps.get(table, ()))
+                for table, ids in changed.items()
+            ):
+                name, _, entity_id = key.rpartition(":")
+                affected.setdefault(name, set()).add(int(entity_id))
+        return affected
+
+    def update(
+        self,
+        section: str,
+        change_id: int,
+        pages: Dict[str, PageRecord],
+        replaced: Optional[Set[str]] = None,
+    ) -> None:
+        """
+        Record a section's generated pages.
+
+        Args:
+            section: Section name
+            change_id: Change id the pages are current at
+            pages: Page key -> record of every page generated this run
+            replaced: Keys regenerated (or found gone) by an incremental
+                run; None means ``pages`` is the whole section
+        """
+        if replaced is None:
+            self.pages[section] = dict(pages)
+        else:
+            section_pages = self.pages.setdefault(section, {})
+            for key in replaced:
+                section_pages.pop(key, None)
+            section_pages.update(pages)
+        self.sections[section] = change_id
@@ -15,8 +15,23 @@ Key Features:
     - Change detection (only writes if content differs)
     - Orphan file cleanup for deleted entities
     - Section-based generation (journal, manuscript, indexes)
+    - Incremental generation: with a page index, only pages whose
+      recorded dependencies intersect the DB change log are rendered
+    - Entities are queried with their configs' eager-loading plans;
+      the statements issued per run are counted in stats["queries"]
+    - Entities are streamed in fixed-size chunks; the session is
+      released between chunks once large, so memory is bounded as the
+      journal grows
+    - Index pages are built from GROUP BY projections instead of
+      loaded entities, and kept when none of the tables they read
+      changed since the indexes watermark
+    - Parallel rendering: with workers > 1, pages are rendered by a
+      process pool while the next contexts are built
+    - Optional persistent template bytecode cache; template load time
+      is reported in stats["template_load_ms"]
 
 Usage:
+    from dev.core.paths import WIKI_INDEX_PATH, WIKI_TEMPLATE_CACHE_DIR
     from dev.wiki.exporter import WikiExporter
     from dev.database.manager import PalimpsestDB
 
@@ -24,26 +39,47 @@ Usage:
     exporter = WikiExporter(db)
     exporter.generate_all()
 
+    # Incremental: re-render only pages affected by changed rows
+    exporter = WikiExporter(db, index_path=WIKI_INDEX_PATH)
+    exporter.generate_all(section="journal")
+
+    # Render on every CPU, reusing compiled templates
+    exporter = WikiExporter(
+        db, workers=None, cache_dir=WIKI_TEMPLATE_CACHE_DIR
+    )
+    exporter.generate_all()
+
 Dependencies:
     - WikiRenderer for Jinja2 rendering
     - WikiContextBuilder for DB → context dict conversion
     - Entity configs from dev.wiki.configs
+    - Page index and change log for incremental runs
 """
 # --- Annotations ---
 from __future__ import annotations
 
 # --- Standard library imports ---
+import os
 from collections import defaultdict
+from datetime import date
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 # --- Third-party imports ---
+from sqlalchemy import Table, extract, func, select
 from sqlalchemy.orm import Session
 
 # --- Local imports ---
 from dev.core.logging_manager import PalimpsestLogger, safe_logger
 from dev.core.paths import WIKI_DIR, WIKI_TEMPLATES_DIR
+from dev.database.change_tracking import (
+    changes_since,
+    get_watermark,
+    latest_change_id,
+    set_watermark,
+)
 from dev.database.manager import PalimpsestDB
+from dev.database.query_optimizer import EntityStream, QueryCounter
 from dev.database.models import (
     Arc,
     City,
@@ -51,17 +87,43 @@ from dev.database.models import (
     Event,
     Location,
     Motif,
+    MotifInstance,
     Person,
+    PersonCharacterMap,
     Poem,
+    PoemVersion,
+    Reference,
     ReferenceSource,
+    Scene,
     Tag,
     Theme,
+    arc_entries,
+    entry_cities,
+    entry_locations,
+    entry_people,
+    entry_tags,
+    event_entries,
+    event_scenes,
+    scene_characters,
 )
 from dev.database.models.enums import RelationType
 from dev.database.models.enums import ChapterStatus, SceneStatus
-from dev.database.models.manuscript import Chapter, Character, ManuscriptScene, Part
+from dev.database.models.manuscript import (
+    Chapter,
+    Character,
+    ManuscriptScene,
+    ManuscriptSource,
+    Part,
+)
 from dev.utils.slugify import slugify
-from dev.wiki.configs import JOURNAL_CONFIGS, MANUSCRIPT_CONFIGS, INDEX_CONFIGS
+from dev.wiki.configs import (
+    ENTITY_INDEXES,
+    ENTRY_DEPENDS_ON,
+    INDEX_CONFIGS,
+    JOURNAL_CONFIGS,
+    MANUSCRIPT_CONFIGS,
+    loader_options,
+)
 from dev.wiki.context import (
     WikiContextBuilder,
     FREQUENT_PERSON_THRESHOLD,
@@ -71,7 +133,87 @@ from dev.wiki.context import (
     MOTIF_SUBPAGE_THRESHOLD,
     EVENT_SUBPAGE_THRESHOLD,
 )
-from dev.wiki.renderer import WikiRenderer
+from dev.wiki.dependencies import (
+    PageIndex,
+    PageRecord,
+    collect_dependencies,
+    template_fingerprint,
+)
+from dev.wiki.link_targets import (
+    load_link_targets,
+    refresh_link_targets,
+    resolve_target,
+)
+from dev.wiki.renderer import RenderPool, WikiRenderer
+
+
+# Change-log consumer per section (sections regenerate independently)
+WATERMARK_CONSUMERS = {
+    "journal": "wiki_journal",
+    "manuscript": "wiki_manuscript",
+    "indexes": "wiki_indexes",
+}
+
+# Page key prefix -> model, per section with per-entity pages
+SECTION_MODELS: Dict[str, Dict[str, Any]] = {
+    "journal": {
+        "entries": Entry,
+        **{config.name: config.model for config in JOURNAL_CONFIGS},
+    },
+    "manuscript": {config.name: config.model for config in MANUSCRIPT_CONFIGS},
+}
+
+# Model -> relationship paths its page context reads (dependencies
+# of its pages, and the eager-loading plan of its query)
+DEPENDS_ON: Dict[Any, Tuple[str, ...]] = {
+    Entry: ENTRY_DEPENDS_ON,
+    **{
+        config.model: config.depends_on
+        for config in JOURNAL_CONFIGS + MANUSCRIPT_CONFIGS
+    },
+}
+
+
+def _only(
+    ids: Optional[Dict[str, Set[int]]], name: str
+) -> Optional[Set[int]]:
+    """Return the ids selected for one entity type (None = all)."""
+    return None if ids is None else ids.get(name, set())
+
+
+def _count_by(session: Session, column: Any) -> Dict[Any, int]:
+    """Count rows per value of a column with one GROUP BY."""
+    return dict(
+        session.execute(select(column, func.count()).group_by(column)).all()
+    )
+
+
+def _entry_stats(
+    session: Session, link_table: Table, key: str
+) -> Dict[int, Tuple[int, Optional[date], Optional[date]]]:
+    """
+    Aggregate the entries linked to each entity with one GROUP BY.
+
+    Args:
+        session: Active SQLAlchemy session
+        link_table: Table with an ``entry_id`` column and the entity key
+        key: Column holding the entity id (e.g. "arc_id")
+
+    Returns:
+        Entity id -> (linked rows, first entry date, last entry date)
+    """
+    column = link_table.c[key]
+    rows = session.execute(
+        select(column, func.count(), func.min(Entry.date), func.max(Entry.date))
+        .join(Entry, Entry.id == link_table.c.entry_id)
+        .group_by(column)
+    )
+    return {id_: (count, first, last) for id_, count, first, last in rows}
+
+
+def _display(value: Any) -> str:
+    """Display name of an optional enum value ("Unknown" when unset)."""
+    return value.display_name if value else "Unknown"
 
 
 class WikiExporter:
@@ -94,6 +236,10 @@ class WikiExporter:
         db: PalimpsestDB,
         output_dir: Optional[Path] = None,
         logger: Optional[PalimpsestLogger] = None,
+        index_path: Optional[Path] = None,
+        workers: Optional[int] = 1,
+        cache_dir: Optional[Path] = None,
+        renderer: Optional[WikiRenderer] = None,
     ) -> None:
         """
         Initialize wiki exporter.
@@ -102,66 +248,437 @@ class WikiExporter:
             db: Database manager instance
             output_dir: Wiki output directory (defaults to data/wiki)
             logger: Optional logger for progress tracking
+            index_path: Page index file; enables incremental generation
+                driven by the DB change log (None = always render all)
+            workers: Render processes (None = CPU count; 1 = render in
+                this process)
+            cache_dir: Persistent template bytecode cache (None = compile
+                templates in memory)
+            renderer: Already-loaded renderer to reuse (e.g. held by the
+                ``plm serve`` daemon); cache_dir is ignored when given
         """
         self.db = db
         self.output_dir = output_dir or WIKI_DIR
         self.logger = logger
-        self.renderer = WikiRenderer(WIKI_TEMPLATES_DIR)
+        self.index_path = index_path
+        self.workers = workers or os.cpu_count() or 1
+        self.renderer = renderer or WikiRenderer(
+            WIKI_TEMPLATES_DIR, cache_dir=cache_dir
+        )
+        self._pool: Optional[RenderPool] = None
 
         # Stats
         self.stats: Dict[str, int] = {}
         self.generated_files: Set[Path] = set()
 
+        # Page tracking (populated when index_path is set)
+        self._index: Optional[PageIndex] = None
+        self._head: Optional[int] = None
+        self._pages: Optional[Dict[str, Dict[str, PageRecord]]] = None
+        self._page: Optional[PageRecord] = None
+        self._replaced: Dict[str, Set[str]] = {}
+
     def generate_all(
         self,
         section: Optional[str] = None,
         entity_type: Optional[str] = None,
+        full: bool = False,
     ) -> None:
         """
         Generate all wiki pages from database.
 
+        With a page index, each section whose index is current at its
+        change-log watermark is generated incrementally: only pages
+        that read a changed row (or belong to one) are rendered.
+
         Args:
             section: Optional filter: "journal", "manuscript", "indexes"
-            entity_type: Optional filter: entity name (e.g., "people")
+            entity_type: Optional filter: entity name (e.g., "people");
+                such runs always render every page of that type and
+                leave the page index untouched
+            full: Render every page even when the index is current
         """
 
         safe_logger(self.logger).log_info("Starting wiki generation")
 
-        with self.db.session_scope() as session:
+        sections = [s for s in WATERMARK_CONSUMERS if not section or section == s]
+
+        counter = QueryCounter(self.db.engine)
+        with counter, self.db.session_scope() as session:
             # Build global wikilink lookup and inject into Jinja2 env
-            targets = self._build_wikilink_targets(session)
+            targets = self._build_wikilink_targets(session, full)
             self.renderer.env.globals["_wikilink_targets"] = targets
 
             builder = WikiContextBuilder(session)
-
-            if not section or section == "journal":
-                self._generate_journal_entries(session, builder)
-                self._generate_journal_entities(
-                    session, builder, entity_type
+            changes = self._load_changes(session, sections, entity_type, full)
+            if self.workers > 1:
+                self._pool = RenderPool(
+                    self.renderer, WIKI_TEMPLATES_DIR, self.workers
                 )
-                if not entity_type:
-                    self._generate_entity_subpages(session, builder)
 
-            if not section or section == "manuscript":
-                self._generate_manuscript_entities(
-                    session, builder, entity_type
-                )
+            try:
+                if not section or section == "journal":
+                    ids = self._affected_pages("journal", changes)
+                    self._generate_journal_entries(
+                        session, builder, _only(ids, "entries")
+                    )
+                    self._generate_journal_entities(
+                        session, builder, entity_type, ids
+                    )
+                    if not entity_type:
+                        self._generate_entity_subpages(session, builder, ids)
 
-            if not section or section == "indexes":
-                self._generate_indexes(session, builder)
+                if not section or section == "manuscript":
+                    ids = self._affected_pages("manuscript", changes)
+                    self._generate_manuscript_entities(
+                        session, builder, entity_type, ids
+                    )
+
+                if not section or section == "indexes":
+                    self._generate_indexes(
+                        session, builder, changed=changes.get("indexes")
+                    )
+
+                self._finish_rendering()
+            finally:
+                if self._pool is not None:
+                    self._pool.cancel()
+                    self._pool = None
 
             # Orphan cleanup
             if not entity_type:
                 self._cleanup_orphans()
 
+        self._save_index()
+        self.stats["queries"] = counter.count
+        timings = self.renderer.timings
+        self.stats["template_load_ms"] = round(
+            timings["setup_ms"] + timings["load_ms"]
+        )
+        safe_logger(self.logger).log_debug("Template loading", timings)
+
         safe_logger(self.logger).log_info(
             f"Wiki generation complete: {self.stats}"
         )
 
+    def generate_entity(self, entity_type: str, key: str) -> int:
+        """
+        Regenerate the pages of a single entity.
+
+        Renders the entity's page and subpages plus the index pages
+        that list its type, for editor save hooks. Other pages that
+        mention the entity, orphan cleanup and the page index are left
+        to the next ``generate_all`` (which still sees the change).
+
+        Args:
+            entity_type: Entity type, e.g. "people" or "entries"
+            key: Page key: wiki path tail (``clara``, ``montreal/cafe``,
+                ``2024-03-05``) or wikilink name
+
+        Returns:
+            Primary key of the regenerated entity
+
+        Raises:
+            ValueError: If the type is unknown or no entity matches key
+        """
+        if entity_type not in ENTITY_INDEXES:
+            raise ValueError(
+                f"Unknown entity type '{entity_type}' "
+                f"(expected one of: {', '.join(sorted(ENTITY_INDEXES))})"
+            )
+
+        counter = QueryCounter(self.db.engine)
+        with counter, self.db.session_scope() as session:
+            targets = self._build_wikilink_targets(session)
+            self.renderer.env.globals["_wikilink_targets"] = targets
+
+            entity_id = resolve_target(session, entity_type, key, refresh=False)
+            if entity_id is None:
+                raise ValueError(f"No {entity_type} page matches '{key}'")
+
+            builder = WikiContextBuilder(session)
+            ids = {entity_type: {entity_id}}
+            if entity_type == "entries":
+                self._generate_journal_entries(session, builder, ids["entries"])
+            elif any(c.name == entity_type for c in JOURNAL_CONFIGS):
+                self._generate_journal_entities(session, builder, entity_type, ids)
+                self._generate_entity_subpages(session, builder, ids)
+            else:
+                self._generate_manuscript_entities(
+                    session, builder, entity_type, ids
+                )
+            self._generate_indexes(
+                session, builder, names=set(ENTITY_INDEXES[entity_type])
+            )
+            self._finish_rendering()
+
+        self.stats["queries"] = counter.count
+        safe_logger(self.logger).log_info(
+            f"Regenerated {entity_type}:{key}: {self.stats}"
+        )
+        return entity_id
+
+    # ==============================================================
+    #  INCREMENTAL GENERATION
+    # ==============================================================
+
+    def _load_changes(
+        self,
+        session: Session,
+        sections: List[str],
+        entity_type: Optional[str],
+        full: bool,
+    ) -> Dict[str, Dict[str, Set[int]]]:
+        """
+        Turn on page tracking and read what changed per section.
+
+        Tracking needs an index path and a database with a change log,
+        and is skipped for ``entity_type`` runs. A section is generated
+        incrementally when the loaded index is current at the section's
+        watermark; any other section is rendered in full (rebuilding its
+        part of the index).
+
+        Args:
+            session: Session the pages are generated with
+            sections: Sections this run generates
+            entity_type: Entity type filter of the run
+            full: Force full generation
+
+        Returns:
+            Section -> changed rows (table name -> ids), for the sections
+            to generate incrementally only
+        """
+        if (
+            self.index_path is None
+            or entity_type
+            or not getattr(self.db, "tracks_changes", False)
+        ):
+            return {}
+
+        self._index = PageIndex(
+            self.index_path,
+            self.output_dir,
+            template_fingerprint(WIKI_TEMPLATES_DIR),
+        )
+        self._pages = {section: {} for section in sections}
+        self._head = latest_change_id(session)
+        if not self._index.load() or full:
+            return {}
+
+        changes: Dict[str, Dict[str, Set[int]]] = {}
+        for section in sections:
+            change_id = self._index.change_id(section)
+            watermark = get_watermark(session, WATERMARK_CONSUMERS[section])
+            if change_id is not None and change_id == watermark:
+                _head, changes[section] = changes_since(session, change_id)
+        return changes
+
+    def _affected_pages(
+        self,
+        section: str,
+        changes: Dict[str, Dict[str, Set[int]]],
+    ) -> Optional[Dict[str, Set[int]]]:
+        """
+        Select the pages of an incremental section to regenerate.
+
+        These are the indexed pages that read a changed row, pages of
+        changed rows (new entities have no index record yet), and pages
+        with a file missing on disk. Files of every other indexed page
+        count as generated, so orphan cleanup keeps them.
+
+        Args:
+            section: "journal" or "manuscript"
+            changes: Changed rows per incremental section
+
+        Returns:
+            Entity type -> ids to regenerate, or None to generate the
+            whole section
+        """
+        if self._index is None or section not in changes:
+            return None
+
+        changed = changes[section]
+        affected = self._index.affected(section, changed)
+        for name, model in SECTION_MODELS[section].items():
+            new_ids = changed.get(model.__tablename__)
+            if new_ids:
+                affected.setdefault(name, set()).update(new_ids)
+
+        keys = {f"{name}:{id_}" for name, ids in affected.items() for id_ in ids}
+        kept = 0
+        for key, record in self._index.pages.get(section, {}).items():
+            if key in keys:
+                continue
+            paths = [self.output_dir / rel_path for rel_path in record.files]
+            if all(path.exists() for path in paths):
+                self.generated_files.update(paths)
+                kept += 1
+            else:
+                name, _, id_ = key.rpartition(":")
+                affected.setdefault(name, set()).add(int(id_))
+                keys.add(key)
+        self._replaced[section] = keys
+
+        safe_logger(self.logger).log_info(
+            f"Incremental {section} generation: "
+            f"{sum(len(ids) for ids in changed.values())} changed rows, "
+            f"{len(keys)} pages to render, {kept} unchanged"
+        )
+        self.stats[f"{section}_pages_unchanged"] = kept
+        return affected
+
+    def _begin_page(self, section: str, name: str, entity: Any) -> None:
+        """
+        Attribute the files written next to an entity's page key.
+
+        The first time a key is seen in a run, the rows its context
+        reads (the entity's ``depends_on`` paths) are recorded. No-op
+        unless page tracking is on.
+
+        Args:
+            section: Section the page belongs to
+            name: Entity type (page key prefix)
+            entity: Entity the page is generated for
+        """
+        if self._pages is None or section not in self._pages:
+            return
+        pages = self._pages[section]
+        key = f"{name}:{entity.id}"
+        if key not in pages:
+            pages[key] = PageRecord(
+                deps=collect_dependencies(entity, DEPENDS_ON[type(entity)])
+            )
+        self._page = pages[key]
+
+    def _render(
+        self,
+        template_name: str,
+        context: Dict[str, Any],
+        output_path: Path,
+        changed_stat: Optional[str] = None,
+    ) -> None:
+        """
+        Render a page now, or queue it on the render pool.
+
+        Args:
+            template_name: Template path relative to templates root
+            context: Template variables
+            output_path: Destination file path
+            changed_stat: Stats key incremented if the file is written
+        """
+        if self._pool is not None:
+            self._pool.submit(template_name, context, output_path, changed_stat)
+        elif (
+            self.renderer.render_to_file(template_name, context, output_path)
+            and changed_stat
+        ):
+            self.stats[changed_stat] += 1
+
+    def _finish_rendering(self) -> None:
+        """Wait for queued pages and merge their write counts into stats."""
+        if self._pool is None:
+            return
+        pool, self._pool = self._pool, None
+        for key, count in pool.close().items():
+            self.stats[key] = self.stats.get(key, 0) + count
+
+    def _mark_generated(self, path: Path) -> None:
+        """
+        Record a written (or unchanged) output file.
+
+        Args:
+            path: Absolute output path
+        """
+        self.generated_files.add(path)
+        if self._page is not None:
+            self._page.files.add(path.relative_to(self.output_dir).as_posix())
+
+    def _entry_backlinks(self, session: Session) -> Dict[int, Dict[str, Set[int]]]:
+        """
+        Map entries to the manuscript rows their backlinks display.
+
+        Entry pages list the manuscript scenes citing the entry (or its
+        scenes), which no entry relationship reaches.
+
+        Args:
+            session: Active SQLAlchemy session
+
+        Returns:
+            Entry id -> table name -> ids
+        """
+        rows = session.execute(
+            select(
+                func.coalesce(ManuscriptSource.entry_id, Scene.entry_id),
+                ManuscriptScene.id,
+                ManuscriptScene.chapter_id,
+            )
+            .join(
+                ManuscriptScene,
+                ManuscriptSource.manuscript_scene_id == ManuscriptScene.id,
+            )
+            .outerjoin(Scene, ManuscriptSource.scene_id == Scene.id)
+        )
+        backlinks: Dict[int, Dict[str, Set[int]]] = {}
+        for entry_id, scene_id, chapter_id in rows:
+            if entry_id is None:
+                continue
+            deps = backlinks.setdefault(entry_id, {})
+            deps.setdefault(ManuscriptScene.__tablename__, set()).add(scene_id)
+            if chapter_id is not None:
+                deps.setdefault(Chapter.__tablename__, set()).add(chapter_id)
+        return backlinks
+
+    def _query_entities(
+        self,
+        session: Session,
+        model: Any,
+        ids: Optional[Set[int]],
+        *order_by: Any,
+    ) -> EntityStream:
+        """
+        Stream the entities of one type to generate pages for.
+
+        Relationships their contexts read are eager-loaded per the
+        type's loader plan, so building every page costs one query per
+        relationship level and chunk instead of one per entity and
+        relationship. The session may be expunged between chunks, so
+        an entity must be fully rendered before the loop moves on.
+
+        Args:
+            session: Active SQLAlchemy session
+            model: Entity model class
+            ids: Restrict to these primary keys (None = all)
+            order_by: Optional ordering columns
+
+        Returns:
+            Sized iterable of entity instances
+        """
+        return EntityStream(
+            session,
+            model,
+            loader_options(model, DEPENDS_ON[model]),
+            ids=ids,
+            order_by=order_by,
+        )
+
+    def _save_index(self) -> None:
+        """Write the page index, then move the sections' watermarks."""
+        if self._index is None or self._pages is None or self._head is None:
+            return
+        for section, pages in self._pages.items():
+            self._index.update(
+                section, self._head, pages, self._replaced.get(section)
+            )
+        self._index.save()
+        with self.db.session_scope() as session:
+            for section in self._pages:
+                set_watermark(session, WATERMARK_CONSUMERS[section], self._head)
+
     def _generate_journal_entries(
         self,
         session: Session,
         builder: WikiContextBuilder,
+        ids: Optional[Set[int]] = None,
     ) -> None:
         """
         Generate Entry wiki pages.
@@ -172,37 +689,39 @@ class WikiExporter:
         Args:
             session: Active SQLAlchemy session
             builder: WikiContextBuilder instance
+            ids: Restrict to these primary keys (None = all)
         """
-        entries = session.query(Entry).order_by(Entry.date).all()
+        entries = self._query_entities(session, Entry, ids, Entry.date)
         total = len(entries)
-        changed = 0
+        self.stats["entries"] = total
+        self.stats["entries_changed"] = 0
+        backlinks = (
+            self._entry_backlinks(session) if self._pages is not None else {}
+        )
 
         for i, entry in enumerate(entries, 1):
+            self._begin_page("journal", "entries", entry)
+            for table, table_ids in backlinks.get(entry.id, {}).items():
+                self._page.deps.setdefault(table, set()).update(table_ids)
             ctx = builder.build_entry_context(entry)
             year = entry.date.strftime("%Y")
             filename = f"{entry.date.isoformat()}.md"
             output_path = self.output_dir / "journal" / "entries" / year / filename
 
-            if self.renderer.render_to_file(
-                "journal/entry.jinja2", ctx, output_path
-            ):
-                changed += 1
+            self._render(
+                "journal/entry.jinja2", ctx, output_path, "entries_changed"
+            )
+            self._mark_generated(output_path)
 
-            self.generated_files.add(output_path)
+            # Rating subpage for entries with rating_justification
+            if entry.rating_justification:
+                self._generate_rating_subpage(entry)
 
             if i % 100 == 0 or i == total:
                 safe_logger(self.logger).log_debug(
                     f"Generating entries: {i}/{total}"
                 )
 
-        # Rating subpages for entries with rating_justification
-        for entry in entries:
-            if entry.rating_justification:
-                self._generate_rating_subpage(entry)
-
-        self.stats["entries"] = total
-        self.stats["entries_changed"] = changed
-
     def _generate_rating_subpage(self, entry: Entry) -> None:
         """
         Generate rating justification subpage for an entry.
@@ -228,18 +747,19 @@ class WikiExporter:
         if output_path.exists():
             existing = output_path.read_text(encoding="utf-8")
             if existing == content:
-                self.generated_files.add(output_path)
+                self._mark_generated(output_path)
                 return
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
         output_path.write_text(content, encoding="utf-8")
-        self.generated_files.add(output_path)
+        self._mark_generated(output_path)
 
     def _generate_journal_entities(
         self,
         session: Session,
         builder: WikiContextBuilder,
         entity_type: Optional[str] = None,
+        ids: Optional[Dict[str, Set[int]]] = None,
     ) -> None:
         """
         Generate wiki pages for all journal entity types.
@@ -250,44 +770,46 @@ class WikiExporter:
             session: Active SQLAlchemy session
             builder: WikiContextBuilder instance
             entity_type: Optional filter to generate only one type
+            ids: Entity type -> primary keys to regenerate (None = all)
         """
         for config in JOURNAL_CONFIGS:
             if entity_type and config.name != entity_type:
                 continue
 
-            entities = session.query(config.model).all()
+            entities = self._query_entities(
+                session, config.model, _only(ids, config.name)
+            )
             total = len(entities)
-            changed = 0
+            self.stats[config.name] = total
+            self.stats[f"{config.name}_changed"] = 0
 
             for i, entity in enumerate(entities, 1):
                 if not config.should_generate(entity):
                     continue
 
+                self._begin_page("journal", config.name, entity)
                 context_fn = getattr(builder, config.context_method)
                 ctx = context_fn(entity)
                 filename = config.filename_fn(entity)
                 output_path = self.output_dir / config.output_subdir / filename
 
-                if self.renderer.render_to_file(
-                    config.template, ctx, output_path
-                ):
-                    changed += 1
-
-                self.generated_files.add(output_path)
+                self._render(
+                    config.template, ctx, output_path,
+                    f"{config.name}_changed",
+                )
+                self._mark_generated(output_path)
 
                 if i % 100 == 0 or i == total:
                     safe_logger(self.logger).log_debug(
                         f"Generating {config.name}: {i}/{total}"
                     )
 
-            self.stats[config.name] = total
-            self.stats[f"{config.name}_changed"] = changed
-
     def _generate_manuscript_entities(
         self,
         session: Session,
         builder: WikiContextBuilder,
         entity_type: Optional[str] = None,
+        ids: Optional[Dict[str, Set[int]]] = None,
     ) -> None:
         """
         Generate wiki pages for all manuscript entity types.
@@ -299,43 +821,45 @@ class WikiExporter:
             session: Active SQLAlchemy session
             builder: WikiContextBuilder instance
             entity_type: Optional filter to generate only one type
+            ids: Entity type -> primary keys to regenerate (None = all)
         """
         for config in MANUSCRIPT_CONFIGS:
             if entity_type and config.name != entity_type:
                 continue
 
-            entities = session.query(config.model).all()
+            entities = self._query_entities(
+                session, config.model, _only(ids, config.name)
+            )
             total = len(entities)
-            changed = 0
+            self.stats[config.name] = total
+            self.stats[f"{config.name}_changed"] = 0
 
             for i, entity in enumerate(entities, 1):
                 if not config.should_generate(entity):
                     continue
 
+                self._begin_page("manuscript", config.name, entity)
                 context_fn = getattr(builder, config.context_method)
                 ctx = context_fn(entity)
                 filename = config.filename_fn(entity)
                 output_path = self.output_dir / config.output_subdir / filename
 
-                if self.renderer.render_to_file(
-                    config.template, ctx, output_path
-                ):
-                    changed += 1
-
-                self.generated_files.add(output_path)
+                self._render(
+                    config.template, ctx, output_path,
+                    f"{config.name}_changed",
+                )
+                self._mark_generated(output_path)
 
                 if i % 100 == 0 or i == total:
                     safe_logger(self.logger).log_debug(
                         f"Generating {config.name}: {i}/{total}"
                     )
 
-            self.stats[config.name] = total
-            self.stats[f"{config.name}_changed"] = changed
-
     def _generate_entity_subpages(
         self,
         session: Session,
         builder: WikiContextBuilder,
+        ids: Optional[Dict[str, Set[int]]] = None,
     ) -> None:
         """
         Generate entry subpages for high-frequency entities.
@@ -346,15 +870,20 @@ class WikiExporter:
         Args:
             session: Active SQLAlchemy session
             builder: WikiContextBuilder instance
+            ids: Entity type -> primary keys to regenerate (None = all)
         """
-        self._generate_person_subpages(session, builder)
-        self._generate_location_subpages(session, builder)
-        self._generate_tag_subpages(session, builder)
-        self._generate_theme_subpages(session, builder)
-        self._generate_arc_subpages(session, builder)
-        self._generate_reference_source_subpages(session, builder)
-        self._generate_motif_subpages(session, builder)
-        self._generate_event_subpages(session, builder)
+        self._generate_person_subpages(session, builder, _only(ids, "people"))
+        self._generate_location_subpages(
+            session, builder, _only(ids, "locations")
+        )
+        self._generate_tag_subpages(session, builder, _only(ids, "tags"))
+        self._generate_theme_subpages(session, builder, _only(ids, "themes"))
+        self._generate_arc_subpages(session, builder, _only(ids, "arcs"))
+        self._generate_reference_source_subpages(
+            session, builder, _only(ids, "reference_sources")
+        )
+        self._generate_motif_subpages(session, builder, _only(ids, "motifs"))
+        self._generate_event_subpages(session, builder, _only(ids, "events"))
 
     def _generate_year_pages(
         self,
@@ -395,10 +924,10 @@ class WikiExporter:
                 "entries": [yg],
             }
             year_path = base_dir / f"{file_prefix}-{year}.md"
-            self.renderer.render_to_file(
+            self._render(
                 "journal/entries_year_page.jinja2", year_ctx, year_path
             )
-            self.generated_files.add(year_path)
+            self._mark_generated(year_path)
 
         return year_summary
 
@@ -406,6 +935,7 @@ class WikiExporter:
         self,
         session: Session,
         builder: WikiContextBuilder,
+        ids: Optional[Set[int]] = None,
     ) -> None:
         """
         Generate entry subpages for frequent people (20+ entries).
@@ -415,13 +945,15 @@ class WikiExporter:
         Args:
             session: Active SQLAlchemy session
             builder: WikiContextBuilder instance
+            ids: Restrict to these primary keys (None = all)
         """
-        for person in session.query(Person).all():
+        for person in self._query_entities(session, Person, ids):
             if person.relation_type == RelationType.SELF:
                 continue
             if person.entry_count < FREQUENT_PERSON_THRESHOLD:
                 continue
 
+            self._begin_page("journal", "people", person)
             ctx = builder.build_person_context(person)
             slug = person.slug
             base_dir = self.output_dir / "journal" / "people"
@@ -440,15 +972,16 @@ class WikiExporter:
 
             # Render year-index subpage
             output_path = base_dir / f"{file_prefix}.md"
-            self.renderer.render_to_file(
+            self._render(
                 "journal/person_entries.jinja2", ctx, output_path
             )
-            self.generated_files.add(output_path)
+            self._mark_generated(output_path)
 
     def _generate_location_subpages(
         self,
         session: Session,
         builder: WikiContextBuilder,
+        ids: Optional[Set[int]] = None,
     ) -> None:
         """
         Generate entry subpages for dashboard locations (20+ entries).
@@ -460,11 +993,13 @@ class WikiExporter:
         Args:
             session: Active SQLAlchemy session
             builder: WikiContextBuilder instance
+            ids: Restrict to these primary keys (None = all)
         """
-        for location in session.query(Location).all():
+        for location in self._query_entities(session, Location, ids):
             if location.entry_count < FREQUENT_LOCATION_THRESHOLD:
                 continue
 
+            self._begin_page("journal", "locations", location)
             ctx = builder.build_location_context(location)
             city_slug = slugify(location.city.name)
             loc_slug = slugify(location.name)
@@ -486,10 +1021,10 @@ class WikiExporter:
 
             # Render year-index subpage
             output_path = base_dir / f"{file_prefix}.md"
-            self.renderer.render_to_file(
+            self._render(
                 "journal/location_entries.jinja2", ctx, output_path
             )
-            self.generated_files.add(output_path)
+            self._mark_generated(output_path)
 
             # Generate person-at-location subpages (>5 entries)
             for person_data in ctx.get("frequent_people", []):
@@ -500,10 +1035,9 @@ class WikiExporter:
                 if not entry_ids:
                     continue
 
+                # Already loaded via location.scenes.entry
                 person_entries = sorted(
-                    session.query(Entry).filter(
-                        Entry.id.in_(entry_ids)
-                    ).all(),
+                    (session.get(Entry, eid) for eid in entry_ids),
                     key=lambda e: e.date,
                     reverse=True,
                 )
@@ -516,16 +1050,17 @@ class WikiExporter:
                 }
                 person_slug = person_data["slug"]
                 person_path = base_dir / f"{loc_slug}-people-{person_slug}.md"
-                self.renderer.render_to_file(
+                self._render(
                     "journal/location_person_entries.jinja2",
                     person_ctx, person_path,
                 )
-                self.generated_files.add(person_path)
+                self._mark_generated(person_path)
 
     def _generate_tag_subpages(
         self,
         session: Session,
         builder: WikiContextBuilder,
+        ids: Optional[Set[int]] = None,
     ) -> None:
         """
         Generate entry subpages for dashboard tags (5+ entries).
@@ -535,11 +1070,13 @@ class WikiExporter:
         Args:
             session: Active SQLAlchemy session
             builder: WikiContextBuilder instance
+            ids: Restrict to these primary keys (None = all)
         """
-        for tag in session.query(Tag).all():
+        for tag in self._query_entities(session, Tag, ids):
             if tag.usage_count < TAG_DASHBOARD_THRESHOLD:
                 continue
 
+            self._begin_page("journal", "tags", tag)
             ctx = builder.build_tag_context(tag)
             slug = slugify(tag.name)
             base_dir = self.output_dir / "journal" / "tags"
@@ -552,15 +1089,16 @@ class WikiExporter:
             ctx["year_summary"] = year_summary
 
             output_path = base_dir / f"{file_prefix}.md"
-            self.renderer.render_to_file(
+            self._render(
                 "journal/tag_entries.jinja2", ctx, output_path
             )
-            self.generated_files.add(output_path)
+            self._mark_generated(output_path)
 
     def _generate_theme_subpages(
         self,
         session: Session,
         builder: WikiContextBuilder,
+        ids: Optional[Set[int]] = None,
     ) -> None:
         """
         Generate entry subpages for dashboard themes (5+ entries).
@@ -570,11 +1108,13 @@ class WikiExporter:
         Args:
             session: Active SQLAlchemy session
             builder: WikiContextBuilder instance
+            ids: Restrict to these primary keys (None = all)
         """
-        for theme in session.query(Theme).all():
+        for theme in self._query_entities(session, Theme, ids):
             if theme.usage_count < TAG_DASHBOARD_THRESHOLD:
                 continue
 
+            self._begin_page("journal", "themes", theme)
             ctx = builder.build_theme_context(theme)
             slug = slugify(theme.name)
             base_dir = self.output_dir / "journal" / "themes"
@@ -587,15 +1127,16 @@ class WikiExporter:
             ctx["year_summary"] = year_summary
 
             output_path = base_dir / f"{file_prefix}.md"
-            self.renderer.render_to_file(
+            self._render(
                 "journal/theme_entries.jinja2", ctx, output_path
             )
-            self.generated_files.add(output_path)
+            self._mark_generated(output_path)
 
     def _generate_arc_subpages(
         self,
         session: Session,
         builder: WikiContextBuilder,
+        ids: Optional[Set[int]] = None,
     ) -> None:
         """
         Generate entry subpages for all arcs.
@@ -605,8 +1146,10 @@ class WikiExporter:
         Args:
             session: Active SQLAlchemy session
             builder: WikiContextBuilder instance
+            ids: Restrict to these primary keys (None = all)
         """
-        for arc in session.query(Arc).all():
+        for arc in self._query_entities(session, Arc, ids):
+            self._begin_page("journal", "arcs", arc)
             ctx = builder.build_arc_context(arc)
             slug = slugify(arc.name)
             base_dir = self.output_dir / "journal" / "arcs"
@@ -622,15 +1165,16 @@ class WikiExporter:
                 yg["entry_count"] = year_counts.get(yg["year"], 0)
 
             output_path = base_dir / f"{file_prefix}.md"
-            self.renderer.render_to_file(
+            self._render(
                 "journal/arc_entries.jinja2", ctx, output_path
             )
-            self.generated_files.add(output_path)
+            self._mark_generated(output_path)
 
     def _generate_reference_source_subpages(
         self,
         session: Session,
         builder: WikiContextBuilder,
+        ids: Optional[Set[int]] = None,
     ) -> None:
         """
         Generate reference subpages for heavy reference sources.
@@ -641,11 +1185,13 @@ class WikiExporter:
         Args:
             session: Active SQLAlchemy session
             builder: WikiContextBuilder instance
+            ids: Restrict to these primary keys (None = all)
         """
-        for source in session.query(ReferenceSource).all():
+        for source in self._query_entities(session, ReferenceSource, ids):
             if source.reference_count < REFSOURCE_SUBPAGE_THRESHOLD:
                 continue
 
+            self._begin_page("journal", "reference_sources", source)
             ctx = builder.build_reference_source_context(source)
             slug = slugify(source.title)
             base_dir = self.output_dir / "journal" / "references"
@@ -670,25 +1216,26 @@ class WikiExporter:
                     "references": year_refs,
                 }
                 year_path = base_dir / f"{file_prefix}-{year}.md"
-                self.renderer.render_to_file(
+                self._render(
                     "journal/reference_source_refs_year.jinja2",
                     year_ctx, year_path,
                 )
-                self.generated_files.add(year_path)
+                self._mark_generated(year_path)
 
             ctx["year_summary"] = year_summary
 
             # Render year-index page
             output_path = base_dir / f"{file_prefix}.md"
-            self.renderer.render_to_file(
+            self._render(
                 "journal/reference_source_refs.jinja2", ctx, output_path
             )
-            self.generated_files.add(output_path)
+            self._mark_generated(output_path)
 
     def _generate_motif_subpages(
         self,
         session: Session,
         builder: WikiContextBuilder,
+        ids: Optional[Set[int]] = None,
     ) -> None:
         """
         Generate entry subpages for heavy motifs.
@@ -699,11 +1246,13 @@ class WikiExporter:
         Args:
             session: Active SQLAlchemy session
             builder: WikiContextBuilder instance
+            ids: Restrict to these primary keys (None = all)
         """
-        for motif in session.query(Motif).all():
+        for motif in self._query_entities(session, Motif, ids):
             if motif.instance_count < MOTIF_SUBPAGE_THRESHOLD:
                 continue
 
+            self._begin_page("journal", "motifs", motif)
             ctx = builder.build_motif_context(motif)
             slug = slugify(motif.name)
             base_dir = self.output_dir / "journal" / "motifs"
@@ -718,15 +1267,16 @@ class WikiExporter:
 
             # Render main subpage (instances + year links)
             output_path = base_dir / f"{file_prefix}.md"
-            self.renderer.render_to_file(
+            self._render(
                 "journal/motif_entries.jinja2", ctx, output_path
             )
-            self.generated_files.add(output_path)
+            self._mark_generated(output_path)
 
     def _generate_event_subpages(
         self,
         session: Session,
         builder: WikiContextBuilder,
+        ids: Optional[Set[int]] = None,
     ) -> None:
         """
         Generate scene subpages for heavy events.
@@ -738,11 +1288,13 @@ class WikiExporter:
         Args:
             session: Active SQLAlchemy session
             builder: WikiContextBuilder instance
+            ids: Restrict to these primary keys (None = all)
         """
-        for event in session.query(Event).all():
+        for event in self._query_entities(session, Event, ids):
             if event.scene_count < EVENT_SUBPAGE_THRESHOLD:
                 continue
 
+            self._begin_page("journal", "events", event)
             ctx = builder.build_event_context(event)
             slug = slugify(event.name)
             filename = f"{slug}-scenes.md"
@@ -750,39 +1302,74 @@ class WikiExporter:
                 self.output_dir / "journal" / "events" / filename
             )
 
-            self.renderer.render_to_file(
+            self._render(
                 "journal/event_scenes.jinja2", ctx, output_path
             )
-            self.generated_files.add(output_path)
+            self._mark_generated(output_path)
 
     def _generate_indexes(
         self,
         session: Session,
         builder: WikiContextBuilder,
+        names: Optional[Set[str]] = None,
+        changed: Optional[Dict[str, Set[int]]] = None,
     ) -> None:
         """
         Generate all index pages.
 
+        In an incremental run, an index page whose config tables saw no
+        change since the indexes watermark (and whose file exists) is
+        kept as is, without building its context.
+
         Args:
             session: Active SQLAlchemy session
             builder: WikiContextBuilder instance
+            names: Restrict to these index configs (None = all); the
+                per-year entry pages come with "entries"
+            changed: Rows changed since the indexes were last generated
+                (table name -> ids); None regenerates every page
         """
+        self._page = None
+        kept = 0
         for config in INDEX_CONFIGS:
+            if names is not None and config.name not in names:
+                continue
+            output_path = self.output_dir / config.output_path
+            if (
+                changed is not None
+                and config.tables
+                and changed.keys().isdisjoint(config.tables)
+                and output_path.exists()
+            ):
+                self._mark_generated(output_path)
+                kept += 1
+                continue
+
             context_fn = getattr(self, config.context_method)
             ctx = context_fn(session)
-            output_path = self.output_dir / config.output_path
 
-            self.renderer.render_to_file(
+            self._render(
                 config.template, ctx, output_path
             )
-            self.generated_files.add(output_path)
+            self._mark_generated(output_path)
 
         # Per-year entry subpages
-        self._generate_entry_year_pages(session)
+        if names is None or "entries" in names:
+            kept += self._generate_entry_year_pages(
+                session, reuse=changed is not None and "entries" not in changed
+            )
+
+        if changed is not None:
+            self.stats["indexes_pages_unchanged"] = kept
+            safe_logger(self.logger).log_info(
+                f"Incremental indexes generation: "
+                f"{sum(len(ids) for ids in changed.values())} changed rows, "
+                f"{kept} pages unchanged"
+            )
 
     def _generate_entry_year_pages(
-        self, session: Session
-    ) -> None:
+        self, session: Session, reuse: bool = False
+    ) -> int:
         """
         Generate per-year entry index subpages.
 
@@ -791,19 +1378,34 @@ class WikiExporter:
 
         Args:
             session: Active SQLAlchemy session
+            reuse: Entries are unchanged; keep the pages if every
+                year's file exists
+
+        Returns:
+            Number of pages kept without rendering
         """
         from collections import defaultdict as dd
 
-        entries = (
-            session.query(Entry)
-            .order_by(Entry.date.desc())
-            .all()
-        )
+        if reuse:
+            year = extract("year", Entry.date)
+            years = session.execute(select(year).distinct()).scalars().all()
+            paths = [
+                self.output_dir / "indexes" / f"entries-{y}.md" for y in years
+            ]
+            if all(path.exists() for path in paths):
+                for path in paths:
+                    self._mark_generated(path)
+                return len(paths)
+
+        # Listings read only the date, so load rows rather than entities
+        rows = session.execute(
+            select(Entry.date).order_by(Entry.date.desc())
+        ).all()
 
         # Group entries by year
-        by_year: Dict[int, List[Entry]] = dd(list)
-        for entry in entries:
-            by_year[entry.date.year].append(entry)
+        by_year: Dict[int, List[Any]] = dd(list)
+        for row in rows:
+            by_year[row.date.year].append(row)
 
         builder = WikiContextBuilder(session)
         for year, year_entries in sorted(by_year.items(), reverse=True):
@@ -817,10 +1419,11 @@ class WikiExporter:
             output_path = (
                 self.output_dir / "indexes" / f"entries-{year}.md"
             )
-            self.renderer.render_to_file(
+            self._render(
                 "indexes/entries_year.jinja2", ctx, output_path
             )
-            self.generated_files.add(output_path)
+            self._mark_generated(output_path)
+        return 0
 
     def _cleanup_orphans(self) -> None:
         """
@@ -828,14 +1431,26 @@ class WikiExporter:
 
         Only walks directories that contain at least one generated file,
         so a partial generation cannot delete files in unrelated sections.
+        Files of pages an incremental run regenerated (or found gone) and
+        did not write again are removed even outside those directories.
         """
+        removed = 0
+        for section, keys in self._replaced.items():
+            pages = self._index.pages.get(section, {}) if self._index else {}
+            for key in keys & pages.keys():
+                for rel_path in pages[key].files:
+                    path = self.output_dir / rel_path
+                    if path not in self.generated_files and path.exists():
+                        path.unlink()
+                        removed += 1
+
         if not self.generated_files:
+            self.stats["orphans_removed"] = removed
             return
 
         # Collect the set of directories that contain generated files
         generated_dirs = {f.parent for f in self.generated_files}
 
-        removed = 0
         for directory in generated_dirs:
             if not directory.exists():
                 continue
@@ -858,145 +1473,27 @@ class WikiExporter:
     # ==============================================================
 
     def _build_wikilink_targets(
-        self, session: Session
+        self, session: Session, full: bool = False
     ) -> Dict[str, str]:
         """
-        Build a lookup table mapping display names to absolute wiki paths.
+        Load the lookup table mapping display names to absolute wiki paths.
 
-        Queries all entity types and maps each entity's display name to
-        its absolute wiki path (with leading ``/``). This table is
-        injected into the Jinja2 environment so the ``wikilink`` filter
-        can resolve names to correct paths regardless of which page
-        directory the link appears in.
+        Reads the persisted wikilink target index (refreshing the rows of
+        entities changed since the last run). This table is injected into
+        the Jinja2 environment so the ``wikilink`` filter can resolve
+        names to correct paths regardless of which page directory the
+        link appears in.
 
         Args:
             session: Active SQLAlchemy session
+            full: Rebuild the whole target index first
 
         Returns:
             Dict mapping display_name → absolute wiki path (no extension)
         """
-        targets: Dict[str, str] = {}
-        collisions: list[str] = []
-
-        def _register(name: str, path: str) -> None:
-            """Register a wikilink target, logging collisions."""
-            if name in targets and targets[name] != path:
-                collisions.append(
-                    f"  '{name}': {targets[name]} vs {path}"
-                )
-                return
-            targets[name] = path
-
-        # Entries: date string → /journal/entries/YYYY/YYYY-MM-DD
-        for entry in session.query(Entry).all():
-            date_str = entry.date.isoformat()
-            year = entry.date.strftime("%Y")
-            _register(date_str, f"/journal/entries/{year}/{date_str}")
-
-        # People: display_name → /journal/people/{slug}
-        for person in session.query(Person).all():
-            _register(
-                person.display_name,
-                f"/journal/people/{person.slug}",
-            )
-
-        # Cities: name → /journal/cities/{slug}
-        for city in session.query(City).all():
-            _register(
-                city.name,
-                f"/journal/cities/{slugify(city.name)}",
-            )
-
-        # Locations: name → /journal/locations/{city_slug}/{loc_slug}
-        for loc in session.query(Location).all():
-            city_slug = slugify(loc.city.name)
-            loc_slug = slugify(loc.name)
-            _register(
-                loc.name,
-                f"/journal/locations/{city_slug}/{loc_slug}",
-            )
-
-        # Events: name → /journal/events/{slug}
-        for event in session.query(Event).all():
-            _register(
-                event.name,
-                f"/journal/events/{slugify(event.name)}",
-            )
-
-        # Arcs: name → /journal/arcs/{slug}
-        for arc in session.query(Arc).all():
-            _register(
-                arc.name,
-                f"/journal/arcs/{slugify(arc.name)}",
-            )
-
-        # Tags: name → /journal/tags/{slug}
-        for tag in session.query(Tag).all():
-            _register(
-                tag.name,
-                f"/journal/tags/{slugify(tag.name)}",
-            )
-
-        # Themes: name → /journal/themes/{slug} (multi-entry only)
-        for theme in session.query(Theme).all():
-            if theme.usage_count > 1:
-                _register(
-                    theme.name,
-                    f"/journal/themes/{slugify(theme.name)}",
-                )
-
-        # Motifs: name → /journal/motifs/{slug}
-        for motif in session.query(Motif).all():
-            _register(
-                motif.name,
-                f"/journal/motifs/{slugify(motif.name)}",
-            )
-
-        # Poems: title → /journal/poems/{slug}
-        for poem in session.query(Poem).all():
-            _register(
-                poem.title,
-                f"/journal/poems/{slugify(poem.title)}",
-            )
-
-        # Reference sources: title → /journal/references/{slug}
-        for source in session.query(ReferenceSource).all():
-            _register(
-                source.title,
-                f"/journal/references/{slugify(source.title)}",
-            )
-
-        # Chapters: title → /manuscript/chapters/{slug}
-        for chapter in session.query(Chapter).all():
-            _register(
-                chapter.title,
-                f"/manuscript/chapters/{slugify(chapter.title)}",
-            )
-
-        # Characters: name → /manuscript/characters/{slug}
-        for character in session.query(Character).all():
-            _register(
-                character.name,
-                f"/manuscript/characters/{slugify(character.name)}",
-            )
-
-        # Manuscript scenes: name → /manuscript/scenes/{slug}
-        for scene in session.query(ManuscriptScene).all():
-            _register(
-                scene.name,
-                f"/manuscript/scenes/{slugify(scene.name)}",
-            )
-
-        # Parts: display_name → /manuscript/parts/{filename_stem}
-        for part in session.query(Part).all():
-            stem = (
-                slugify(part.title) if part.title
-                else f"part-{part.number}"
-            )
-            _register(
-                part.display_name,
-                f"/manuscript/parts/{stem}",
-            )
+        if full:
+            refresh_link_targets(session, full=True)
+        targets, collisions = load_link_targets(session)
 
         if collisions:
             safe_logger(self.logger).log_warning(
@@ -1019,27 +1516,36 @@ class WikiExporter:
         """
         Build context for main index page.
 
+        Every count is a scalar subquery of one statement.
+
         Args:
             session: Active SQLAlchemy session
 
         Returns:
             Dict with section counts and links
         """
-        return {
-            "entry_count": session.query(Entry).count(),
-            "person_count": session.query(Person).count(),
-            "location_count": session.query(Location).count(),
-            "city_count": session.query(City).count(),
-            "event_count": session.query(Event).count(),
-            "arc_count": session.query(Arc).count(),
-            "tag_count": session.query(Tag).count(),
-            "poem_count": session.query(Poem).count(),
-            "reference_count": session.query(ReferenceSource).count(),
-            "motif_count": session.query(Motif).count(),
-            "chapter_count": session.query(Chapter).count(),
-            "character_count": session.query(Character).count(),
-            "manuscript_scene_count": session.query(ManuscriptScene).count(),
+        models = {
+            "entry_count": Entry,
+            "person_count": Person,
+            "location_count": Location,
+            "city_count": City,
+            "event_count": Event,
+            "arc_count": Arc,
+            "tag_count": Tag,
+            "poem_count": Poem,
+            "reference_count": ReferenceSource,
+            "motif_count": Motif,
+            "chapter_count": Chapter,
+            "character_count": Character,
+            "manuscript_scene_count": ManuscriptScene,
         }
+        counts = session.execute(
+            select(*(
+                select(func.count()).select_from(model).scalar_subquery()
+                for model in models.values()
+            ))
+        ).one()
+        return dict(zip(models, counts))
 
     def _build_people_index_context(
         self, session: Session
@@ -1055,7 +1561,17 @@ class WikiExporter:
         Returns:
             Dict with people grouped by relation
         """
-        people = session.query(Person).all()
+        counts = _count_by(session, entry_people.c.person_id)
+        people = session.execute(
+            select(
+                Person.id,
+                Person.name,
+                Person.lastname,
+                Person.disambiguator,
+                Person.slug,
+                Person.relation_type,
+            ).order_by(Person.id)
+        ).all()
         groups: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
 
         for person in people:
@@ -1067,9 +1583,11 @@ class WikiExporter:
                 else "Uncategorized"
             )
             groups[rel].append({
-                "display_name": person.display_name,
+                "display_name": Person.format_display_name(
+                    person.name, person.lastname, person.disambiguator
+                ),
                 "slug": person.slug,
-                "entry_count": person.entry_count,
+                "entry_count": counts.get(person.id, 0),
             })
 
         # Sort each group by entry count descending
@@ -1093,12 +1611,30 @@ class WikiExporter:
         Returns:
             Dict with cities containing neighborhoods and locations
         """
-        cities = session.query(City).all()
+        city_counts = _count_by(session, entry_cities.c.city_id)
+        location_counts = _count_by(session, entry_locations.c.location_id)
+        cities = session.execute(
+            select(City.id, City.name, City.country).order_by(City.id)
+        ).all()
+        locations = session.execute(
+            select(
+                Location.id,
+                Location.name,
+                Location.city_id,
+                Location.neighborhood,
+            ).order_by(Location.id)
+        ).all()
+        city_locations: Dict[int, List[Any]] = defaultdict(list)
+        for loc in locations:
+            city_locations[loc.city_id].append(loc)
+
         result = []
-        for city in sorted(cities, key=lambda c: c.entry_count, reverse=True):
+        for city in sorted(
+            cities, key=lambda c: city_counts.get(c.id, 0), reverse=True
+        ):
             locs = sorted(
-                city.locations,
-                key=lambda loc: loc.entry_count,
+                city_locations[city.id],
+                key=lambda loc: location_counts.get(loc.id, 0),
                 reverse=True,
             )
 
@@ -1106,10 +1642,11 @@ class WikiExporter:
                 defaultdict(list)
             )
             for loc in locs:
-                if loc.entry_count >= 3:
+                entry_count = location_counts.get(loc.id, 0)
+                if entry_count >= 3:
                     hood_locs[loc.neighborhood].append({
                         "name": loc.name,
-                        "entry_count": loc.entry_count,
+                        "entry_count": entry_count,
                     })
 
             neighborhoods = []
@@ -1129,16 +1666,15 @@ class WikiExporter:
             result.append({
                 "name": city.name,
                 "country": city.country,
-                "entry_count": city.entry_count,
+                "entry_count": city_counts.get(city.id, 0),
                 "any_neighborhoods": len(neighborhoods) > 0,
                 "neighborhoods": neighborhoods,
                 "locations": ungrouped,
             })
-        total_locations = sum(len(city.locations) for city in cities)
         return {
             "cities": result,
             "city_count": len(result),
-            "location_count": total_locations,
+            "location_count": len(locations),
         }
 
     def _build_entries_index_context(
@@ -1148,8 +1684,9 @@ class WikiExporter:
         Build context for Entry index page (year summary with links).
 
         Produces a flat list of year summaries with per-month entry
-        counts for the top-level index. Per-year detail pages are
-        generated separately by ``_generate_entry_year_pages``.
+        counts for the top-level index, counted by one GROUP BY.
+        Per-year detail pages are generated separately by
+        ``_generate_entry_year_pages``.
 
         Args:
             session: Active SQLAlchemy session
@@ -1158,17 +1695,16 @@ class WikiExporter:
             Dict with year_summaries list and total_count
         """
         import calendar
-        from collections import Counter, defaultdict
 
-        entries = (
-            session.query(Entry)
-            .order_by(Entry.date.desc())
-            .all()
-        )
+        year = extract("year", Entry.date)
+        month = extract("month", Entry.date)
+        rows = session.execute(
+            select(year, month, func.count()).group_by(year, month)
+        ).all()
 
-        year_months: Dict[int, Counter] = defaultdict(Counter)
-        for entry in entries:
-            year_months[entry.date.year][entry.date.month] += 1
+        year_months: Dict[int, Dict[int, int]] = defaultdict(dict)
+        for row_year, row_month, count in rows:
+            year_months[row_year][row_month] = count
 
         year_summaries = []
         for year in sorted(year_months.keys(), reverse=True):
@@ -1189,7 +1725,7 @@ class WikiExporter:
 
         return {
             "year_summaries": year_summaries,
-            "total_count": len(entries),
+            "total_count": sum(count for _y, _m, count in rows),
         }
 
     def _build_events_index_context(
@@ -1206,7 +1742,11 @@ class WikiExporter:
         """
         import calendar
 
-        events = session.query(Event).all()
+        entry_stats = _entry_stats(session, event_entries, "event_id")
+        scene_counts = _count_by(session, event_scenes.c.event_id)
+        events = session.execute(
+            select(Event.id, Event.name).order_by(Event.id)
+        ).all()
 
         dated: Dict[int, Dict[int, List[Dict[str, Any]]]] = defaultdict(
             lambda: defaultdict(list)
@@ -1214,14 +1754,15 @@ class WikiExporter:
         undated: List[Dict[str, Any]] = []
 
         for event in events:
-            entry_dates = [e.date for e in event.entries]
+            entry_count, min_date, _last = entry_stats.get(
+                event.id, (0, None, None)
+            )
             event_dict = {
                 "name": event.name,
-                "scene_count": event.scene_count,
-                "entry_count": event.entry_count,
+                "scene_count": scene_counts.get(event.id, 0),
+                "entry_count": entry_count,
             }
-            if entry_dates:
-                min_date = min(entry_dates)
+            if min_date is not None:
                 dated[min_date.year][min_date.month].append(
                     (min_date, event_dict)
                 )
@@ -1261,28 +1802,24 @@ class WikiExporter:
         Returns:
             Dict with all arcs and their metadata
         """
-        arcs = session.query(Arc).all()
-        return {
-            "arc_count": len(arcs),
-            "arcs": [
-                {
-                    "name": arc.name,
-                    "description": arc.description,
-                    "entry_count": arc.entry_count,
-                    "first_date": (
-                        arc.first_entry_date.isoformat()
-                        if arc.first_entry_date else None
-                    ),
-                    "last_date": (
-                        arc.last_entry_date.isoformat()
-                        if arc.last_entry_date else None
-                    ),
-                }
-                for arc in sorted(
-                    arcs, key=lambda a: a.entry_count, reverse=True
-                )
-            ]
-        }
+        entry_stats = _entry_stats(session, arc_entries, "arc_id")
+        arcs = session.execute(
+            select(Arc.id, Arc.name, Arc.description).order_by(Arc.id)
+        ).all()
+
+        result = []
+        for arc in arcs:
+            entry_count, first, last = entry_stats.get(arc.id, (0, None, None))
+            result.append({
+                "name": arc.name,
+                "description": arc.description,
+                "entry_count": entry_count,
+                "first_date": first.isoformat() if first else None,
+                "last_date": last.isoformat() if last else None,
+            })
+        result.sort(key=lambda a: a["entry_count"], reverse=True)
+
+        return {"arc_count": len(arcs), "arcs": result}
 
     def _build_tags_index_context(
         self, session: Session
@@ -1296,26 +1833,27 @@ class WikiExporter:
         Returns:
             Dict with alphabetically sorted tags
         """
-        tags = session.query(Tag).all()
+        counts = _count_by(session, entry_tags.c.tag_id)
+        tags = session.execute(select(Tag.id, Tag.name).order_by(Tag.id)).all()
 
         return {
             "tags": [
-                {"name": t.name, "count": t.usage_count}
+                {"name": t.name, "count": counts.get(t.id, 0)}
                 for t in sorted(
                     tags, key=lambda t: t.name.lower()
                 )
             ],
         }
 
-
     def _build_motifs_index_context(
         self, session: Session
     ) -> Dict[str, Any]:
         """
         Build context for Motifs index page.
 
-        Queries all motifs with instance counts, date ranges, and
-        the most recent instance description for each.
+        Reads one (motif, entry date, description) row per instance
+        for instance counts, date ranges, and the most recent
+        instance description of each motif.
 
         Args:
             session: Active SQLAlchemy session
@@ -1323,37 +1861,44 @@ class WikiExporter:
         Returns:
             Dict with frequency-sorted motifs and total instance count
         """
-        motifs = session.query(Motif).all()
+        motifs = session.execute(
+            select(Motif.id, Motif.name).order_by(Motif.id)
+        ).all()
+        instances: Dict[int, List[Any]] = defaultdict(list)
+        for row in session.execute(
+            select(
+                MotifInstance.motif_id,
+                MotifInstance.entry_id,
+                MotifInstance.description,
+                Entry.date,
+            )
+            .join(Entry, Entry.id == MotifInstance.entry_id)
+            .order_by(Entry.date, MotifInstance.id)
+        ):
+            instances[row.motif_id].append(row)
 
         result = []
         total_instances = 0
         for m in sorted(
-            motifs, key=lambda m: m.instance_count, reverse=True
+            motifs, key=lambda m: len(instances[m.id]), reverse=True
         ):
-            count = m.instance_count
-            total_instances += count
-
-            entries = sorted(
-                [i.entry for i in m.instances if i.entry],
-                key=lambda e: e.date,
-            )
-            first = entries[0].date.isoformat() if entries else None
-            last = entries[-1].date.isoformat() if entries else None
+            rows = instances[m.id]
+            total_instances += len(rows)
 
             # Most recent instance description
             latest = None
-            if entries:
-                latest_entry = entries[-1]
-                for inst in m.instances:
-                    if inst.entry_id == latest_entry.id:
-                        latest = inst.description
-                        break
+            if rows:
+                latest_entry_id = rows[-1].entry_id
+                latest = next(
+                    row.description for row in rows
+                    if row.entry_id == latest_entry_id
+                )
 
             result.append({
                 "name": m.name,
-                "instance_count": count,
-                "first_date": first,
-                "last_date": last,
+                "instance_count": len(rows),
+                "first_date": rows[0].date.isoformat() if rows else None,
+                "last_date": rows[-1].date.isoformat() if rows else None,
                 "latest_description": latest,
             })
 
@@ -1374,21 +1919,22 @@ class WikiExporter:
         Returns:
             Dict with all poems and version counts
         """
-        poems = session.query(Poem).all()
-        return {
-            "poem_count": len(poems),
-            "poems": [
-                {
-                    "title": p.title,
-                    "version_count": p.version_count,
-                    "first_appearance": (
-                        p.first_appearance.isoformat()
-                        if p.first_appearance else None
-                    ),
-                }
-                for p in sorted(poems, key=lambda p: p.title)
-            ]
-        }
+        version_stats = _entry_stats(session, PoemVersion.__table__, "poem_id")
+        poems = session.execute(
+            select(Poem.id, Poem.title).order_by(Poem.id)
+        ).all()
+
+        result = []
+        for p in sorted(poems, key=lambda p: p.title):
+            version_count, first, _last = version_stats.get(
+                p.id, (0, None, None)
+            )
+            result.append({
+                "title": p.title,
+                "version_count": version_count,
+                "first_appearance": first.isoformat() if first else None,
+            })
+        return {"poem_count": len(poems), "poems": result}
 
     def _build_references_index_context(
         self, session: Session
@@ -1404,7 +1950,15 @@ class WikiExporter:
         Returns:
             Dict with sources grouped by type
         """
-        sources = session.query(ReferenceSource).all()
+        counts = _count_by(session, Reference.source_id)
+        sources = session.execute(
+            select(
+                ReferenceSource.id,
+                ReferenceSource.title,
+                ReferenceSource.author,
+                ReferenceSource.type,
+            ).order_by(ReferenceSource.id)
+        ).all()
         groups: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
 
         for source in sources:
@@ -1412,7 +1966,7 @@ class WikiExporter:
             groups[type_name].append({
                 "title": source.title,
                 "author": source.author,
-                "reference_count": source.reference_count,
+                "reference_count": counts.get(source.id, 0),
             })
 
         # Sort each group by reference count
@@ -1424,6 +1978,37 @@ class WikiExporter:
         total_sources = sum(len(srcs) for srcs in groups.values())
         return {"groups": dict(groups), "source_count": total_sources}
 
+    def _character_loads(
+        self, session: Session
+    ) -> Dict[int, Tuple[int, int, int]]:
+        """
+        Count each character's scenes, chapters and unassigned scenes.
+
+        Args:
+            session: Active SQLAlchemy session
+
+        Returns:
+            Character id -> (scene count, chapter count, loose scenes)
+        """
+        scenes: Dict[int, List[Optional[int]]] = defaultdict(list)
+        for character_id, chapter_id in session.execute(
+            select(scene_characters.c.character_id, ManuscriptScene.chapter_id)
+            .join(
+                ManuscriptScene,
+                ManuscriptScene.id == scene_characters.c.manuscript_scene_id,
+            )
+        ):
+            scenes[character_id].append(chapter_id)
+
+        return {
+            character_id: (
+                len(chapter_ids),
+                len({id_ for id_ in chapter_ids if id_ is not None}),
+                chapter_ids.count(None),
+            )
+            for character_id, chapter_ids in scenes.items()
+        }
+
     def _build_manuscript_index_context(
         self, session: Session
     ) -> Dict[str, Any]:
@@ -1443,57 +2028,67 @@ class WikiExporter:
             scene_status_counts
         """
         builder = WikiContextBuilder(session)
-        parts = session.query(Part).all()
-        all_chapters = session.query(Chapter).all()
-        all_scenes = session.query(ManuscriptScene).all()
-
-        # Find chapters not assigned to any part
-        assigned_ids = set()
-        for part in parts:
-            for ch in part.chapters:
-                assigned_ids.add(ch.id)
-
-        unassigned_chapters = [
-            ch for ch in all_chapters if ch.id not in assigned_ids
-        ]
-
-        # Find scenes not assigned to any chapter
-        unassigned_scenes = [s for s in all_scenes if not s.chapter_id]
-
-        # Progress counts
-        chapter_status_counts = {}
-        for status in ChapterStatus:
-            count = sum(
-                1 for ch in all_chapters if ch.status == status
+        parts = session.query(Part).options(
+            *loader_options(Part, DEPENDS_ON[Part])
+        ).all()
+
+        # Chapters not assigned to any part
+        unassigned_chapters = session.execute(
+            select(
+                Chapter.title, Chapter.number, Chapter.type, Chapter.status
             )
-            if count:
-                chapter_status_counts[status.display_name] = count
-
-        scene_status_counts = {}
-        for status in SceneStatus:
-            count = sum(
-                1 for s in all_scenes if s.status == status
+            .where(Chapter.part_id.is_(None))
+            .order_by(Chapter.id)
+        ).all()
+
+        # Scenes not assigned to any chapter
+        unassigned_scenes = session.execute(
+            select(
+                ManuscriptScene.name,
+                ManuscriptScene.origin,
+                ManuscriptScene.status,
             )
-            if count:
-                scene_status_counts[status.display_name] = count
+            .where(ManuscriptScene.chapter_id.is_(None))
+            .order_by(ManuscriptScene.id)
+        ).all()
+
+        # Progress counts
+        chapter_counts = _count_by(session, Chapter.status)
+        chapter_status_counts = {
+            status.display_name: chapter_counts[status]
+            for status in ChapterStatus
+            if chapter_counts.get(status)
+        }
+        scene_counts = _count_by(session, ManuscriptScene.status)
+        scene_status_counts = {
+            status.display_name: scene_counts[status]
+            for status in SceneStatus
+            if scene_counts.get(status)
+        }
 
         # Top characters for cast mini-dashboard (skip narrators)
-        characters = session.query(Character).all()
+        loads = self._character_loads(session)
+        characters = session.execute(
+            select(
+                Character.id, Character.name, Character.role,
+                Character.is_narrator,
+            ).order_by(Character.id)
+        ).all()
         sorted_chars = sorted(
             (c for c in characters if not c.is_narrator),
-            key=lambda c: (c.scene_count, c.chapter_count),
+            key=lambda c: loads.get(c.id, (0, 0, 0))[:2],
             reverse=True,
         )
         top_n = 5
         top_characters = []
         for c in sorted_chars[:top_n]:
-            loose = sum(1 for s in c.scenes if not s.chapter_id)
+            scene_count, chapter_count, loose = loads.get(c.id, (0, 0, 0))
             # Pre-compute metrics string for clean template rendering
             parts_list = []
-            if c.chapter_count:
+            if chapter_count:
                 ch_str = (
-                    f"{c.chapter_count} chapter"
-                    f"{'s' if c.chapter_count != 1 else ''}"
+                    f"{chapter_count} chapter"
+                    f"{'s' if chapter_count != 1 else ''}"
                 )
                 parts_list.append(ch_str)
             if loose:
@@ -1502,10 +2097,10 @@ class WikiExporter:
                     f"{'s' if loose != 1 else ''}"
                 )
                 parts_list.append(loose_str)
-            elif c.scene_count and not c.chapter_count:
+            elif scene_count and not chapter_count:
                 sc_str = (
-                    f"{c.scene_count} scene"
-                    f"{'s' if c.scene_count != 1 else ''}"
+                    f"{scene_count} scene"
+                    f"{'s' if scene_count != 1 else ''}"
                 )
                 parts_list.append(sc_str)
 
@@ -1525,16 +2120,16 @@ class WikiExporter:
                 {
                     "title": ch.title,
                     "number": ch.number,
-                    "type": ch.type_display,
-                    "status": ch.status_display,
+                    "type": _display(ch.type),
+                    "status": _display(ch.status),
                 }
                 for ch in unassigned_chapters
             ],
             "unassigned_scenes": [
                 {
                     "name": s.name,
-                    "origin": s.origin_display,
-                    "status": s.status_display,
+                    "origin": _display(s.origin),
+                    "status": _display(s.status),
                 }
                 for s in unassigned_scenes
             ],
@@ -1562,31 +2157,48 @@ class WikiExporter:
         Returns:
             Dict with narrators, role_groups, and character_count
         """
-        characters = session.query(Character).all()
+        loads = self._character_loads(session)
+        characters = session.execute(
+            select(
+                Character.id, Character.name, Character.role,
+                Character.is_narrator,
+            ).order_by(Character.id)
+        ).all()
+        based_on: Dict[int, List[str]] = defaultdict(list)
+        for mapping in session.execute(
+            select(
+                PersonCharacterMap.character_id,
+                Person.name,
+                Person.lastname,
+                Person.disambiguator,
+            )
+            .join(Person, Person.id == PersonCharacterMap.person_id)
+            .order_by(PersonCharacterMap.id)
+        ):
+            based_on[mapping.character_id].append(
+                Person.format_display_name(
+                    mapping.name, mapping.lastname, mapping.disambiguator
+                )
+            )
 
         narrators: List[Dict[str, Any]] = []
         groups: Dict[str, List[Dict[str, Any]]] = {}
 
         for c in characters:
-            loose = sum(1 for s in c.scenes if not s.chapter_id)
-            load = c.scene_count + c.chapter_count
+            scene_count, chapter_count, loose = loads.get(c.id, (0, 0, 0))
+            load = scene_count + chapter_count
             parts: List[str] = []
-            if c.chapter_count:
-                parts.append(f"{c.chapter_count} chapter{'s' if c.chapter_count != 1 else ''}")
+            if chapter_count:
+                parts.append(f"{chapter_count} chapter{'s' if chapter_count != 1 else ''}")
                 if loose:
                     parts.append(f"{loose} loose scene{'s' if loose != 1 else ''}")
-            elif c.scene_count:
-                parts.append(f"{c.scene_count} scene{'s' if c.scene_count != 1 else ''}")
-            based_on_names = [
-                mapping.person.display_name
-                for mapping in c.person_mappings
-                if mapping.person
-            ]
+            elif scene_count:
+                parts.append(f"{scene_count} scene{'s' if scene_count != 1 else ''}")
             char_dict = {
                 "name": c.name,
                 "load": load,
                 "metrics": " · ".join(parts),
-                "based_on": ", ".join(based_on_names),
+                "based_on": ", ".join(based_on[c.id]),
             }
 
             if c.is_narrator:
@@ -1628,21 +2240,43 @@ class WikiExporter:
         Returns:
             Dict with chapter_groups, unassigned_scenes, scene_count
         """
-        all_scenes = session.query(ManuscriptScene).all()
+        all_scenes = session.execute(
+            select(
+                ManuscriptScene.name,
+                ManuscriptScene.order,
+                ManuscriptScene.origin,
+                ManuscriptScene.status,
+                ManuscriptScene.chapter_id,
+            ).order_by(ManuscriptScene.id)
+        ).all()
         chapters = sorted(
-            session.query(Chapter).all(),
+            session.execute(
+                select(
+                    Chapter.id,
+                    Chapter.title,
+                    Chapter.number,
+                    Chapter.part_id,
+                    Part.number.label("part_number"),
+                )
+                .outerjoin(Part, Part.id == Chapter.part_id)
+                .order_by(Chapter.id)
+            ).all(),
             key=lambda ch: (
-                ch.part.number if ch.part else 999,
+                ch.part_number if ch.part_id is not None else 999,
                 ch.number if ch.number is not None else 999,
                 ch.title,
             ),
         )
 
+        scenes_by_chapter: Dict[Optional[int], List[Any]] = defaultdict(list)
+        for s in all_scenes:
+            scenes_by_chapter[s.chapter_id].append(s)
+
         # Group scenes by chapter (ordered by part/number)
         chapter_groups: Dict[str, List[Dict[str, Any]]] = {}
         for ch in chapters:
             ch_scenes = sorted(
-                [s for s in all_scenes if s.chapter_id == ch.id],
+                scenes_by_chapter.get(ch.id, []),
                 key=lambda s: (s.order is None, s.order or 0, s.name),
             )
             if ch_scenes:
@@ -1650,8 +2284,8 @@ class WikiExporter:
                     {
                         "name": s.name,
                         "order": s.order,
-                        "origin": s.origin_display,
-                        "status": s.status_display,
+                        "origin": _display(s.origin),
+                        "status": _display(s.status),
                     }
                     for s in ch_scenes
                 ]
@@ -1659,11 +2293,10 @@ class WikiExporter:
         unassigned = [
             {
                 "name": s.name,
-                "origin": s.origin_display,
-                "status": s.status_display,
+                "origin": _display(s.origin),
+                "status": _display(s.status),
             }
-            for s in all_scenes
-            if not s.chapter_id
+            for s in scenes_by_chapter.get(None, [])
         ]
 
         return {
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+link_targets.py
+---------------
+Persisted wikilink target index, refreshed from the change log.
+
+Every linkable entity (entries, people, places, tags, manuscript
+chapters, ...) has one wikilink name and one absolute wiki path. The
+generator resolves ``[[name]]`` through them, the linter checks links
+against them, and the markdown-it wikilink plugin turns them into
+hrefs. The ``wikilink_targets`` table holds them so none of these has
+to query and slugify every entity on every run.
+
+Key Features:
+    - refresh_link_targets: rewrites the rows of entities changed since
+      its watermark (a renamed city rewrites its locations' paths), or
+      every row on first run
+    - The ``wikilinks`` watermark is the index version: readers that
+      cache targets compare it to know when to reload
+    - load_link_targets: name -> path map in registration order, with
+      first-registered-wins collision reporting
+    - known_targets: lowercased names and paths, for link validation
+    - resolve_target: entity id from a page key such as ``clara`` or
+      ``montreal/cafe`` (the wiki path tail) or a wikilink name
+
+Usage:
+    from dev.wiki.link_targets import load_link_targets, known_targets
+
+    targets, collisions = load_link_targets(session)
+    targets["Clara Dupont"]  # "/journal/people/clara-dupont"
+
+    known = known_targets(session)
+    "clara dupont" in known  # True
+"""
+# --- Annotations ---
+from __future__ import annotations
+
+# --- Standard library imports ---
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+# --- Third-party imports ---
+from sqlalchemy import inspect, select
+from sqlalchemy.orm import Session, selectinload
+
+# --- Local imports ---
+from dev.database.change_tracking import (
+    changes_since,
+    get_watermark,
+    latest_change_id,
+    set_watermark,
+)
+from dev.database.models import (
+    Arc,
+    City,
+    EntityChange,
+    Entry,
+    Event,
+    Location,
+    Motif,
+    Person,
+    Poem,
+    ReferenceSource,
+    Tag,
+    Theme,
+    WikilinkTarget,
+)
+from dev.database.models.manuscript import (
+    Chapter,
+    Character,
+    ManuscriptScene,
+    Part,
+)
+from dev.utils.slugify import slugify
+
+
+# Change-log consumer name of the wikilink target table
+WIKILINKS_CONSUMER = "wikilinks"
+
+# Entity ids per SELECT / DELETE statement
+ID_CHUNK = 500
+
+
+def _entry_target(entry: Entry) -> Tuple[str, str]:
+    """Entries link by ISO date to /journal/entries/YYYY/YYYY-MM-DD."""
+    date_str = entry.date.isoformat()
+    return date_str, f"/journal/entries/{entry.date.strftime('%Y')}/{date_str}"
+
+
+def _person_target(person: Person) -> Tuple[str, str]:
+    """People link by display name to their slug."""
+    return person.display_name, f"/journal/people/{person.slug}"
+
+
+def _location_target(location: Location) -> Tuple[str, str]:
+    """Locations live under their city's slug."""
+    city_slug = slugify(location.city.name)
+    return location.name, f"/journal/locations/{city_slug}/{slugify(location.name)}"
+
+
+def _theme_target(theme: Theme) -> Optional[Tuple[str, str]]:
+    """Themes link only once used by several entries (no page before)."""
+    if theme.usage_count <= 1:
+        return None
+    return theme.name, f"/journal/themes/{slugify(theme.name)}"
+
+
+def _part_target(part: Part) -> Tuple[str, str]:
+    """Parts link by display name; untitled parts by number."""
+    stem = slugify(part.title) if part.title else f"part-{part.number}"
+    return part.display_name, f"/manuscript/parts/{stem}"
+
+
+def _named(directory: str, attr: str = "name") -> Callable[[Any], Tuple[str, str]]:
+    """Target builder for entities whose path is ``directory/slug(attr)``."""
+    def target(entity: Any) -> Tuple[str, str]:
+        name = getattr(entity, attr)
+        return name, f"{directory}/{slugify(name)}"
+    return target
+
+
+# Table name -> (model, loader options, target builder), in registration
+# order: when two entities share a name, the earlier one keeps the link
+TARGET_TYPES: Dict[str, Tuple[Any, Tuple[Any, ...], Callable[[Any], Any]]] = {
+    "entries": (Entry, (), _entry_target),
+    "people": (Person, (), _person_target),
+    "cities": (City, (), _named("/journal/cities")),
+    "locations": (Location, (selectinload(Location.city),), _location_target),
+    "events": (Event, (), _named("/journal/events")),
+    "arcs": (Arc, (), _named("/journal/arcs")),
+    "tags": (Tag, (), _named("/journal/tags")),
+    "themes": (Theme, (selectinload(Theme.instances),), _theme_target),
+    "motifs": (Motif, (), _named("/journal/motifs")),
+    "poems": (Poem, (), _named("/journal/poems", "title")),
+    "reference_sources": (
+        ReferenceSource, (), _named("/journal/references", "title"),
+    ),
+    "chapters": (Chapter, (), _named("/manuscript/chapters", "title")),
+    "characters": (Character, (), _named("/manuscript/characters")),
+    "manuscript_scenes": (ManuscriptScene, (), _named("/manuscript/scenes")),
+    "parts": (Part, (), _part_target),
+}
+
+
+def _chunks(ids: Set[int]) -> List[List[int]]:
+    """Split ids into statement-sized lists."""
+    ordered = sorted(ids)
+    return [ordered[i:i + ID_CHUNK] for i in range(0, len(ordered), ID_CHUNK)]
+
+
+def _rewrite(session: Session, subjects: Optional[Dict[str, Set[int]]]) -> int:
+    """
+    Replace the target rows of some (or all) entities.
+
+    Args:
+        session: Active session
+        subjects: Table name -> ids to rewrite (None = everything);
+            ids of deleted entities just lose their rows
+
+    Returns:
+        Number of target rows written
+    """
+    table = WikilinkTarget.__table__
+    rows: List[Dict[str, Any]] = []
+
+    for entity_type, (model, options, build) in TARGET_TYPES.items():
+        if subjects is None:
+            session.execute(table.delete().where(table.c.entity_type == entity_type))
+            batches = [
+                session.execute(select(model).options(*options)).scalars().all()
+            ]
+        else:
+            batches = []
+            for chunk in _chunks(subjects.get(entity_type, set())):
+                session.execute(table.delete().where(
+                    table.c.entity_type == entity_type,
+                    table.c.entity_id.in_(chunk),
+                ))
+                batches.append(session.execute(
+                    select(model).where(model.id.in_(chunk)).options(*options)
+                ).scalars().all())
+        for batch in batches:
+            for entity in batch:
+                target = build(entity)
+                if target is not None:
+                    rows.append({
+                        "entity_type": entity_type,
+                        "entity_id": entity.id,
+                        "name": target[0],
+                        "path": target[1],
+                    })
+
+    if rows:
+        session.execute(table.insert(), rows)
+    return len(rows)
+
+
+def _affected_subjects(
+    session: Session, changed: Dict[str, Set[int]]
+) -> Dict[str, Set[int]]:
+    """
+    Find the entities whose target a set of changes can affect.
+
+    These are the changed entities plus the locations of changed cities
+    (a location's path contains its city). Theme instances touch their
+    theme in the change log, so page-gaining themes are already listed.
+
+    Args:
+        session: Active session
+        changed: Table name -> changed ids, from the change log
+
+    Returns:
+        Table name -> ids to rewrite
+    """
+    subjects = {
+        entity_type: set(changed.get(entity_type, ()))
+        for entity_type in TARGET_TYPES
+    }
+    for chunk in _chunks(changed.get("cities", set())):
+        subjects["locations"].update(session.execute(
+            select(Location.id).where(Location.city_id.in_(chunk))
+        ).scalars())
+    return subjects
+
+
+def refresh_link_targets(session: Session, full: bool = False) -> int:
+    """
+    Bring the wikilink target table up to date with the session's data.
+
+    Without a change log (or on first run) every row is rewritten;
+    otherwise only the rows of entities changed since the ``wikilinks``
+    watermark. Pending ORM changes are flushed first.
+
+    Args:
+        session: Active session (caller commits)
+        full: Rewrite every row regardless of the watermark
+
+    Returns:
+        Number of target rows written
+    """
+    session.flush()
+    tracked = inspect(session.get_bind()).has_table(EntityChange.__tablename__)
+    watermark = get_watermark(session, WIKILINKS_CONSUMER) if tracked else None
+
+    if watermark is None or full:
+        head = latest_change_id(session) if tracked else None
+        written = _rewrite(session, None)
+    else:
+        head, changed = changes_since(session, watermark)
+        if head == watermark:
+            return 0
+        written = _rewrite(session, _affected_subjects(session, changed))
+
+    if head is not None:
+        set_watermark(session, WIKILINKS_CONSUMER, head)
+    return written
+
+
+def _rows(session: Session, refresh: bool) -> List[Any]:
+    """Target rows in registration order, refreshing first if asked."""
+    if refresh:
+        refresh_link_targets(session)
+    order = {entity_type: i for i, entity_type in enumerate(TARGET_TYPES)}
+    rows = session.execute(select(WikilinkTarget.__table__)).all()
+    rows.sort(key=lambda row: (order.get(row.entity_type, len(order)), row.entity_id))
+    return rows
+
+
+def load_link_targets(
+    session: Session, refresh: bool = True
+) -> Tuple[Dict[str, str], List[str]]:
+    """
+    Load the name -> wiki path map the ``wikilink`` filter resolves with.
+
+    Args:
+        session: Active session
+        refresh: Refresh the table first
+
+    Returns:
+        Tuple of (name -> absolute path, collision descriptions); on a
+        name collision the first-registered entity keeps the name
+    """
+    targets: Dict[str, str] = {}
+    collisions: List[str] = []
+    for row in _rows(session, refresh):
+        existing = targets.get(row.name)
+        if existing is None:
+            targets[row.name] = row.path
+        elif existing != row.path:
+            collisions.append(f"  '{row.name}': {existing} vs {row.path}")
+    return targets, collisions
+
+
+def known_targets(session: Session, refresh: bool = True) -> Set[str]:
+    """
+    Load every string a wikilink may point at, for validation.
+
+    Args:
+        session: Active session
+        refresh: Refresh the table first
+
+    Returns:
+        Lowercased names and absolute paths of every target
+    """
+    known: Set[str] = set()
+    for row in _rows(session, refresh):
+        known.add(row.name.lower())
+        known.add(row.path)
+    return known
+
+
+def resolve_target(
+    session: Session, entity_type: str, key: str, refresh: bool = True
+) -> Optional[int]:
+    """
+    Find the entity a page key names.
+
+    The key matches the tail of the entity's wiki path (``clara``,
+    ``montreal/cafe``, ``2024-03-05``) or, case-insensitively, its
+    wikilink name.
+
+    Args:
+        session: Active session
+        entity_type: Table name of the entity (e.g. "people")
+        key: Path tail or wikilink name
+        refresh: Refresh the table first
+
+    Returns:
+        Entity primary key, or None if no target matches
+    """
+    if refresh:
+        refresh_link_targets(session)
+    table = WikilinkTarget.__table__
+    wanted = key.strip().strip("/").lower()
+    by_name = None
+    for row in session.execute(
+        select(table.c.entity_id, table.c.name, table.c.path)
+        .where(table.c.entity_type == entity_type)
+        .order_by(table.c.entity_id)
+    ):
+        if row.path.lower().endswith(f"/{wanted}"):
+            return row.entity_id
+        if by_name is None and row.name.lower() == wanted:
+            by_name = row.entity_id
+    return by_name
@@ -16,6 +16,8 @@ Key Features:
     - Escaped brackets ``\\[[`` are not treated as wikilinks
     - Wikilinks inside code spans/blocks are naturally ignored by
       markdown-it-py's parsing order
+    - Optional name -> path table (e.g. from dev.wiki.link_targets)
+      resolves targets to hrefs when rendering
 
 Usage:
     from markdown_it import MarkdownIt
@@ -24,6 +26,10 @@ Usage:
     md = MarkdownIt().use(wikilink_plugin)
     tokens = md.parse("Visit [[Clara Dupont]] today")
 
+    # Resolve hrefs through the wikilink target index
+    targets, _ = load_link_targets(session)
+    html = MarkdownIt().use(wikilink_plugin, targets=targets).render(text)
+
     # Access wikilink data via token meta
     for token in tokens[0].children:
         if token.type == "wikilink":
@@ -37,14 +43,16 @@ Dependencies:
 from __future__ import annotations
 
 # --- Standard library imports ---
-from typing import Any, List, Sequence
+from typing import Any, List, Mapping, Optional, Sequence
 
 # --- Third-party imports ---
 from markdown_it import MarkdownIt
 from markdown_it.rules_inline import StateInline
 
 
-def wikilink_plugin(md: MarkdownIt) -> None:
+def wikilink_plugin(
+    md: MarkdownIt, targets: Optional[Mapping[str, str]] = None
+) -> None:
     """
     Register the wikilink inline rule with a MarkdownIt instance.
 
@@ -55,9 +63,12 @@ def wikilink_plugin(md: MarkdownIt) -> None:
 
     Args:
         md: MarkdownIt instance to extend
+        targets: Optional name -> wiki path table; rendered links to a
+            known name point at its path
     """
     md.inline.ruler.push("wikilink", _wikilink_rule)
     md.add_render_rule("wikilink", _wikilink_render)
+    md.options["wikilink_targets"] = targets or {}
 
 
 def _wikilink_rule(state: StateInline, silent: bool) -> bool:
@@ -149,8 +160,10 @@ def _wikilink_render(
     Default HTML render rule for wikilink tokens.
 
     Renders wikilinks as ``<a>`` tags with a ``data-wikilink`` attribute.
-    In practice, wiki pages use custom renderers, but this provides a
-    reasonable default for testing and HTML preview.
+    The href is the target's path from the plugin's targets table, or
+    the raw target when the name is unknown. In practice, wiki pages use
+    custom renderers, but this provides a reasonable default for
+    testing and HTML preview.
 
     Args:
         self: Renderer instance
@@ -165,7 +178,8 @@ def _wikilink_render(
     token = tokens[idx]
     target = token.meta["target"]
     display = token.meta["display"]
-    return f'<a href="{target}" data-wikilink="true">{display}</a>'
+    href = options.get("wikilink_targets", {}).get(target, target)
+    return f'<a href="{href}" data-wikilink="true">{display}</a>'
 
 
 def extract_wikilinks(md: MarkdownIt, text: str) -> List[dict]:
@@ -13,6 +13,11 @@ Key Features:
     - Change detection: only writes files when content differs
     - Support for DictLoader (tests) and FileSystemLoader (production)
     - Consistent markdown output with trailing newline
+    - RenderPool: fan render_to_file calls out to worker processes,
+      each with a warm Environment and the exporter's globals preloaded
+    - Optional persistent bytecode cache, so short-lived processes load
+      compiled templates instead of recompiling them
+    - Load timings (environment setup, template loads, cache hits)
 
 Usage:
     from dev.wiki.renderer import WikiRenderer
@@ -22,10 +27,19 @@ Usage:
     content = renderer.render("journal/entry.jinja2", context)
     changed = renderer.render_to_file("journal/entry.jinja2", context, path)
 
+    # Reuse compiled templates across processes
+    renderer = WikiRenderer(cache_dir=WIKI_TEMPLATE_CACHE_DIR)
+    renderer.timings  # {"setup_ms": ..., "load_ms": ..., "cache_hits": ...}
+
     # Testing: supply templates as dict
     renderer = WikiRenderer(templates={"test.jinja2": "Hello {{ name }}"})
     content = renderer.render("test.jinja2", {"name": "World"})
 
+    # Parallel: contexts must be picklable (plain dicts)
+    pool = RenderPool(renderer, WIKI_TEMPLATES_DIR, workers=4)
+    pool.submit("journal/entry.jinja2", context, path, key="entries_changed")
+    written = pool.close()  # Counter: key -> files written
+
 Dependencies:
     - jinja2>=3.1.0
 """
@@ -33,17 +47,76 @@ Dependencies:
 from __future__ import annotations
 
 # --- Standard library imports ---
+from collections import Counter
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple
 
 # --- Third-party imports ---
 from jinja2 import Environment, FileSystemLoader, DictLoader, BaseLoader
+from jinja2 import FileSystemBytecodeCache, Template
+from jinja2.bccache import Bucket
+from jinja2.defaults import DEFAULT_NAMESPACE
 
 # --- Local imports ---
 from dev.wiki import filters as wiki_filters
 from dev.core.paths import WIKI_TEMPLATES_DIR
 
 
+class TemplateCache(FileSystemBytecodeCache):
+    """
+    Persistent bytecode cache counting hits and misses.
+
+    Jinja2 stores one file per template, keyed by the template name and
+    file, and discards it when the source checksum or the Python
+    bytecode version differs, so edited templates recompile by
+    themselves.
+
+    Attributes:
+        hits: Templates loaded from the cache
+        misses: Templates compiled (and then stored)
+    """
+
+    def __init__(self, directory: Path) -> None:
+        """
+        Initialize the cache, creating its directory.
+
+        Args:
+            directory: Directory holding the cache files
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        super().__init__(str(directory))
+        self.hits = 0
+        self.misses = 0
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        """Load a bucket, counting whether compiled code was found."""
+        super().load_bytecode(bucket)
+        if bucket.code is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+
+def clear_template_cache(directory: Path) -> int:
+    """
+    Delete every compiled template in a cache directory.
+
+    Args:
+        directory: Cache directory
+
+    Returns:
+        Number of cache files removed
+    """
+    if not directory.is_dir():
+        return 0
+    cache = TemplateCache(directory)
+    count = len(list(directory.glob(cache.pattern % "*")))
+    cache.clear()
+    return count
+
+
 class WikiRenderer:
     """
     Jinja2-based wiki page renderer.
@@ -53,12 +126,16 @@ class WikiRenderer:
 
     Attributes:
         env: Configured Jinja2 Environment instance
+        cache_dir: Bytecode cache directory, if any
+        timings: Environment setup and template load timings (ms) and
+            bytecode cache hits/misses
     """
 
     def __init__(
         self,
         templates_dir: Optional[Path] = None,
         templates: Optional[Dict[str, str]] = None,
+        cache_dir: Optional[Path] = None,
     ) -> None:
         """
         Initialize the wiki renderer.
@@ -70,6 +147,8 @@ class WikiRenderer:
         Args:
             templates_dir: Path to templates directory (FileSystemLoader)
             templates: Dict of template_name → template_string (DictLoader)
+            cache_dir: Directory for compiled template bytecode; None
+                compiles templates in memory only
 
         Raises:
             ValueError: If both templates_dir and templates are provided
@@ -79,6 +158,7 @@ class WikiRenderer:
                 "Provide either templates_dir or templates, not both"
             )
 
+        started = perf_counter()
         loader: BaseLoader
         if templates is not None:
             loader = DictLoader(templates)
@@ -87,14 +167,76 @@ class WikiRenderer:
         else:
             loader = FileSystemLoader(str(WIKI_TEMPLATES_DIR))
 
+        self.cache_dir = cache_dir
+        self._cache = TemplateCache(cache_dir) if cache_dir else None
         self.env = Environment(
             loader=loader,
             keep_trailing_newline=True,
             trim_blocks=True,
             lstrip_blocks=True,
+            bytecode_cache=self._cache,
         )
 
         self._register_filters()
+        self._setup_ms = (perf_counter() - started) * 1000
+        self._load_ms = 0.0
+        self._templates: Dict[str, Template] = {}
+
+    @property
+    def timings(self) -> Dict[str, Any]:
+        """
+        Startup cost of this renderer.
+
+        Returns:
+            Dict with setup_ms, load_ms (time spent loading templates,
+            from the bytecode cache or by compiling), templates loaded,
+            and cache_hits/cache_misses when a cache is configured
+        """
+        timings: Dict[str, Any] = {
+            "setup_ms": round(self._setup_ms, 1),
+            "load_ms": round(self._load_ms, 1),
+            "templates": len(self._templates),
+        }
+        if self._cache is not None:
+            timings["cache_hits"] = self._cache.hits
+            timings["cache_misses"] = self._cache.misses
+        return timings
+
+    def get_template(self, template_name: str) -> Template:
+        """
+        Load a template, timing its first load.
+
+        Args:
+            template_name: Template path relative to templates root
+
+        Returns:
+            Compiled template
+        """
+        template = self._templates.get(template_name)
+        if template is None:
+            started = perf_counter()
+            template = self.env.get_template(template_name)
+            self._load_ms += (perf_counter() - started) * 1000
+            self._templates[template_name] = template
+        return template
+
+    def drop_stale(self) -> int:
+        """
+        Forget loaded templates whose source changed on disk.
+
+        Long-lived renderers (the ``plm serve`` daemon) call this before
+        each run so edited templates are reloaded on next use.
+
+        Returns:
+            Number of templates dropped
+        """
+        stale = [
+            name for name, template in self._templates.items()
+            if not template.is_up_to_date
+        ]
+        for name in stale:
+            del self._templates[name]
+        return len(stale)
 
     def _register_filters(self) -> None:
         """
@@ -133,8 +275,7 @@ class WikiRenderer:
         Returns:
             Rendered markdown string
         """
-        template = self.env.get_template(template_name)
-        return template.render(**context)
+        return self.get_template(template_name).render(**context)
 
     def render_to_file(
         self,
@@ -170,3 +311,166 @@ class WikiRenderer:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         output_path.write_text(content, encoding="utf-8")
         return True
+
+
+# ==================== Parallel Rendering ====================
+
+# Pages per worker task; runs queuing fewer pages render in-process
+RENDER_BATCH = 200
+
+# (template name, context, output path, stat key)
+RenderJob = Tuple[str, Dict[str, Any], str, Optional[str]]
+
+# Renderer of the current worker process (set by _init_render_worker)
+_worker_renderer: Optional[WikiRenderer] = None
+
+
+def _init_render_worker(
+    templates_dir: str,
+    cache_dir: Optional[str],
+    env_globals: Dict[str, Any],
+) -> None:
+    """
+    Build the worker's Environment once, at process start.
+
+    Args:
+        templates_dir: Templates root
+        cache_dir: Bytecode cache directory shared with the parent
+        env_globals: Globals to preload (e.g. ``_wikilink_targets``)
+    """
+    global _worker_renderer
+    _worker_renderer = WikiRenderer(
+        Path(templates_dir), cache_dir=Path(cache_dir) if cache_dir else None
+    )
+    _worker_renderer.env.globals.update(env_globals)
+
+
+def _render_batch(jobs: List[RenderJob]) -> List[Optional[str]]:
+    """
+    Render a batch of pages in a worker process.
+
+    Args:
+        jobs: Render jobs
+
+    Returns:
+        Stat keys of the jobs whose file was written
+    """
+    assert _worker_renderer is not None
+    return [
+        key
+        for template, context, path, key in jobs
+        if _worker_renderer.render_to_file(template, context, Path(path))
+    ]
+
+
+class RenderPool:
+    """
+    Render queue fanning pages out to a process pool.
+
+    Jobs are sent in batches of RENDER_BATCH as they are queued, so the
+    caller keeps building contexts (and querying the DB) while workers
+    render. The pool starts with the first full batch; a run queuing
+    fewer pages renders them in the calling process on close().
+
+    Attributes:
+        renderer: Renderer used for in-process rendering
+        templates_dir: Templates root the workers load from
+        workers: Number of worker processes
+    """
+
+    def __init__(
+        self,
+        renderer: WikiRenderer,
+        templates_dir: Path,
+        workers: int,
+        batch_size: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize an idle render pool.
+
+        Args:
+            renderer: Renderer whose globals the workers copy
+            templates_dir: Templates root the workers load from
+            workers: Number of worker processes
+            batch_size: Pages per worker task (None = RENDER_BATCH)
+        """
+        self.renderer = renderer
+        self.templates_dir = templates_dir
+        self.workers = workers
+        self.batch_size = batch_size or RENDER_BATCH
+        self._pending: List[RenderJob] = []
+        self._futures: List[Future] = []
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def submit(
+        self,
+        template_name: str,
+        context: Dict[str, Any],
+        output_path: Path,
+        key: Optional[str] = None,
+    ) -> None:
+        """
+        Queue a page for rendering.
+
+        Args:
+            template_name: Template path relative to templates root
+            context: Template variables (must be picklable)
+            output_path: Destination file path
+            key: Stat key counted in close() if the file is written
+        """
+        self._pending.append((template_name, context, str(output_path), key))
+        if len(self._pending) >= self.batch_size:
+            self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Send the pending jobs to the pool, starting it if needed."""
+        if self._executor is None:
+            cache_dir = self.renderer.cache_dir
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_render_worker,
+                initargs=(
+                    str(self.templates_dir),
+                    str(cache_dir) if cache_dir else None,
+                    {
+                        name: value
+                        for name, value in self.renderer.env.globals.items()
+                        if name not in DEFAULT_NAMESPACE
+                    },
+                ),
+            )
+        self._futures.append(self._executor.submit(_render_batch, self._pending))
+        self._pending = []
+
+    def close(self) -> Counter:
+        """
+        Render everything queued and stop the workers.
+
+        Returns:
+            Stat key -> number of files written
+        """
+        written: Counter = Counter()
+        try:
+            if self._executor is None:
+                for template, context, path, key in self._pending:
+                    if self.renderer.render_to_file(template, context, Path(path)):
+                        written[key] += 1
+            else:
+                if self._pending:
+                    self._dispatch()
+                for future in self._futures:
+                    written.update(future.result())
+        finally:
+            self._pending, self._futures = [], []
+            if self._executor is not None:
+                self._executor.shutdown(cancel_futures=True)
+                self._executor = None
+        written.pop(None, None)
+        return written
+
+    def cancel(self) -> None:
+        """Drop queued pages and stop the workers without waiting."""
+        self._pending, self._futures = [], []
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -128,6 +128,7 @@ class WikiSync:
         wiki_dir: Root wiki directory
         validator: WikiValidator for pre-sync checks
         logger: Optional logger instance
+        cache_dir: Template bytecode cache used for regeneration
     """
 
     def __init__(
@@ -135,6 +136,7 @@ class WikiSync:
         db: PalimpsestDB,
         wiki_dir: Optional[Path] = None,
         logger: Optional[PalimpsestLogger] = None,
+        cache_dir: Optional[Path] = None,
     ) -> None:
         """
         Initialize the wiki sync manager.
@@ -143,9 +145,11 @@ class WikiSync:
             db: PalimpsestDB instance
             wiki_dir: Wiki root directory (defaults to WIKI_DIR)
             logger: Optional logger for progress reporting
+            cache_dir: Template bytecode cache directory (None = none)
         """
         self.db = db
         self.wiki_dir = wiki_dir or WIKI_DIR
+        self.cache_dir = cache_dir
         self.validator = WikiValidator(db)
         self.logger = safe_logger(logger)
 
@@ -291,6 +295,7 @@ class WikiSync:
             self.db,
             output_dir=self.wiki_dir,
             logger=self.logger,
+            cache_dir=self.cache_dir,
         )
         exporter.generate_all(section="manuscript")
 
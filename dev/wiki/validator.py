@@ -9,11 +9,17 @@ consistency. Produces diagnostics in a format compatible with
 vim.diagnostic and common editor integrations.
 
 Key Features:
-    - Wikilink resolution (checks all [[links]] exist in DB)
+    - Wikilink resolution (checks all [[links]] against the persisted
+      wikilink target index)
     - Required section validation (H1 title, HR separator)
     - Empty section detection
     - Severity levels: error, warning, info
     - JSON-serializable output for editor integration
+    - Every check reads one shared scan of the file (single pass over
+      its lines), see dev.validators.scanner
+    - Directories are linted across a thread pool; diagnostics are
+      cached per file content hash (and known-target set), optionally
+      persisted, so re-linting only re-checks changed files
 
 Usage:
     from dev.wiki.validator import WikiValidator
@@ -21,51 +27,172 @@ Usage:
     validator = WikiValidator(db)
     diagnostics = validator.validate_file(Path("wiki/journal/people/clara.md"))
 
+    # Persist results between runs
+    validator = WikiValidator(db, cache_path=WIKI_LINT_CACHE_PATH)
+    results = validator.validate_directory(WIKI_DIR)
+    validator.save_cache()
+
 Dependencies:
     - PalimpsestDB for wikilink resolution
-    - re for markdown pattern matching
+    - dev.validators.scanner for markdown tokenizing
 """
 # --- Annotations ---
 from __future__ import annotations
 
 # --- Standard library imports ---
-import re
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 # --- Third-party imports ---
 
 # --- Local imports ---
 from dev.database.manager import PalimpsestDB
-from dev.database.models import (
-    Arc,
-    City,
-    Entry,
-    Event,
-    Location,
-    Motif,
-    Person,
-    Poem,
-    ReferenceSource,
-    Tag,
-    Theme,
-)
-from dev.database.models.manuscript import (
-    Chapter,
-    Character,
-    ManuscriptScene,
-    Part,
-)
-from dev.utils.slugify import slugify
 from dev.validators.diagnostic import Diagnostic
+from dev.validators.scanner import MarkdownScan, scan_markdown
+from dev.wiki.link_targets import known_targets
 
 
 # ==================== Constants ====================
 
-WIKILINK_PATTERN = re.compile(r'\[\[([^\]|]+)(?:\|[^\]]+)?\]\]')
-WIKILINK1_PATTERN = re.compile(r'\[([^\]]*)\]\[([^\]]*)\]')
-H1_PATTERN = re.compile(r'^# .+', re.MULTILINE)
-HEADING_PATTERN = re.compile(r'^(#{1,6}) (.+)', re.MULTILINE)
+# Bump when checks or the on-disk layout change; older caches are discarded
+LINT_CACHE_VERSION = 1
+
+# Directories with fewer files are linted serially
+PARALLEL_MIN_FILES = 16
+
+
+# ==================== LintCache ====================
+
+class LintCache:
+    """
+    Diagnostics of previously linted files, keyed by content hash.
+
+    Results are only valid for the known-target set they were checked
+    against; a cache built for another set (``targets`` digest) is
+    emptied on first use.
+
+    Attributes:
+        path: JSON file backing the cache (None keeps it in memory only)
+        hits: Files served from the cache
+        misses: Files that had to be checked
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        """
+        Initialize the cache, loading any existing state.
+
+        Args:
+            path: JSON file backing the cache (None = in-memory only)
+        """
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._targets: Optional[str] = None
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def load(self) -> None:
+        """Load the cache from disk, discarding it if unreadable or stale."""
+        self._targets, self._files = None, {}
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != LINT_CACHE_VERSION:
+            return
+        files = data.get("files")
+        if isinstance(files, dict):
+            self._targets, self._files = data.get("targets"), files
+
+    def save(self) -> None:
+        """Atomically write the cache to disk if it changed."""
+        if self.path is None or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        tmp_path.write_text(
+            json.dumps({
+                "version": LINT_CACHE_VERSION,
+                "targets": self._targets,
+                "files": self._files,
+            }),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def use_targets(self, digest: str) -> None:
+        """
+        Bind the cache to a known-target set, dropping other results.
+
+        Args:
+            digest: Digest of the known-target set
+        """
+        if self._targets != digest:
+            self._targets = digest
+            self._files = {}
+            self._dirty = True
+
+    def lookup(self, file_path: str, digest: str) -> Optional[List[Diagnostic]]:
+        """
+        Return cached diagnostics if the file content is unchanged.
+
+        Args:
+            file_path: File path string the diagnostics report
+            digest: Content hash of the file
+
+        Returns:
+            Diagnostics, or None if the file is unknown or changed
+        """
+        entry = self._files.get(file_path)
+        if entry is None or entry.get("sha256") != digest:
+            return None
+        return [Diagnostic(**d) for d in entry.get("diagnostics", [])]
+
+    def record(
+        self, file_path: str, digest: str, diagnostics: List[Diagnostic]
+    ) -> None:
+        """
+        Store the diagnostics found for one file content.
+
+        Args:
+            file_path: File path string the diagnostics report
+            digest: Content hash of the file
+            diagnostics: Diagnostics found in it
+        """
+        self._files[file_path] = {
+            "sha256": digest,
+            "diagnostics": [d.to_dict() for d in diagnostics],
+        }
+        self._dirty = True
+
+    def prune(self, root: Path, keep: Set[str]) -> None:
+        """
+        Forget files under ``root`` that were not linted this run.
+
+        Args:
+            root: Directory that was linted
+            keep: File path strings linted under it
+        """
+        prefix = os.path.join(str(root), "")
+        stale = [
+            path for path in self._files
+            if path.startswith(prefix) and path not in keep
+        ]
+        for path in stale:
+            del self._files[path]
+        if stale:
+            self._dirty = True
 
 
 # ==================== WikiValidator ====================
@@ -77,21 +204,35 @@ class WikiValidator:
     Checks structural rules (H1 title, non-empty sections) and
     resolves wikilinks against the database to find broken references.
     All valid wikilink targets are loaded once and cached for the
-    lifetime of the validator instance.
+    lifetime of the validator instance, as are the diagnostics of
+    every file content checked against them.
 
     Attributes:
         db: PalimpsestDB instance for entity resolution
+        cache: Diagnostics cache keyed by file content hash
+        workers: Threads used by validate_directory
         _known_targets: Cached set of valid lowercase wikilink targets
     """
 
-    def __init__(self, db: PalimpsestDB) -> None:
+    def __init__(
+        self,
+        db: PalimpsestDB,
+        cache_path: Optional[Path] = None,
+        workers: Optional[int] = None,
+    ) -> None:
         """
         Initialize the wiki validator.
 
         Args:
             db: PalimpsestDB instance for querying wikilink targets
+            cache_path: JSON file persisting the diagnostics cache
+                (None = in-memory only)
+            workers: Threads for directory validation (None = default
+                pool size; 1 = serial)
         """
         self.db = db
+        self.cache = LintCache(cache_path)
+        self.workers = workers or min(32, (os.cpu_count() or 1) + 4)
         self._known_targets: Optional[Set[str]] = None
 
     def validate_file(self, file_path: Path) -> List[Diagnostic]:
@@ -100,7 +241,8 @@ class WikiValidator:
 
         Runs all structural checks and wikilink resolution against
         the file content. Returns a list of diagnostics sorted by
-        line number.
+        line number. A file whose content was already checked is
+        answered from the cache.
 
         Args:
             file_path: Path to the markdown file to validate
@@ -109,23 +251,18 @@ class WikiValidator:
             List of Diagnostic instances found in the file,
             sorted by line number
         """
-        content = file_path.read_text(encoding="utf-8")
-        file_str = str(file_path)
-
-        diagnostics: List[Diagnostic] = []
-        diagnostics.extend(self._check_title(content, file_str))
-        diagnostics.extend(self._check_empty_sections(content, file_str))
-        diagnostics.extend(self._check_wikilinks(content, file_str))
-
-        diagnostics.sort(key=lambda d: (d.line, d.col))
+        self._bind_cache()
+        file_str, digest, diagnostics, cached = self._lint(file_path)
+        self._count(file_str, digest, diagnostics, cached)
         return diagnostics
 
     def validate_directory(self, dir_path: Path) -> Dict[str, List[Diagnostic]]:
         """
         Validate all markdown files in a directory tree.
 
-        Recursively walks the directory and validates every .md file.
-        Returns results keyed by file path string.
+        Recursively walks the directory and validates every .md file,
+        reading and checking files across a thread pool. Cache entries
+        of files no longer in the tree are dropped.
 
         Args:
             dir_path: Root directory to scan for .md files
@@ -134,21 +271,88 @@ class WikiValidator:
             Dict mapping file path strings to their diagnostic lists.
             All files are included, even those with no diagnostics.
         """
-        results: Dict[str, List[Diagnostic]] = {}
+        md_files = sorted(dir_path.rglob("*.md"))
+        self._bind_cache()
+
+        if self.workers <= 1 or len(md_files) < PARALLEL_MIN_FILES:
+            linted = [self._lint(md_file) for md_file in md_files]
+        else:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                linted = list(executor.map(self._lint, md_files))
 
-        for md_file in sorted(dir_path.rglob("*.md")):
-            diagnostics = self.validate_file(md_file)
-            results[str(md_file)] = diagnostics
+        results: Dict[str, List[Diagnostic]] = {}
+        for file_str, digest, diagnostics, cached in linted:
+            self._count(file_str, digest, diagnostics, cached)
+            results[file_str] = diagnostics
+        self.cache.prune(dir_path, set(results))
 
         return results
 
+    def save_cache(self) -> None:
+        """Persist the diagnostics cache (no-op without a cache path)."""
+        self.cache.save()
+
+    def _bind_cache(self) -> None:
+        """Load known targets and tie the cache to their digest."""
+        targets = self._load_known_targets()
+        digest = hashlib.sha256(
+            "\n".join(sorted(targets)).encode("utf-8")
+        ).hexdigest()
+        self.cache.use_targets(digest)
+
+    def _lint(
+        self, file_path: Path
+    ) -> Tuple[str, str, List[Diagnostic], bool]:
+        """
+        Check one file, or fetch its diagnostics from the cache.
+
+        Only reads the cache, so it is safe to run across threads;
+        callers record the result with _count().
+
+        Args:
+            file_path: Path to the markdown file to validate
+
+        Returns:
+            (file path string, content hash, diagnostics, cache hit)
+        """
+        file_str = str(file_path)
+        raw = file_path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+
+        cached = self.cache.lookup(file_str, digest)
+        if cached is not None:
+            return file_str, digest, cached, True
+
+        scan = scan_markdown(raw.decode("utf-8"))
+        diagnostics: List[Diagnostic] = []
+        diagnostics.extend(self._check_title(scan, file_str))
+        diagnostics.extend(self._check_empty_sections(scan, file_str))
+        diagnostics.extend(self._check_wikilinks(scan, file_str))
+
+        diagnostics.sort(key=lambda d: (d.line, d.col))
+        return file_str, digest, diagnostics, False
+
+    def _count(
+        self,
+        file_str: str,
+        digest: str,
+        diagnostics: List[Diagnostic],
+        cached: bool,
+    ) -> None:
+        """Record a _lint() result in the cache and its counters."""
+        if cached:
+            self.cache.hits += 1
+        else:
+            self.cache.misses += 1
+            self.cache.record(file_str, digest, diagnostics)
+
     def _load_known_targets(self) -> Set[str]:
         """
-        Load all valid wikilink targets from the database.
+        Load all valid wikilink targets from the wikilink target index.
 
-        Queries every entity type that can be a wikilink target and
-        collects their names/identifiers into a single set of
-        lowercased strings. Results are cached after first load.
+        Reads the persisted index (refreshing entities changed since
+        its last use) instead of querying every entity type, plus the
+        per-year entry index pages. Results are cached after first load.
 
         Returns:
             Set of lowercase strings representing valid wikilink targets
@@ -156,108 +360,23 @@ class WikiValidator:
         if self._known_targets is not None:
             return self._known_targets
 
-        targets: Set[str] = set()
-
         with self.db.session_scope() as session:
-            # People: by display_name + absolute path
-            for person in session.query(Person).all():
-                targets.add(person.display_name.lower())
-                targets.add(f"/journal/people/{person.slug}")
-
-            # Locations: by name + absolute path
-            for location in session.query(Location).all():
-                targets.add(location.name.lower())
-                city_slug = slugify(location.city.name)
-                loc_slug = slugify(location.name)
-                targets.add(f"/journal/locations/{city_slug}/{loc_slug}")
-
-            # Cities: by name + absolute path
-            for city in session.query(City).all():
-                targets.add(city.name.lower())
-                targets.add(f"/journal/cities/{slugify(city.name)}")
-
-            # Events: by name + absolute path
-            for event in session.query(Event).all():
-                targets.add(event.name.lower())
-                targets.add(f"/journal/events/{slugify(event.name)}")
-
-            # Arcs: by name + absolute path
-            for arc in session.query(Arc).all():
-                targets.add(arc.name.lower())
-                targets.add(f"/journal/arcs/{slugify(arc.name)}")
-
-            # Tags: by name + absolute path
-            for tag in session.query(Tag).all():
-                targets.add(tag.name.lower())
-                targets.add(f"/journal/tags/{slugify(tag.name)}")
-
-            # Themes: by name + absolute path (multi-entry only)
-            for theme in session.query(Theme).all():
-                if theme.usage_count > 1:
-                    targets.add(theme.name.lower())
-                    targets.add(f"/journal/themes/{slugify(theme.name)}")
-
-            # Poems: by title + absolute path
-            for poem in session.query(Poem).all():
-                targets.add(poem.title.lower())
-                targets.add(f"/journal/poems/{slugify(poem.title)}")
-
-            # Reference sources: by title + absolute path
-            for source in session.query(ReferenceSource).all():
-                targets.add(source.title.lower())
-                targets.add(f"/journal/references/{slugify(source.title)}")
-
-            # Motifs: by name + absolute path
-            for motif in session.query(Motif).all():
-                targets.add(motif.name.lower())
-                targets.add(f"/journal/motifs/{slugify(motif.name)}")
-
-            # Entries: by date + absolute path + per-year index pages
-            entry_years: set = set()
-            for entry in session.query(Entry).all():
-                date_str = entry.date.isoformat()
-                year = entry.date.strftime("%Y")
-                targets.add(date_str.lower())
-                targets.add(f"/journal/entries/{year}/{date_str}")
-                entry_years.add(year)
-
-            for year in entry_years:
-                targets.add(f"/indexes/entries-{year}")
-            targets.add("/indexes/entry-index")
-
-            # Manuscript: Chapters by title + absolute path
-            for chapter in session.query(Chapter).all():
-                targets.add(chapter.title.lower())
-                targets.add(
-                    f"/manuscript/chapters/{slugify(chapter.title)}"
-                )
+            targets = known_targets(session)
 
-            # Manuscript: Characters by name + absolute path
-            for character in session.query(Character).all():
-                targets.add(character.name.lower())
-                targets.add(
-                    f"/manuscript/characters/{slugify(character.name)}"
-                )
-
-            # Manuscript: Scenes by name + absolute path
-            for ms_scene in session.query(ManuscriptScene).all():
-                targets.add(ms_scene.name.lower())
-                targets.add(
-                    f"/manuscript/scenes/{slugify(ms_scene.name)}"
-                )
-
-            # Manuscript: Parts by display_name + absolute path
-            for part in session.query(Part).all():
-                title = part.title or ""
-                targets.add(f"part {part.number}: {title}".lower())
-                stem = slugify(part.title) if part.title else f"part-{part.number}"
-                targets.add(f"/manuscript/parts/{stem}")
+        entry_years = {
+            target.split("/")[3]
+            for target in targets
+            if target.startswith("/journal/entries/")
+        }
+        for year in entry_years:
+            targets.add(f"/indexes/entries-{year}")
+        targets.add("/indexes/entry-index")
 
         self._known_targets = targets
         return self._known_targets
 
     def _check_wikilinks(
-        self, content: str, file_path: str
+        self, scan: MarkdownScan, file_path: str
     ) -> List[Diagnostic]:
         """
         Check all wikilinks in the content resolve to known targets.
@@ -266,7 +385,7 @@ class WikiValidator:
         and WikiLink1 (``[display][target]``, ``[target][]``) formats.
 
         Args:
-            content: File content as string
+            scan: Scanned file content
             file_path: File path for diagnostic reporting
 
         Returns:
@@ -274,53 +393,44 @@ class WikiValidator:
         """
         known = self._load_known_targets()
         diagnostics: List[Diagnostic] = []
-        lines = content.split("\n")
-
-        for line_num, line in enumerate(lines, start=1):
-            # WikiLink0: [[target]] or [[target|display]]
-            for match in WIKILINK_PATTERN.finditer(line):
-                target = match.group(1).strip()
-                if target.lower() not in known:
-                    col = match.start() + 1
-                    end_col = match.end() + 1
-                    diagnostics.append(Diagnostic(
-                        file=file_path,
-                        line=line_num,
-                        col=col,
-                        end_line=line_num,
-                        end_col=end_col,
-                        severity="error",
-                        code="UNRESOLVED_WIKILINK",
-                        message=f"Wikilink target not found: [[{target}]]",
-                    ))
-
-            # WikiLink1: [display][target] or [target][]
-            for match in WIKILINK1_PATTERN.finditer(line):
-                display = match.group(1).strip()
-                target = match.group(2).strip()
-                # [target][] → target is in group 1, group 2 is empty
+
+        for link in scan.links:
+            if link.kind == "wikilink":
+                # WikiLink0: [[target]] or [[target|display]]
+                target = link.target.strip()
+                if target.lower() in known:
+                    continue
+                message = f"Wikilink target not found: [[{target}]]"
+            elif link.kind == "wikilink1":
+                # WikiLink1: [display][target] or [target][]
+                display = link.text.strip()
+                target = link.target.strip()
+                # [target][] → target is the display text
                 resolved = target if target else display
-                if resolved.lower() not in known:
-                    col = match.start() + 1
-                    end_col = match.end() + 1
-                    diagnostics.append(Diagnostic(
-                        file=file_path,
-                        line=line_num,
-                        col=col,
-                        end_line=line_num,
-                        end_col=end_col,
-                        severity="error",
-                        code="UNRESOLVED_WIKILINK",
-                        message=(
-                            f"Wikilink target not found: "
-                            f"[{display}][{target}]"
-                        ),
-                    ))
+                if resolved.lower() in known:
+                    continue
+                message = (
+                    f"Wikilink target not found: "
+                    f"[{display}][{target}]"
+                )
+            else:
+                continue
+
+            diagnostics.append(Diagnostic(
+                file=file_path,
+                line=link.line,
+                col=link.col,
+                end_line=link.line,
+                end_col=link.end_col,
+                severity="error",
+                code="UNRESOLVED_WIKILINK",
+                message=message,
+            ))
 
         return diagnostics
 
     def _check_title(
-        self, content: str, file_path: str
+        self, scan: MarkdownScan, file_path: str
     ) -> List[Diagnostic]:
         """
         Check that the file contains an H1 heading.
@@ -329,14 +439,14 @@ class WikiValidator:
         (``# Title``). Files without one receive an error diagnostic.
 
         Args:
-            content: File content as string
+            scan: Scanned file content
             file_path: File path for diagnostic reporting
 
         Returns:
             List containing one MISSING_TITLE diagnostic if no H1 found,
             or empty list if H1 exists
         """
-        if H1_PATTERN.search(content):
+        if scan.has_title:
             return []
 
         return [Diagnostic(
@@ -351,7 +461,7 @@ class WikiValidator:
         )]
 
     def _check_empty_sections(
-        self, content: str, file_path: str
+        self, scan: MarkdownScan, file_path: str
     ) -> List[Diagnostic]:
         """
         Check for empty sections (headings with no content before next heading).
@@ -361,55 +471,41 @@ class WikiValidator:
         last section). Only checks H2+ headings; H1 title is excluded.
 
         Args:
-            content: File content as string
+            scan: Scanned file content
             file_path: File path for diagnostic reporting
 
         Returns:
             List of EMPTY_SECTION diagnostics for headings with no content
         """
         diagnostics: List[Diagnostic] = []
-        lines = content.split("\n")
-
-        # Collect heading positions (line_num, level, title)
-        headings: List[tuple] = []
-        for line_num, line in enumerate(lines, start=1):
-            match = HEADING_PATTERN.match(line)
-            if match:
-                level = len(match.group(1))
-                title = match.group(2)
-                headings.append((line_num, level, title))
+        lines = scan.lines
+        headings = scan.headings
 
         # Check each H2+ heading for content before the next heading
-        for i, (line_num, level, title) in enumerate(headings):
-            if level < 2:
+        for i, heading in enumerate(headings):
+            if heading.level < 2:
                 continue
 
-            # Determine the range to check for content
-            start_line = line_num  # heading line (1-based)
+            # Lines after the heading, up to the next heading (0-based)
             if i + 1 < len(headings):
-                end_line = headings[i + 1][0]
+                end = headings[i + 1].line - 1
             else:
-                end_line = len(lines) + 1
+                end = len(lines)
 
-            # Check for non-whitespace content between heading and next heading
-            has_content = False
-            for check_line in range(start_line, end_line - 1):
-                # check_line is 1-based index, lines[] is 0-based
-                line_content = lines[check_line]  # line after heading
-                if line_content.strip():
-                    has_content = True
-                    break
+            has_content = any(
+                lines[index].strip() for index in range(heading.line, end)
+            )
 
             if not has_content:
                 diagnostics.append(Diagnostic(
                     file=file_path,
-                    line=line_num,
+                    line=heading.line,
                     col=1,
-                    end_line=line_num,
-                    end_col=len(lines[line_num - 1]) + 1,
+                    end_line=heading.line,
+                    end_col=len(lines[heading.line - 1]) + 1,
                     severity="warning",
                     code="EMPTY_SECTION",
-                    message=f"Empty section: {title}",
+                    message=f"Empty section: {heading.title}",
                 ))
 
         return diagnostics
@@ -5,7 +5,7 @@ test_wiki_cli.py
 Integration tests for the ``plm wiki`` CLI commands.
 
 Tests CLI invocation via Click's CliRunner for all wiki subcommands:
-generate, lint, sync, and publish.
+generate, lint, sync, clear-cache, and publish.
 """
 # --- Annotations ---
 from __future__ import annotations
@@ -29,13 +29,16 @@ def runner():
 
 
 @pytest.fixture(autouse=True)
-def _patch_db_path(test_db, test_db_path, populated_wiki_db, monkeypatch):
+def _patch_db_path(
+    test_db, test_db_path, populated_wiki_db, tmp_path, monkeypatch
+):
     """
     Patch DB_PATH so CLI commands use the test database.
 
     The CLI commands import DB_PATH at module level, so we monkeypatch
     both the source (dev.core.paths) and the local references in the
-    wiki and metadata_yaml CLI modules.
+    wiki and metadata_yaml CLI modules. The page index, template
+    cache and lint cache are redirected under tmp_path.
     """
     import sys
 
@@ -44,6 +47,15 @@ def _patch_db_path(test_db, test_db_path, populated_wiki_db, monkeypatch):
     wiki_mod = sys.modules.get("dev.pipeline.cli.wiki")
     if wiki_mod is not None:
         monkeypatch.setattr(wiki_mod, "DB_PATH", test_db_path)
+        monkeypatch.setattr(
+            wiki_mod, "WIKI_INDEX_PATH", tmp_path / ".wiki_index.json"
+        )
+        monkeypatch.setattr(
+            wiki_mod, "WIKI_TEMPLATE_CACHE_DIR", tmp_path / "wiki-templates"
+        )
+        monkeypatch.setattr(
+            wiki_mod, "WIKI_LINT_CACHE_PATH", tmp_path / ".wiki_lint.json"
+        )
     metadata_mod = sys.modules.get("dev.pipeline.cli.metadata_yaml")
     if metadata_mod is not None:
         monkeypatch.setattr(metadata_mod, "DB_PATH", test_db_path)
@@ -95,6 +107,30 @@ class TestWikiGenerateCLI:
         )
         assert result.exit_code == 0
 
+    def test_generate_single_entity(self, runner, wiki_output):
+        """Generate with --entity renders only that entity's pages."""
+        result = runner.invoke(
+            cli,
+            [
+                "wiki", "generate",
+                "--entity", "tags:Loneliness",
+                "--output-dir", str(wiki_output),
+            ],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0
+        assert not (wiki_output / "journal" / "people").exists()
+
+    def test_generate_unknown_entity(self, runner, wiki_output):
+        """Unresolvable --entity keys are usage errors."""
+        result = runner.invoke(
+            cli,
+            ["wiki", "generate", "--entity", "people:nobody",
+             "--output-dir", str(wiki_output)],
+        )
+        assert result.exit_code == 2
+        assert "No people page matches 'nobody'" in result.output
+
     def test_generate_invalid_section(self, runner):
         """Invalid section choice rejected."""
         result = runner.invoke(
@@ -103,6 +139,27 @@ class TestWikiGenerateCLI:
         assert result.exit_code != 0
 
 
+class TestWikiClearCacheCLI:
+    """Tests for ``plm wiki clear-cache``."""
+
+    def test_clears_compiled_templates(self, runner, wiki_output, tmp_path):
+        """Templates compiled by generate are removed."""
+        cache_dir = tmp_path / "wiki-templates"
+        runner.invoke(
+            cli,
+            ["wiki", "generate", "--section", "indexes",
+             "--output-dir", str(wiki_output)],
+            catch_exceptions=False,
+        )
+        assert list(cache_dir.iterdir())
+
+        result = runner.invoke(cli, ["wiki", "clear-cache"], catch_exceptions=False)
+
+        assert result.exit_code == 0
+        assert "Removed" in result.output
+        assert not list(cache_dir.iterdir())
+
+
 class TestWikiLintCLI:
     """Tests for ``plm wiki lint``."""
 
@@ -157,6 +214,20 @@ class TestWikiLintCLI:
         parsed = json.loads(result.output)
         assert isinstance(parsed, dict)
 
+    def test_lint_cache_reused(self, runner, test_db, wiki_output, tmp_path):
+        """A second lint answers from the cache; --full discards it."""
+        exporter = WikiExporter(test_db, output_dir=wiki_output)
+        exporter.generate_all()
+
+        args = ["wiki", "lint", str(wiki_output), "--format", "json"]
+        first = runner.invoke(cli, args, catch_exceptions=False)
+        assert (tmp_path / ".wiki_lint.json").exists()
+        second = runner.invoke(cli, args, catch_exceptions=False)
+        full = runner.invoke(cli, [*args, "--full"], catch_exceptions=False)
+
+        assert json.loads(second.output) == json.loads(first.output)
+        assert json.loads(full.output) == json.loads(first.output)
+
 
 class TestWikiSyncCLI:
     """Tests for ``plm wiki sync``."""
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Tests for md_stream - streaming Markdown assembly for PDF builders.
+
+Covers:
+- Body output matching split_frontmatter
+- Dropping a trailing blank line as the notes builder did
+- Marker injection around the first header
+- Month grouping
+- Raw LaTeX fencing
+"""
+import io
+
+import pytest
+
+from dev.builders.md_stream import group_by_month, raw_latex_block, write_body
+from dev.utils.md import split_frontmatter
+
+
+def _write(tmp_path, content, **kwargs):
+    """Run write_body on content; return (output, header_found)."""
+    md_file = tmp_path / "2025-01-01.md"
+    md_file.write_text(content, encoding="utf-8")
+    out = io.StringIO()
+    found = write_body(out, md_file, **kwargs)
+    return out.getvalue(), found
+
+
+class TestWriteBody:
+    """Test body streaming."""
+
+    @pytest.mark.parametrize("content", [
+        "",
+        "Plain text",
+        "Plain text\n",
+        "Trailing blanks\n\n\n",
+        "---\ndate: 2025-01-01\n---\n\n\n## Title\nBody\n",
+        "  ---  \ndate: x\n---\n   \nBody",
+        "---\ndate: x\n---\n",
+        "---\ndate: x\n---\n  \n \t",
+        "---\nunclosed frontmatter\n\nBody\n",
+        "---",
+        "\n\nLeading blanks kept without frontmatter\n",
+        "---\na: 1\n---\n    indented first line\n",
+        "Windows\r\nline endings\r\n",
+    ])
+    def test_matches_split_frontmatter(self, tmp_path, content):
+        """Without markers the output is the joined body plus end."""
+        output, found = _write(tmp_path, content)
+
+        md_text = (tmp_path / "2025-01-01.md").read_text(encoding="utf-8")
+        assert output == "\n".join(split_frontmatter(md_text)[1]) + "\n\n"
+        assert not found
+
+    @pytest.mark.parametrize("content", [
+        "Body ends in a blank line\n\n",
+        "Two trailing blanks\n\n\n",
+        "---\ndate: x\n---\n\nBody\n\n",
+        "Whitespace line last\n  \n\n",
+        "No trailing blank\n",
+        "\n\n",
+    ])
+    def test_drop_trailing_blank_matches_resplit(self, tmp_path, content):
+        """Dropping matches splitting and joining the joined body again."""
+        output, _ = _write(tmp_path, content, drop_trailing_blank=True)
+
+        body = "\n".join(split_frontmatter(content)[1])
+        assert output == "\n".join(body.splitlines()) + "\n\n"
+
+    def test_drop_trailing_blank_after_header(self, tmp_path):
+        """A blank line right after the header is dropped after the markers."""
+        output, found = _write(
+            tmp_path, "## Only\n\n", after_header=("A",), drop_trailing_blank=True
+        )
+
+        assert found
+        assert output == "## Only\nA\n\n"
+
+    def test_markers_around_first_header(self, tmp_path):
+        """Markers wrap the first header line only."""
+        output, found = _write(
+            tmp_path,
+            "---\ndate: x\n---\n\nIntro\n## One\nText\n## Two\n",
+            before_header=("B",),
+            after_header=("A1", "A2"),
+        )
+
+        assert found
+        assert output == "Intro\nB\n## One\nA1\nA2\nText\n## Two\n\n"
+
+    def test_header_on_last_line(self, tmp_path):
+        """A header without a trailing newline still gets its markers."""
+        output, found = _write(tmp_path, "## Only", after_header=("A",))
+
+        assert found
+        assert output == "## Only\nA\n\n"
+
+    def test_no_header(self, tmp_path):
+        """Bodies without a header are written unchanged."""
+        output, found = _write(tmp_path, "# Not it\n #x", before_header=("B",))
+
+        assert not found
+        assert output == "# Not it\n #x\n\n"
+
+    def test_header_inside_frontmatter_ignored(self, tmp_path):
+        """Only body lines are searched for the header."""
+        output, _ = _write(
+            tmp_path, "---\n## not body\n---\n## Body\n", before_header=("B",)
+        )
+
+        assert output == "B\n## Body\n\n"
+
+    def test_custom_end(self, tmp_path):
+        """The end separator replaces the default blank line."""
+        output, _ = _write(tmp_path, "Text\n", end="\n---\n")
+
+        assert output == "Text\n---\n"
+
+
+class TestGroupByMonth:
+    """Test month grouping."""
+
+    def test_calendar_order(self, tmp_path):
+        """Months are ordered numerically with sorted files."""
+        files = [tmp_path / n for n in (
+            "2025-12-01.md", "2025-02-10.md", "2025-02-01.md", "malformed.md",
+        )]
+
+        months = group_by_month(files)
+
+        assert list(months) == ["02", "12"]
+        assert [p.name for p in months["02"]] == ["2025-02-01.md", "2025-02-10.md"]
+
+
+class TestRawLatexBlock:
+    """Test raw LaTeX fencing."""
+
+    def test_default_fence(self):
+        """Plain LaTeX uses a three-backtick fence."""
+        assert raw_latex_block("\\newpage\n") == "```{=latex}\n\\newpage\n```\n\n"
+
+    def test_fence_outgrows_backticks(self):
+        """The fence is longer than any backtick run in the LaTeX."""
+        assert raw_latex_block("a````b").startswith("`````{=latex}\n")
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tests for PdfBuildCache - content-addressed PDF build cache.
+
+Covers:
+- Key derivation
+- Fragment storage
+- Build records and pruning
+"""
+from dev.builders.pdf_cache import PdfBuildCache
+
+
+class TestDigest:
+    """Test cache key derivation."""
+
+    def test_parts_are_length_prefixed(self):
+        """Moving a boundary between parts changes the key."""
+        assert PdfBuildCache.digest("ab", "c") != PdfBuildCache.digest("a", "bc")
+
+    def test_str_and_bytes_agree(self):
+        """Text parts hash as their UTF-8 bytes."""
+        assert PdfBuildCache.digest("día") == PdfBuildCache.digest("día".encode())
+
+
+class TestFragments:
+    """Test fragment storage."""
+
+    def test_roundtrip(self, tmp_path):
+        """Stored fragments are returned by key; unknown keys miss."""
+        cache = PdfBuildCache(tmp_path / "cache")
+        cache.put_fragment("abc", "\\section{Uno}")
+
+        assert cache.get_fragment("abc") == "\\section{Uno}"
+        assert cache.get_fragment("missing") is None
+
+
+class TestBuildRecords:
+    """Test build records and pruning."""
+
+    def test_record_and_lookup(self, tmp_path):
+        """The recorded key is returned for the same PDF path only."""
+        cache = PdfBuildCache(tmp_path / "cache")
+        cache.record_build(tmp_path / "2025.pdf", "key1", ["f1"])
+
+        assert cache.build_key(tmp_path / "2025.pdf") == "key1"
+        assert cache.build_key(tmp_path / "2025-notes.pdf") is None
+
+    def test_corrupt_record_misses(self, tmp_path):
+        """An unreadable record is treated as missing."""
+        cache = PdfBuildCache(tmp_path / "cache")
+        cache.record_build(tmp_path / "2025.pdf", "key1")
+        next(cache.builds_dir.glob("*.json")).write_text("{not json")
+
+        assert cache.build_key(tmp_path / "2025.pdf") is None
+
+    def test_forget(self, tmp_path):
+        """Forgetting a PDF drops its record."""
+        cache = PdfBuildCache(tmp_path / "cache")
+        cache.record_build(tmp_path / "2025.pdf", "key1")
+        cache.forget(tmp_path / "2025.pdf")
+
+        assert cache.build_key(tmp_path / "2025.pdf") is None
+
+    def test_prune_keeps_referenced_fragments(self, tmp_path):
+        """Only fragments no record references are removed."""
+        cache = PdfBuildCache(tmp_path / "cache")
+        cache.put_fragment("live", "a")
+        cache.put_fragment("dead", "b")
+        cache.record_build(tmp_path / "2025.pdf", "key1", ["live"])
+
+        assert cache.prune() == 1
+        assert cache.get_fragment("live") == "a"
+        assert cache.get_fragment("dead") is None
+
+    def test_prune_removes_legacy_fragments(self, tmp_path):
+        """Fragments from older layouts go; in-progress writes stay."""
+        cache = PdfBuildCache(tmp_path / "cache")
+        cache.put_fragment("live", "a")
+        (cache.fragments_dir / "old.tex").write_text("\\section{Old}")
+        (cache.fragments_dir / ".live.json.tmp").write_text("partial")
+
+        assert cache.prune() == 2
+        assert not (cache.fragments_dir / "old.tex").exists()
+        assert (cache.fragments_dir / ".live.json.tmp").exists()
@@ -1,7 +1,12 @@
+import io
+import json
 import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+from pypandoc import convert_file, get_pandoc_version
+
+from dev.builders.pdf_cache import PdfBuildCache
 from dev.builders.pdfbuilder import PdfBuilder, PdfBuildError
 from dev.core.temporal_files import TemporalFileManager
 
@@ -201,4 +206,212 @@ class TestPdfBuilder:
         assert kwargs['outputfile'] == str(setup_real_paths["pdf_dir"] / "2025-notes.pdf")
         assert str(setup_real_paths["notes_preamble"]) in kwargs['extra_args']
 
-        mock_cleanup.assert_called_once()
\ No newline at end of file
+        mock_cleanup.assert_called_once()
+
+    def test_entry_ending_in_blank_line(self, tmp_path):
+        """Notes drop an entry's trailing blank line; clean output keeps it."""
+        md_file = tmp_path / "2025-01-01.md"
+        md_file.write_text("---\ndate: x\n---\n## Day\nText\n\n")
+        builder = PdfBuilder(year="2025", md_dir=tmp_path, pdf_dir=tmp_path)
+
+        clean, notes = io.StringIO(), io.StringIO()
+        builder._write_month_entries(clean, [md_file])
+        builder._write_month_entries(notes, [md_file], notes=True)
+
+        assert clean.getvalue() == "## Day\nText\n\n\n"
+        assert notes.getvalue().endswith("\\linenumbers\nText\n\n")
+
+class TestCachedBuild:
+    """Tests for builds through the content-addressed cache."""
+
+    @pytest.fixture
+    def journal(self, tmp_path):
+        """Two months of entries and both preambles."""
+        md_year = tmp_path / "md" / "2025"
+        md_year.mkdir(parents=True)
+        (md_year / "2025-01-01.md").write_text("---\ndate: 2025-01-01\n---\n## One\nJanuary text")
+        (md_year / "2025-02-10.md").write_text("---\ndate: 2025-02-10\n---\n## Two\nFebruary text")
+        (tmp_path / "clean.tex").write_text("clean preamble")
+        (tmp_path / "notes.tex").write_text("notes preamble")
+        return tmp_path
+
+    @pytest.fixture
+    def pandoc(self):
+        """Fake pandoc: fragments wrap their source, PDFs join the raw blocks."""
+        def to_ast(source, to, format, extra_args=None):
+            return json.dumps({
+                "pandoc-api-version": [1, 23, 1],
+                "meta": {},
+                "blocks": [{"t": "RawBlock", "c": ["markdown", source]}],
+            })
+
+        def to_pdf(in_md, to, outputfile, extra_args):
+            document = json.loads(Path(in_md).read_text())
+            Path(outputfile).write_text(
+                "".join(block["c"][1] for block in document["blocks"])
+            )
+
+        with patch("dev.builders.pdfbuilder.convert_text", side_effect=to_ast) as text, \
+                patch("dev.builders.pdfbuilder.convert_file", side_effect=to_pdf) as pdf:
+            yield text, pdf
+
+    def _builder(self, journal, **kwargs):
+        return PdfBuilder(
+            year="2025",
+            md_dir=journal / "md",
+            pdf_dir=journal / "pdf",
+            preamble=journal / "clean.tex",
+            preamble_notes=journal / "notes.tex",
+            cache_dir=journal / "cache",
+            keep_temp_on_error=False,
+            **kwargs,
+        )
+
+    def test_first_build_converts_every_month(self, journal, pandoc):
+        """Each month is parsed once per PDF type and typeset from JSON."""
+        text, pdf = pandoc
+
+        stats = self._builder(journal).build()
+
+        assert stats.pdfs_created == 2
+        assert stats.months_converted == 4
+        assert text.call_count == 4
+        assert text.call_args.kwargs["to"] == "json"
+        content = (journal / "pdf" / "2025.pdf").read_text()
+        assert "# January, 2025\n\n## One\nJanuary text" in content
+        assert r"\tableofcontents" in content
+        extra_args = pdf.call_args.kwargs["extra_args"]
+        assert extra_args[extra_args.index("--from") + 1] == "json"
+
+    def test_months_prefix_identifiers(self, journal, pandoc):
+        """Identifiers and internal links are prefixed with the month."""
+        text, pdf = pandoc
+        text.side_effect = lambda source, to, format: json.dumps({
+            "pandoc-api-version": [1, 23, 1],
+            "meta": {},
+            "blocks": [
+                {"t": "Header", "c": [2, ["one", [], []], []]},
+                {"t": "Para", "c": [{"t": "Link", "c": [
+                    ["", [], []], [{"t": "Str", "c": "One"}], ["#one", ""],
+                ]}]},
+            ],
+        })
+        pdf.side_effect = lambda in_md, to, outputfile, extra_args: (
+            Path(outputfile).write_text(Path(in_md).read_text())
+        )
+
+        self._builder(journal).build()
+
+        blocks = json.loads((journal / "pdf" / "2025.pdf").read_text())["blocks"]
+        assert [b["c"][1][0] for b in blocks if b["t"] == "Header"] == [
+            "2025-01-one", "2025-02-one",
+        ]
+        assert blocks[1]["c"][0]["c"][2][0] == "#2025-01-one"
+
+    def test_final_latex_loads_feature_packages(self, journal):
+        """Tables, strikeout and code in a cached month reach the template."""
+        try:
+            get_pandoc_version()
+        except OSError:
+            pytest.skip("pandoc not available")
+        (journal / "md" / "2025" / "2025-01-01.md").write_text(
+            "## One\n\n- item\n\n| A | B |\n|---|---|\n| 1 | 2 |\n\n"
+            "~~gone~~\n\n```python\nprint(1)\n```\n"
+        )
+
+        def to_latex(in_md, to, outputfile, extra_args):
+            # Stop short of the PDF engine and keep the standalone LaTeX
+            args = list(extra_args)
+            del args[args.index("--pdf-engine"):args.index("--pdf-engine") + 2]
+            Path(outputfile).write_text(convert_file(
+                in_md, to="latex", extra_args=args + ["--standalone"]
+            ))
+
+        with patch("dev.builders.pdfbuilder.convert_file", side_effect=to_latex):
+            self._builder(journal).build()
+            # Second pass typesets from cached fragments only
+            self._builder(journal, force_overwrite=True).build()
+
+        latex = (journal / "pdf" / "2025.pdf").read_text()
+        assert r"\begin{itemize}" in latex
+        assert r"\usepackage{longtable" in latex
+        assert r"\usepackage{soul}" in latex and r"\st{gone}" in latex
+        assert r"\begin{Highlighting}" in latex
+        assert r"\newenvironment{Shaded}" in latex
+
+    def test_unchanged_inputs_are_a_noop(self, journal, pandoc):
+        """A second build with identical inputs runs no pandoc at all."""
+        text, pdf = pandoc
+        self._builder(journal).build()
+        text.reset_mock()
+        pdf.reset_mock()
+
+        stats = self._builder(journal).build()
+
+        assert stats.pdfs_created == 0
+        assert stats.pdfs_up_to_date == 2
+        text.assert_not_called()
+        pdf.assert_not_called()
+
+    def test_edit_reconverts_only_its_month(self, journal, pandoc):
+        """Editing one entry re-converts its month and re-typesets."""
+        text, pdf = pandoc
+        self._builder(journal).build()
+        text.reset_mock()
+        (journal / "md" / "2025" / "2025-02-10.md").write_text("## Two\nEdited")
+
+        stats = self._builder(journal).build()
+
+        assert stats.pdfs_created == 2
+        assert stats.months_converted == 2
+        assert stats.months_cached == 2
+        assert all("Edited" in c.args[0] for c in text.call_args_list)
+        assert "Edited" in (journal / "pdf" / "2025-notes.pdf").read_text()
+
+    def test_preamble_change_rebuilds_without_reconverting(self, journal, pandoc):
+        """Typesetting inputs invalidate the PDF but not the fragments."""
+        text, pdf = pandoc
+        self._builder(journal).build()
+        text.reset_mock()
+        (journal / "clean.tex").write_text("new clean preamble")
+
+        stats = self._builder(journal).build()
+
+        assert stats.pdfs_created == 1
+        assert stats.pdfs_up_to_date == 1
+        text.assert_not_called()
+
+    def test_force_rebuilds_up_to_date_pdf(self, journal, pandoc):
+        """force_overwrite re-typesets from cached fragments."""
+        text, pdf = pandoc
+        self._builder(journal).build()
+        text.reset_mock()
+
+        stats = self._builder(journal, force_overwrite=True).build()
+
+        assert stats.pdfs_created == 2
+        assert stats.months_cached == 4
+        text.assert_not_called()
+
+    def test_prune_disabled_keeps_unreferenced_fragments(self, journal, pandoc):
+        """prune=False leaves fragments other builds may still record."""
+        cache = PdfBuildCache(journal / "cache")
+        cache.put_fragment("in-flight", "{}")
+
+        self._builder(journal, prune=False).build()
+        assert cache.get_fragment("in-flight") == "{}"
+
+        self._builder(journal, force_overwrite=True).build()
+        assert cache.get_fragment("in-flight") is None
+
+    def test_failed_typesetting_is_not_recorded(self, journal, pandoc):
+        """A PDF whose pandoc run failed is rebuilt next time."""
+        text, pdf = pandoc
+        pdf.side_effect = RuntimeError("xelatex crashed")
+        with pytest.raises(PdfBuildError):
+            self._builder(journal).build()
+
+        pdf.side_effect = lambda in_md, to, outputfile, extra_args: Path(outputfile).write_text("ok")
+        stats = self._builder(journal).build()
+
+        assert stats.pdfs_created == 2
@@ -5,7 +5,7 @@ test_config.py
 Unit tests for the project configuration loader.
 
 Verifies config loading, local overrides, shallow merge behavior,
-and sync-specific defaults.
+and sync/database-specific defaults.
 
 Usage:
     pytest tests/unit/core/test_config.py -v
@@ -20,7 +20,7 @@ from unittest.mock import patch
 import pytest
 
 # --- Local imports ---
-from dev.core.config import load_config, get_sync_config
+from dev.core.config import load_config, get_sync_config, get_database_config
 
 
 @pytest.fixture
@@ -162,3 +162,28 @@ class TestGetSyncConfig:
              patch("dev.core.config.LOCAL_CONFIG_PATH", local):
             result = get_sync_config()
         assert result["years"] == "2024"
+
+
+class TestGetDatabaseConfig:
+    """Tests for get_database_config()."""
+
+    def test_defaults_when_no_config(self, config_files):
+        """Defaults to the interactive profile with no overrides."""
+        shared, local = config_files
+        with patch("dev.core.config.CONFIG_PATH", shared), \
+             patch("dev.core.config.LOCAL_CONFIG_PATH", local):
+            result = get_database_config()
+        assert result == {"profile": "interactive", "pragmas": {}}
+
+    def test_local_profile_and_pragmas(self, config_files):
+        """Per-host config selects the profile and PRAGMA overrides."""
+        shared, local = config_files
+        shared.write_text("database:\n  profile: interactive\n")
+        local.write_text(
+            "database:\n  profile: bulk_import\n  pragmas:\n    busy_timeout: 100\n"
+        )
+        with patch("dev.core.config.CONFIG_PATH", shared), \
+             patch("dev.core.config.LOCAL_CONFIG_PATH", local):
+            result = get_database_config()
+        assert result["profile"] == "bulk_import"
+        assert result["pragmas"] == {"busy_timeout": 100}
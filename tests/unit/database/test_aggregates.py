@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+test_aggregates.py
+------------------
+Unit tests for the materialized aggregate tables.
+
+Verifies that refresh_aggregates builds month histograms and
+co-occurrence counts, that incremental refreshes follow the change log
+(added links, removed links, deleted entries), and that the Aggregates
+reader and QueryAnalytics return the stored counts.
+
+Usage:
+    pytest tests/unit/database/test_aggregates.py -v
+"""
+# --- Annotations ---
+from __future__ import annotations
+
+# --- Standard library imports ---
+from datetime import date
+
+# --- Third-party imports ---
+import pytest
+from sqlalchemy import select
+
+# --- Local imports ---
+from dev.database.aggregates import Aggregates, refresh_aggregates
+from dev.database.models import (
+    EntityCoOccurrence,
+    Entry,
+    Location,
+    City,
+    Person,
+    Scene,
+    Tag,
+    Theme,
+    ThemeInstance,
+)
+from dev.database.query_analytics import QueryAnalytics
+
+
+@pytest.fixture
+def journal(db_session):
+    """Three entries over two months with people, tags and a theme."""
+    clara = Person(name="Clara", slug="clara")
+    majo = Person(name="Majo", slug="majo")
+    coffee = Tag(name="coffee")
+    rain = Tag(name="rain")
+    memory = Theme(name="memory")
+    entries = [
+        Entry(date=date(2024, 1, 5), file_path="2024-01-05.md"),
+        Entry(date=date(2024, 1, 20), file_path="2024-01-20.md"),
+        Entry(date=date(2024, 2, 3), file_path="2024-02-03.md"),
+    ]
+    entries[0].people.extend([clara, majo])
+    entries[1].people.append(clara)
+    entries[2].people.extend([clara, majo])
+    for entry in entries:
+        entry.tags.append(coffee)
+    entries[2].tags.append(rain)
+    db_session.add_all(entries)
+    db_session.flush()
+    db_session.add_all([
+        ThemeInstance(theme=memory, entry=entries[0], description="First."),
+        ThemeInstance(theme=memory, entry=entries[2], description="Again."),
+    ])
+    db_session.flush()
+    refresh_aggregates(db_session)
+    return {
+        "clara": clara, "majo": majo, "coffee": coffee, "rain": rain,
+        "memory": memory, "entries": entries,
+    }
+
+
+def _pairs(session, entity_type, entity_id, other_type):
+    """Read stored co-occurrence counts directly from the table."""
+    rows = session.execute(
+        select(EntityCoOccurrence.other_id, EntityCoOccurrence.entry_count)
+        .where(
+            EntityCoOccurrence.entity_type == entity_type,
+            EntityCoOccurrence.entity_id == entity_id,
+            EntityCoOccurrence.other_type == other_type,
+        )
+    )
+    return dict(rows.all())
+
+
+class TestRefreshAggregates:
+    """Test full and incremental refreshes."""
+
+    def test_full_build(self, db_session, journal):
+        """Month histograms and pair counts match the links."""
+        clara, majo = journal["clara"], journal["majo"]
+        coffee, rain, memory = journal["coffee"], journal["rain"], journal["memory"]
+        aggregates = Aggregates(db_session, refresh=False)
+
+        assert aggregates.monthly_counts("tags", coffee.id) == {
+            "2024-01": 2, "2024-02": 1,
+        }
+        assert aggregates.monthly_counts("themes", memory.id) == {
+            "2024-01": 1, "2024-02": 1,
+        }
+        assert aggregates.co_occurrences("people", clara.id, "people") == {
+            clara.id: 3, majo.id: 2,
+        }
+        assert aggregates.co_occurrences("tags", coffee.id, "tags") == {
+            coffee.id: 3, rain.id: 1,
+        }
+        assert aggregates.co_occurrences("themes", memory.id, "people") == {
+            clara.id: 2, majo.id: 2,
+        }
+
+    def test_unchanged_database_writes_nothing(self, db_session, journal):
+        """A refresh with no new changes is a no-op."""
+        assert refresh_aggregates(db_session) == 0
+
+    def test_added_link_refreshes_both_sides(self, db_session, journal):
+        """Linking a person to an entry updates every co-mentioned person."""
+        clara, majo = journal["clara"], journal["majo"]
+        journal["entries"][1].people.append(majo)
+
+        refresh_aggregates(db_session)
+
+        assert _pairs(db_session, "people", clara.id, "people")[majo.id] == 3
+        assert _pairs(db_session, "people", majo.id, "people")[clara.id] == 3
+        assert _pairs(db_session, "people", majo.id, "people")[majo.id] == 3
+
+    def test_removed_link_refreshes_both_sides(self, db_session, journal):
+        """Unlinking a tag drops its pairs with the entry's other tags."""
+        coffee, rain = journal["coffee"], journal["rain"]
+        journal["entries"][2].tags.remove(rain)
+
+        refresh_aggregates(db_session)
+
+        assert _pairs(db_session, "tags", coffee.id, "tags") == {coffee.id: 3}
+        assert _pairs(db_session, "tags", rain.id, "tags") == {}
+
+    def test_entry_date_change_moves_month(self, db_session, journal):
+        """Redating an entry moves it between months for its entities."""
+        journal["entries"][2].date = date(2024, 1, 30)
+
+        refresh_aggregates(db_session)
+
+        aggregates = Aggregates(db_session, refresh=False)
+        assert aggregates.monthly_counts("tags", journal["coffee"].id) == {
+            "2024-01": 3,
+        }
+
+    def test_deleted_entry_rebuilds(self, db_session, journal):
+        """Deleting an entry removes its contribution everywhere."""
+        clara, majo = journal["clara"], journal["majo"]
+        db_session.delete(journal["entries"][0])
+
+        refresh_aggregates(db_session)
+
+        assert _pairs(db_session, "people", clara.id, "people") == {
+            clara.id: 2, majo.id: 1,
+        }
+
+    def test_scene_level_person_locations(self, db_session, journal):
+        """Person-location counts come from shared scenes."""
+        clara = journal["clara"]
+        city = City(name="Montreal")
+        cafe = Location(name="Cafe", city=city)
+        for entry in journal["entries"][:2]:
+            scene = Scene(name=f"At the cafe {entry.id}", description="Coffee.", entry=entry)
+            scene.people.append(clara)
+            scene.locations.append(cafe)
+            db_session.add(scene)
+        db_session.flush()
+
+        refresh_aggregates(db_session)
+
+        assert _pairs(db_session, "people", clara.id, "locations") == {cafe.id: 2}
+
+
+class TestAggregateReaders:
+    """Test reading aggregates through Aggregates and QueryAnalytics."""
+
+    def test_reader_refreshes_before_first_read(self, db_session, journal):
+        """Pending changes are counted by a new reader."""
+        journal["entries"][0].tags.append(journal["rain"])
+
+        aggregates = Aggregates(db_session)
+
+        assert aggregates.monthly_counts("tags", journal["rain"].id) == {
+            "2024-01": 1, "2024-02": 1,
+        }
+
+    def test_person_companions(self, db_session, journal):
+        """Companions exclude the person and sort by shared entries."""
+        companions = QueryAnalytics().get_person_companions(db_session, "clara")
+
+        assert companions == [{"name": "Majo", "shared_entries": 2}]
+
+    def test_entity_timeline(self, db_session, journal):
+        """Timelines are read for any entity type with entry links."""
+        timeline = QueryAnalytics().get_entity_timeline(
+            db_session, "people", journal["majo"].id
+        )
+
+        assert timeline == {"2024-01": 1, "2024-02": 1}
+
+    def test_entity_timeline_unknown_type(self, db_session):
+        """Types without entry links are rejected."""
+        with pytest.raises(ValueError):
+            QueryAnalytics().get_entity_timeline(db_session, "poems", 1)
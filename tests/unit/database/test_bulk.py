@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+test_bulk.py
+------------
+Unit tests for the set-based bulk write helpers.
+
+Verifies that bulk_upsert inserts, updates only rows whose values
+changed, and reports written ids; and that replace_links writes only the
+difference between existing and desired association rows. Both record
+their writes in the change log when asked to.
+
+Usage:
+    pytest tests/unit/database/test_bulk.py -v
+"""
+# --- Annotations ---
+from __future__ import annotations
+
+# --- Standard library imports ---
+from datetime import date
+
+# --- Third-party imports ---
+from sqlalchemy import func, select
+
+# --- Local imports ---
+from dev.database.bulk import bulk_upsert, replace_links
+from dev.database.models import City, EntityChange, Entry, Tag, entry_tags
+
+
+def _log(session):
+    """Return (operation, table, id) tuples in the change log."""
+    rows = session.execute(
+        select(EntityChange.operation, EntityChange.table_name, EntityChange.entity_id)
+    )
+    return set(rows.all())
+
+
+def _clear_log(session):
+    """Empty the change log."""
+    session.execute(EntityChange.__table__.delete())
+
+
+class TestBulkUpsert:
+    """Test INSERT ... ON CONFLICT DO UPDATE through bulk_upsert."""
+
+    def test_inserts_and_returns_ids(self, db_session):
+        """New rows are inserted and keyed by their natural key."""
+        written = bulk_upsert(
+            db_session, City,
+            [{"name": "Montreal", "country": "Canada"}, {"name": "Lima", "country": "Peru"}],
+            ("name",),
+        )
+
+        ids = dict(db_session.execute(select(City.name, City.id)).all())
+        assert written == {("Montreal",): ids["Montreal"], ("Lima",): ids["Lima"]}
+
+    def test_only_changed_rows_written(self, db_session):
+        """Unchanged rows are neither updated nor returned."""
+        rows = [{"name": "Montreal", "country": "Canada"}, {"name": "Lima", "country": "Peru"}]
+        bulk_upsert(db_session, City, rows, ("name",))
+
+        written = bulk_upsert(
+            db_session, City,
+            [{"name": "Montreal", "country": "Canada"}, {"name": "Lima", "country": "PE"}],
+            ("name",),
+        )
+
+        assert list(written) == [("Lima",)]
+        assert db_session.execute(
+            select(City.country).where(City.name == "Lima")
+        ).scalar() == "PE"
+
+    def test_duplicate_keys_last_wins(self, db_session):
+        """Repeated keys in one call collapse to the last row."""
+        bulk_upsert(
+            db_session, City,
+            [{"name": "Lima", "country": "A"}, {"name": "Lima", "country": "B"}],
+            ("name",),
+        )
+
+        assert db_session.execute(select(City.country)).scalars().all() == ["B"]
+
+    def test_key_only_rows(self, db_session):
+        """Rows without update columns are inserted once."""
+        bulk_upsert(db_session, Tag, [{"name": "coffee"}], ("name",))
+        written = bulk_upsert(db_session, Tag, [{"name": "coffee"}, {"name": "tea"}], ("name",))
+
+        assert list(written) == [("tea",)]
+        assert db_session.execute(select(func.count(Tag.id))).scalar() == 2
+
+    def test_tracked_writes_logged(self, db_session):
+        """Written rows are logged as updates; unchanged rows are not."""
+        rows = [{"name": "Montreal", "country": "Canada"}]
+        written = bulk_upsert(db_session, City, rows, ("name",), track=True)
+        city_id = written[("Montreal",)]
+        assert ("update", "cities", city_id) in _log(db_session)
+
+        _clear_log(db_session)
+        bulk_upsert(db_session, City, rows, ("name",), track=True)
+        assert _log(db_session) == set()
+
+
+class TestReplaceLinks:
+    """Test association-table diffs through replace_links."""
+
+    def _entry_and_tags(self, session):
+        """Create an entry and three tags, returning their ids."""
+        entry = Entry(date=date(2024, 1, 1), file_path="2024-01-01.md")
+        tags = [Tag(name=name) for name in ("a", "b", "c")]
+        session.add_all([entry, *tags])
+        session.flush()
+        return entry.id, [tag.id for tag in tags]
+
+    def _links(self, session, entry_id):
+        """Return the tag ids linked to an entry."""
+        return set(session.execute(
+            select(entry_tags.c.tag_id).where(entry_tags.c.entry_id == entry_id)
+        ).scalars())
+
+    def test_writes_only_difference(self, db_session):
+        """Missing links are added and extra links removed."""
+        entry_id, (a, b, c) = self._entry_and_tags(db_session)
+        replace_links(db_session, entry_tags, "entry_id", "tag_id", {entry_id: {a, b}})
+
+        changed = replace_links(
+            db_session, entry_tags, "entry_id", "tag_id", {entry_id: {b, c}}
+        )
+
+        assert changed == 2
+        assert self._links(db_session, entry_id) == {b, c}
+
+    def test_empty_set_clears(self, db_session):
+        """An empty child set removes every link of that parent."""
+        entry_id, (a, b, _c) = self._entry_and_tags(db_session)
+        replace_links(db_session, entry_tags, "entry_id", "tag_id", {entry_id: {a, b}})
+
+        replace_links(db_session, entry_tags, "entry_id", "tag_id", {entry_id: set()})
+
+        assert self._links(db_session, entry_id) == set()
+
+    def test_tracked_links_logged(self, db_session):
+        """Changed links update the parent and touch the children."""
+        entry_id, (a, _b, _c) = self._entry_and_tags(db_session)
+        _clear_log(db_session)
+
+        replace_links(
+            db_session, entry_tags, "entry_id", "tag_id", {entry_id: {a}}, track=True
+        )
+
+        assert _log(db_session) == {
+            ("update", "entries", entry_id),
+            ("touch", "tags", a),
+        }
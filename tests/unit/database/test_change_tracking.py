@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+test_change_tracking.py
+-----------------------
+Unit tests for the entity change log.
+
+Verifies that the after_flush hook records inserts, updates, deletes
+(including delete-orphan removals) and touches on referenced rows, and
+that watermarks prune rows every consumer has processed.
+
+Usage:
+    pytest tests/unit/database/test_change_tracking.py -v
+"""
+# --- Annotations ---
+from __future__ import annotations
+
+# --- Standard library imports ---
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import patch
+
+# --- Third-party imports ---
+from sqlalchemy import select
+
+# --- Local imports ---
+from dev.database.change_tracking import (
+    changes_since,
+    get_watermark,
+    latest_change_id,
+    set_watermark,
+)
+from dev.database.models import (
+    ChangeWatermark,
+    EntityChange,
+    Entry,
+    Event,
+    Scene,
+    Tag,
+)
+
+
+def _log(session, after=0):
+    """Return (operation, table, id) tuples recorded after a change id."""
+    rows = session.execute(
+        select(EntityChange.operation, EntityChange.table_name, EntityChange.entity_id)
+        .where(EntityChange.id > after)
+        .order_by(EntityChange.id)
+    )
+    return set(rows.all())
+
+
+def _entry(session, day=1):
+    """Create and flush an entry for 2024-01-<day>."""
+    entry = Entry(date=date(2024, 1, day), file_path=f"2024-01-{day:02d}.md")
+    session.add(entry)
+    session.flush()
+    return entry
+
+
+class TestRecordFlushChanges:
+    """Test the after_flush hook installed by PalimpsestDB."""
+
+    def test_tracking_installed(self, test_db):
+        """Databases with the change log get the hook."""
+        assert test_db.tracks_changes is True
+
+    def test_insert_touches_parent(self, db_session):
+        """A child row inserted by FK alone touches its parent."""
+        entry = _entry(db_session)
+        scene = Scene(name="Coffee", description="d", entry_id=entry.id)
+        db_session.add(scene)
+        db_session.flush()
+
+        log = _log(db_session)
+        assert ("insert", "entries", entry.id) in log
+        assert ("insert", "scenes", scene.id) in log
+        assert ("touch", "entries", entry.id) in log
+
+    def test_update_and_collection_change(self, db_session):
+        """Column and many-to-many changes are updates plus touches."""
+        entry = _entry(db_session)
+        head = latest_change_id(db_session)
+
+        entry.summary = "Edited"
+        tag = Tag(name="writing")
+        entry.tags.append(tag)
+        db_session.flush()
+
+        log = _log(db_session, head)
+        assert ("update", "entries", entry.id) in log
+        assert ("insert", "tags", tag.id) in log
+        assert ("touch", "tags", tag.id) in log
+
+    def test_update_touches_owner(self, db_session):
+        """Renaming a child row touches the row its required FK names."""
+        entry = _entry(db_session)
+        scene = Scene(name="Coffee", description="d", entry_id=entry.id)
+        db_session.add(scene)
+        db_session.flush()
+        head = latest_change_id(db_session)
+
+        scene.name = "Tea"
+        db_session.flush()
+
+        log = _log(db_session, head)
+        assert ("update", "scenes", scene.id) in log
+        assert ("touch", "entries", entry.id) in log
+
+    def test_unmodified_object_not_recorded(self, db_session):
+        """Dirty objects whose values did not change are skipped."""
+        entry = _entry(db_session)
+        entry.summary = "Same"
+        db_session.flush()
+        head = latest_change_id(db_session)
+
+        entry.summary = "Same"
+        db_session.flush()
+        assert _log(db_session, head) == set()
+
+    def test_orphan_removal_is_delete(self, db_session):
+        """Delete-orphan removals are deletes that touch M2M partners."""
+        entry = _entry(db_session)
+        scene = Scene(name="Coffee", description="d", entry=entry)
+        event = Event(name="Routine")
+        event.scenes.append(scene)
+        db_session.add(event)
+        db_session.flush()
+        head = latest_change_id(db_session)
+
+        entry.scenes.clear()
+        db_session.flush()
+
+        log = _log(db_session, head)
+        assert ("delete", "scenes", scene.id) in log
+        assert ("touch", "events", event.id) in log
+        assert ("touch", "entries", entry.id) in log
+
+    def test_rollback_discards_log(self, test_db):
+        """Log rows share the transaction of the data they describe."""
+        with test_db.session_scope() as session:
+            head = latest_change_id(session)
+            _entry(session)
+            session.rollback()
+            assert latest_change_id(session) == head
+
+
+class TestWatermarks:
+    """Test consumer watermarks and pruning."""
+
+    def test_changes_since(self, db_session):
+        """Changes after a watermark are grouped by table."""
+        _entry(db_session, 1)
+        head = latest_change_id(db_session)
+        second = _entry(db_session, 2)
+
+        new_head, changed = changes_since(db_session, head)
+        assert new_head == latest_change_id(db_session)
+        assert changed == {"entries": {second.id}}
+
+    def test_unknown_consumer(self, db_session):
+        """Consumers that never ran have no watermark."""
+        assert get_watermark(db_session, "json_export") is None
+
+    def test_prunes_below_slowest_consumer(self, db_session):
+        """Rows are kept until every consumer has processed them."""
+        _entry(db_session, 1)
+        first = latest_change_id(db_session)
+        _entry(db_session, 2)
+        second = latest_change_id(db_session)
+
+        set_watermark(db_session, "wiki", first)
+        set_watermark(db_session, "json_export", second)
+        remaining = db_session.execute(select(EntityChange.id)).scalars().all()
+        assert min(remaining) == first + 1
+
+        set_watermark(db_session, "wiki", second)
+        assert db_session.query(EntityChange).count() == 0
+        assert latest_change_id(db_session) == second
+        assert get_watermark(db_session, "wiki") == second
+
+    def test_lagging_consumer_dropped(self, db_session):
+        """A consumer too far behind the head stops holding the log back."""
+        _entry(db_session, 1)
+        set_watermark(db_session, "wiki", latest_change_id(db_session))
+        _entry(db_session, 2)
+        _entry(db_session, 3)
+        head = latest_change_id(db_session)
+
+        with patch("dev.database.change_tracking.WATERMARK_MAX_LAG", 1):
+            set_watermark(db_session, "json_export", head)
+
+        assert get_watermark(db_session, "wiki") is None
+        assert db_session.execute(select(EntityChange.id)).first() is None
+
+    def test_idle_consumer_dropped_only_when_behind(self, db_session):
+        """Old watermarks are dropped if behind the head, kept if current."""
+        _entry(db_session, 1)
+        set_watermark(db_session, "wiki", latest_change_id(db_session))
+        set_watermark(db_session, "aggregates", latest_change_id(db_session))
+        db_session.query(ChangeWatermark).update(
+            {"updated_at": datetime.now(timezone.utc) - timedelta(days=365)},
+            synchronize_session=False,
+        )
+        set_watermark(db_session, "json_export", latest_change_id(db_session))
+        assert get_watermark(db_session, "wiki") is not None
+
+        _entry(db_session, 2)
+        set_watermark(db_session, "json_export", latest_change_id(db_session))
+
+        assert get_watermark(db_session, "wiki") is None
+        assert get_watermark(db_session, "aggregates") is None
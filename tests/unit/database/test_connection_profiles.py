@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+test_connection_profiles.py
+---------------------------
+Unit tests for SQLite connection profiles.
+
+Verifies preset resolution, config-driven overrides, and that
+PalimpsestDB applies the profile PRAGMAs on every new connection.
+
+Usage:
+    pytest tests/unit/database/test_connection_profiles.py -v
+"""
+# --- Annotations ---
+from __future__ import annotations
+
+# --- Standard library imports ---
+from unittest.mock import patch
+
+# --- Third-party imports ---
+import pytest
+from sqlalchemy import text
+
+# --- Local imports ---
+from dev.core.exceptions import DatabaseError
+from dev.database.configs.connection_profiles import (
+    BULK_IMPORT_PROFILE,
+    INTERACTIVE_PROFILE,
+    ConnectionProfile,
+    resolve_profile,
+)
+from dev.database.manager import PalimpsestDB
+
+
+PROFILES_MOD = "dev.database.configs.connection_profiles"
+
+
+def _config(profile="interactive", pragmas=None):
+    """Build a get_database_config() return value."""
+    return {"profile": profile, "pragmas": pragmas or {}}
+
+
+class TestResolveProfile:
+    """Tests for resolve_profile()."""
+
+    def test_default_from_config(self):
+        """None resolves to the configured preset."""
+        with patch(f"{PROFILES_MOD}.get_database_config", return_value=_config()):
+            assert resolve_profile() == INTERACTIVE_PROFILE
+
+    def test_config_overrides_apply_to_default(self):
+        """Configured PRAGMA overrides are layered on the default preset."""
+        cfg = _config("bulk_import", {"busy_timeout": 1234})
+        with patch(f"{PROFILES_MOD}.get_database_config", return_value=cfg):
+            profile = resolve_profile()
+        assert profile.name == "bulk_import"
+        assert profile.busy_timeout == 1234
+        assert profile.cache_size == BULK_IMPORT_PROFILE.cache_size
+
+    def test_named_preset(self):
+        """An explicit name ignores the configured default."""
+        cfg = _config("interactive", {"busy_timeout": 1})
+        with patch(f"{PROFILES_MOD}.get_database_config", return_value=cfg):
+            assert resolve_profile("bulk_import") == BULK_IMPORT_PROFILE
+
+    def test_unknown_preset_raises(self):
+        """Unknown names raise DatabaseError."""
+        with pytest.raises(DatabaseError):
+            resolve_profile("turbo")
+
+    def test_unknown_pragma_raises(self):
+        """Overrides must name known PRAGMAs."""
+        with pytest.raises(DatabaseError):
+            INTERACTIVE_PROFILE.with_overrides({"page_size": 4096})
+
+
+class TestProfileApplied:
+    """Tests for PRAGMA application through PalimpsestDB."""
+
+    def test_pragmas_set_on_connect(self, tmp_path):
+        """Every pooled connection carries the profile PRAGMAs."""
+        profile = ConnectionProfile(
+            name="test", cache_size=-2048, busy_timeout=1500
+        )
+        db = PalimpsestDB(tmp_path / "p.db", enable_auto_backup=False, profile=profile)
+
+        with db.engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+            assert conn.execute(text("PRAGMA cache_size")).scalar() == -2048
+            assert conn.execute(text("PRAGMA temp_store")).scalar() == 2
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 1500
+            assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+        db.engine.dispose()
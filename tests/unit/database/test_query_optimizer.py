@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+test_query_optimizer.py
+-----------------------
+Unit tests for the query counting and streaming helpers.
+
+Verifies that QueryCounter counts statements executed inside its block,
+including lazy loads, and stops listening once the block exits, and
+that EntityStream yields rows in order, chunk by chunk, releasing the
+session between chunks once it exceeds the object limit.
+
+Usage:
+    pytest tests/unit/database/test_query_optimizer.py -v
+"""
+# --- Annotations ---
+from __future__ import annotations
+
+# --- Standard library imports ---
+from datetime import date
+
+# --- Third-party imports ---
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+# --- Local imports ---
+from dev.database.models import Entry, Tag
+from dev.database.query_optimizer import EntityStream, QueryCounter
+
+
+class TestQueryCounter:
+    """Test statement counting through QueryCounter."""
+
+    def test_counts_statements_in_block(self, test_db, db_session):
+        """Explicit queries and lazy loads are counted once each."""
+        entry = Entry(date=date(2024, 1, 1), file_path="2024-01-01.md")
+        entry.tags.append(Tag(name="coffee"))
+        db_session.add(entry)
+        db_session.commit()
+        db_session.expunge_all()
+
+        with QueryCounter(test_db.engine) as counter:
+            loaded = db_session.execute(select(Entry)).scalar_one()
+            assert [tag.name for tag in loaded.tags] == ["coffee"]
+
+        assert counter.count == 2
+
+    def test_stops_counting_after_exit(self, test_db, db_session):
+        """Statements after the block are not counted."""
+        with QueryCounter(test_db.engine) as counter:
+            db_session.execute(select(Tag)).all()
+        db_session.execute(select(Entry)).all()
+
+        assert counter.count == 1
+
+
+class TestEntityStream:
+    """Test chunked iteration through EntityStream."""
+
+    def _entries(self, session, count):
+        """Add entries in reverse date order, each with one tag."""
+        for i in range(count, 0, -1):
+            entry = Entry(date=date(2024, 1, i), file_path=f"2024-01-{i:02d}.md")
+            entry.tags.append(Tag(name=f"tag{i}"))
+            session.add(entry)
+        session.flush()
+
+    def test_yields_rows_in_order(self, db_session):
+        """Rows come back ordered across chunk boundaries."""
+        self._entries(db_session, 5)
+
+        stream = EntityStream(
+            db_session, Entry, order_by=(Entry.date,), chunk_size=2
+        )
+
+        assert len(stream) == 5
+        assert [entry.date.day for entry in stream] == [1, 2, 3, 4, 5]
+
+    def test_restricts_to_ids(self, db_session):
+        """Only the requested ids are loaded; an empty set loads nothing."""
+        self._entries(db_session, 3)
+        ids = db_session.execute(select(Entry.id)).scalars().all()
+
+        assert len(list(EntityStream(db_session, Entry, ids={ids[0]}))) == 1
+        assert list(EntityStream(db_session, Entry, ids=set())) == []
+
+    def test_releases_chunks(self, test_db, db_session):
+        """Earlier chunks leave the session; the last one stays loaded."""
+        self._entries(db_session, 4)
+        db_session.expunge_all()
+        options = (selectinload(Entry.tags),)
+
+        with QueryCounter(test_db.engine) as counter:
+            stream = EntityStream(
+                db_session, Entry, options, chunk_size=2, keep=0
+            )
+            seen = []
+            for entry in stream:
+                seen.append(entry)
+                assert [tag.name for tag in entry.tags]
+                assert len(db_session.identity_map) <= 4
+
+        # Ids, then entries and tags per chunk
+        assert counter.count == 1 + 2 * 2
+        assert not any(entry in db_session for entry in seen[:2])
+        assert all(entry in db_session for entry in seen[2:])
+
+    def test_keeps_chunks_below_limit(self, db_session):
+        """A session under the object limit is not released."""
+        self._entries(db_session, 4)
+
+        seen = list(EntityStream(db_session, Entry, chunk_size=2))
+
+        assert all(entry in db_session for entry in seen)
@@ -11,6 +11,7 @@ Usage:
 from __future__ import annotations
 
 # --- Standard library imports ---
+from datetime import date
 
 # --- Third-party imports ---
 import pytest
@@ -20,11 +21,13 @@ from dev.database.managers.chapter_manager import ChapterManager
 from dev.database.models import (
     Arc,
     Character,
+    Entry,
     ManuscriptReference,
     ManuscriptScene,
     ManuscriptSource,
     Part,
     ReferenceSource,
+    Scene,
 )
 from dev.database.models.enums import (
     ChapterStatus,
@@ -72,6 +75,24 @@ def sample_character(db_session):
     return char
 
 
+@pytest.fixture
+def sample_entry(db_session):
+    """Create a sample journal entry."""
+    entry = Entry(date=date(2024, 1, 15), file_path="2024/2024-01-15.md")
+    db_session.add(entry)
+    db_session.flush()
+    return entry
+
+
+@pytest.fixture
+def sample_scene(db_session, sample_entry):
+    """Create a sample journal scene."""
+    scene = Scene(name="Morning", description="Coffee", entry=sample_entry)
+    db_session.add(scene)
+    db_session.flush()
+    return scene
+
+
 @pytest.fixture
 def sample_arc(db_session):
     """Create a sample arc."""
@@ -293,16 +314,16 @@ class TestManuscriptScene:
 class TestManuscriptSource:
     """Test linking scenes to journal source material."""
 
-    def test_add_scene_source(self, chapter_manager, sample_chapter):
+    def test_add_scene_source(self, chapter_manager, sample_chapter, sample_entry):
         """Add source to manuscript scene."""
         scene = chapter_manager.create_manuscript_scene(
             sample_chapter, {"name": "Test Scene"}
         )
         source = chapter_manager.add_scene_source(
-            scene, {"source_type": "entry", "entry_id": 1}
+            scene, {"source_type": "entry", "entry_id": sample_entry.id}
         )
         assert source.source_type == SourceType.ENTRY
-        assert source.entry_id == 1
+        assert source.entry_id == sample_entry.id
 
     def test_add_external_source(self, chapter_manager, sample_chapter):
         """Add external source with note."""
@@ -318,13 +339,15 @@ class TestManuscriptSource:
         assert source.source_type == SourceType.EXTERNAL
         assert source.external_note == "Family story told by mother"
 
-    def test_remove_source(self, chapter_manager, sample_chapter, db_session):
+    def test_remove_source(
+        self, chapter_manager, sample_chapter, sample_scene, db_session
+    ):
         """Remove source from manuscript scene."""
         scene = chapter_manager.create_manuscript_scene(
             sample_chapter, {"name": "Test Scene"}
         )
         source = chapter_manager.add_scene_source(
-            scene, {"source_type": "scene", "scene_id": 1}
+            scene, {"source_type": "scene", "scene_id": sample_scene.id}
         )
         source_id = source.id
         chapter_manager.remove_scene_source(source)
@@ -14,6 +14,7 @@ Key Features:
     - Validates all subcommand groups and their children
     - Verifies removed commands no longer exist
     - Tests --help output for each group
+    - Keeps ``plm``/``jsearch`` startup free of heavy dependencies
 
 Usage:
     pytest tests/unit/pipeline/test_cli_structure.py -v
@@ -21,6 +22,11 @@ Usage:
 # --- Annotations ---
 from __future__ import annotations
 
+# --- Standard library imports ---
+import subprocess
+import sys
+from pathlib import Path
+
 # --- Third-party imports ---
 import pytest
 from click.testing import CliRunner
@@ -29,6 +35,18 @@ from click.testing import CliRunner
 from dev.pipeline.cli import cli
 
 
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+# Modules that only specific commands need; none may load at startup
+HEAVY_MODULES = (
+    "sqlalchemy", "alembic", "jinja2", "pypandoc",
+    "ftfy", "textstat", "nltk", "markdown_it", "yaml",
+)
+
+# Cumulative import budget for the CLI package (generous for slow CI)
+IMPORT_BUDGET_US = 400_000
+
+
 @pytest.fixture
 def runner():
     """Create Click test runner."""
@@ -39,7 +57,7 @@ class TestTopLevelCommands:
     """Verify top-level commands are registered."""
 
     @pytest.mark.parametrize("command", [
-        "inbox", "convert", "status", "sync", "export",
+        "inbox", "convert", "status", "sync", "export", "serve",
     ])
     def test_top_level_commands_exist(self, runner, command):
         """Top-level commands should be accessible."""
@@ -148,3 +166,55 @@ class TestRemovedCommands:
         """plm json should not exist (subsumed by sync + top-level export)."""
         result = runner.invoke(cli, ["json", "export"])
         assert result.exit_code != 0
+
+
+class TestStartupCost:
+    """Keep CLI startup cheap: subcommand modules load on demand."""
+
+    @staticmethod
+    def _importtime(code: str) -> dict:
+        """Run code under ``-X importtime`` and map module → cumulative µs."""
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        )
+        times = {}
+        for line in proc.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+        return times
+
+    @pytest.mark.parametrize("module", ["dev.pipeline.cli", "dev.search.cli"])
+    def test_import_is_light(self, module):
+        """Importing an entry point loads no heavy dependency."""
+        times = self._importtime(f"import {module}")
+
+        assert not [m for m in HEAVY_MODULES if m in times]
+        assert times[module] < IMPORT_BUDGET_US
+
+    def test_help_is_light(self):
+        """``plm --help`` lists every command without importing them."""
+        times = self._importtime(
+            "import sys\n"
+            "from dev.pipeline.cli import cli\n"
+            "sys.argv = ['plm', '--help']\n"
+            "try:\n    cli()\nexcept SystemExit:\n    pass\n"
+        )
+
+        assert not [m for m in HEAVY_MODULES if m in times]
+
+    def test_lazy_commands_resolve(self):
+        """Every lazily declared command imports to a click command."""
+        from dev.core.cli import LazyGroup
+
+        def walk(group):
+            for name in group.list_commands(None):
+                command = group.get_command(None, name)
+                assert command is not None, name
+                if isinstance(command, LazyGroup):
+                    walk(command)
+
+        walk(cli)
@@ -8,6 +8,8 @@ Tests cover:
     - Entity serialization for all entity types (using natural keys)
     - Change detection (added/modified/deleted)
     - File writing with proper directory structure
+    - Incremental sync: only changed files written, orphans deleted
+    - Change-driven exports from the DB change log and export index
     - Loading existing exports for comparison
     - README generation
 
@@ -19,9 +21,13 @@ from __future__ import annotations
 
 # --- Standard library imports ---
 import json
+import os
 from datetime import date
+from pathlib import Path
+from unittest.mock import patch
 
 # --- Third-party imports ---
+import pytest
 from sqlalchemy.orm import Session
 
 # --- Local imports ---
@@ -41,12 +47,15 @@ from dev.database.models import (
     Part,
     Person,
     PersonCharacterMap,
+    Poem,
+    PoemVersion,
     Reference,
     ReferenceSource,
     Scene,
     SceneDate,
     Tag,
     Theme,
+    ThemeInstance,
     Thread,
 )
 from dev.database.models.enums import (
@@ -61,6 +70,7 @@ from dev.database.models.enums import (
     SourceType,
 )
 from dev.pipeline.export_json import JSONExporter
+from dev.utils.file_state import FileStateCache
 
 
 # =========================================================================
@@ -784,6 +794,259 @@ class TestWriteExports:
         assert event_file.exists()
 
 
+class TestSyncExports:
+    """Test incremental export: only differing files are touched."""
+
+    def _exports(self, tags, entries=None):
+        """Build an exports dict with the given tags and entries."""
+        return {
+            "tags": {name: {"name": name} for name in tags},
+            "entries": {
+                d: {"date": d, "summary": summary}
+                for d, summary in (entries or {}).items()
+            },
+        }
+
+    def test_first_sync_writes_everything(self, test_db, tmp_dir):
+        """All files are added on the first run."""
+        exporter = JSONExporter(test_db, output_dir=tmp_dir)
+        exporter._sync_exports(self._exports(["writing", "travel"]))
+
+        assert exporter.files_written == 2
+        assert (tmp_dir / "journal" / "tags" / "travel.json").exists()
+        assert sorted(exporter.changes) == ["+ tag travel", "+ tag writing"]
+
+    def test_unchanged_files_not_rewritten(self, test_db, tmp_dir):
+        """Identical content leaves files and mtimes alone."""
+        exports = self._exports(["writing"], {"2024-01-15": "Test"})
+        JSONExporter(test_db, output_dir=tmp_dir)._sync_exports(exports)
+        entry_file = tmp_dir / "journal" / "entries" / "2024" / "2024-01-15.json"
+        mtime = entry_file.stat().st_mtime_ns
+
+        exporter = JSONExporter(test_db, output_dir=tmp_dir)
+        exporter._sync_exports(exports)
+
+        assert exporter.files_written == 0
+        assert exporter.files_deleted == 0
+        assert exporter.changes == []
+        assert entry_file.stat().st_mtime_ns == mtime
+
+    def test_changed_file_rewritten(self, test_db, tmp_dir):
+        """Only the modified entity's file is written."""
+        JSONExporter(test_db, output_dir=tmp_dir)._sync_exports(
+            self._exports(["writing"], {"2024-01-15": "Old"})
+        )
+
+        exporter = JSONExporter(test_db, output_dir=tmp_dir)
+        exporter._sync_exports(self._exports(["writing"], {"2024-01-15": "New"}))
+
+        assert exporter.files_written == 1
+        assert len(exporter.changes) == 1
+        assert exporter.changes[0].startswith("~ ")
+        assert "~summary [changed]" in exporter.changes[0]
+        entry_file = tmp_dir / "journal" / "entries" / "2024" / "2024-01-15.json"
+        assert json.loads(entry_file.read_text())["summary"] == "New"
+
+    def test_orphans_deleted(self, test_db, tmp_dir):
+        """Files with no matching entity are removed with their empty dirs."""
+        JSONExporter(test_db, output_dir=tmp_dir)._sync_exports(
+            self._exports(["writing"], {"2024-01-15": "Test"})
+        )
+
+        exporter = JSONExporter(test_db, output_dir=tmp_dir)
+        exporter._sync_exports(self._exports(["writing"]))
+
+        assert exporter.files_deleted == 1
+        assert len(exporter.changes) == 1
+        assert exporter.changes[0].startswith("- ")
+        assert not (tmp_dir / "journal" / "entries" / "2024").exists()
+        assert (tmp_dir / "journal" / "tags" / "writing.json").exists()
+
+    def test_file_state_cache_skips_reads(self, test_db, tmp_dir):
+        """With a warm cache, unchanged files are compared without reading."""
+        exports = self._exports(["writing"])
+        JSONExporter(test_db, output_dir=tmp_dir)._sync_exports(exports)
+        tag_file = tmp_dir / "journal" / "tags" / "writing.json"
+        old = tag_file.stat().st_mtime - 60
+        os.utime(tag_file, (old, old))
+
+        cache = FileStateCache()
+        JSONExporter(test_db, output_dir=tmp_dir, file_state=cache)._sync_exports(exports)
+        assert len(cache) == 1
+
+        exporter = JSONExporter(test_db, output_dir=tmp_dir, file_state=cache)
+        with patch.object(Path, "read_bytes", side_effect=AssertionError("read")):
+            exporter._sync_exports(exports)
+        assert exporter.files_written == 0
+
+
+class TestChangeDrivenExport:
+    """Test dirty exports driven by the DB change log and export index."""
+
+    def _seed(self, test_db):
+        """Two entries sharing a tag, each with a scene in its own event."""
+        with test_db.session_scope() as session:
+            tag = Tag(name="writing")
+            for day in (1, 2):
+                entry = Entry(
+                    date=date(2024, 1, day),
+                    file_path=f"2024-01-{day:02d}.md",
+                    summary=f"Day {day}",
+                )
+                entry.tags.append(tag)
+                scene = Scene(name=f"Scene {day}", description="d", entry=entry)
+                event = Event(name=f"Event {day}")
+                event.scenes.append(scene)
+                session.add_all([entry, event])
+
+    def _export(self, test_db, tmp_dir):
+        """Run an incremental export with an export index."""
+        exporter = JSONExporter(
+            test_db, output_dir=tmp_dir / "out", index_path=tmp_dir / "index.json"
+        )
+        exporter.export_all(commit=False)
+        return exporter
+
+    def _assert_matches_full_export(self, test_db, tmp_dir):
+        """The dirty export tree equals a from-scratch export."""
+        JSONExporter(test_db, output_dir=tmp_dir / "ref").export_all(
+            commit=False, incremental=False
+        )
+        trees = []
+        for name in ("out", "ref"):
+            root = tmp_dir / name / "journal"
+            trees.append({
+                path.relative_to(root): path.read_text()
+                for path in root.rglob("*.json")
+            })
+        assert trees[0] == trees[1]
+
+    def test_first_run_is_full_and_builds_index(self, test_db, tmp_dir):
+        """Without an index the whole database is exported."""
+        self._seed(test_db)
+        exporter = self._export(test_db, tmp_dir)
+
+        index = json.loads((tmp_dir / "index.json").read_text())
+        assert exporter.files_written == 7
+        assert sorted(index["entities"]["scenes"].values()) == [
+            ["Scene 1::2024-01-01", "scenes/2024-01-01/scene-1.json"],
+            ["Scene 2::2024-01-02", "scenes/2024-01-02/scene-2.json"],
+        ]
+
+    def test_no_changes_exports_nothing(self, test_db, tmp_dir):
+        """An unchanged database queries no entity table."""
+        self._seed(test_db)
+        self._export(test_db, tmp_dir)
+
+        with patch.object(JSONExporter, "_export_entries") as export_entries:
+            exporter = self._export(test_db, tmp_dir)
+        export_entries.assert_not_called()
+        assert exporter.files_written == 0
+        assert exporter.stats["entries"] == 2
+
+    def test_only_changed_entity_exported(self, test_db, tmp_dir):
+        """An edited entry is re-exported alone."""
+        self._seed(test_db)
+        self._export(test_db, tmp_dir)
+        with test_db.session_scope() as session:
+            session.query(Entry).filter_by(date=date(2024, 1, 2)).one().summary = "New"
+
+        with patch.object(JSONExporter, "_export_tags") as export_tags:
+            exporter = self._export(test_db, tmp_dir)
+        export_tags.assert_not_called()
+        assert exporter.files_written == 1
+        self._assert_matches_full_export(test_db, tmp_dir)
+
+    def test_rename_reexports_dependents(self, test_db, tmp_dir):
+        """A renamed tag rewrites every entry embedding its name."""
+        self._seed(test_db)
+        self._export(test_db, tmp_dir)
+        with test_db.session_scope() as session:
+            session.query(Tag).one().name = "drafting"
+
+        exporter = self._export(test_db, tmp_dir)
+        assert exporter.files_written == 3
+        assert exporter.files_deleted == 1
+        assert not (tmp_dir / "out" / "journal" / "tags" / "writing.json").exists()
+        self._assert_matches_full_export(test_db, tmp_dir)
+
+    @pytest.mark.parametrize("model, attr", [
+        (Scene, "name"),
+        (Thread, "name"),
+        (Theme, "name"),
+        (Motif, "name"),
+        (Poem, "title"),
+        (ReferenceSource, "title"),
+    ])
+    def test_renamed_child_reexports_entry(self, test_db, tmp_dir, model, attr):
+        """Renaming a row an entry embeds by name rewrites that entry."""
+        with test_db.session_scope() as session:
+            entry = Entry(date=date(2024, 1, 1), file_path="2024-01-01.md")
+            session.add(entry)
+            session.flush()
+            theme, motif = Theme(name="Old"), Motif(name="Old")
+            poem = Poem(title="Old")
+            source = ReferenceSource(title="Old", type=ReferenceType.BOOK)
+            session.add_all([theme, motif, poem, source])
+            session.flush()
+            session.add_all([
+                Scene(name="Old", description="d", entry_id=entry.id),
+                Thread(name="Old", from_date="2024-01-01", to_date="2023",
+                       content="c", entry_id=entry.id),
+                ThemeInstance(description="d", theme_id=theme.id, entry_id=entry.id),
+                MotifInstance(description="d", motif_id=motif.id, entry_id=entry.id),
+                PoemVersion(content="verse", poem_id=poem.id, entry_id=entry.id),
+                Reference(content="q", mode=ReferenceMode.DIRECT,
+                          source_id=source.id, entry_id=entry.id),
+            ])
+        self._export(test_db, tmp_dir)
+
+        with test_db.session_scope() as session:
+            setattr(session.query(model).one(), attr, "New")
+        self._export(test_db, tmp_dir)
+
+        entry_json = tmp_dir / "out" / "journal" / "entries" / "2024" / "2024-01-01.json"
+        assert "New" in entry_json.read_text()
+        self._assert_matches_full_export(test_db, tmp_dir)
+
+    def test_removed_scene_deleted(self, test_db, tmp_dir):
+        """Deleted rows lose their files and their events are updated."""
+        self._seed(test_db)
+        self._export(test_db, tmp_dir)
+        with test_db.session_scope() as session:
+            entry = session.query(Entry).filter_by(date=date(2024, 1, 1)).one()
+            entry.scenes.clear()
+
+        exporter = self._export(test_db, tmp_dir)
+        assert exporter.files_deleted == 1
+        assert "~ event Event 1: -scenes ['Scene 1::2024-01-01']" in exporter.changes
+        self._assert_matches_full_export(test_db, tmp_dir)
+
+    def test_date_change_moves_scene_files(self, test_db, tmp_dir):
+        """Key changes cascade: entry date -> scene keys -> events."""
+        self._seed(test_db)
+        self._export(test_db, tmp_dir)
+        with test_db.session_scope() as session:
+            session.query(Entry).filter_by(date=date(2024, 1, 2)).one().date = date(2024, 2, 2)
+
+        self._export(test_db, tmp_dir)
+        assert not (tmp_dir / "out" / "journal" / "scenes" / "2024-01-02").exists()
+        self._assert_matches_full_export(test_db, tmp_dir)
+
+    def test_stale_index_falls_back_to_full(self, test_db, tmp_dir):
+        """An index that does not match the watermark is rebuilt."""
+        self._seed(test_db)
+        self._export(test_db, tmp_dir)
+        (tmp_dir / "index.json").write_text("{not json")
+
+        exporter = JSONExporter(
+            test_db, output_dir=tmp_dir / "out", index_path=tmp_dir / "index.json"
+        )
+        assert not exporter._can_export_changes()
+        exporter.export_all(commit=False)
+        assert exporter._can_export_changes()
+
+
 class TestLoadExistingExports:
     """Test loading old JSON files for comparison."""
 
@@ -25,11 +25,13 @@ from datetime import date
 from sqlalchemy.orm import Session
 
 # --- Local imports ---
+from dev.database.change_tracking import set_watermark
 from dev.database.models import (
     Arc,
     Chapter,
     Character,
     City,
+    EntityChange,
     Entry,
     Event,
     Location,
@@ -508,6 +510,55 @@ class TestIdempotency:
         assert db_session.query(Entry).count() == 1
         assert db_session.query(Person).count() == 1
 
+    def test_unchanged_import_logs_no_changes(self, db_session, test_db, tmp_dir):
+        """
+        Re-importing data identical to the DB writes nothing to the change log.
+        """
+        _populate_db(db_session)
+        db_session.commit()
+
+        exporter = JSONExporter(test_db, output_dir=tmp_dir)
+        exporter.export_all()
+        db_session.query(EntityChange).delete()
+        db_session.commit()
+
+        JSONImporter(test_db, input_dir=tmp_dir).import_all()
+
+        assert db_session.query(EntityChange).count() == 0
+
+    def test_reimport_replaces_links(self, db_session, test_db, tmp_dir):
+        """
+        Links missing from the JSON are removed; changed rows are logged.
+        """
+        _populate_db(db_session)
+        db_session.commit()
+
+        exporter = JSONExporter(test_db, output_dir=tmp_dir)
+        exporter.export_all()
+        db_session.query(EntityChange).delete()
+        # A consumer that has seen nothing keeps the log from being pruned
+        # by the aggregate refresh at the end of the import
+        set_watermark(db_session, "reader", 0)
+        db_session.commit()
+
+        entry_file = next((tmp_dir / "journal" / "entries").rglob("*.json"))
+        data = json.loads(entry_file.read_text())
+        data["tags"] = []
+        data["summary"] = "Rewritten"
+        entry_file.write_text(json.dumps(data))
+
+        JSONImporter(test_db, input_dir=tmp_dir).import_all()
+
+        db_session.expire_all()
+        entry = db_session.query(Entry).one()
+        assert entry.tags == []
+        assert entry.summary == "Rewritten"
+        logged = {
+            (c.table_name, c.entity_id)
+            for c in db_session.query(EntityChange).all()
+        }
+        assert ("entries", entry.id) in logged
+
 
 class TestPartialImport:
     """Test handling of missing or partial export directories."""
@@ -558,6 +609,56 @@ class TestPartialImport:
         assert stats["cities"] == 1  # Only valid file imported
 
 
+class TestFileLoading:
+    """Test file bucketing and parallel JSON loading."""
+
+    def test_collect_files_buckets_by_entity_type(self, test_db, tmp_dir):
+        """Files are bucketed by their first directory under journal/."""
+        _write_json_file(tmp_dir, "cities", "b.json", {"name": "B"})
+        _write_json_file(tmp_dir, "cities", "a.json", {"name": "A"})
+        _write_json_file(tmp_dir, "scenes/2024", "s.json", {"name": "S"})
+        (tmp_dir / "journal" / "README.json").write_text("{}")
+
+        importer = JSONImporter(test_db, input_dir=tmp_dir)
+        files = importer._collect_files()
+
+        journal = tmp_dir / "journal"
+        assert set(files) == {"cities", "scenes"}
+        assert files["cities"] == [journal / "cities/a.json", journal / "cities/b.json"]
+        assert files["scenes"] == [journal / "scenes/2024/s.json"]
+
+    def test_collect_files_incremental(self, test_db, tmp_dir):
+        """Only existing changed JSON files under journal/ are bucketed."""
+        _write_json_file(tmp_dir, "cities", "a.json", {"name": "A"})
+        _write_json_file(tmp_dir, "tags", "t.json", {"name": "T"})
+        journal = tmp_dir / "journal"
+        changed = {
+            journal / "cities/a.json",
+            journal / "cities/deleted.json",
+            tmp_dir / "elsewhere.json",
+        }
+
+        importer = JSONImporter(test_db, input_dir=tmp_dir)
+
+        assert importer._collect_files(changed) == {
+            "cities": [journal / "cities/a.json"]
+        }
+
+    def test_parallel_load_matches_serial(self, test_db, tmp_dir):
+        """Thread-pool loading keeps file order and skips corrupted files."""
+        for i in range(40):
+            _write_json_file(tmp_dir, "tags", f"tag-{i:02d}.json", {"name": f"T{i}"})
+        (tmp_dir / "journal" / "tags" / "tag-bad.json").write_text("{{nope")
+
+        importer = JSONImporter(test_db, input_dir=tmp_dir)
+        files = importer._collect_files()
+        serial = importer._load_json_files(files, workers=1)
+        parallel = importer._load_json_files(files, workers=8)
+
+        assert parallel == serial
+        assert [d["name"] for d in parallel["tags"]] == [f"T{i}" for i in range(40)]
+
+
 class TestIndividualImports:
     """Test individual entity type imports with natural key resolution."""
 
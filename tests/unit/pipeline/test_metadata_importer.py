@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+test_metadata_importer.py
+-------------------------
+Tests for EntryImporter — journal entry import from MD + metadata YAML.
+
+Tests cover:
+    - EntryPreparer: single-read hashing, merged metadata, error capture
+    - Pipelined import across a process pool with a single writer
+    - Per-file SAVEPOINT rollback inside batched transactions
+    - Skip-unchanged before validation, failure threshold
+    - Stat-signature fast path via FileStateCache
+
+Usage:
+    python -m pytest tests/unit/pipeline/test_metadata_importer.py -v
+"""
+# --- Annotations ---
+from __future__ import annotations
+
+# --- Standard library imports ---
+import hashlib
+import os
+import time
+from datetime import date
+from unittest.mock import patch
+
+# --- Third-party imports ---
+import pytest
+from sqlalchemy.orm import Query
+
+# --- Local imports ---
+from dev.database.aggregates import AGGREGATES_CONSUMER
+from dev.database.change_tracking import get_watermark, latest_change_id
+from dev.database.models import Entry, EntityMonthCount, Tag
+from dev.pipeline.metadata_importer import EntryImporter, EntryPreparer
+from dev.utils.file_state import FileStateCache
+
+
+IMPORTER_MOD = "dev.pipeline.metadata_importer"
+
+
+def _write_entry(md_dir, yaml_dir, day, md_people, yaml_people, body="One two three"):
+    """Write an MD file and its metadata YAML for 2024-01-<day>."""
+    iso = f"2024-01-{day:02d}"
+    md_path = md_dir / "2024" / f"{iso}.md"
+    md_path.parent.mkdir(parents=True, exist_ok=True)
+    people = "".join(f"  - {p}\n" for p in md_people)
+    md_path.write_text(
+        f"---\ndate: {iso}\npeople:\n{people}---\n\n{body}\n", encoding="utf-8"
+    )
+
+    yaml_path = yaml_dir / f"{iso}.yaml"
+    yaml_people_text = "".join(f"  - {p}\n" for p in yaml_people)
+    yaml_path.write_text(
+        f"date: {iso}\nsummary: Day {day}\npeople:\n{yaml_people_text}",
+        encoding="utf-8",
+    )
+    return yaml_path
+
+
+@pytest.fixture
+def md_dir(tmp_path):
+    """MD root laid out like data/journal/content/md."""
+    path = tmp_path / "journal" / "content" / "md"
+    path.mkdir(parents=True)
+    return path
+
+
+@pytest.fixture
+def yaml_dir(tmp_path):
+    """Directory holding metadata YAML files."""
+    path = tmp_path / "metadata"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture(autouse=True)
+def log_dir(tmp_path):
+    """Keep failed_imports.json out of the real log directory."""
+    with patch(f"{IMPORTER_MOD}.LOG_DIR", tmp_path / "logs"):
+        yield tmp_path / "logs"
+
+
+class TestEntryPreparer:
+    """Tests for EntryPreparer.prepare()."""
+
+    def test_prepares_merged_metadata(self, md_dir, yaml_dir):
+        """Hashes, word count and merged fields come from a single read."""
+        yaml_path = _write_entry(md_dir, yaml_dir, 1, ["Alice"], ["Alice"])
+        prepared = EntryPreparer(md_dir).prepare(yaml_path)
+
+        md_path = md_dir / "2024" / "2024-01-01.md"
+        assert prepared.error is None
+        assert prepared.validation_error is None
+        assert prepared.entry_date == date(2024, 1, 1)
+        assert prepared.md_hash == hashlib.sha256(md_path.read_bytes()).hexdigest()
+        assert prepared.metadata["file_path"] == "content/md/2024/2024-01-01.md"
+        assert prepared.metadata["word_count"] == 3
+        assert prepared.metadata["people"] == [{"name": "Alice"}]
+
+    def test_missing_md_is_fatal(self, md_dir, yaml_dir):
+        """A YAML without its MD file captures a fatal error."""
+        yaml_path = _write_entry(md_dir, yaml_dir, 1, ["Alice"], ["Alice"])
+        (md_dir / "2024" / "2024-01-01.md").unlink()
+
+        prepared = EntryPreparer(md_dir).prepare(yaml_path)
+        assert prepared.error is not None
+        assert prepared.error.error_type == "FileNotFoundError"
+
+    def test_people_mismatch_is_validation_error(self, md_dir, yaml_dir):
+        """Validation errors are captured separately from fatal ones."""
+        yaml_path = _write_entry(md_dir, yaml_dir, 1, ["Alice"], ["Bob"])
+        prepared = EntryPreparer(md_dir).prepare(yaml_path)
+
+        assert prepared.error is None
+        assert prepared.md_hash is not None
+        assert prepared.validation_error.error_type == "ValueError"
+
+
+class TestImportAll:
+    """Tests for EntryImporter.import_all()."""
+
+    def test_parallel_import(self, db_session, md_dir, yaml_dir):
+        """Files prepared in worker processes are all written."""
+        files = [
+            _write_entry(md_dir, yaml_dir, day, ["Alice"], ["Alice"])
+            for day in range(1, 5)
+        ]
+        importer = EntryImporter(db_session, md_dir=md_dir)
+
+        with patch(f"{IMPORTER_MOD}.PARALLEL_MIN_FILES", 2):
+            stats = importer.import_all(files, workers=2, batch_size=3)
+
+        assert stats.succeeded == 4
+        assert stats.failed == 0
+        assert db_session.query(Entry).count() == 4
+
+    def test_aggregates_refreshed_after_import(self, db_session, md_dir, yaml_dir):
+        """The import leaves the aggregate tables current for readers."""
+        yaml_path = _write_entry(md_dir, yaml_dir, 1, ["Alice"], ["Alice"])
+        with yaml_path.open("a", encoding="utf-8") as handle:
+            handle.write("tags:\n  - reflection\n")
+        EntryImporter(db_session, md_dir=md_dir).import_all([yaml_path], workers=1)
+
+        assert get_watermark(db_session, AGGREGATES_CONSUMER) == latest_change_id(
+            db_session
+        )
+        counts = db_session.query(EntityMonthCount).filter_by(entity_type="tags")
+        assert [(c.month, c.entry_count) for c in counts] == [("2024-01", 1)]
+
+    def test_failed_file_rolls_back_alone(self, db_session, md_dir, yaml_dir, log_dir):
+        """A failing file inside a batch does not undo its neighbours."""
+        files = [
+            _write_entry(md_dir, yaml_dir, 1, ["Alice"], ["Alice"]),
+            _write_entry(md_dir, yaml_dir, 2, ["Alice"], ["Bob"]),
+            _write_entry(md_dir, yaml_dir, 3, ["Alice"], ["Alice"]),
+        ]
+        importer = EntryImporter(db_session, md_dir=md_dir)
+        stats = importer.import_all(files, workers=1)
+
+        assert stats.succeeded == 2
+        assert stats.failed == 1
+        dates = {e.date for e in db_session.query(Entry).all()}
+        assert dates == {date(2024, 1, 1), date(2024, 1, 3)}
+        assert importer.failed_imports[0].error_type == "ValueError"
+        assert (log_dir / "jumpstart" / "failed_imports.json").exists()
+
+    def test_lookup_race_keeps_earlier_files(self, db_session, md_dir, yaml_dir):
+        """An IntegrityError on a get-or-create spares the uncommitted batch."""
+        files = [
+            _write_entry(md_dir, yaml_dir, day, ["Alice"], ["Alice"])
+            for day in range(1, 4)
+        ]
+        with files[2].open("a", encoding="utf-8") as handle:
+            handle.write("tags:\n  - reflection\n")
+        db_session.add(Tag(name="reflection"))
+        db_session.commit()
+
+        real_first = Query.first
+        raced = []
+
+        def racing_first(query):
+            # The tag lookup misses as if another writer created it just after
+            if query.column_descriptions[0]["entity"] is Tag and not raced:
+                raced.append(query)
+                return None
+            return real_first(query)
+
+        importer = EntryImporter(db_session, md_dir=md_dir)
+        with patch.object(Query, "first", racing_first):
+            stats = importer.import_all(files, workers=1, batch_size=50)
+
+        assert raced
+        assert stats.succeeded == 3
+        assert stats.failed == 0
+        assert db_session.query(Entry).count() == 3
+        entry = db_session.query(Entry).filter_by(date=date(2024, 1, 3)).one()
+        assert [t.name for t in entry.tags] == ["reflection"]
+
+    def test_unchanged_entry_skipped_before_validation(
+        self, db_session, md_dir, yaml_dir
+    ):
+        """Unchanged entries are skipped even if they would fail validation."""
+        yaml_path = _write_entry(md_dir, yaml_dir, 1, ["Alice"], ["Alice"])
+        EntryImporter(db_session, md_dir=md_dir).import_all([yaml_path], workers=1)
+
+        prepared = EntryPreparer(md_dir).prepare(yaml_path)
+        entry = db_session.query(Entry).one()
+        assert entry.file_hash == prepared.md_hash
+        assert entry.metadata_hash == prepared.yaml_hash
+
+        stats = EntryImporter(db_session, md_dir=md_dir).import_all(
+            [yaml_path], workers=1
+        )
+        assert stats.skipped == 1
+        assert stats.entries_created == 0
+
+    def test_stops_at_failure_threshold(self, db_session, md_dir, yaml_dir):
+        """Consecutive failures stop the import at the same file as before."""
+        files = [yaml_dir / f"2024-01-{day:02d}.yaml" for day in range(1, 10)]
+        for path in files:
+            path.write_text("", encoding="utf-8")
+
+        importer = EntryImporter(db_session, md_dir=md_dir)
+        stats = importer.import_all(files, workers=1)
+
+        assert stats.failed == 5
+        assert stats.processed == 5
+
+
+class TestFileStateFastPath:
+    """Tests for the stat-signature fast path."""
+
+    def _backdate(self, *dirs):
+        """Move every file's mtime out of the racy window."""
+        old = time.time() - 60
+        for directory in dirs:
+            for path in directory.rglob("*"):
+                if path.is_file():
+                    os.utime(path, (old, old))
+
+    def test_unchanged_files_are_not_read(self, db_session, md_dir, yaml_dir):
+        """A second import with a warm cache prepares nothing."""
+        files = [
+            _write_entry(md_dir, yaml_dir, day, ["Alice"], ["Alice"])
+            for day in range(1, 4)
+        ]
+        self._backdate(md_dir, yaml_dir)
+        cache = FileStateCache()
+
+        EntryImporter(db_session, md_dir=md_dir, file_state=cache).import_all(
+            files, workers=1
+        )
+        assert len(cache) == 6
+
+        with patch.object(EntryPreparer, "prepare") as prepare:
+            stats = EntryImporter(
+                db_session, md_dir=md_dir, file_state=cache
+            ).import_all(files, workers=1)
+
+        prepare.assert_not_called()
+        assert stats.skipped == 3
+        assert stats.succeeded == 3
+
+    def test_edited_file_is_reimported(self, db_session, md_dir, yaml_dir):
+        """A changed stat signature sends the file through preparation."""
+        files = [
+            _write_entry(md_dir, yaml_dir, day, ["Alice"], ["Alice"])
+            for day in range(1, 3)
+        ]
+        self._backdate(md_dir, yaml_dir)
+        cache = FileStateCache()
+        EntryImporter(db_session, md_dir=md_dir, file_state=cache).import_all(
+            files, workers=1
+        )
+
+        _write_entry(md_dir, yaml_dir, 2, ["Alice"], ["Alice"], body="Edited")
+        with patch(
+            "dev.database.managers.entry_manager.JOURNAL_DIR", md_dir.parent.parent
+        ):
+            stats = EntryImporter(
+                db_session, md_dir=md_dir, file_state=cache
+            ).import_all(files, workers=1)
+
+        assert stats.skipped == 1
+        assert stats.entries_created == 1
+        entry = db_session.query(Entry).filter_by(date=date(2024, 1, 2)).one()
+        assert entry.word_count == 1
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+test_pdf_batch.py
+-----------------
+Tests for multi-year PDF builds across a process pool.
+
+Key Features:
+    - Year spec parsing
+    - Job planning (gaps in ranges, unknown kinds)
+    - In-process builds with per-job scratch dirs and aggregate stats
+    - Pool builds isolate failing jobs
+    - The shared cache is pruned once per batch
+
+Usage:
+    pytest tests/unit/pipeline/test_pdf_batch.py -v
+"""
+# --- Annotations ---
+from __future__ import annotations
+
+# --- Standard library imports ---
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+# --- Third-party imports ---
+import pytest
+
+# --- Local imports ---
+from dev.builders.pdf_cache import PdfBuildCache
+from dev.core.exceptions import PdfBuildError
+from dev.pipeline.pdf_batch import (
+    PdfBatchOptions,
+    PdfJob,
+    build_pdfs,
+    parse_years,
+    plan_jobs,
+)
+
+
+@pytest.fixture
+def options(tmp_path):
+    """Two years of entries (2023, 2025) with clean and notes preambles."""
+    for year in ("2023", "2025"):
+        md_year = tmp_path / "md" / year
+        md_year.mkdir(parents=True)
+        (md_year / f"{year}-03-01.md").write_text(f"## Entry\n{year} text")
+    (tmp_path / "clean.tex").write_text("clean")
+    (tmp_path / "notes.tex").write_text("notes")
+    (tmp_path / "scratch").mkdir()
+    return PdfBatchOptions(
+        md_dir=tmp_path / "md",
+        yaml_dir=tmp_path / "yaml",
+        pdf_dir=tmp_path / "pdf",
+        preamble=tmp_path / "clean.tex",
+        preamble_notes=tmp_path / "notes.tex",
+        cache_dir=tmp_path / "cache",
+        scratch_dir=tmp_path / "scratch",
+    )
+
+
+@pytest.fixture
+def pandoc():
+    """Fake pandoc that records the scratch dir of each typesetting run."""
+    scratch_dirs = []
+
+    def to_ast(source, to, format):
+        return json.dumps({
+            "pandoc-api-version": [1, 23, 1],
+            "meta": {},
+            "blocks": [{"t": "RawBlock", "c": ["markdown", source]}],
+        })
+
+    def to_pdf(in_md, to, outputfile, extra_args):
+        scratch_dirs.append(Path(in_md).parent)
+        Path(outputfile).write_text(Path(in_md).read_text())
+
+    with patch("dev.builders.pdfbuilder.convert_text", side_effect=to_ast), \
+            patch("dev.builders.pdfbuilder.convert_file", side_effect=to_pdf):
+        yield scratch_dirs
+
+
+class TestParseYears:
+    """Year spec expansion."""
+
+    @pytest.mark.parametrize("spec, years", [
+        ("2024", ["2024"]),
+        ("2022-2024", ["2022", "2023", "2024"]),
+        ("2024,2020-2021,2024", ["2020", "2021", "2024"]),
+    ])
+    def test_valid(self, spec, years):
+        """Singles, ranges and lists expand to sorted unique years."""
+        assert parse_years(spec) == years
+
+    @pytest.mark.parametrize("spec", ["24", "2025-2020", "2024;2025", ""])
+    def test_invalid(self, spec):
+        """Malformed specs and reversed ranges are rejected."""
+        with pytest.raises(PdfBuildError):
+            parse_years(spec)
+
+
+class TestPlanJobs:
+    """Job planning."""
+
+    def test_range_skips_years_without_sources(self, options):
+        """Years in a range with no entries are not scheduled."""
+        jobs = plan_jobs(parse_years("2023-2025"), ("clean", "notes"), options)
+
+        assert jobs == [
+            PdfJob("2023", "clean"), PdfJob("2023", "notes"),
+            PdfJob("2025", "clean"), PdfJob("2025", "notes"),
+        ]
+
+    def test_single_year_always_planned(self, options):
+        """An explicit single year is kept so the builder reports it."""
+        assert plan_jobs(["2024"], ("clean",), options) == [PdfJob("2024", "clean")]
+
+    def test_unknown_kind(self, options):
+        """Unknown kinds are rejected."""
+        with pytest.raises(PdfBuildError, match="Unknown PDF kind"):
+            plan_jobs(["2023"], ("poster",), options)
+
+
+class TestBuildPdfs:
+    """Batch execution."""
+
+    def test_in_process_batch_aggregates_stats(self, options, pandoc):
+        """Every job builds once, in its own scratch dir, into one total."""
+        seen = []
+
+        stats = build_pdfs(
+            ["2023", "2025"], ("clean", "notes"), options,
+            jobs=1, on_result=seen.append,
+        )
+
+        assert stats.jobs == 4 and len(seen) == 4
+        assert stats.pdfs_created == 4
+        assert stats.files_processed == 4
+        assert not stats.failures
+        assert len(set(pandoc)) == 4
+        assert all(d.parent == options.scratch_dir for d in pandoc)
+        assert list(options.scratch_dir.iterdir()) == []
+        assert sorted(p.name for p in options.pdf_dir.iterdir()) == [
+            "2023-notes.pdf", "2023.pdf", "2025-notes.pdf", "2025.pdf",
+        ]
+
+    def test_second_batch_is_up_to_date(self, options, pandoc):
+        """A repeated batch finds every PDF up to date."""
+        build_pdfs(["2023", "2025"], ("clean", "notes"), options, jobs=1)
+
+        stats = build_pdfs(["2023", "2025"], ("clean", "notes"), options, jobs=1)
+
+        assert stats.pdfs_created == 0
+        assert stats.pdfs_up_to_date == 4
+
+    def test_cache_pruned_once_after_all_jobs(self, options, pandoc):
+        """Jobs leave the shared cache alone; the batch prunes at the end."""
+        cache = PdfBuildCache(options.cache_dir)
+        cache.put_fragment("stale", "{}")
+
+        with patch.object(
+            PdfBuildCache, "prune", autospec=True, side_effect=PdfBuildCache.prune,
+        ) as prune:
+            build_pdfs(["2023", "2025"], ("clean", "notes"), options, jobs=1)
+
+        assert prune.call_count == 1
+        assert cache.get_fragment("stale") is None
+        assert len(list(cache.fragments_dir.iterdir())) == 4
+
+    def test_pool_isolates_failing_jobs(self, options):
+        """A failing job is reported while the others still run."""
+        options.preamble_notes = options.md_dir / "missing.tex"
+        options.preamble = options.md_dir / "also-missing.tex"
+
+        stats = build_pdfs(["2023", "2025"], ("clean", "notes"), options, jobs=2)
+
+        assert stats.jobs == 4
+        assert stats.errors == 4
+        assert {r.job for r in stats.failures} == {
+            PdfJob(y, k) for y in ("2023", "2025") for k in ("clean", "notes")
+        }
+        assert all("preamble not found" in r.error for r in stats.failures)
+
+    def test_nothing_to_build(self, options):
+        """A range without any sources is an error."""
+        with pytest.raises(PdfBuildError, match="Nothing to build"):
+            build_pdfs(["2010", "2011"], ("clean",), options, jobs=1)
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+test_server.py
+--------------
+Tests for the ``plm serve`` JSON-RPC daemon.
+
+Key Features:
+    - Round-trips requests through a real Unix socket
+    - Verifies JSON-RPC error codes and notifications
+    - Verifies the warm renderer is reused across wiki runs
+    - Verifies socket lifecycle (stale socket, second daemon, shutdown)
+
+Usage:
+    pytest tests/unit/pipeline/test_server.py -v
+"""
+# --- Annotations ---
+from __future__ import annotations
+
+# --- Standard library imports ---
+import json
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# --- Third-party imports ---
+import pytest
+
+# --- Local imports ---
+import dev.core.paths as paths
+from dev.database.models.entities import Person
+from dev.pipeline.server import (
+    INVALID_PARAMS,
+    INVALID_REQUEST,
+    METHOD_NOT_FOUND,
+    PARSE_ERROR,
+    PlmServer,
+    RpcError,
+    call,
+    is_running,
+)
+
+
+@pytest.fixture
+def socket_path():
+    """Short socket path (Unix socket paths are limited to ~100 bytes)."""
+    root = Path(tempfile.mkdtemp(prefix="plm"))
+    yield root / "plm.sock"
+    shutil.rmtree(root, ignore_errors=True)
+
+
+@pytest.fixture
+def server(test_db, socket_path, tmp_path, monkeypatch):
+    """Daemon serving the test database from a background thread."""
+    monkeypatch.setattr(paths, "WIKI_INDEX_PATH", tmp_path / "wiki_index.json")
+    monkeypatch.setattr(paths, "WIKI_TEMPLATE_CACHE_DIR", tmp_path / "tpl")
+
+    plm = PlmServer(socket_path, db=test_db)
+    thread = threading.Thread(target=plm.serve_forever, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 30
+    while not is_running(socket_path):
+        assert time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.05)
+
+    yield plm
+
+    if thread.is_alive():
+        call("shutdown", socket_path=socket_path)
+        thread.join(timeout=10)
+
+
+class TestRequests:
+    """Method calls over the socket."""
+
+    def test_ping(self, server, socket_path):
+        """ping reports the served database."""
+        info = call("ping", socket_path=socket_path)
+        assert info["db_path"] == str(server.db.db_path)
+        assert info["requests"] >= 1
+
+    def test_metadata_list(self, server, socket_path, test_db):
+        """Names are listed for one type or several in one request."""
+        with test_db.session_scope() as session:
+            session.add(Person(name="Clara", lastname="Dupont", slug="clara_dupont"))
+
+        names = call(
+            "metadata.list", {"entity_type": "people"}, socket_path=socket_path
+        )
+        batch = call(
+            "metadata.list",
+            {"entity_types": ["people", "cities"]},
+            socket_path=socket_path,
+        )
+
+        assert names == ["Clara Dupont"]
+        assert batch == {"people": ["Clara Dupont"], "cities": []}
+
+    def test_wiki_generate_reuses_renderer(self, server, socket_path):
+        """Consecutive wiki runs share the daemon's loaded templates."""
+        loaded = server.renderer.timings["templates"]
+
+        stats = call(
+            "wiki.generate", {"section": "indexes"}, socket_path=socket_path
+        )
+        again = call(
+            "wiki.generate", {"section": "indexes"}, socket_path=socket_path
+        )
+
+        assert loaded > 0
+        assert "queries" in stats and "queries" in again
+        assert server.renderer.timings["templates"] == loaded
+        assert (paths.WIKI_DIR / "index.md").exists()
+
+    def test_connection_carries_several_requests(self, server, socket_path):
+        """One connection can send requests back to back."""
+        import socket
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(socket_path))
+            payload = b"".join(
+                json.dumps(
+                    {"jsonrpc": "2.0", "id": i, "method": "ping"}
+                ).encode() + b"\n"
+                for i in (1, 2)
+            )
+            sock.sendall(payload)
+            with sock.makefile("rb") as stream:
+                ids = [json.loads(stream.readline())["id"] for _ in range(2)]
+
+        assert ids == [1, 2]
+
+
+class TestErrors:
+    """JSON-RPC error handling."""
+
+    def test_unknown_method(self, server, socket_path):
+        """Unknown methods answer METHOD_NOT_FOUND."""
+        with pytest.raises(RpcError) as exc:
+            call("wiki.nope", socket_path=socket_path)
+        assert exc.value.code == METHOD_NOT_FOUND
+
+    def test_invalid_params(self, server, socket_path):
+        """Parameters outside the method signature answer INVALID_PARAMS."""
+        with pytest.raises(RpcError) as exc:
+            call("metadata.list", {"colour": "red"}, socket_path=socket_path)
+        assert exc.value.code == INVALID_PARAMS
+
+    def test_unknown_entity_type(self, server, socket_path):
+        """Bad entity types are reported as INVALID_PARAMS."""
+        with pytest.raises(RpcError) as exc:
+            call(
+                "metadata.list", {"entity_type": "dragons"},
+                socket_path=socket_path,
+            )
+        assert exc.value.code == INVALID_PARAMS
+
+    def test_malformed_lines(self, test_db, socket_path):
+        """Parse errors and non-request objects get error responses."""
+        plm = PlmServer(socket_path, db=test_db)
+
+        assert plm.handle_line(b"{nope")["error"]["code"] == PARSE_ERROR
+        assert plm.handle_line(b"[1, 2]")["error"]["code"] == INVALID_REQUEST
+
+    def test_notification_has_no_response(self, test_db, socket_path):
+        """Requests without an id are answered with nothing."""
+        plm = PlmServer(socket_path, db=test_db)
+        assert plm.handle_line(b'{"jsonrpc": "2.0", "method": "ping"}') is None
+
+
+class TestLifecycle:
+    """Socket ownership and shutdown."""
+
+    def test_second_daemon_refused(self, server, socket_path, test_db):
+        """A live socket is never taken over."""
+        with pytest.raises(RuntimeError, match="already listening"):
+            PlmServer(socket_path, db=test_db).serve_forever()
+
+    def test_shutdown_removes_socket(self, server, socket_path):
+        """shutdown replies, then the daemon exits and removes its socket."""
+        assert call("shutdown", socket_path=socket_path) is None
+
+        deadline = time.monotonic() + 10
+        while socket_path.exists():
+            assert time.monotonic() < deadline, "socket not removed"
+            time.sleep(0.05)
+        assert not is_running(socket_path)
+
+    def test_stale_socket_replaced(self, test_db, socket_path, tmp_path, monkeypatch):
+        """A socket file left by a dead daemon does not block startup."""
+        import socket
+
+        monkeypatch.setattr(paths, "WIKI_TEMPLATE_CACHE_DIR", tmp_path / "tpl")
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(socket_path))
+        stale.close()
+
+        plm = PlmServer(socket_path, db=test_db)
+        thread = threading.Thread(target=plm.serve_forever, daemon=True)
+        thread.start()
+        deadline = time.monotonic() + 30
+        while not is_running(socket_path):
+            assert time.monotonic() < deadline, "daemon did not start"
+            time.sleep(0.05)
+
+        call("shutdown", socket_path=socket_path)
+        thread.join(timeout=10)
+        assert not thread.is_alive()
@@ -18,7 +18,7 @@ Usage:
 from __future__ import annotations
 
 # --- Standard library imports ---
-import sys
+import importlib
 from unittest.mock import MagicMock, patch
 
 # --- Third-party imports ---
@@ -35,9 +35,8 @@ def runner():
     return CliRunner()
 
 
-# The __init__.py `from .sync import sync` shadows the module name with the
-# click Command.  Retrieve the *real* module from sys.modules for patching.
-_sync_mod = sys.modules["dev.pipeline.cli.sync"]
+# Commands load lazily, so import the module explicitly for patching.
+_sync_mod = importlib.import_module("dev.pipeline.cli.sync")
 
 DB_MANAGER = "dev.database.manager"
 SYNC_STATE = "dev.pipeline.sync_state"
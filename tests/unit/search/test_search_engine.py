@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+test_search_engine.py
+---------------------
+Unit tests for the SQL-planned search engine.
+
+Verifies that text matching, metadata filters, ordering and pagination
+are applied by SQLite, including matches beyond the old 1000-row FTS
+prefetch window.
+
+Usage:
+    pytest tests/unit/search/test_search_engine.py -v
+"""
+# --- Annotations ---
+from __future__ import annotations
+
+# --- Standard library imports ---
+from datetime import date, timedelta
+
+# --- Third-party imports ---
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+# --- Local imports ---
+from dev.database.models import Entry, Tag, Theme, ThemeInstance
+from dev.search.search_engine import SearchEngine, SearchQuery, SearchQueryParser
+from dev.search.search_index import SearchIndexManager
+
+
+@pytest.fixture
+def search_db(test_db):
+    """Database with an FTS index and a handful of tagged entries."""
+    mgr = SearchIndexManager(test_db.engine)
+    mgr.create_index()
+    mgr.setup_triggers()
+
+    with test_db.session_scope() as session:
+        tag = Tag(name="reflection")
+        theme = Theme(name="memory")
+        for i in range(6):
+            entry = Entry(
+                date=date(2024, 1, 1) + timedelta(days=i),
+                file_path=f"content/md/2024/e{i}.md",
+                word_count=100 * (i + 1),
+            )
+            if i % 2 == 0:
+                entry.tags.append(tag)
+            session.add(entry)
+            session.flush()
+            if i == 4:
+                session.add(ThemeInstance(theme=theme, entry=entry, description="d"))
+            body = "therapy " * (i + 1) if i < 4 else "garden walk"
+            session.execute(
+                text("UPDATE entries_fts SET body = :b WHERE entry_id = :id"),
+                {"b": body, "id": entry.id},
+            )
+    return test_db
+
+
+def _dates(results):
+    """Entry days-of-month in result order."""
+    return [r["entry"].date.day for r in results]
+
+
+class TestSearchEngine:
+    """Tests for SearchEngine.search() and count()."""
+
+    def test_text_search_ranked_by_bm25(self, search_db):
+        """Matches are ordered by relevance and carry snippets."""
+        with search_db.session_scope() as session:
+            results = SearchEngine(session).search(SearchQuery(text="therapy"))
+            assert sorted(_dates(results)) == [1, 2, 3, 4]
+            scores = [r["score"] for r in results]
+            assert scores == sorted(scores, reverse=True)
+            assert all("<mark>" in r["snippet"] for r in results)
+
+    def test_filters_and_text_combined(self, search_db):
+        """Tag filter is applied in SQL alongside the MATCH."""
+        query = SearchQueryParser.parse("therapy tag:reflection sort:date")
+        with search_db.session_scope() as session:
+            assert _dates(SearchEngine(session).search(query)) == [3, 1]
+
+    def test_theme_filter(self, search_db):
+        """Themes are matched through ThemeInstance."""
+        query = SearchQueryParser.parse("theme:memory")
+        with search_db.session_scope() as session:
+            assert _dates(SearchEngine(session).search(query)) == [5]
+
+    def test_pagination_in_sql(self, search_db):
+        """LIMIT/OFFSET pages are disjoint and cover all matches."""
+        with search_db.session_scope() as session:
+            engine = SearchEngine(session)
+            first = engine.search(SearchQuery(sort_by="date", limit=4))
+            second = engine.search(SearchQuery(sort_by="date", limit=4, offset=4))
+            assert _dates(first) == [6, 5, 4, 3]
+            assert _dates(second) == [2, 1]
+            assert engine.count(SearchQuery(sort_by="date", limit=4)) == 6
+
+    def test_word_count_sort_ascending(self, search_db):
+        """word_count sort honours sort_order."""
+        query = SearchQuery(sort_by="word_count", sort_order="asc", min_words=300)
+        with search_db.session_scope() as session:
+            assert _dates(SearchEngine(session).search(query)) == [3, 4, 5, 6]
+
+    def test_without_index_ignores_text(self, test_db):
+        """Without an FTS table, text is ignored and filters still apply."""
+        with test_db.session_scope() as session:
+            session.add(Entry(date=date(2024, 2, 1), file_path="x.md"))
+            session.flush()
+            results = SearchEngine(session).search(SearchQuery(text="anything"))
+            assert len(results) == 1
+            assert results[0]["score"] == 0
+
+    def test_malformed_text_is_value_error(self, search_db):
+        """FTS5 syntax errors surface as ValueError on every read path."""
+        query = SearchQuery(text='foo"')
+        with search_db.session_scope() as session:
+            engine = SearchEngine(session)
+            with pytest.raises(ValueError, match="Invalid search syntax"):
+                engine.search(query)
+            with pytest.raises(ValueError, match="Invalid search syntax"):
+                engine.count(query)
+            with pytest.raises(ValueError, match="Invalid search syntax"):
+                list(engine.iter_pages(query))
+
+    @pytest.mark.parametrize("query", [
+        SearchQuery(tags=["reflection"]),
+        SearchQuery(text="therapy", tags=["reflection"]),
+    ])
+    def test_database_errors_are_not_syntax_errors(self, search_db, query):
+        """Errors unrelated to the query text propagate unchanged."""
+        with search_db.session_scope() as session:
+            session.execute(text("DROP TABLE entry_tags"))
+            engine = SearchEngine(session)
+            with pytest.raises(OperationalError, match="no such table"):
+                engine.search(query)
+            with pytest.raises(OperationalError, match="no such table"):
+                engine.count(query)
+            session.rollback()
+
+
+class TestStreaming:
+    """Tests for keyset-paginated iter_pages() / iter_results()."""
+
+    @pytest.mark.parametrize("sort_by", ["date", "word_count", "relevance"])
+    @pytest.mark.parametrize("sort_order", ["desc", "asc"])
+    def test_pages_match_single_query(self, search_db, sort_by, sort_order):
+        """Concatenated keyset pages equal one unpaginated search."""
+        text_query = "therapy" if sort_by == "relevance" else None
+        query = SearchQuery(
+            text=text_query, sort_by=sort_by, sort_order=sort_order, limit=100
+        )
+        with search_db.session_scope() as session:
+            engine = SearchEngine(session)
+            expected = [r["entry"].id for r in engine.search(query)]
+            pages = list(engine.iter_pages(query, page_size=2))
+            assert all(len(page) <= 2 for page in pages)
+            assert [r["entry"].id for p in pages for r in p] == expected
+
+    def test_max_results_and_offset(self, search_db):
+        """Streaming honours offset and stops at max_results."""
+        query = SearchQuery(sort_by="date", offset=1)
+        with search_db.session_scope() as session:
+            results = list(
+                SearchEngine(session).iter_results(query, page_size=2, max_results=3)
+            )
+            assert _dates(results) == [5, 4, 3]
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+test_search_index.py
+--------------------
+Unit tests for the FTS5 search index manager.
+
+Verifies incremental reindexing: only entries whose file_hash moved (or
+that were never indexed) are re-read, and FTS rows are rewritten only
+when the body hash changes.
+
+Usage:
+    pytest tests/unit/search/test_search_index.py -v
+"""
+# --- Annotations ---
+from __future__ import annotations
+
+# --- Standard library imports ---
+from datetime import date
+from unittest.mock import patch
+
+# --- Third-party imports ---
+import pytest
+from sqlalchemy import text
+
+# --- Local imports ---
+from dev.database.models import Entry
+from dev.search.search_index import SearchIndexManager, extract_body
+
+
+INDEX_MOD = "dev.search.search_index"
+
+
+def _write_md(journal_dir, rel_path, body):
+    """Write an MD file with minimal frontmatter under journal_dir."""
+    path = journal_dir / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"---\ndate: 2024-01-15\n---\n\n{body}\n", encoding="utf-8")
+
+
+def _fts_body(session, entry_id):
+    """Fetch the indexed body for an entry."""
+    return session.execute(
+        text("SELECT body FROM entries_fts WHERE entry_id = :id"), {"id": entry_id}
+    ).scalar()
+
+
+@pytest.fixture
+def journal_dir(tmp_path):
+    """Temporary JOURNAL_DIR patched into the search index module."""
+    with patch(f"{INDEX_MOD}.JOURNAL_DIR", tmp_path):
+        yield tmp_path
+
+
+@pytest.fixture
+def indexed_db(test_db, journal_dir):
+    """Database with FTS index, triggers and one entry."""
+    _write_md(journal_dir, "content/md/2024/2024-01-15.md", "Original body text")
+
+    mgr = SearchIndexManager(test_db.engine)
+    mgr.create_index()
+    mgr.setup_triggers()
+
+    with test_db.session_scope() as session:
+        session.add(Entry(
+            date=date(2024, 1, 15),
+            file_path="content/md/2024/2024-01-15.md",
+            file_hash="hash-1",
+        ))
+    return test_db
+
+
+class TestExtractBody:
+    """Tests for extract_body()."""
+
+    def test_strips_frontmatter(self):
+        """Frontmatter is removed and body is stripped."""
+        assert extract_body("---\ndate: x\n---\n\nHello\n") == "Hello"
+
+    def test_without_frontmatter(self):
+        """Content without frontmatter is returned as-is."""
+        assert extract_body("Hello") == "Hello"
+
+
+class TestUpdateIndex:
+    """Tests for SearchIndexManager.update_index()."""
+
+    def test_fills_trigger_inserted_empty_body(self, indexed_db):
+        """Entries inserted via trigger get their body indexed."""
+        mgr = SearchIndexManager(indexed_db.engine)
+        with indexed_db.session_scope() as session:
+            assert _fts_body(session, 1) == ""
+            assert mgr.update_index(session) == 1
+            assert _fts_body(session, 1) == "Original body text"
+
+    def test_unchanged_file_hash_is_skipped(self, indexed_db, journal_dir):
+        """Entries with an unchanged file_hash are not re-read."""
+        mgr = SearchIndexManager(indexed_db.engine)
+        with indexed_db.session_scope() as session:
+            mgr.update_index(session)
+
+        _write_md(journal_dir, "content/md/2024/2024-01-15.md", "Edited elsewhere")
+        with indexed_db.session_scope() as session:
+            assert mgr.update_index(session) == 0
+            assert _fts_body(session, 1) == "Original body text"
+
+            # --verify catches edits that bypassed the importer
+            assert mgr.update_index(session, verify=True) == 1
+            assert _fts_body(session, 1) == "Edited elsewhere"
+
+    def test_changed_file_hash_reindexes(self, indexed_db, journal_dir):
+        """A new file_hash with a new body rewrites the FTS row."""
+        mgr = SearchIndexManager(indexed_db.engine)
+        with indexed_db.session_scope() as session:
+            mgr.update_index(session)
+
+        _write_md(journal_dir, "content/md/2024/2024-01-15.md", "New body")
+        with indexed_db.session_scope() as session:
+            session.get(Entry, 1).file_hash = "hash-2"
+            assert mgr.update_index(session, entry_ids=[1]) == 1
+            assert _fts_body(session, 1) == "New body"
+            count = session.execute(
+                text("SELECT COUNT(*) FROM entries_fts WHERE entry_id = 1")
+            ).scalar()
+            assert count == 1
+
+    def test_frontmatter_only_change_keeps_fts_row(self, indexed_db):
+        """A new file_hash with identical body only refreshes the state."""
+        mgr = SearchIndexManager(indexed_db.engine)
+        with indexed_db.session_scope() as session:
+            mgr.update_index(session)
+
+        with indexed_db.session_scope() as session:
+            session.get(Entry, 1).file_hash = "hash-2"
+            assert mgr.update_index(session) == 0
+            stored = session.execute(
+                text("SELECT file_hash FROM entries_fts_state WHERE entry_id = 1")
+            ).scalar()
+            assert stored == "hash-2"
+
+    def test_no_index_is_noop(self, test_db):
+        """Without an FTS table nothing happens."""
+        mgr = SearchIndexManager(test_db.engine)
+        with test_db.session_scope() as session:
+            assert mgr.update_index(session) == 0
@@ -0,0 +1,122 @@
+"""
+test_file_state.py
+------------------
+Unit tests for dev.utils.file_state module.
+
+Tests the stat-signature hash cache: hits and misses, invalidation on
+content change, the racy-mtime guard, and persistence.
+"""
+import hashlib
+import json
+import os
+import time
+
+from dev.utils.file_state import CACHE_VERSION, FileStateCache
+from dev.utils.fs import get_file_hash
+
+
+def _write_old(path, content):
+    """Write a file and backdate its mtime out of the racy window."""
+    path.write_text(content)
+    old = time.time() - 60
+    os.utime(path, (old, old))
+    return path
+
+
+class TestFileStateCache:
+    """Test FileStateCache hashing and invalidation."""
+
+    def test_second_hash_is_a_hit(self, tmp_dir):
+        """An unchanged file is hashed once."""
+        path = _write_old(tmp_dir / "a.md", "hello")
+        cache = FileStateCache()
+
+        expected = hashlib.sha256(b"hello").hexdigest()
+        assert cache.get_hash(path) == expected
+        assert cache.get_hash(path) == expected
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_changed_file_is_rehashed(self, tmp_dir):
+        """A new stat signature forces a reread."""
+        path = _write_old(tmp_dir / "a.md", "hello")
+        cache = FileStateCache()
+        cache.get_hash(path)
+
+        _write_old(path, "hello, world")
+        assert cache.lookup(path) is None
+        assert cache.get_hash(path) == hashlib.sha256(b"hello, world").hexdigest()
+
+    def test_fresh_file_not_cached(self, tmp_dir):
+        """Files modified within the racy window are never cached."""
+        path = tmp_dir / "a.md"
+        path.write_text("hello")
+        cache = FileStateCache()
+
+        cache.get_hash(path)
+        assert cache.lookup(path) is None
+        assert len(cache) == 0
+
+    def test_algorithms_cached_separately(self, tmp_dir):
+        """MD5 and SHA256 digests share one stat entry."""
+        path = _write_old(tmp_dir / "a.md", "hello")
+        cache = FileStateCache()
+
+        cache.get_hash(path, "md5")
+        assert cache.lookup(path, "sha256") is None
+        cache.get_hash(path, "sha256")
+        assert cache.lookup(path, "md5") == hashlib.md5(b"hello").hexdigest()
+        assert len(cache) == 1
+
+    def test_invalidate(self, tmp_dir):
+        """Invalidated files are rehashed."""
+        path = _write_old(tmp_dir / "a.md", "hello")
+        cache = FileStateCache()
+        cache.get_hash(path)
+
+        cache.invalidate(path)
+        assert cache.lookup(path) is None
+
+
+class TestPersistence:
+    """Test FileStateCache save/load."""
+
+    def test_round_trip(self, tmp_dir):
+        """Saved state is served after reload."""
+        path = _write_old(tmp_dir / "a.md", "hello")
+        state_file = tmp_dir / ".file_state.json"
+
+        cache = FileStateCache(state_file)
+        cache.get_hash(path)
+        cache.save()
+
+        reloaded = FileStateCache(state_file)
+        assert reloaded.lookup(path) == hashlib.sha256(b"hello").hexdigest()
+        assert not state_file.with_name(".file_state.json.tmp").exists()
+
+    def test_corrupt_file_is_ignored(self, tmp_dir):
+        """An unreadable cache starts empty."""
+        state_file = tmp_dir / ".file_state.json"
+        state_file.write_text("{not json")
+        assert len(FileStateCache(state_file)) == 0
+
+    def test_other_version_is_discarded(self, tmp_dir):
+        """Caches from another layout version start empty."""
+        state_file = tmp_dir / ".file_state.json"
+        state_file.write_text(json.dumps({
+            "version": CACHE_VERSION + 1,
+            "files": {"x": {"sig": [0, 0, 0], "hashes": {}}},
+        }))
+        assert len(FileStateCache(state_file)) == 0
+
+
+class TestGetFileHashWithCache:
+    """Test get_file_hash(cache=...)."""
+
+    def test_matches_uncached_md5(self, tmp_dir):
+        """Cached MD5 equals the plain MD5 hash."""
+        path = _write_old(tmp_dir / "a.md", "hello")
+        cache = FileStateCache()
+
+        assert get_file_hash(path, cache=cache) == get_file_hash(path)
+        get_file_hash(path, cache=cache)
+        assert cache.hits == 1
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+test_scanner.py
+---------------
+Unit tests for the one-pass markdown scanner.
+
+Verifies heading and link tokens carry the right kind, line and
+columns, and that overlapping link syntaxes yield a single token.
+
+Usage:
+    pytest tests/unit/validators/test_scanner.py -v
+"""
+# --- Annotations ---
+from __future__ import annotations
+
+# --- Local imports ---
+from dev.validators.scanner import scan_markdown
+
+
+class TestScanMarkdown:
+    """Tests for scan_markdown()."""
+
+    def test_headings(self):
+        """Headings record line, level and title; other lines are skipped."""
+        scan = scan_markdown("# Title\n\n#hashtag\n## Section\n")
+
+        assert [(h.line, h.level, h.title) for h in scan.headings] == [
+            (1, 1, "Title"),
+            (4, 2, "Section"),
+        ]
+        assert scan.has_title
+
+    def test_no_title(self):
+        """A document with only H2+ headings has no title."""
+        assert not scan_markdown("## Section\n\ntext").has_title
+
+    def test_link_kinds(self):
+        """Each link syntax is reported with its target and text."""
+        scan = scan_markdown(
+            "intro\n"
+            "[[Clara|her]] and [Montreal][/places/mtl] or [x][]\n"
+            "see [notes](notes.md)"
+        )
+
+        assert [(l.kind, l.line, l.target, l.text) for l in scan.links] == [
+            ("wikilink", 2, "Clara", ""),
+            ("wikilink1", 2, "/places/mtl", "Montreal"),
+            ("wikilink1", 2, "", "x"),
+            ("link", 3, "notes.md", "notes"),
+        ]
+
+    def test_columns(self):
+        """Columns are 1-based; end_col points just past the token."""
+        link = scan_markdown("Some text [[broken link]] more").links[0]
+
+        assert (link.col, link.end_col) == (11, 26)
+
+    def test_wikilink_claims_its_span(self):
+        """Adjacent wikilinks are not re-read as a reference link."""
+        scan = scan_markdown("[[a]][[b]]")
+
+        assert [(l.kind, l.target) for l in scan.links] == [
+            ("wikilink", "a"),
+            ("wikilink", "b"),
+        ]
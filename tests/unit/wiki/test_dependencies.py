@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+test_dependencies.py
+--------------------
+Tests for the wiki page dependency graph.
+
+Verifies that collect_dependencies records every row along the
+declared relationship paths, that every configured path names real
+relationships, and that PageIndex round-trips, rejects foreign
+indexes, and maps changed rows to the pages that read them.
+"""
+# --- Annotations ---
+from __future__ import annotations
+
+# --- Standard library imports ---
+from datetime import date
+
+# --- Third-party imports ---
+import pytest
+from sqlalchemy import inspect
+
+# --- Local imports ---
+from dev.database.models import Entry, Person, Tag
+from dev.wiki.configs import ENTRY_DEPENDS_ON, JOURNAL_CONFIGS, MANUSCRIPT_CONFIGS
+from dev.wiki.dependencies import (
+    PageIndex,
+    PageRecord,
+    collect_dependencies,
+)
+
+
+class TestCollectDependencies:
+    """Tests for relationship path walking."""
+
+    def test_rows_along_paths(self, db_session):
+        """The root and every row on each path are recorded."""
+        clara = Person(name="Clara", slug="clara")
+        majo = Person(name="Majo", slug="majo")
+        entry = Entry(date=date(2024, 1, 1), file_path="2024-01-01.md")
+        entry.people.extend([clara, majo])
+        entry.tags.append(Tag(name="coffee"))
+        db_session.add(entry)
+        db_session.flush()
+
+        deps = collect_dependencies(clara, ("entries.people",))
+
+        assert deps == {
+            "people": {clara.id, majo.id},
+            "entries": {entry.id},
+        }
+
+    def test_empty_relationships(self, db_session):
+        """Unset to-one and empty collections end the walk."""
+        person = Person(name="Solo", slug="solo")
+        db_session.add(person)
+        db_session.flush()
+
+        assert collect_dependencies(person, ("entries.tags", "threads")) == {
+            "people": {person.id},
+        }
+
+    @pytest.mark.parametrize(
+        "model,paths",
+        [(Entry, ENTRY_DEPENDS_ON)]
+        + [(c.model, c.depends_on) for c in JOURNAL_CONFIGS + MANUSCRIPT_CONFIGS],
+    )
+    def test_configured_paths_exist(self, model, paths):
+        """Every path segment is a relationship (or a derived property)."""
+        for path in paths:
+            cls = model
+            for attr in path.split("."):
+                assert hasattr(cls, attr), f"{model.__name__}: {path}"
+                relationships = inspect(cls).relationships
+                if attr not in relationships:
+                    # Property over relationships (e.g. Chapter.characters)
+                    break
+                cls = relationships[attr].mapper.class_
+
+
+class TestPageIndex:
+    """Tests for the persisted page index."""
+
+    def _index(self, tmp_path, fingerprint="abc"):
+        """Page index for a wiki root under tmp_path."""
+        (tmp_path / "wiki").mkdir(exist_ok=True)
+        return PageIndex(tmp_path / "index.json", tmp_path / "wiki", fingerprint)
+
+    def test_round_trip(self, tmp_path):
+        """Saved sections and pages load back unchanged."""
+        index = self._index(tmp_path)
+        record = PageRecord({"journal/people/clara.md"}, {"entries": {1, 2}})
+        index.update("journal", 7, {"people:3": record})
+        index.save()
+
+        loaded = self._index(tmp_path)
+        assert loaded.load()
+        assert loaded.change_id("journal") == 7
+        assert loaded.pages["journal"]["people:3"] == record
+
+    def test_template_change_invalidates(self, tmp_path):
+        """An index written with other templates is ignored."""
+        index = self._index(tmp_path)
+        index.update("journal", 1, {})
+        index.save()
+
+        loaded = self._index(tmp_path, fingerprint="def")
+        assert not loaded.load()
+        assert loaded.change_id("journal") is None
+
+    def test_affected_pages(self, tmp_path):
+        """Pages are selected when they read any changed row."""
+        index = self._index(tmp_path)
+        index.update("journal", 1, {
+            "people:3": PageRecord(set(), {"people": {3}, "entries": {1, 2}}),
+            "tags:5": PageRecord(set(), {"tags": {5}, "entries": {2}}),
+            "entries:1": PageRecord(set(), {"entries": {1}}),
+        })
+
+        affected = index.affected("journal", {"entries": {2}, "cities": {9}})
+
+        assert affected == {"people": {3}, "tags": {5}}
+
+    def test_incremental_update_replaces_keys(self, tmp_path):
+        """Replaced keys are dropped unless regenerated."""
+        index = self._index(tmp_path)
+        index.update("journal", 1, {
+            "people:3": PageRecord({"a.md"}),
+            "people:4": PageRecord({"b.md"}),
+        })
+
+        index.update(
+            "journal", 2, {"people:3": PageRecord({"c.md"})},
+            replaced={"people:3", "people:4"},
+        )
+
+        assert index.pages["journal"] == {"people:3": PageRecord({"c.md"})}
+        assert index.change_id("journal") == 2
@@ -587,3 +587,342 @@ class TestManuscriptIndexContexts:
             assert len(ctx["unassigned_scenes"]) >= 1
             orphan_names = [s["name"] for s in ctx["unassigned_scenes"]]
             assert "Lost Fragment" in orphan_names
+
+
+class TestIncrementalGeneration:
+    """Tests for change-log driven regeneration with a page index."""
+
+    def _generate(self, test_db, tmp_path, name="wiki", **kwargs):
+        """Run a generation with a page index."""
+        exporter = WikiExporter(
+            test_db,
+            output_dir=tmp_path / name,
+            index_path=tmp_path / f"{name}-index.json",
+        )
+        exporter.generate_all(**kwargs)
+        return exporter
+
+    def _tree(self, root):
+        """Map relative path -> content of every generated page."""
+        return {
+            path.relative_to(root): path.read_text()
+            for path in root.rglob("*.md")
+        }
+
+    def _assert_matches_full_generation(self, test_db, tmp_path):
+        """The incrementally maintained tree equals a fresh generation."""
+        WikiExporter(test_db, output_dir=tmp_path / "ref").generate_all()
+        assert self._tree(tmp_path / "wiki") == self._tree(tmp_path / "ref")
+
+    def test_first_run_records_pages(self, test_db, populated_db, tmp_path):
+        """A run without an index renders everything and indexes pages."""
+        exporter = self._generate(test_db, tmp_path)
+
+        assert exporter.stats["entries"] == 2
+        record = exporter._index.pages["journal"]
+        clara = populated_db.query(Person).filter_by(slug="clara_dupont").one()
+        assert "journal/people/clara_dupont.md" in record[f"people:{clara.id}"].files
+
+    def test_unchanged_database_renders_nothing(
+        self, test_db, populated_db, tmp_path
+    ):
+        """A second run keeps every page without rendering it."""
+        first = self._generate(test_db, tmp_path)
+        files = set((tmp_path / "wiki").rglob("*.md"))
+
+        second = self._generate(test_db, tmp_path)
+
+        assert second.stats["entries"] == 0
+        assert second.stats["people"] == 0
+        assert second.stats["journal_pages_unchanged"] == len(
+            first._index.pages["journal"]
+        )
+        assert set((tmp_path / "wiki").rglob("*.md")) == files
+
+    def test_only_dependent_pages_rendered(
+        self, test_db, populated_db, tmp_path
+    ):
+        """Renaming a person re-renders the pages that display them."""
+        self._generate(test_db, tmp_path)
+        with test_db.session_scope() as session:
+            session.query(Person).filter_by(slug="clara_dupont").one().name = "Clarisse"
+
+        exporter = self._generate(test_db, tmp_path)
+
+        # 2024-11-08 lists Clara; 2024-11-09 does not
+        assert exporter.stats["entries"] == 1
+        assert exporter.stats["people"] == 2
+        assert exporter.stats["motifs"] == 0
+        self._assert_matches_full_generation(test_db, tmp_path)
+
+    def test_deleted_entity_page_removed(self, test_db, populated_db, tmp_path):
+        """A deleted row loses its page on the next run."""
+        self._generate(test_db, tmp_path)
+        page = tmp_path / "wiki" / "journal" / "motifs" / "the-loop.md"
+        assert page.exists()
+        with test_db.session_scope() as session:
+            session.delete(session.query(Motif).one())
+
+        self._generate(test_db, tmp_path)
+
+        assert not page.exists()
+        self._assert_matches_full_generation(test_db, tmp_path)
+
+    def test_missing_file_regenerated(self, test_db, populated_db, tmp_path):
+        """A page deleted on disk is rendered again."""
+        self._generate(test_db, tmp_path)
+        page = tmp_path / "wiki" / "journal" / "arcs" / "the-long-wanting.md"
+        page.unlink()
+
+        exporter = self._generate(test_db, tmp_path)
+
+        assert page.exists()
+        assert exporter.stats["arcs"] == 1
+
+    def test_full_flag_renders_everything(self, test_db, populated_db, tmp_path):
+        """--full ignores a current index."""
+        self._generate(test_db, tmp_path)
+
+        exporter = self._generate(test_db, tmp_path, full=True)
+
+        assert exporter.stats["entries"] == 2
+
+    def test_sections_tracked_independently(
+        self, test_db, populated_db, tmp_path
+    ):
+        """A journal-only run does not consume changes for other sections."""
+        self._generate(test_db, tmp_path)
+        with test_db.session_scope() as session:
+            session.query(Tag).one().name = "solitude"
+
+        self._generate(test_db, tmp_path, section="journal")
+        exporter = self._generate(test_db, tmp_path, section="indexes")
+
+        tags_index = tmp_path / "wiki" / "indexes" / "tags-index.md"
+        assert "solitude" in tags_index.read_text()
+        assert exporter._index.change_id("indexes") == exporter._head
+
+    def test_unchanged_indexes_kept(self, test_db, populated_db, tmp_path):
+        """Only index pages reading a changed table are rendered."""
+        self._generate(test_db, tmp_path)
+        indexes = tmp_path / "wiki" / "indexes"
+        people_index = indexes / "people-index.md"
+        tags_index = indexes / "tags-index.md"
+        tags_index.write_text("stale")
+        with test_db.session_scope() as session:
+            session.query(Person).filter_by(slug="clara_dupont").one().name = "Clarisse"
+
+        exporter = self._generate(test_db, tmp_path, section="indexes")
+
+        assert "Clarisse" in people_index.read_text()
+        assert tags_index.read_text() == "stale"
+        assert exporter.stats["indexes_pages_unchanged"] > 0
+
+    def test_missing_index_regenerated(self, test_db, populated_db, tmp_path):
+        """An index page deleted on disk is rendered again."""
+        self._generate(test_db, tmp_path)
+        year_page = tmp_path / "wiki" / "indexes" / "entries-2024.md"
+        tags_index = tmp_path / "wiki" / "indexes" / "tags-index.md"
+        year_page.unlink()
+        tags_index.unlink()
+
+        self._generate(test_db, tmp_path)
+
+        assert year_page.exists()
+        assert tags_index.exists()
+        self._assert_matches_full_generation(test_db, tmp_path)
+
+
+class TestQueryBudget:
+    """Tests that full generation issues a bounded number of queries."""
+
+    def _add_entries(self, session, start, count):
+        """Add entries, each with its own person, place, scene and event."""
+        city = session.query(City).one()
+        tag = session.query(Tag).one()
+        for i in range(start, start + count):
+            person = Person(
+                name=f"Friend{i}", slug=f"friend{i}",
+                relation_type=RelationType.FRIEND,
+            )
+            location = Location(name=f"Bar {i}", city_id=city.id)
+            entry = Entry(
+                date=date(2023, 1, 1 + i), file_path=f"2023/2023-01-{1 + i:02d}.md",
+            )
+            entry.people.append(person)
+            entry.locations.append(location)
+            entry.tags.append(tag)
+            scene = Scene(name=f"Night {i}", description="Drinks.", entry=entry)
+            scene.people.append(person)
+            scene.locations.append(location)
+            event = Event(name=f"Evening {i}")
+            event.entries.append(entry)
+            event.scenes.append(scene)
+            session.add_all([entry, event])
+        session.flush()
+
+    def _count(self, test_db, output_dir):
+        """
+        Run a full generation and return its query count.
+
+        A first run brings the derived tables (aggregates, wikilink
+        targets) up to date, so the counted run measures page building.
+        """
+        WikiExporter(test_db, output_dir=output_dir).generate_all()
+        exporter = WikiExporter(test_db, output_dir=output_dir)
+        exporter.generate_all()
+        return exporter.stats["queries"]
+
+    def test_queries_independent_of_row_count(
+        self, test_db, populated_db, tmp_path
+    ):
+        """Tripling the entities leaves the statement count unchanged."""
+        self._add_entries(populated_db, 0, 2)
+        populated_db.commit()
+        small = self._count(test_db, tmp_path / "small")
+
+        self._add_entries(populated_db, 2, 4)
+        populated_db.commit()
+        large = self._count(test_db, tmp_path / "large")
+
+        assert small > 0
+        assert large == small
+
+    def test_index_queries_independent_of_row_count(
+        self, test_db, populated_db, tmp_path
+    ):
+        """Index pages are built from aggregates, not per-row loads."""
+        def count():
+            # First run refreshes the derived tables, as in _count()
+            for _ in range(2):
+                exporter = WikiExporter(test_db, output_dir=tmp_path / "wiki")
+                exporter.generate_all(section="indexes")
+            return exporter.stats["queries"]
+
+        self._add_entries(populated_db, 0, 2)
+        populated_db.commit()
+        small = count()
+
+        self._add_entries(populated_db, 2, 4)
+        populated_db.commit()
+
+        assert count() == small
+
+
+class TestGenerateEntity:
+    """Tests for single-entity regeneration."""
+
+    def _files(self, root):
+        """Relative paths of every generated page."""
+        return {path.relative_to(root).as_posix() for path in root.rglob("*.md")}
+
+    def test_person_pages_and_indexes_only(
+        self, test_db, populated_db, wiki_output
+    ):
+        """Only the person's page and the indexes listing people are written."""
+        exporter = WikiExporter(test_db, output_dir=wiki_output)
+        exporter.generate_entity("people", "clara_dupont")
+
+        assert self._files(wiki_output) == {
+            "journal/people/clara_dupont.md",
+            "indexes/people-index.md",
+            "index.md",
+        }
+        assert exporter.stats["people_changed"] == 1
+
+    def test_matches_full_generation(self, test_db, populated_db, tmp_path):
+        """Regenerated pages are identical to a full run's."""
+        full = tmp_path / "full"
+        WikiExporter(test_db, output_dir=full).generate_all()
+        single = tmp_path / "single"
+
+        WikiExporter(test_db, output_dir=single).generate_entity(
+            "locations", "montreal/cafe-olimpico"
+        )
+
+        for path in self._files(single):
+            assert (single / path).read_text() == (full / path).read_text()
+        assert "journal/locations/montreal/cafe-olimpico.md" in self._files(single)
+
+    def test_entry_by_date(self, test_db, populated_db, wiki_output):
+        """Entries are keyed by ISO date and bring their year page."""
+        WikiExporter(test_db, output_dir=wiki_output).generate_entity(
+            "entries", "2024-11-08"
+        )
+
+        files = self._files(wiki_output)
+        assert "journal/entries/2024/2024-11-08.md" in files
+        assert "indexes/entries-2024.md" in files
+        assert "journal/entries/2024/2024-11-09.md" not in files
+
+    def test_key_by_name(self, test_db, populated_db, wiki_output):
+        """A wikilink name resolves like a path key."""
+        exporter = WikiExporter(test_db, output_dir=wiki_output)
+        tag_id = exporter.generate_entity("tags", "Loneliness")
+
+        assert tag_id == populated_db.query(Tag).one().id
+
+    @pytest.mark.parametrize("entity_type,key", [
+        ("people", "nobody"),
+        ("dragons", "clara_dupont"),
+    ])
+    def test_unknown_entity(self, test_db, populated_db, entity_type, key):
+        """Unknown types and keys raise ValueError."""
+        with pytest.raises(ValueError):
+            WikiExporter(test_db).generate_entity(entity_type, key)
+
+
+class TestParallelRendering:
+    """Tests that rendering through worker processes matches serial runs."""
+
+    def _tree(self, root):
+        """Relative path -> content of every generated page."""
+        return {
+            path.relative_to(root).as_posix(): path.read_text()
+            for path in sorted(root.rglob("*.md"))
+        }
+
+    def test_pool_matches_serial(
+        self, test_db, populated_db, tmp_path, monkeypatch
+    ):
+        """Same pages and *_changed stats with and without workers."""
+        monkeypatch.setattr("dev.wiki.renderer.RENDER_BATCH", 2)
+        serial = WikiExporter(test_db, output_dir=tmp_path / "serial")
+        serial.generate_all()
+        parallel = WikiExporter(
+            test_db, output_dir=tmp_path / "parallel", workers=2
+        )
+        parallel.generate_all()
+
+        assert self._tree(tmp_path / "parallel") == self._tree(tmp_path / "serial")
+        changed = {k: v for k, v in serial.stats.items() if k.endswith("_changed")}
+        assert changed
+        assert {
+            k: v for k, v in parallel.stats.items() if k.endswith("_changed")
+        } == changed
+
+    def test_rerun_writes_nothing(self, test_db, populated_db, tmp_path):
+        """A second parallel run finds every page unchanged."""
+        WikiExporter(test_db, output_dir=tmp_path, workers=2).generate_all()
+
+        exporter = WikiExporter(test_db, output_dir=tmp_path, workers=2)
+        exporter.generate_all()
+
+        assert exporter.stats["entries_changed"] == 0
+        assert exporter.stats["people_changed"] == 0
+
+
+class TestStreaming:
+    """Tests that chunked entity loading matches loading everything."""
+
+    def test_small_chunks_match(
+        self, test_db, populated_db, tmp_path, monkeypatch
+    ):
+        """Pages are identical when every entity is released once rendered."""
+        WikiExporter(test_db, output_dir=tmp_path / "whole").generate_all()
+        monkeypatch.setattr("dev.database.query_optimizer.STREAM_CHUNK", 1)
+        monkeypatch.setattr("dev.database.query_optimizer.STREAM_KEEP_OBJECTS", 0)
+        WikiExporter(test_db, output_dir=tmp_path / "chunked").generate_all()
+
+        tree = TestParallelRendering()._tree
+        assert tree(tmp_path / "chunked") == tree(tmp_path / "whole")
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+test_link_targets.py
+--------------------
+Tests for the persisted wikilink target index.
+
+Verifies that refresh_link_targets builds a name and path for every
+linkable entity, that incremental refreshes follow creates, renames
+and deletes made through the managers, and that readers report
+collisions, lowercased names and the entities page keys name.
+"""
+# --- Annotations ---
+from __future__ import annotations
+
+# --- Standard library imports ---
+from datetime import date
+
+# --- Third-party imports ---
+from sqlalchemy import select
+
+# --- Local imports ---
+from dev.database.models import (
+    City,
+    Entry,
+    Location,
+    Person,
+    Tag,
+    Theme,
+    ThemeInstance,
+    WikilinkTarget,
+)
+from dev.wiki.link_targets import (
+    known_targets,
+    load_link_targets,
+    refresh_link_targets,
+    resolve_target,
+)
+
+
+def _stored(session):
+    """Read (type, id) -> (name, path) straight from the table."""
+    return {
+        (row.entity_type, row.entity_id): (row.name, row.path)
+        for row in session.execute(select(WikilinkTarget.__table__))
+    }
+
+
+class TestRefreshLinkTargets:
+    """Tests for full and incremental refreshes."""
+
+    def test_full_build(self, db_session):
+        """Every linkable entity gets its name and wiki path."""
+        entry = Entry(date=date(2024, 3, 5), file_path="2024-03-05.md")
+        cafe = Location(name="Café Olimpico", city=City(name="Montreal"))
+        entry.tags.append(Tag(name="coffee"))
+        db_session.add_all([entry, cafe])
+        db_session.flush()
+
+        refresh_link_targets(db_session)
+
+        targets, collisions = load_link_targets(db_session, refresh=False)
+        assert targets == {
+            "2024-03-05": "/journal/entries/2024/2024-03-05",
+            "Montreal": "/journal/cities/montreal",
+            "Café Olimpico": "/journal/locations/montreal/cafe-olimpico",
+            "coffee": "/journal/tags/coffee",
+        }
+        assert collisions == []
+
+    def test_unchanged_database_writes_nothing(self, db_session):
+        """A refresh with no new changes is a no-op."""
+        db_session.add(Tag(name="coffee"))
+        refresh_link_targets(db_session)
+
+        assert refresh_link_targets(db_session) == 0
+
+    def test_manager_create_rename_delete(self, db_session, person_manager):
+        """Managed person writes reach the index on the next refresh."""
+        refresh_link_targets(db_session)
+        person = person_manager.create({"name": "Clara", "lastname": "Dupont"})
+        refresh_link_targets(db_session)
+        assert _stored(db_session)[("people", person.id)][0] == "Clara Dupont"
+
+        person_manager.update(person, {"lastname": "Roy"})
+        refresh_link_targets(db_session)
+        assert _stored(db_session)[("people", person.id)][0] == "Clara Roy"
+
+        person_id = person.id
+        person_manager.delete(person, hard_delete=True)
+        refresh_link_targets(db_session)
+        assert ("people", person_id) not in _stored(db_session)
+
+    def test_city_rename_moves_locations(self, db_session):
+        """Renaming a city rewrites the paths of its locations."""
+        city = City(name="Montreal")
+        cafe = Location(name="Cafe", city=city)
+        db_session.add(cafe)
+        refresh_link_targets(db_session)
+
+        city.name = "Montréal Nord"
+        refresh_link_targets(db_session)
+
+        assert _stored(db_session)[("locations", cafe.id)][1] == (
+            "/journal/locations/montreal-nord/cafe"
+        )
+
+    def test_theme_linked_from_second_use(self, db_session):
+        """Themes become targets once a second entry uses them."""
+        memory = Theme(name="memory")
+        entries = [
+            Entry(date=date(2024, 1, day), file_path=f"2024-01-0{day}.md")
+            for day in (1, 2)
+        ]
+        db_session.add_all(entries)
+        db_session.add(ThemeInstance(theme=memory, entry=entries[0], description="."))
+        refresh_link_targets(db_session)
+        assert "memory" not in load_link_targets(db_session, refresh=False)[0]
+
+        db_session.add(ThemeInstance(theme=memory, entry=entries[1], description="."))
+        refresh_link_targets(db_session)
+
+        assert load_link_targets(db_session, refresh=False)[0]["memory"] == (
+            "/journal/themes/memory"
+        )
+
+
+class TestReaders:
+    """Tests for load_link_targets and known_targets."""
+
+    def test_collision_first_registered_wins(self, db_session):
+        """A tag named like a person keeps pointing at the person."""
+        db_session.add_all([
+            Person(name="Rain", slug="rain"),
+            Tag(name="Rain"),
+        ])
+
+        targets, collisions = load_link_targets(db_session)
+
+        assert targets["Rain"] == "/journal/people/rain"
+        assert collisions == ["  'Rain': /journal/people/rain vs /journal/tags/rain"]
+
+    def test_known_targets_lowercase_names(self, db_session):
+        """Names are lowercased; paths are kept as stored."""
+        db_session.add(Person(name="Clara", lastname="Dupont", slug="clara-dupont"))
+
+        known = known_targets(db_session)
+
+        assert "clara dupont" in known
+        assert "/journal/people/clara-dupont" in known
+
+    def test_resolve_target(self, db_session):
+        """Page keys match path tails or names, per entity type."""
+        cafe = Location(name="Café Olimpico", city=City(name="Montreal"))
+        tag = Tag(name="Montreal")
+        db_session.add_all([cafe, tag])
+
+        assert resolve_target(db_session, "locations", "montreal/cafe-olimpico") == cafe.id
+        assert resolve_target(db_session, "locations", "café olimpico") == cafe.id
+        assert resolve_target(db_session, "tags", "montreal") == tag.id
+        assert resolve_target(db_session, "tags", "paris") is None
@@ -202,6 +202,15 @@ class TestHTMLRendering:
         assert 'href="Clara Dupont"' in html
         assert ">Clara</a>" in html
 
+    def test_targets_resolve_href(self):
+        """Known names link to their wiki path; unknown ones stay raw."""
+        md = MarkdownIt().use(
+            wikilink_plugin, targets={"Clara Dupont": "/journal/people/clara"}
+        )
+        html = md.render("[[Clara Dupont|Clara]] and [[Majo]]")
+        assert 'href="/journal/people/clara"' in html
+        assert 'href="Majo"' in html
+
 
 class TestExtractWikilinks:
     """Tests for the extract_wikilinks helper function."""
@@ -5,12 +5,14 @@ test_renderer.py
 Tests for the WikiRenderer class.
 
 Covers Jinja2 environment setup, filter registration, template
-rendering, and file-based rendering with change detection.
+rendering, file-based rendering with change detection, the bytecode
+cache, and the RenderPool worker pool.
 """
 # --- Annotations ---
 from __future__ import annotations
 
 # --- Standard library imports ---
+import os
 from datetime import date
 from pathlib import Path
 
@@ -18,7 +20,7 @@ from pathlib import Path
 import pytest
 
 # --- Local imports ---
-from dev.wiki.renderer import WikiRenderer
+from dev.wiki.renderer import RenderPool, WikiRenderer, clear_template_cache
 
 
 # ==================== Initialization ====================
@@ -241,3 +243,131 @@ class TestRenderToFile:
         renderer.render_to_file("t.jinja2", {"title": "Hello"}, output)
 
         assert output.read_text() == "# Hello"
+
+
+# ==================== Bytecode Cache ====================
+
+class TestBytecodeCache:
+    """Tests for the persistent compiled-template cache."""
+
+    @pytest.fixture
+    def templates_dir(self, tmp_path: Path) -> Path:
+        """Filesystem templates root with one template."""
+        root = tmp_path / "templates"
+        root.mkdir()
+        (root / "t.jinja2").write_text("Hello {{ name }}")
+        return root
+
+    def test_second_process_loads_compiled(self, templates_dir, tmp_path) -> None:
+        """A new renderer reuses templates compiled by an earlier one."""
+        cache_dir = tmp_path / "cache"
+        first = WikiRenderer(templates_dir, cache_dir=cache_dir)
+        first.render("t.jinja2", {"name": "Clara"})
+
+        second = WikiRenderer(templates_dir, cache_dir=cache_dir)
+
+        assert second.render("t.jinja2", {"name": "Majo"}) == "Hello Majo"
+        assert first.timings["cache_misses"] == 1
+        assert second.timings["cache_hits"] == 1
+        assert second.timings["templates"] == 1
+
+    def test_edited_template_recompiles(self, templates_dir, tmp_path) -> None:
+        """Changed template source is not served from the cache."""
+        cache_dir = tmp_path / "cache"
+        WikiRenderer(templates_dir, cache_dir=cache_dir).render("t.jinja2", {})
+        (templates_dir / "t.jinja2").write_text("Bye {{ name }}")
+
+        renderer = WikiRenderer(templates_dir, cache_dir=cache_dir)
+
+        assert renderer.render("t.jinja2", {"name": "Clara"}) == "Bye Clara"
+        assert renderer.timings["cache_misses"] == 1
+
+    def test_clear_template_cache(self, templates_dir, tmp_path) -> None:
+        """Clearing removes every compiled template."""
+        cache_dir = tmp_path / "cache"
+        WikiRenderer(templates_dir, cache_dir=cache_dir).render("t.jinja2", {})
+
+        assert clear_template_cache(cache_dir) == 1
+        assert not list(cache_dir.iterdir())
+        assert clear_template_cache(tmp_path / "missing") == 0
+
+    def test_no_cache_by_default(self, templates_dir) -> None:
+        """Without a cache directory only timings are reported."""
+        renderer = WikiRenderer(templates_dir)
+        renderer.render("t.jinja2", {})
+
+        assert renderer.env.bytecode_cache is None
+        assert set(renderer.timings) == {"setup_ms", "load_ms", "templates"}
+
+    def test_drop_stale_reloads_edited(self, templates_dir) -> None:
+        """A long-lived renderer picks up edited templates after drop_stale."""
+        renderer = WikiRenderer(templates_dir)
+        renderer.render("t.jinja2", {"name": "Clara"})
+        assert renderer.drop_stale() == 0
+
+        source = templates_dir / "t.jinja2"
+        source.write_text("Bye {{ name }}")
+        mtime = source.stat().st_mtime + 5
+        os.utime(source, (mtime, mtime))
+
+        assert renderer.drop_stale() == 1
+        assert renderer.render("t.jinja2", {"name": "Clara"}) == "Bye Clara"
+
+
+# ==================== Parallel Rendering ====================
+
+class TestRenderPool:
+    """Tests for rendering through the worker pool."""
+
+    @pytest.fixture
+    def templates_dir(self, tmp_path: Path) -> Path:
+        """Filesystem templates reading a renderer global."""
+        root = tmp_path / "templates"
+        root.mkdir()
+        (root / "t.jinja2").write_text("{{ prefix }} {{ name }}")
+        return root
+
+    def _renderer(self, templates_dir: Path) -> WikiRenderer:
+        """Renderer with the global the template reads."""
+        renderer = WikiRenderer(templates_dir)
+        renderer.env.globals["prefix"] = "Hello"
+        return renderer
+
+    def test_small_run_renders_inline(self, templates_dir, tmp_path) -> None:
+        """Fewer pages than a batch are rendered without starting workers."""
+        pool = RenderPool(self._renderer(templates_dir), templates_dir, workers=2)
+        pool.submit("t.jinja2", {"name": "Clara"}, tmp_path / "a.md", "pages")
+
+        written = pool.close()
+
+        assert pool._executor is None
+        assert written == {"pages": 1}
+        assert (tmp_path / "a.md").read_text() == "Hello Clara"
+
+    def test_workers_use_renderer_globals(self, templates_dir, tmp_path) -> None:
+        """Batches rendered by workers match in-process output."""
+        pool = RenderPool(
+            self._renderer(templates_dir), templates_dir, workers=2, batch_size=2
+        )
+        names = ["Clara", "Majo", "Sofia", "Ana", "Lu"]
+        for name in names:
+            pool.submit("t.jinja2", {"name": name}, tmp_path / f"{name}.md", "pages")
+        (tmp_path / "Lu.md").write_text("Hello Lu")
+        pool.submit("t.jinja2", {"name": "x"}, tmp_path / "x.md")
+
+        written = pool.close()
+
+        assert written == {"pages": 4}
+        for name in names:
+            assert (tmp_path / f"{name}.md").read_text() == f"Hello {name}"
+        assert (tmp_path / "x.md").exists()
+
+    def test_cancel_stops_workers(self, templates_dir, tmp_path) -> None:
+        """Cancelled pools drop queued pages."""
+        pool = RenderPool(self._renderer(templates_dir), templates_dir, workers=2)
+        pool.submit("t.jinja2", {"name": "Clara"}, tmp_path / "a.md")
+
+        pool.cancel()
+
+        assert pool.close() == {}
+        assert not (tmp_path / "a.md").exists()
@@ -4,8 +4,9 @@ test_validator.py
 -----------------
 Tests for WikiValidator and Diagnostic dataclass.
 
-Validates structural checks (H1 title, empty sections) and
-wikilink resolution against a test database.
+Validates structural checks (H1 title, empty sections),
+wikilink resolution against a test database, and the per-file
+diagnostics cache.
 """
 # --- Annotations ---
 from __future__ import annotations
@@ -421,3 +422,90 @@ class TestWikiValidatorIntegration:
         diags = validator.validate_file(f)
         lines = [d.line for d in diags]
         assert lines == sorted(lines)
+
+
+class TestWikiValidatorLintCache:
+    """Tests for the content-hash diagnostics cache."""
+
+    def test_unchanged_file_served_from_cache(self, test_db, tmp_path):
+        """A file is checked once; re-validating it hits the cache."""
+        f = tmp_path / "test.md"
+        f.write_text("No title\n\n[[broken]]")
+        validator = WikiValidator(test_db)
+
+        first = validator.validate_file(f)
+        second = validator.validate_file(f)
+
+        assert second == first
+        assert (validator.cache.misses, validator.cache.hits) == (1, 1)
+
+    def test_changed_file_rechecked(self, test_db, tmp_path):
+        """Editing a file invalidates its cached diagnostics."""
+        f = tmp_path / "test.md"
+        f.write_text("No title")
+        validator = WikiValidator(test_db)
+        assert validator.validate_file(f)
+
+        f.write_text("# Title\n\nContent.")
+
+        assert validator.validate_file(f) == []
+        assert validator.cache.misses == 2
+
+    def test_persisted_between_validators(self, test_db, tmp_path):
+        """A saved cache is reused by the next validator."""
+        cache_path = tmp_path / "cache" / "lint.json"
+        wiki = tmp_path / "wiki"
+        wiki.mkdir()
+        (wiki / "a.md").write_text("# A\n\n[[missing]]")
+        (wiki / "b.md").write_text("# B\n\nContent.")
+
+        validator = WikiValidator(test_db, cache_path=cache_path)
+        first = validator.validate_directory(wiki)
+        validator.save_cache()
+
+        reloaded = WikiValidator(test_db, cache_path=cache_path)
+        assert reloaded.validate_directory(wiki) == first
+        assert (reloaded.cache.misses, reloaded.cache.hits) == (0, 2)
+
+    def test_new_target_invalidates_cache(
+        self, test_db, db_session, tmp_path
+    ):
+        """Results checked against another target set are discarded."""
+        from dev.database.models.entities import Tag
+
+        cache_path = tmp_path / "lint.json"
+        f = tmp_path / "test.md"
+        f.write_text("# Title\n\n[[late_tag]]")
+        validator = WikiValidator(test_db, cache_path=cache_path)
+        assert validator.validate_file(f)
+        validator.save_cache()
+
+        db_session.add(Tag(name="late_tag"))
+        db_session.commit()
+
+        assert WikiValidator(test_db, cache_path=cache_path).validate_file(f) == []
+
+    def test_removed_files_pruned(self, test_db, tmp_path):
+        """Files gone from the linted tree leave the cache."""
+        (tmp_path / "a.md").write_text("# A")
+        (tmp_path / "b.md").write_text("# B")
+        validator = WikiValidator(test_db)
+        validator.validate_directory(tmp_path)
+
+        (tmp_path / "b.md").unlink()
+        validator.validate_directory(tmp_path)
+
+        assert len(validator.cache) == 1
+
+    def test_parallel_matches_serial(self, test_db, tmp_path):
+        """Threaded directory linting returns the serial results."""
+        for i in range(40):
+            (tmp_path / f"page{i:02d}.md").write_text(
+                f"# Page {i}\n\n## Empty\n\n## Full\n\n[[missing{i}]]"
+            )
+
+        serial = WikiValidator(test_db, workers=1).validate_directory(tmp_path)
+        threaded = WikiValidator(test_db, workers=4).validate_directory(tmp_path)
+
+        assert threaded == serial
+        assert list(threaded) == sorted(threaded)